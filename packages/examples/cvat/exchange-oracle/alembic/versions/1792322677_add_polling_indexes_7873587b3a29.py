@@ -0,0 +1,65 @@
+"""
+Add partial indexes for the cron polling queries
+
+The indexes only cover the rows the crons are looking for (pending webhooks, active escrow
+creations and assignments), so they stay small while the tables grow. On large tables,
+they can be created beforehand with CREATE INDEX CONCURRENTLY under the same names
+to avoid blocking writes, the migration skips the existing indexes.
+
+Revision ID: 7873587b3a29
+Revises: 9884511c7077
+Create Date: 2026-10-18 11:24:37.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7873587b3a29"
+down_revision = "9884511c7077"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_webhooks_pending",
+        "webhooks",
+        ["direction", "type", "wait_until"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_cvat_webhooks_pending",
+        "cvat_webhooks",
+        ["wait_until"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_escrow_creations_active",
+        "escrow_creations",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("finished_at IS NULL"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_assignments_active_expires_at",
+        "assignments",
+        ["expires_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'created' AND completed_at IS NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assignments_active_expires_at", table_name="assignments")
+    op.drop_index("ix_escrow_creations_active", table_name="escrow_creations")
+    op.drop_index("ix_cvat_webhooks_pending", table_name="cvat_webhooks")
+    op.drop_index("ix_webhooks_pending", table_name="webhooks")
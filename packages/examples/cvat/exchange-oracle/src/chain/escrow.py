@@ -1,4 +1,8 @@
 import json
+import time
+from collections.abc import Generator, Iterable, Sequence
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from decimal import Decimal
 from functools import partial
 
@@ -32,14 +36,90 @@ def _get_manifest_content(manifest: str) -> str:
     return manifest
 
 
+_escrow_memo: ContextVar[dict[tuple[int, str], tuple[float, EscrowData]] | None] = ContextVar(
+    "escrow_memo", default=None
+)
+
+
+@contextmanager
+def escrow_memo() -> Generator[None, None, None]:
+    """
+    Reuses escrows fetched from the subgraph inside the block, so that one request
+    or webhook never fetches the same escrow twice. Entries expire after
+    Config.features.escrow_memo_ttl seconds. Nested blocks share the outer memo.
+    """
+
+    if _escrow_memo.get() is not None:
+        yield
+        return
+
+    token = _escrow_memo.set({})
+    try:
+        yield
+    finally:
+        _escrow_memo.reset(token)
+
+
+def _get_memoized_escrow(chain_id: int, escrow_address: str) -> EscrowData | None:
+    memo = _escrow_memo.get()
+    if memo is None:
+        return None
+
+    entry = memo.get((chain_id, escrow_address.lower()))
+    if not entry:
+        return None
+
+    fetched_at, escrow = entry
+    if time.monotonic() - fetched_at > Config.features.escrow_memo_ttl:
+        return None
+
+    return escrow
+
+
+def _memoize_escrow(chain_id: int, escrow_address: str, escrow: EscrowData) -> None:
+    memo = _escrow_memo.get()
+    if memo is not None:
+        memo[(chain_id, escrow_address.lower())] = (time.monotonic(), escrow)
+
+
 def get_escrow(chain_id: int, escrow_address: str) -> EscrowData:
+    escrow = _get_memoized_escrow(chain_id, escrow_address)
+    if escrow:
+        return escrow
+
     escrow = EscrowUtils.get_escrow(ChainId(chain_id), escrow_address)
     if not escrow:
         raise Exception(f"Can't find escrow {escrow_address}")
 
+    _memoize_escrow(chain_id, escrow_address, escrow)
     return escrow
 
 
+def get_escrows(chain_id: int, escrow_addresses: Iterable[str]) -> dict[str, EscrowData]:
+    """
+    Fetches several escrows in batched subgraph requests.
+    Returns the found escrows by lowercase address, missing escrows are not included.
+    """
+
+    escrows = {}
+    missing_addresses = []
+    for escrow_address in escrow_addresses:
+        escrow = _get_memoized_escrow(chain_id, escrow_address)
+        if escrow:
+            escrows[escrow_address.lower()] = escrow
+        else:
+            missing_addresses.append(escrow_address)
+
+    if missing_addresses:
+        fetched_escrows = EscrowUtils.get_escrows_by_addresses(ChainId(chain_id), missing_addresses)
+        for escrow_address, escrow in fetched_escrows.items():
+            _memoize_escrow(chain_id, escrow_address, escrow)
+
+        escrows.update(fetched_escrows)
+
+    return escrows
+
+
 def validate_escrow(
     chain_id: int,
     escrow_address: str,
@@ -65,10 +145,36 @@ def validate_escrow(
         raise ValueError("Escrow doesn't have funds")
 
 
+def _get_existing_escrows(chain_id: int, escrow_addresses: Sequence[str]) -> dict[str, EscrowData]:
+    escrows = get_escrows(chain_id, escrow_addresses)
+
+    existing_escrows = {}
+    for escrow_address in escrow_addresses:
+        escrow = escrows.get(escrow_address.lower())
+        if not escrow:
+            raise Exception(f"Can't find escrow {escrow_address}")
+
+        existing_escrows[escrow_address] = escrow
+
+    return existing_escrows
+
+
 def download_manifest(chain_id: int, escrow_address: str) -> dict:
     escrow = get_escrow(chain_id, escrow_address)
+    return _load_manifest(escrow.manifest)
+
+
+def _download_manifests(chain_id: int, escrow_addresses: Sequence[str]) -> dict[str, dict]:
+    manifests = {}
+    for escrow_address, escrow in _get_existing_escrows(chain_id, escrow_addresses).items():
+        with suppress(ManifestNotAvailableError):
+            manifests[escrow_address] = _load_manifest(escrow.manifest)
+
+    return manifests
 
-    manifest_content = _get_manifest_content(escrow.manifest)
+
+def _load_manifest(manifest: str) -> dict:
+    manifest_content = _get_manifest_content(manifest)
 
     if EncryptionUtils.is_encrypted(manifest_content):
         encryption = Encryption(
@@ -89,6 +195,21 @@ def get_escrow_manifest(chain_id: int, escrow_address: str) -> dict:
     )
 
 
+def get_escrow_manifests(chain_id: int, escrow_addresses: Sequence[str]) -> dict[str, dict]:
+    """
+    Returns manifests of several escrows by escrow address. Cached manifests are read
+    in one request, escrows of the missing ones are fetched in one subgraph query.
+    Unavailable manifests are not included.
+    """
+
+    cache = Cache()
+    return cache.get_or_set_manifests(
+        escrow_addresses,
+        chain_id,
+        set_callback=partial(_download_manifests, chain_id),
+    )
+
+
 def get_available_webhook_types(
     chain_id: int, escrow_address: str
 ) -> dict[str, OracleWebhookTypes]:
@@ -111,6 +232,26 @@ def get_escrow_fund_token_symbol(chain_id: int, escrow_address: str) -> str:
     )
 
 
+def get_escrow_fund_token_symbols(chain_id: int, escrow_addresses: Sequence[str]) -> dict[str, str]:
+    """
+    Returns fund token symbols of several escrows by escrow address,
+    fetching the escrows in one subgraph query and the cached symbols in one request.
+    """
+
+    escrows = _get_existing_escrows(chain_id, escrow_addresses)
+
+    cache = Cache()
+    token_symbols = cache.get_or_set_token_symbols(
+        chain_id,
+        list(dict.fromkeys(escrow.token for escrow in escrows.values())),
+        set_callback=partial(get_token_symbol, chain_id),
+    )
+
+    return {
+        escrow_address: token_symbols[escrow.token] for escrow_address, escrow in escrows.items()
+    }
+
+
 def get_escrow_fund_token_decimals(chain_id: int, escrow_address: str) -> int:
     """
     ERC-20 decimals: divide the raw token amount by 10**decimals for the user representation
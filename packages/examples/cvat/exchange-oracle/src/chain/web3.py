@@ -1,12 +1,18 @@
 import json
+import threading
+from functools import cache
 from typing import Any
 
+import requests
+from eth_account import Account
 from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
 from web3.providers.rpc import HTTPProvider
 
-from src.core.config import Config
+from src.core.config import Config, _NetworkConfig
 from src.core.types import Networks
 
 symbol_abi = [
@@ -30,21 +36,41 @@ decimals_abi = [
 ]  # ABI for fetching token decimals (ERC-20 optional method; https://eips.ethereum.org/EIPS/eip-20)
 
 
-def get_web3(chain_id: int | Networks):
+_web3_lock = threading.Lock()
+_web3_instances: dict[tuple[int, str, str], Web3] = {}
+
+
+def _get_network_config(chain_id: int | Networks) -> type[_NetworkConfig]:
     match chain_id:
         case Networks.polygon_mainnet:
-            network = Config.polygon_mainnet
+            return Config.polygon_mainnet
         case Networks.polygon_amoy:
-            network = Config.polygon_amoy
+            return Config.polygon_amoy
         case Networks.localhost:
-            network = Config.localhost
+            return Config.localhost
         case _:
             raise ValueError(f"{chain_id} is not in available list of networks.")
 
-    w3 = Web3(HTTPProvider(network.rpc_api))
-    gas_payer = w3.eth.account.from_key(network.private_key)
+
+def _make_rpc_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=Config.web3_config.rpc_pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _make_web3(network: type[_NetworkConfig]) -> Web3:
+    w3 = Web3(
+        HTTPProvider(
+            network.rpc_api,
+            request_kwargs={"timeout": Config.web3_config.rpc_timeout},
+            session=_make_rpc_session(),
+        )
+    )
+    gas_payer = _get_account(network.private_key)
     w3.middleware_onion.inject(
-        SignAndSendRawMiddlewareBuilder.build(network.private_key),
+        SignAndSendRawMiddlewareBuilder.build(gas_payer),
         "SignAndSendRawMiddlewareBuilder",
         layer=0,
     )
@@ -52,35 +78,49 @@ def get_web3(chain_id: int | Networks):
     return w3
 
 
+@cache
+def _get_account(private_key: str) -> LocalAccount:
+    return Account.from_key(private_key)
+
+
+def get_web3(chain_id: int | Networks) -> Web3:
+    """
+    Returns a Web3 instance for the network, shared by all the callers.
+    The instance keeps a pool of HTTP connections to the RPC node.
+    """
+
+    network = _get_network_config(chain_id)
+    key = (network.chain_id, network.rpc_api, network.private_key)
+
+    w3 = _web3_instances.get(key)
+    if w3 is None:
+        with _web3_lock:
+            w3 = _web3_instances.get(key)
+            if w3 is None:
+                w3 = _make_web3(network)
+                _web3_instances[key] = w3
+
+    return w3
+
+
 def serialize_message(message: Any) -> str:
     return json.dumps(message, separators=(",", ":"))
 
 
 def sign_message(chain_id: Networks, message) -> str:
-    w3 = get_web3(chain_id)
-    private_key = ""
-    match chain_id:
-        case Config.polygon_mainnet.chain_id:
-            private_key = Config.polygon_mainnet.private_key
-        case Config.polygon_amoy.chain_id:
-            private_key = Config.polygon_amoy.private_key
-        case Config.localhost.chain_id:
-            private_key = Config.localhost.private_key
-        case _:
-            raise ValueError(f"{chain_id} is not in available list of networks.")
+    network = _get_network_config(chain_id)
 
     serialized_message = serialize_message(message)
-    signed_message = w3.eth.account.sign_message(
-        encode_defunct(text=serialized_message), private_key
+    signed_message = _get_account(network.private_key).sign_message(
+        encode_defunct(text=serialized_message)
     )
 
     return signed_message.signature.to_0x_hex(), serialized_message
 
 
-def recover_signer(chain_id: Networks, message, signature: str) -> str:
-    w3 = get_web3(chain_id)
+def recover_signer(chain_id: Networks, message, signature: str) -> str:  # noqa: ARG001
     message_hash = encode_defunct(text=serialize_message(message))
-    return w3.eth.account.recover_message(message_hash, signature=signature)
+    return Account.recover_message(message_hash, signature=signature)
 
 
 def validate_address(escrow_address: str) -> str:
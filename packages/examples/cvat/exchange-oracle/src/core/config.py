@@ -54,6 +54,8 @@ class PostgresConfig:
     password = getenv("PG_PASSWORD", "admin")
     database = getenv("PG_DB", "exchange_oracle")
     lock_timeout = int(getenv("PG_LOCK_TIMEOUT", "3000"))  # milliseconds
+    # connections kept open, each API_MAX_BLOCKING_WORKERS worker can open one more
+    pool_size = int(getenv("PG_POOL_SIZE", "10"))
 
     @classmethod
     def connection_url(cls) -> str:
@@ -128,6 +130,14 @@ class LocalhostConfig(_NetworkConfig):
     reputation_oracle_url = getenv("LOCALHOST_REPUTATION_ORACLE_URL")
 
 
+class Web3Config:
+    rpc_timeout = float(getenv("RPC_TIMEOUT", 30))
+    "Timeout for blockchain RPC requests, in seconds"
+
+    rpc_pool_size = int(getenv("RPC_POOL_SIZE", 10))
+    "Max kept-alive connections to the RPC node of each network"
+
+
 class CronConfig:
     process_job_launcher_webhooks_int = int(getenv("PROCESS_JOB_LAUNCHER_WEBHOOKS_INT", 30))
     process_job_launcher_webhooks_chunk_size = int(
@@ -196,9 +206,18 @@ class CvatConfig:
     max_jobs_per_task = int(getenv("CVAT_MAX_JOBS_PER_TASK", 1000))
     task_creation_check_interval = int(getenv("CVAT_TASK_CREATION_CHECK_INTERVAL", 5))
 
+    max_active_task_creations = int(getenv("CVAT_MAX_ACTIVE_TASK_CREATIONS", 4))
+    "Maximum number of CVAT tasks with the data being uploaded at once during escrow creation"
+
     export_timeout = int(getenv("CVAT_EXPORT_TIMEOUT", 5 * 60))
     "Timeout, in seconds, for annotations or dataset export waiting"
 
+    export_max_memory_size = int(getenv("CVAT_EXPORT_MAX_MEMORY_SIZE", 2**20))
+    """
+    Maximum size, in bytes, of a downloaded annotations or dataset export kept in memory.
+    Bigger exports are written to temporary files.
+    """
+
     import_timeout = int(getenv("CVAT_IMPORT_TIMEOUT", 60 * 60))
     "Timeout, in seconds, for waiting on GT annotations import"
 
@@ -267,9 +286,23 @@ class FeaturesConfig:
     token_symbol_ttl = int(getenv("TOKEN_SYMBOL_CACHE_TTL", str(2 * 24 * 60 * 60)))
     "TTL for cached token symbols, in seconds"
 
+    escrow_memo_ttl = int(getenv("ESCROW_MEMO_TTL", 10))
+    "TTL for escrows reused within one request or webhook, in seconds"
+
     max_data_storage_connections = int(getenv("MAX_DATA_STORAGE_CONNECTIONS", 5))
     "Max parallel data storage connections in 1 client (job creation, ...)"
 
+    roi_processing_workers = int(getenv("ROI_PROCESSING_WORKERS", os.cpu_count() or 1))
+    "Threads for decoding, cropping and encoding RoI images in job creation"
+
+    annotation_conversion_workers = int(
+        getenv("ANNOTATION_CONVERSION_WORKERS", os.cpu_count() or 1)
+    )
+    "Processes for converting job annotations in escrow export, 1 to convert them in place"
+
+    audio_processing_workers = int(getenv("AUDIO_PROCESSING_WORKERS", os.cpu_count() or 1))
+    "Parallel ffmpeg processes for probing and cutting media in audio task creation"
+
 
 class CoreConfig:
     default_assignment_time = int(getenv("DEFAULT_ASSIGNMENT_TIME", 1800))
@@ -300,6 +333,9 @@ class ApiConfig:
 
     stats_rps_limit = int(getenv("STATS_RPS_LIMIT", 4))
 
+    max_blocking_workers = int(getenv("API_MAX_BLOCKING_WORKERS", 40))
+    "Max threads running blocking DB and CVAT calls of the API endpoints"
+
 
 class EncryptionConfig(_BaseConfig):
     pgp_passphrase = getenv("PGP_PASSPHRASE", "")
@@ -356,12 +392,25 @@ class Config:
     environment = Environment(getenv("ENVIRONMENT", Environment.DEVELOPMENT.value))
     workers_amount = int(getenv("WORKERS_AMOUNT", 1))
     webhook_max_retries = int(getenv("WEBHOOK_MAX_RETRIES", 5))
+    "Retry budget: failed webhooks are moved to the dead-letter queue after so many attempts"
     webhook_delay_if_failed = int(getenv("WEBHOOK_DELAY_IF_FAILED", 60))
+    "Delay before the first retry of a failed webhook, doubled for each next retry, in seconds"
+    webhook_max_delay_if_failed = int(getenv("WEBHOOK_MAX_DELAY_IF_FAILED", 60 * 60))
+    "Max delay between the retries of a failed webhook, in seconds"
+    webhook_send_workers = int(getenv("WEBHOOK_SEND_WORKERS", 10))
+    "Max outgoing webhooks sent in parallel"
+    webhook_max_host_connections = int(getenv("WEBHOOK_MAX_HOST_CONNECTIONS", 2))
+    "Max outgoing webhooks sent in parallel to one receiver host"
+    webhook_url_cache_ttl = int(getenv("WEBHOOK_URL_CACHE_TTL", 5 * 60))
+    "TTL for cached webhook receiver URLs, in seconds"
+    admin_api_key = getenv("ADMIN_API_KEY", "")
+    "Key for the admin endpoints (X-Admin-Key header). The endpoints are disabled if empty"
     loglevel = parse_log_level(getenv("LOGLEVEL", "info"))
 
     polygon_mainnet = PolygonMainnetConfig
     polygon_amoy = PolygonAmoyConfig
     localhost = LocalhostConfig
+    web3_config = Web3Config
 
     postgres_config = PostgresConfig
     redis_config = RedisConfig
@@ -1,14 +1,17 @@
 import logging
 from collections.abc import Callable
 from contextlib import contextmanager
+from functools import cache
 
-import httpx2
 from sqlalchemy.orm import Session
 
+from src.chain.escrow import escrow_memo
+from src.core.config import Config
 from src.core.types import OracleWebhookTypes
 from src.db.utils import ForUpdateParams
 from src.models.webhook import Webhook
 from src.services import webhook as webhook_service
+from src.utils.webhook_dispatcher import OutgoingWebhookRequest, WebhookDispatcher
 from src.utils.webhooks import prepare_outgoing_webhook_body, prepare_signed_message
 
 
@@ -29,7 +32,8 @@ def handle_webhook(
     )
     savepoint = session.begin_nested()
     try:
-        yield
+        with escrow_memo():
+            yield
     except Exception as e:
         savepoint.rollback()
         logger.exception(f"Webhook {webhook.id} sending failed: {e}")
@@ -46,7 +50,9 @@ def handle_webhook(
         logger.debug("Webhook handled successfully")
 
 
-def _send_webhook(url: str, webhook: Webhook, *, with_timestamp: bool = True) -> None:
+def _prepare_webhook_request(
+    webhook: Webhook, *, with_timestamp: bool = True
+) -> OutgoingWebhookRequest:
     body = prepare_outgoing_webhook_body(
         webhook.escrow_address,
         webhook.chain_id,
@@ -59,10 +65,22 @@ def _send_webhook(url: str, webhook: Webhook, *, with_timestamp: bool = True) ->
         webhook.chain_id,
         body=body,
     )
-    headers = {"human-signature": signature}
-    with httpx2.Client() as client:
-        response = client.post(url, headers=headers, json=body)
-        response.raise_for_status()
+    return OutgoingWebhookRequest(
+        webhook_id=webhook.id,
+        chain_id=webhook.chain_id,
+        escrow_address=webhook.escrow_address,
+        headers={"human-signature": signature},
+        body=body,
+    )
+
+
+@cache
+def _get_webhook_dispatcher() -> WebhookDispatcher:
+    return WebhookDispatcher(
+        max_workers=Config.webhook_send_workers,
+        max_host_connections=Config.webhook_max_host_connections,
+        url_ttl=Config.webhook_url_cache_ttl,
+    )
 
 
 def process_outgoing_webhooks(
@@ -80,7 +98,31 @@ def process_outgoing_webhooks(
         limit=chunk_size,
         for_update=ForUpdateParams(skip_locked=True),
     )
+
+    requests = []
+    failed_ids = []
     for webhook in webhooks:
-        with handle_webhook(logger, session, webhook, queue=webhook_service.outbox):
-            webhook_url = url_getter(webhook.chain_id, webhook.escrow_address)
-            _send_webhook(webhook_url, webhook, with_timestamp=with_timestamp)
+        try:
+            requests.append(_prepare_webhook_request(webhook, with_timestamp=with_timestamp))
+        except Exception as e:
+            logger.exception(f"Webhook {webhook.id} sending failed: {e}")
+            failed_ids.append(webhook.id)
+
+    # The requests are sent concurrently, the database is only updated here, in one statement.
+    # The url getters fetch the escrows, the memo shares them between the webhooks of an escrow.
+    with escrow_memo():
+        errors = _get_webhook_dispatcher().send(requests, url_getter)
+
+    succeeded_ids = []
+    for request, error in zip(requests, errors, strict=True):
+        if error:
+            logger.error(f"Webhook {request.webhook_id} sending failed: {error}", exc_info=error)
+            failed_ids.append(request.webhook_id)
+        else:
+            succeeded_ids.append(request.webhook_id)
+
+    webhook_service.outbox.handle_webhook_results(
+        session, succeeded_ids=succeeded_ids, failed_ids=failed_ids
+    )
+    if webhooks:
+        logger.debug(f"Webhooks sent: {len(succeeded_ids)} succeeded, {len(failed_ids)} failed")
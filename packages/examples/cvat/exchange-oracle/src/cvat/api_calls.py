@@ -2,13 +2,14 @@ import io
 import json
 import logging
 import zipfile
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 from io import BytesIO
 from pathlib import Path
+from tempfile import TemporaryFile
 from time import sleep
 from typing import Any
 
@@ -28,6 +29,11 @@ _NOTSET = object()
 _PLAIN_FILE_EXPORT_FORMATS = frozenset({"Generic TSV 1.0"})
 "Export formats that return a plain file instead of a zip archive"
 
+_EXPORT_CHECK_MIN_INTERVAL = 0.5
+"The first interval, in seconds, between the export request status checks"
+
+_DOWNLOAD_CHUNK_SIZE = 2**20
+
 
 class CVATException(Exception):
     """Indicates that CVAT API returned unexpected response"""
@@ -88,6 +94,73 @@ def _request_annotations(endpoint: Endpoint, cvat_id: int, format_name: str) ->
     return rq_id
 
 
+def _get_export_request(api_client: ApiClient, request_id: str) -> models.Request:
+    request_info = api_client.requests_api.retrieve(request_id)[0]
+    if request_info.status.value == models.RequestStatus.allowed_values[("value",)]["FAILED"]:
+        raise Exception(f"Failed to export annotations for {request_id=}: {request_info.message}")
+
+    return request_info
+
+
+def _is_export_finished(request_info: models.Request) -> bool:
+    return request_info.status.value == models.RequestStatus.allowed_values[("value",)]["FINISHED"]
+
+
+def _download_export_result(api_client: ApiClient, request_info: models.Request) -> io.RawIOBase:
+    result_url = URL(request_info.result_url)
+    query_params = result_url.params
+    headers = api_client.get_common_headers()
+    api_client.update_params_for_auth(
+        headers=headers,
+        queries=query_params,
+        auth_settings=[""],
+        resource_path="",
+        method="GET",
+        request_auths=list(api_client.configuration.auth_settings().values()),
+        body="",
+    )
+
+    response = api_client.rest_client.GET(
+        request_info.result_url, headers=headers, _parse_response=False
+    )
+    try:
+        file_buffer = _spool_chunks(
+            response.stream(_DOWNLOAD_CHUNK_SIZE),
+            max_memory_size=Config.cvat_config.export_max_memory_size,
+        )
+    finally:
+        response.release_conn()
+
+    # Validate the data received. Most formats return a zip archive, but some return contents
+    # directly.
+    if request_info.operation.format not in _PLAIN_FILE_EXPORT_FORMATS:
+        assert zipfile.is_zipfile(file_buffer)
+
+    file_buffer.seek(0)
+    return file_buffer
+
+
+def _spool_chunks(chunks: Iterable[bytes], *, max_memory_size: int) -> io.BufferedIOBase:
+    """
+    Writes the chunks to a memory buffer, which is moved to a temporary file on disk
+    once it grows bigger than max_memory_size. Returns the buffer or the file,
+    positioned at the start.
+    """
+
+    file_buffer = io.BytesIO()
+    for chunk in chunks:
+        in_memory = isinstance(file_buffer, io.BytesIO)
+        if in_memory and max_memory_size < file_buffer.tell() + len(chunk):
+            temp_file = TemporaryFile()  # noqa: SIM115
+            temp_file.write(file_buffer.getbuffer())
+            file_buffer = temp_file
+
+        file_buffer.write(chunk)
+
+    file_buffer.seek(0)
+    return file_buffer
+
+
 def _get_annotations(
     api_client: ApiClient,
     request_id: str,
@@ -101,6 +174,9 @@ def _get_annotations(
 
     request_id = _request_annotations(...)
     _get_annotations(request_id, ...)
+
+    The request status is checked in growing intervals, up to attempt_interval seconds.
+    The result is streamed to a temporary file, if it's too big to be kept in memory.
     """
 
     time_begin = utcnow()
@@ -108,44 +184,34 @@ def _get_annotations(
     if timeout is _NOTSET:
         timeout = Config.cvat_config.export_timeout
 
+    interval = _EXPORT_CHECK_MIN_INTERVAL
     while True:
-        request_info = api_client.requests_api.retrieve(request_id)[0]
-        if request_info.status.value == models.RequestStatus.allowed_values[("value",)]["FAILED"]:
-            raise Exception(
-                f"Failed to export annotations for {request_id=}: {request_info.message}"
-            )
-
-        if request_info.status.value == models.RequestStatus.allowed_values[("value",)]["FINISHED"]:
+        request_info = _get_export_request(api_client, request_id)
+        if _is_export_finished(request_info):
             break
 
         if timeout is not None and timedelta(seconds=timeout) < (utcnow() - time_begin):
             raise Exception("Failed to retrieve the dataset from CVAT within the timeout interval")
 
-        sleep(attempt_interval)
+        sleep(interval)
+        interval = min(interval * 2, attempt_interval)
 
-    result_url = URL(request_info.result_url)
-    query_params = result_url.params
-    headers = api_client.get_common_headers()
-    api_client.update_params_for_auth(
-        headers=headers,
-        queries=query_params,
-        auth_settings=[""],
-        resource_path="",
-        method="GET",
-        request_auths=list(api_client.configuration.auth_settings().values()),
-        body="",
-    )
+    return _download_export_result(api_client, request_info)
 
-    response = api_client.rest_client.GET(request_info.result_url, headers=headers)
-    file_buffer = io.BytesIO(response.data)
 
-    # Validate the data received. Most formats return a zip archive, but some return contents
-    # directly.
-    if request_info.operation.format not in _PLAIN_FILE_EXPORT_FORMATS:
-        assert zipfile.is_zipfile(file_buffer)
+def is_export_finished(request_id: str) -> bool:
+    """
+    Checks if the annotations export is finished, without waiting.
+    Raises an exception if the export has failed.
+    """
 
-    file_buffer.seek(0)
-    return file_buffer
+    logger = logging.getLogger("app")
+    with get_api_client() as api_client:
+        try:
+            return _is_export_finished(_get_export_request(api_client, request_id))
+        except exceptions.ApiException as e:
+            logger.exception(f"Exception when calling RequestsApi.retrieve: {e}\n")
+            raise
 
 
 _api_client_context: ContextVar[ApiClient] = ContextVar("api_client", default=None)
@@ -560,6 +626,16 @@ def delete_project(cvat_id: int) -> None:
             raise
 
 
+def delete_task(cvat_id: int) -> None:
+    logger = logging.getLogger("app")
+    with get_api_client() as api_client:
+        try:
+            api_client.tasks_api.destroy(cvat_id)
+        except exceptions.ApiException as e:
+            logger.exception(f"Exception when calling TasksApi.destroy(): {e}\n")
+            raise
+
+
 def delete_cloudstorage(cvat_id: int) -> None:
     logger = logging.getLogger("app")
     with get_api_client() as api_client:
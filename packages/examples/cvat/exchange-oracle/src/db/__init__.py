@@ -22,6 +22,9 @@ engine = sqlalchemy.create_engine(
     DATABASE_URL,
     echo="debug" if Config.loglevel <= src.utils.logging.TRACE else False,
     connect_args={"options": f"-c lock_timeout={Config.postgres_config.lock_timeout:d}"},
+    # each blocking API worker can hold a session, on top of the cron jobs
+    pool_size=Config.postgres_config.pool_size,
+    max_overflow=Config.api_config.max_blocking_workers,
 )
 SessionLocal = sessionmaker(autocommit=False, bind=engine)
 
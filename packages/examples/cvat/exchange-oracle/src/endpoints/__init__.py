@@ -4,10 +4,12 @@ from fastapi import APIRouter, FastAPI
 from fastapi_pagination import add_pagination
 
 from src.core.config import Config
+from src.endpoints.admin import router as admin_router
 from src.endpoints.cvat import router as cvat_router
 from src.endpoints.exchange import router as service_router
 from src.endpoints.middleware import setup_middleware
 from src.endpoints.throttling import add_throttling
+from src.endpoints.utils import blocking_executor_lifespan, register_lifespan_context
 from src.endpoints.webhook import router as webhook_router
 from src.schemas import MetaResponse, ResponseError, ValidationErrorResponse
 
@@ -46,11 +48,13 @@ def init_api(app: FastAPI) -> FastAPI:
     }
 
     add_throttling(app)
+    register_lifespan_context(app, lifespan_context=blocking_executor_lifespan)
     add_pagination(app)
 
     app.include_router(greet_router)
     app.include_router(cvat_router, responses=default_responses)
     app.include_router(webhook_router, responses=default_responses)
+    app.include_router(admin_router, responses=default_responses)
     app.include_router(service_router, responses=default_responses)
 
     setup_middleware(app)
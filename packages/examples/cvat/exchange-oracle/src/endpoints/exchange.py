@@ -31,10 +31,10 @@ from src.endpoints.serializers import (
     ASSIGNMENT_PROJECT_VALIDATION_STATUSES,
     PROJECT_COMPLETED_STATUSES,
     serialize_assignment,
-    serialize_job,
+    serialize_jobs,
 )
 from src.endpoints.throttling import RateLimiter
-from src.endpoints.utils import OptionalQuery
+from src.endpoints.utils import OptionalQuery, run_blocking
 from src.schemas.exchange import (
     AssignmentIdRequest,
     AssignmentRequest,
@@ -194,15 +194,18 @@ async def list_jobs(
 
     query = filter.sort_(query)
 
-    with SessionLocal() as session:
+    def _get_page() -> Page[JobResponse]:
+        with SessionLocal() as session:
 
-        def _page_serializer(
-            projects: Sequence[cvat_service.Project],
-        ) -> Sequence[JobResponse]:
-            page = [serialize_job(p, session=session) for p in projects]
-            return [filter.select_fields_(p) for p in page]
+            def _page_serializer(
+                projects: Sequence[cvat_service.Project],
+            ) -> Sequence[JobResponse]:
+                page = serialize_jobs(projects)
+                return [filter.select_fields_(p) for p in page]
 
-        return paginate(session, query, transformer=_page_serializer)
+            return paginate(session, query, transformer=_page_serializer)
+
+    return await run_blocking(_get_page)
 
 
 @router.post("/register", description="Binds a CVAT user to a HUMAN App user")
@@ -210,47 +213,55 @@ async def register(token: Annotated[AuthorizationData, AuthorizationParam]) -> U
     user_email = token.email
     user_wallet_address = token.wallet_address
 
-    with SessionLocal.begin() as session:
-        email_db_user = cvat_service.get_user_by_email(session, user_email, for_update=True)
-        wallet_db_user = cvat_service.get_user_by_id(session, user_wallet_address, for_update=True)
-
-        if email_db_user or wallet_db_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="User already exists"
+    def _register() -> UserResponse:
+        with SessionLocal.begin() as session:
+            email_db_user = cvat_service.get_user_by_email(session, user_email, for_update=True)
+            wallet_db_user = cvat_service.get_user_by_id(
+                session, user_wallet_address, for_update=True
             )
 
-        try:
-            cvat_id = cvat_api.get_user_id(user_email)
-        except cvat_api.exceptions.ApiException as e:
-            if (
-                e.status == status.HTTP_400_BAD_REQUEST
-                and "The user is a member of the organization already." in e.body
-            ):
-                # This error can indicate that we tried to add the user previously
-                # or he was added manually
+            if email_db_user or wallet_db_user:
                 raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="User already exists",
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="User already exists"
                 )
 
-            if e.status == status.HTTP_400_BAD_REQUEST and "Enter a valid email address." in e.body:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid email address"
-                )
+            try:
+                cvat_id = cvat_api.get_user_id(user_email)
+            except cvat_api.exceptions.ApiException as e:
+                if (
+                    e.status == status.HTTP_400_BAD_REQUEST
+                    and "The user is a member of the organization already." in e.body
+                ):
+                    # This error can indicate that we tried to add the user previously
+                    # or he was added manually
+                    raise HTTPException(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail="User already exists",
+                    )
 
-            raise
+                if (
+                    e.status == status.HTTP_400_BAD_REQUEST
+                    and "Enter a valid email address." in e.body
+                ):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid email address"
+                    )
 
-        email_db_user = cvat_service.put_user(
-            session,
-            wallet_address=user_wallet_address,
-            cvat_email=user_email,
-            cvat_id=cvat_id,
-        )
+                raise
 
-        return UserResponse(
-            wallet_address=email_db_user.wallet_address,
-            email=email_db_user.cvat_email,
-        )
+            email_db_user = cvat_service.put_user(
+                session,
+                wallet_address=user_wallet_address,
+                cvat_email=user_email,
+                cvat_id=cvat_id,
+            )
+
+            return UserResponse(
+                wallet_address=email_db_user.wallet_address,
+                email=email_db_user.cvat_email,
+            )
+
+    return await run_blocking(_register)
 
 
 class AssignmentFilter(Filter):
@@ -367,37 +378,42 @@ async def list_assignments(
 
     query = filter.sort_(query)
 
-    with SessionLocal.begin() as session:
+    def _get_page() -> Page[AssignmentResponse]:
+        with SessionLocal.begin() as session:
 
-        def _page_serializer(
-            assignments: Sequence[cvat_service.Assignment],
-        ) -> Sequence[AssignmentResponse]:
-            results = []
+            def _page_serializer(
+                assignments: Sequence[cvat_service.Assignment],
+            ) -> Sequence[AssignmentResponse]:
+                results = []
 
-            jobs_for_assignments = {
-                job.cvat_id: job
-                for job in cvat_service.get_jobs_by_cvat_id(
-                    session, [a.cvat_job_id for a in assignments]
-                )
-            }
-
-            projects_for_assignments = {
-                project.cvat_id: project
-                for project in cvat_service.get_projects_by_cvat_ids(
-                    session,
-                    set(job.cvat_project_id for job in jobs_for_assignments.values()),
-                    limit=len(jobs_for_assignments),
-                )
-            }
+                jobs_for_assignments = {
+                    job.cvat_id: job
+                    for job in cvat_service.get_jobs_by_cvat_id(
+                        session, [a.cvat_job_id for a in assignments]
+                    )
+                }
+
+                projects_for_assignments = {
+                    project.cvat_id: project
+                    for project in cvat_service.get_projects_by_cvat_ids(
+                        session,
+                        set(job.cvat_project_id for job in jobs_for_assignments.values()),
+                        limit=len(jobs_for_assignments),
+                    )
+                }
+
+                for assignment in assignments:
+                    job = jobs_for_assignments[assignment.cvat_job_id]
+                    project = projects_for_assignments[job.cvat_project_id]
+                    results.append(
+                        serialize_assignment(assignment, session=session, project=project)
+                    )
 
-            for assignment in assignments:
-                job = jobs_for_assignments[assignment.cvat_job_id]
-                project = projects_for_assignments[job.cvat_project_id]
-                results.append(serialize_assignment(assignment, session=session, project=project))
+                return results
 
-            return results
+            return paginate(session, query, transformer=_page_serializer)
 
-        return paginate(session, query, transformer=_page_serializer)
+    return await run_blocking(_get_page)
 
 
 @router.post(
@@ -411,7 +427,8 @@ async def create_assignment(
     ],
 ) -> AssignmentResponse:
     try:
-        assignment_id = oracle_service.create_assignment(
+        assignment_id = await run_blocking(
+            oracle_service.create_assignment,
             escrow_address=data.escrow_address,
             chain_id=data.chain_id,
             wallet_address=token.wallet_address,
@@ -429,7 +446,7 @@ async def create_assignment(
             detail="No assignments available for this wallet address.",
         )
 
-    return serialize_assignment(assignment_id)
+    return await run_blocking(serialize_assignment, assignment_id)
 
 
 @router.post(
@@ -440,8 +457,10 @@ async def resign_assignment(
     data: AssignmentIdRequest, token: Annotated[AuthorizationData, AuthorizationParam]
 ) -> None:
     try:
-        await oracle_service.resign_assignment(
-            data.assignment_id, wallet_address=token.wallet_address
+        await run_blocking(
+            oracle_service.resign_assignment,
+            data.assignment_id,
+            wallet_address=token.wallet_address,
         )
     except oracle_service.NoAccessError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST)
@@ -453,36 +472,39 @@ async def get_user_stats(
 ) -> UserStatsResponse:
     wallet_address = token.wallet_address
 
-    with SessionLocal.begin() as session:
-        stats = {}
+    def _get_stats() -> UserStatsResponse:
+        with SessionLocal.begin() as session:
+            stats = {}
 
-        query = session.query(cvat_service.Assignment.id).where(
-            cvat_service.Assignment.user_wallet_address == wallet_address
-        )
-        stats["assignments_total"] = query.count()
-
-        stats["submissions_sent"] = query.where(
-            cvat_service.Assignment.status.in_(
-                [
-                    cvat_service.AssignmentStatuses.completed,
-                    cvat_service.AssignmentStatuses.rejected,
-                ]
-            ),
-        ).count()
+            query = session.query(cvat_service.Assignment.id).where(
+                cvat_service.Assignment.user_wallet_address == wallet_address
+            )
+            stats["assignments_total"] = query.count()
+
+            stats["submissions_sent"] = query.where(
+                cvat_service.Assignment.status.in_(
+                    [
+                        cvat_service.AssignmentStatuses.completed,
+                        cvat_service.AssignmentStatuses.rejected,
+                    ]
+                ),
+            ).count()
+
+            stats["assignments_completed"] = query.where(
+                cvat_service.Assignment.status == cvat_service.AssignmentStatuses.completed,
+            ).count()
 
-        stats["assignments_completed"] = query.where(
-            cvat_service.Assignment.status == cvat_service.AssignmentStatuses.completed,
-        ).count()
+            stats["assignments_rejected"] = query.where(
+                cvat_service.Assignment.status == cvat_service.AssignmentStatuses.rejected,
+            ).count()
 
-        stats["assignments_rejected"] = query.where(
-            cvat_service.Assignment.status == cvat_service.AssignmentStatuses.rejected,
-        ).count()
+            stats["assignments_expired"] = query.where(
+                cvat_service.Assignment.status == cvat_service.AssignmentStatuses.expired,
+            ).count()
 
-        stats["assignments_expired"] = query.where(
-            cvat_service.Assignment.status == cvat_service.AssignmentStatuses.expired,
-        ).count()
+            return UserStatsResponse(**stats)
 
-        return UserStatsResponse(**stats)
+    return await run_blocking(_get_stats)
 
 
 @router.get(
@@ -491,49 +513,52 @@ async def get_user_stats(
     dependencies=[Depends(RateLimiter(seconds=1, times=Config.api_config.stats_rps_limit))],
 )
 async def get_stats() -> OracleStatsResponse:
-    with SessionLocal.begin() as session:
-        stats = {}
+    def _get_stats() -> OracleStatsResponse:
+        with SessionLocal.begin() as session:
+            stats = {}
 
-        stats["escrows_processed"] = (
-            session.query(cvat_service.Project.escrow_address).distinct().count()
-        )
+            stats["escrows_processed"] = (
+                session.query(cvat_service.Project.escrow_address).distinct().count()
+            )
 
-        stats["escrows_active"] = (
-            session.query(cvat_service.Project.escrow_address)
-            .distinct()
-            .where(
-                cvat_service.Project.status.in_(
-                    [ProjectStatuses.annotation, ProjectStatuses.validation]
+            stats["escrows_active"] = (
+                session.query(cvat_service.Project.escrow_address)
+                .distinct()
+                .where(
+                    cvat_service.Project.status.in_(
+                        [ProjectStatuses.annotation, ProjectStatuses.validation]
+                    )
                 )
+                .count()
             )
-            .count()
-        )
 
-        stats["escrows_cancelled"] = (
-            session.query(cvat_service.Project.escrow_address)
-            .distinct()
-            .where(cvat_service.Project.status == ProjectStatuses.canceled)
-            .count()
-        )
+            stats["escrows_cancelled"] = (
+                session.query(cvat_service.Project.escrow_address)
+                .distinct()
+                .where(cvat_service.Project.status == ProjectStatuses.canceled)
+                .count()
+            )
 
-        stats["workers_total"] = session.query(cvat_service.User.wallet_address).count()
+            stats["workers_total"] = session.query(cvat_service.User.wallet_address).count()
 
-        stats["assignments_completed"] = (
-            session.query(cvat_service.Assignment.id)
-            .where(cvat_service.Assignment.status == cvat_service.AssignmentStatuses.completed)
-            .count()
-        )
+            stats["assignments_completed"] = (
+                session.query(cvat_service.Assignment.id)
+                .where(cvat_service.Assignment.status == cvat_service.AssignmentStatuses.completed)
+                .count()
+            )
 
-        stats["assignments_rejected"] = (
-            session.query(cvat_service.Assignment.id)
-            .where(cvat_service.Assignment.status == cvat_service.AssignmentStatuses.rejected)
-            .count()
-        )
+            stats["assignments_rejected"] = (
+                session.query(cvat_service.Assignment.id)
+                .where(cvat_service.Assignment.status == cvat_service.AssignmentStatuses.rejected)
+                .count()
+            )
 
-        stats["assignments_expired"] = (
-            session.query(cvat_service.Assignment.id)
-            .where(cvat_service.Assignment.status == cvat_service.AssignmentStatuses.expired)
-            .count()
-        )
+            stats["assignments_expired"] = (
+                session.query(cvat_service.Assignment.id)
+                .where(cvat_service.Assignment.status == cvat_service.AssignmentStatuses.expired)
+                .count()
+            )
+
+            return OracleStatsResponse(**stats)
 
-        return OracleStatsResponse(**stats)
+    return await run_blocking(_get_stats)
@@ -12,6 +12,7 @@ from pyinstrument.renderers.html import HTMLRenderer
 from pyinstrument.renderers.speedscope import SpeedscopeRenderer
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.chain.escrow import escrow_memo
 from src.core.config import Config
 from src.log import get_root_logger
 
@@ -52,6 +53,15 @@ async def profile_request(request: Request, call_next: Callable):
     return await call_next(request)
 
 
+async def memoize_escrows(request: Request, call_next: Callable):
+    """
+    Reuse escrows fetched from the subgraph within the request
+    """
+
+    with escrow_memo():
+        return await call_next(request)
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
     Middleware in charge of logging the HTTP request and response
@@ -198,6 +208,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
 
 def setup_middleware(app: FastAPI):
+    app.add_middleware(BaseHTTPMiddleware, dispatch=memoize_escrows)
+
     if Config.features.request_logging_enabled:
         app.add_middleware(RequestLoggingMiddleware)
 
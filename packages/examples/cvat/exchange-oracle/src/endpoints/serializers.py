@@ -1,3 +1,5 @@
+from collections import defaultdict
+from collections.abc import Sequence
 from contextlib import ExitStack, suppress
 
 from sqlalchemy.orm import Session
@@ -6,7 +8,9 @@ import src.services.cvat as cvat_service
 from src.chain.escrow import (
     ManifestNotAvailableError,
     get_escrow_fund_token_symbol,
+    get_escrow_fund_token_symbols,
     get_escrow_manifest,
+    get_escrow_manifests,
 )
 from src.core.manifest import ManifestBase, parse_manifest
 from src.core.types import AssignmentStatuses, ProjectStatuses
@@ -38,33 +42,74 @@ def serialize_job(
                 f"or a cvat_service.Project instance, not {project!r}"
             )
 
+        manifest = None
         with suppress(ManifestNotAvailableError):
-            manifest = parse_manifest(get_escrow_manifest(project.chain_id, project.escrow_address))
-
-        if project.status == ProjectStatuses.canceled:
-            api_status = service_api.JobStatuses.canceled
-        elif project.status == ProjectStatuses.annotation:
-            api_status = service_api.JobStatuses.active
-        elif project.status in PROJECT_COMPLETED_STATUSES:
-            api_status = service_api.JobStatuses.completed
-        else:
-            raise AssertionError(f"Unexpected project status '{project.status}'")
+            manifest = get_escrow_manifest(project.chain_id, project.escrow_address)
 
-        bounty = get_assignment_bounty(project, manifest=manifest)
         reward_token = get_escrow_fund_token_symbol(project.chain_id, project.escrow_address)
 
-        return service_api.JobResponse(
-            escrow_address=project.escrow_address,
-            chain_id=project.chain_id,
-            job_type=project.job_type,
-            status=api_status,
-            job_description=manifest.annotation.description if manifest else None,
-            reward_amount=bounty,
-            reward_token=reward_token,
-            created_at=project.created_at,
-            updated_at=project.updated_at,
-            qualifications=manifest.annotation.qualifications if manifest else [],
+        return _serialize_job(project, manifest=manifest, reward_token=reward_token)
+
+
+def serialize_jobs(projects: Sequence[cvat_service.Project]) -> list[service_api.JobResponse]:
+    """
+    Serializes a page of jobs. Manifests and reward tokens of all the escrows
+    are loaded at once instead of per job.
+    """
+
+    escrows_per_chain: dict[int, list[str]] = defaultdict(list)
+    for project in projects:
+        escrows_per_chain[project.chain_id].append(project.escrow_address)
+
+    manifests: dict[tuple[int, str], dict] = {}
+    reward_tokens: dict[tuple[int, str], str] = {}
+    for chain_id, escrow_addresses in escrows_per_chain.items():
+        for escrow_address, manifest in get_escrow_manifests(chain_id, escrow_addresses).items():
+            manifests[(chain_id, escrow_address)] = manifest
+
+        token_symbols = get_escrow_fund_token_symbols(chain_id, escrow_addresses)
+        for escrow_address, token_symbol in token_symbols.items():
+            reward_tokens[(chain_id, escrow_address)] = token_symbol
+
+    return [
+        _serialize_job(
+            project,
+            manifest=manifests.get((project.chain_id, project.escrow_address)),
+            reward_token=reward_tokens[(project.chain_id, project.escrow_address)],
         )
+        for project in projects
+    ]
+
+
+def _serialize_job(
+    project: cvat_service.Project, *, manifest: dict | None, reward_token: str
+) -> service_api.JobResponse:
+    if manifest is not None:
+        manifest = parse_manifest(manifest)
+
+    if project.status == ProjectStatuses.canceled:
+        api_status = service_api.JobStatuses.canceled
+    elif project.status == ProjectStatuses.annotation:
+        api_status = service_api.JobStatuses.active
+    elif project.status in PROJECT_COMPLETED_STATUSES:
+        api_status = service_api.JobStatuses.completed
+    else:
+        raise AssertionError(f"Unexpected project status '{project.status}'")
+
+    bounty = get_assignment_bounty(project, manifest=manifest)
+
+    return service_api.JobResponse(
+        escrow_address=project.escrow_address,
+        chain_id=project.chain_id,
+        job_type=project.job_type,
+        status=api_status,
+        job_description=manifest.annotation.description if manifest else None,
+        reward_amount=bounty,
+        reward_token=reward_token,
+        created_at=project.created_at,
+        updated_at=project.updated_at,
+        qualifications=manifest.annotation.qualifications if manifest else [],
+    )
 
 
 def get_assignment_bounty(
@@ -1,10 +1,17 @@
+import asyncio
+import contextvars
+import threading
 from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Annotated, Any, TypeVar
+from functools import partial
+from typing import Annotated, Any, ParamSpec, TypeVar
 
 import fastapi
 import fastapi.params
 
+from src.core.config import Config
+
 _T = TypeVar("_T")
 
 OptionalQuery = Annotated[_T | None, fastapi.Query()]
@@ -43,3 +50,51 @@ def register_lifespan_context(
 
     router.lifespan_context = wrapped_lifespan
     return app
+
+
+_P = ParamSpec("_P")
+
+_blocking_executor: ThreadPoolExecutor | None = None
+_blocking_executor_lock = threading.Lock()
+
+
+def _get_blocking_executor() -> ThreadPoolExecutor:
+    global _blocking_executor  # noqa: PLW0603
+
+    with _blocking_executor_lock:
+        if _blocking_executor is None:
+            _blocking_executor = ThreadPoolExecutor(
+                max_workers=Config.api_config.max_blocking_workers,
+                thread_name_prefix="api-blocking",
+            )
+
+        return _blocking_executor
+
+
+async def run_blocking(func: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+    """
+    Runs a blocking function (DB session, CVAT API calls etc.) in the bounded
+    thread pool of the API, so that it doesn't stall the other requests on the event loop.
+
+    The function runs in a copy of the current context, so context variables
+    (e.g. the request pagination params) are available inside.
+    """
+
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_blocking_executor(), partial(context.run, func, *args, **kwargs)
+    )
+
+
+@asynccontextmanager
+async def blocking_executor_lifespan(_: fastapi.FastAPI) -> AsyncGenerator[Any, None, None]:
+    global _blocking_executor
+
+    try:
+        yield
+    finally:
+        with _blocking_executor_lock:
+            executor, _blocking_executor = _blocking_executor, None
+
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
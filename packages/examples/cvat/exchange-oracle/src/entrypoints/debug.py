@@ -115,8 +115,21 @@ def _mock_get_manifests_from_minio(logger: Logger) -> Generator[None, None, None
         logger.info(f"DEV: Using local manifest '{manifest_file}' for escrow '{escrow_address}'")
         return escrow
 
+    def patched_get_escrows_by_addresses(
+        chain_id: int, escrow_addresses: list[str]
+    ) -> dict[str, EscrowData]:
+        escrows = {}
+        for escrow_address in escrow_addresses:
+            if escrow := patched_get_escrow(chain_id, escrow_address):
+                escrows[escrow_address.lower()] = escrow
+
+        return escrows
+
     with (
         mock.patch.object(EscrowUtils, "get_escrow", patched_get_escrow),
+        mock.patch.object(
+            EscrowUtils, "get_escrows_by_addresses", patched_get_escrows_by_addresses
+        ),
         mock.patch("src.chain.escrow.get_token_symbol", return_value="HMT"),
         mock.patch("src.chain.web3.get_token_symbol", return_value="HMT"),
         mock.patch(
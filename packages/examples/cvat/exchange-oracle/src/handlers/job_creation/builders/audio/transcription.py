@@ -4,6 +4,7 @@ import csv
 import io
 import uuid
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import timedelta
 from math import ceil
 from pathlib import Path, PurePosixPath
@@ -50,9 +51,10 @@ from src.utils.audio import RegionCut, cut_and_concat, probe_duration
 from src.utils.logging import format_sequence
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from src.core.manifest import ManifestBase
+    from src.services.cloud import StorageClient
 
 
 # --------------------------------------------------------------------------- #
@@ -267,8 +269,8 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
 
         self.spec = parse_audio_manifest(self.manifest)
 
-        self._media_dir: MaybeUnset[Path] = unset
         self._media_paths: MaybeUnset[dict[str, Path]] = unset  # source_filename -> local path
+        self._media_durations: MaybeUnset[dict[str, timedelta]] = unset  # GT media only
         self._regions_by_file: MaybeUnset[dict[str, list[InputRegion]]] = unset
         self._gt_by_file: MaybeUnset[dict[str, list[InputGtRegion]]] = unset
         self._regions_tsv_data: MaybeUnset[bytes] = unset  # raw input regions TSV
@@ -276,6 +278,7 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
         self._ds_regions: MaybeUnset[list[PresentedRegion]] = unset
         self._honeypots: MaybeUnset[list[PresentedRegion]] = unset
         self._assignments: MaybeUnset[list[Clip]] = unset
+        self._clip_cuts: MaybeUnset[dict[str, list[RegionCut]]] = unset  # clip id -> regions
         self._excluded_gt_info: MaybeUnset[ExcludedAnnotationsInfo] = unset
 
         self._meta_serializer = TaskMetaSerializer()
@@ -304,13 +307,45 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
         for filename in sorted(referenced):
             local_path = (media_dir / PurePosixPath(filename)).resolve()
             local_path.relative_to(media_dir)  # guard against path traversal attacks
+            media_paths[filename] = local_path
+
+        def download_media(filename: str) -> None:
+            local_path = media_paths[filename]
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
-            data = media_client.download_file(_bucket_key(media_bucket.path, filename))
-            local_path.write_bytes(data)
-            media_paths[filename] = local_path
+            with local_path.open("wb") as media_file:
+                media_client.download_fileobj(_bucket_key(media_bucket.path, filename), media_file)
+
+        # Each GT media file is probed as soon as it is downloaded,
+        # the durations are only needed to validate the GT regions
+        media_durations: dict[str, Future[timedelta]] = {}
+        with (
+            ThreadPoolExecutor(Config.features.max_data_storage_connections) as download_pool,
+            ThreadPoolExecutor(Config.features.audio_processing_workers) as probe_pool,
+        ):
+            downloads = {
+                download_pool.submit(download_media, filename): filename
+                for filename in sorted(referenced)
+            }
+
+            try:
+                for download in as_completed(downloads):
+                    download.result()
+
+                    filename = downloads[download]
+                    if filename in gt_by_file:
+                        media_durations[filename] = probe_pool.submit(
+                            probe_duration, media_paths[filename]
+                        )
+
+                self._media_durations = {
+                    filename: duration.result() for filename, duration in media_durations.items()
+                }
+            except BaseException:
+                download_pool.shutdown(cancel_futures=True)
+                probe_pool.shutdown(cancel_futures=True)
+                raise
 
-        self._media_dir = media_dir
         self._media_paths = media_paths
         self._regions_by_file = regions_by_file
         self._gt_by_file = gt_by_file
@@ -325,13 +360,13 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
 
     def _build_gt_regions(self) -> None:
         assert self._gt_by_file is not unset
-        assert self._media_paths is not unset
+        assert self._media_durations is not unset
 
         excluded_gt = ExcludedAnnotationsInfo()
         honeypots: list[PresentedRegion] = []
 
         for filename in sorted(self._gt_by_file):
-            file_duration = probe_duration(self._media_paths[filename])
+            file_duration = self._media_durations[filename]
             valid_regions = _validate_gt_regions(
                 self._gt_by_file[filename],
                 filename=filename,
@@ -434,7 +469,6 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
     def _prepare_assignments(self) -> None:
         assert self._ds_regions is not unset
         assert self._honeypots is not unset
-        assert self._media_dir is not unset
         assert self._media_paths is not unset
 
         region_lists = plan_assignments(
@@ -450,43 +484,37 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
                 "No assignments could be formed from the provided regions and ground truth"
             )
 
-        pause = self.spec.details.roi_join_pause
-        pause_ms = round(pause.total_seconds() * 1000)
+        # the clips are cut later, when they are uploaded
         assignments: list[Clip] = []
+        clip_cuts: dict[str, list[RegionCut]] = {}
         for regions in region_lists:
             assignment_id = uuid.uuid4().hex
-            clip_filename = f"{assignment_id}.wav"
-            clip_path = self._media_dir / clip_filename
-
-            cuts = [
-                RegionCut(
-                    media=self._media_paths[r.source_filename],
-                    start=timedelta(seconds=r.start),
-                    stop=timedelta(seconds=r.stop),
-                )
-                for r in regions
-            ]
-            cut_and_concat(
-                cuts, clip_path, pause_ms=pause_ms, sample_rate=self.spec.details.sample_rate
-            )
+            clip_cuts[assignment_id] = [self._make_region_cut(r) for r in regions]
 
-            placed, clip_duration = place_regions(regions, pause=pause)
+            placed, clip_duration = place_regions(regions, pause=self.spec.details.roi_join_pause)
             assignments.append(
                 Clip(
                     id=assignment_id,
-                    clip_filename=clip_filename,
+                    clip_filename=f"{assignment_id}.wav",
                     clip_duration=clip_duration,
                     placed=placed,
                 )
             )
         self._assignments = assignments
+        self._clip_cuts = clip_cuts
+
+    def _make_region_cut(self, region: PresentedRegion) -> RegionCut:
+        return RegionCut(
+            media=self._media_paths[region.source_filename],
+            start=timedelta(seconds=region.start),
+            stop=timedelta(seconds=region.stop),
+        )
 
     # -- persistence ------------------------------------------------------- #
 
     def _upload_clips_and_meta(self) -> None:
         assert self._assignments is not unset
-        assert self._media_dir is not unset
-        assert self._media_paths is not unset
+        assert self._clip_cuts is not unset
         assert self._ds_regions is not unset
         assert self._honeypots is not unset
         assert self._regions_tsv_data is not unset
@@ -494,16 +522,18 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
 
         storage_client = self._make_cloud_storage_client(self._oracle_data_bucket)
 
-        for assignment in self._assignments:
-            clip_path = self._media_dir / assignment.clip_filename
-            storage_client.create_file(
-                compose_data_bucket_filename(
-                    self.escrow_address,
-                    self.chain_id,
+        pause_ms = round(self.spec.details.roi_join_pause.total_seconds() * 1000)
+        self._cut_and_upload(
+            storage_client,
+            [
+                (
                     f"{self._meta_layout.CLIPS_DIR}/{assignment.clip_filename}",
-                ),
-                clip_path.read_bytes(),
-            )
+                    self._clip_cuts[assignment.id],
+                    pause_ms,
+                )
+                for assignment in self._assignments
+            ],
+        )
 
         # copies of the raw inputs, for provenance / downstream scoring
         storage_client.create_file(
@@ -536,9 +566,7 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
         if Config.debug:
             self._upload_roi_cuts(storage_client)
 
-    def _upload_roi_cuts(self, storage_client) -> None:
-        assert self._media_dir is not unset
-        assert self._media_paths is not unset
+    def _upload_roi_cuts(self, storage_client: StorageClient) -> None:
         assert self._ds_regions is not unset
         assert self._honeypots is not unset
 
@@ -546,30 +574,63 @@ class AudioTranscriptionTaskBuilder(TaskBuilderBase):
             (self._meta_layout.DS_CUTS_DIR, self._ds_regions),
             (self._meta_layout.GT_CUTS_DIR, self._honeypots),
         )
+        cuts = []
         for subdir, regions in pairs:
             for i, region in enumerate(regions):
                 stem = PurePosixPath(region.source_filename).stem
                 cut_name = f"{i:04d}_{stem}_{region.start:.2f}-{region.stop:.2f}.wav"
-                cut_path = self._media_dir / cut_name
-                cut_and_concat(
-                    [
-                        RegionCut(
-                            media=self._media_paths[region.source_filename],
-                            start=timedelta(seconds=region.start),
-                            stop=timedelta(seconds=region.stop),
-                        )
-                    ],
-                    cut_path,
-                    pause_ms=0,
-                    sample_rate=self.spec.details.sample_rate,
-                )
-                storage_client.create_file(
-                    compose_data_bucket_filename(
-                        self.escrow_address, self.chain_id, f"{subdir}/{cut_name}"
-                    ),
-                    cut_path.read_bytes(),
+                cuts.append((f"{subdir}/{cut_name}", [self._make_region_cut(region)], 0))
+
+        self._cut_and_upload(storage_client, cuts)
+
+    def _cut_and_upload(
+        self, storage_client: StorageClient, cuts: Sequence[tuple[str, list[RegionCut], int]]
+    ) -> None:
+        """
+        Cuts audio files from the media and uploads them to the escrow data dir.
+        Each cut is (the file name in the dir, the regions to join, the pause between them in ms).
+
+        Up to audio_processing_workers ffmpeg processes run at once,
+        and each file is uploaded as soon as it is cut.
+        """
+
+        sample_rate = self.spec.details.sample_rate
+
+        def cut(regions: list[RegionCut], pause_ms: int, path: Path) -> Path:
+            cut_and_concat(regions, path, pause_ms=pause_ms, sample_rate=sample_rate)
+            return path
+
+        def upload(filename: str, path: Path) -> None:
+            with path.open("rb") as cut_file:
+                storage_client.upload_file(
+                    compose_data_bucket_filename(self.escrow_address, self.chain_id, filename),
+                    cut_file,
                 )
 
+            path.unlink()
+
+        with (
+            TemporaryDirectory() as cuts_dir,
+            ThreadPoolExecutor(Config.features.audio_processing_workers) as cut_pool,
+            ThreadPoolExecutor(Config.features.max_data_storage_connections) as upload_pool,
+        ):
+            cut_results = {
+                cut_pool.submit(cut, regions, pause_ms, Path(cuts_dir, f"{i}.wav")): filename
+                for i, (filename, regions, pause_ms) in enumerate(cuts)
+            }
+
+            try:
+                uploads = [
+                    upload_pool.submit(upload, cut_results[cut_result], cut_result.result())
+                    for cut_result in as_completed(cut_results)
+                ]
+                for upload_result in uploads:
+                    upload_result.result()
+            except BaseException:
+                cut_pool.shutdown(cancel_futures=True)
+                upload_pool.shutdown(cancel_futures=True)
+                raise
+
     # -- CVAT + DB --------------------------------------------------------- #
 
     def _create_on_cvat(self) -> None:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import random
+import threading
 from abc import ABCMeta, abstractmethod
 from contextlib import ExitStack
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from time import sleep
 from typing import TYPE_CHECKING
 
 from datumaro.util import take_by
@@ -13,18 +13,21 @@ from datumaro.util import take_by
 import src.cvat.api_calls as cvat_api
 import src.services.cloud as cloud_service
 from src.core.config import Config
+from src.handlers.job_creation.task_creation import CvatTaskCreator
 from src.services.cloud import CloudProviders, StorageClient
 from src.services.cloud.utils import BucketAccessInfo
 from src.utils.logging import NullLogger
 from src.utils.zip_archive import write_dir_to_zip_archive
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Sequence
     from logging import Logger
 
     import datumaro as dm
+    from cvat_sdk.api_client import models
 
     from src.core.manifest import ManifestBase
+    from src.handlers.job_creation.task_creation import CvatTaskParams
 
 
 class TaskBuilderBase(metaclass=ABCMeta):
@@ -38,6 +41,8 @@ class TaskBuilderBase(metaclass=ABCMeta):
 
         self._oracle_data_bucket = BucketAccessInfo.parse_obj(Config.storage_config)
 
+        self._gt_export_lock = threading.Lock()  # datumaro datasets are not thread-safe
+
     @property
     def _task_segment_size(self) -> int:
         return self.manifest.annotation.job_size
@@ -85,23 +90,17 @@ class TaskBuilderBase(metaclass=ABCMeta):
         # into oracle bucket
         pass
 
-    def _wait_task_creation(self, task_id: int) -> cvat_api.RequestStatus:
+    def _create_cvat_tasks(self, tasks: Sequence[CvatTaskParams]) -> list[models.TaskRead]:
         # TODO: add a timeout or
         # save gt datasets in the oracle bucket and upload in track_task_creation()
-        while True:
-            task_status, _ = cvat_api.get_task_upload_status(task_id)
-            if task_status not in [cvat_api.RequestStatus.STARTED, cvat_api.RequestStatus.QUEUED]:
-                return task_status
-
-            sleep(Config.cvat_config.task_creation_check_interval)
+        # The tasks with failed data uploads are handled in
+        # state_trackers.py::track_task_creation
+        return CvatTaskCreator(self.logger).create(tasks)
 
     def _setup_gt_job_for_cvat_task(
         self, task_id: int, gt_dataset: dm.Dataset, *, dm_export_format: str = "coco"
     ) -> None:
-        task_status = self._wait_task_creation(task_id)
-        if task_status != cvat_api.RequestStatus.FINISHED:
-            return  # will be handled in state_trackers.py::track_task_creation
-
+        # Can be called from several threads at once, for different tasks
         dm_format_to_cvat_format = {
             "coco": "COCO 1.0",
             "cvat": "CVAT 1.1",
@@ -110,7 +109,10 @@ class TaskBuilderBase(metaclass=ABCMeta):
 
         with TemporaryDirectory() as tmp_dir:
             export_dir = Path(tmp_dir) / "export"
-            gt_dataset.export(save_dir=str(export_dir), save_media=False, format=dm_export_format)
+            with self._gt_export_lock:
+                gt_dataset.export(
+                    save_dir=str(export_dir), save_media=False, format=dm_export_format
+                )
 
             annotations_archive_path = Path(tmp_dir) / "annotations.zip"
             with annotations_archive_path.open("wb") as annotations_archive:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import math
 import os
 from abc import abstractmethod
+from functools import partial
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 
@@ -31,6 +32,7 @@ from src.handlers.job_creation.exceptions import (
     DatasetValidationError,
     TooFewSamples,
 )
+from src.handlers.job_creation.task_creation import CvatTaskParams
 from src.handlers.job_creation.utils import (
     MaybeUnset,
     filter_image_files,
@@ -169,33 +171,46 @@ class SimpleTaskBuilder(TaskBuilderBase):
             db_service.get_project_by_id(session, project_id, for_update=True)  # lock the row
             db_service.add_project_images(session, cvat_project.id, data_filenames)
 
-            for data_subset in self._split_dataset_per_task(
-                data_to_be_annotated,
-                subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
-            ):
-                cvat_task = cvat_api.create_task(
-                    cvat_project.id, escrow_address, segment_size=segment_size
-                )
+            def setup_task(task_id: int) -> None:
+                self._setup_gt_job_for_cvat_task(task_id, gt_dataset)
+                self._setup_quality_settings(task_id)
+
+            cvat_tasks = self._create_cvat_tasks(
+                [
+                    CvatTaskParams(
+                        create=partial(
+                            cvat_api.create_task,
+                            cvat_project.id,
+                            escrow_address,
+                            segment_size=segment_size,
+                        ),
+                        # The task is fully created once 'update:task' webhook is received.
+                        upload=partial(
+                            cvat_api.put_task_data,
+                            cloudstorage_id=cloud_storage.id,
+                            filenames=data_subset,
+                            validation_params={
+                                # include whole GT dataset into each task
+                                "gt_filenames": gt_filenames,
+                                "gt_frames_per_job_count": self._job_val_frames_count,
+                            },
+                        ),
+                        setup=setup_task,
+                    )
+                    for data_subset in self._split_dataset_per_task(
+                        data_to_be_annotated,
+                        subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
+                    )
+                ]
+            )
+
+            for cvat_task in cvat_tasks:
                 task_id = db_service.create_task(
                     session, cvat_task.id, cvat_project.id, TaskStatuses[cvat_task.status]
                 )
                 db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
-
-                # The task is fully created once 'update:task' webhook is received.
-                cvat_api.put_task_data(
-                    cvat_task.id,
-                    cloud_storage.id,
-                    filenames=data_subset,
-                    validation_params={
-                        "gt_filenames": gt_filenames,  # include whole GT dataset into each task
-                        "gt_frames_per_job_count": self._job_val_frames_count,
-                    },
-                )
-
-                self._setup_gt_job_for_cvat_task(cvat_task.id, gt_dataset)
-                self._setup_quality_settings(cvat_task.id)
-
                 db_service.create_data_upload(session, cvat_task.id)
+
             db_service.touch(session, Project, [project_id])
 
 
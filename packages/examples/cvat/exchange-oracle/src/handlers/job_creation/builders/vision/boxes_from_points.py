@@ -3,12 +3,11 @@ from __future__ import annotations
 import math
 import os
 import uuid
-from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from itertools import groupby
 from math import ceil
 from pathlib import Path
-from queue import Queue
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, cast
 
@@ -30,10 +29,10 @@ from src.models.cvat import Project
 from src.services.cloud.utils import BucketAccessInfo
 from src.utils.annotations import ProjectLabels, is_point_in_bbox
 from src.utils.logging import format_sequence
-from src.utils.roi_uploader import BufferedRoiImageUploader
+from src.utils.roi_uploader import RoiImageUploadPipeline
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from src.core.manifest.v1 import JobManifest
 
@@ -48,6 +47,7 @@ from src.handlers.job_creation.exceptions import (
     MismatchingAnnotations,
     TooFewSamples,
 )
+from src.handlers.job_creation.task_creation import CvatTaskParams
 from src.handlers.job_creation.utils import (
     MaybeUnset,
     filter_image_files,
@@ -929,10 +929,11 @@ class BoxesFromPointsTaskBuilder(TaskBuilderBase):
             for image_id, g in groupby(sorted(self._rois, key=_roi_key), key=_roi_key)
         }
 
-        def process_file(filename: str, image_pixels: np.ndarray):
-            image_roi_infos = rois_by_image.get(filename, [])
-            if not image_roi_infos:
-                return
+        def download_image(filename: str) -> bytes:
+            return src_client.download_file(os.path.join(src_prefix, filename))
+
+        def extract_rois(filename: str, image_bytes: bytes) -> Iterator[tuple[str, bytes]]:
+            image_pixels = decode_image(image_bytes)
 
             sample = filename_to_sample[filename]
             if tuple(sample.image.size) != tuple(image_pixels.shape[:2]):
@@ -943,8 +944,7 @@ class BoxesFromPointsTaskBuilder(TaskBuilderBase):
                     f"Sample '{filename}': invalid size provided in the point annotations"
                 )
 
-            image_rois = {}
-            for roi_info in image_roi_infos:
+            for roi_info in rois_by_image[filename]:
                 roi_pixels = self._extract_roi(image_pixels, roi_info)
 
                 if self.config.embed_point_in_roi_image:
@@ -953,41 +953,26 @@ class BoxesFromPointsTaskBuilder(TaskBuilderBase):
                 roi_filename = self._roi_filenames[roi_info.point_id]
                 roi_bytes = encode_image(roi_pixels, os.path.splitext(roi_filename)[-1])
 
-                image_rois[roi_filename] = roi_bytes
-
-            for roi_filename, roi_bytes in image_rois.items():
-                dst_client.create_file(
+                yield (
                     compose_data_bucket_filename(self.escrow_address, self.chain_id, roi_filename),
                     roi_bytes,
                 )
 
-        def download_and_decode(key: str):
-            image_bytes = src_client.download_file(key)
-            return decode_image(image_bytes)
-
-        pool_size = Config.features.max_data_storage_connections
-        download_queue_size = 4 * pool_size
-        download_queue = Queue[tuple[str, Future[np.ndarray]]](download_queue_size)
-        roi_uploader = BufferedRoiImageUploader(queue=download_queue)
-        with ThreadPoolExecutor(pool_size) as pool:
-
-            def put_callback(filename: str):
-                image_roi_infos = rois_by_image.get(filename, [])
-                if not image_roi_infos:
-                    return None
-
-                return (
-                    filename,
-                    pool.submit(download_and_decode, os.path.join(src_prefix, filename)),
-                )
-
-            def process_callback(result: tuple[str, Future]):
-                filename, task = result
-                process_file(filename, task.result())
+        def upload_roi(key: str, roi_bytes: bytes) -> None:
+            dst_client.create_file(key, roi_bytes)
+
+        storage_connections = Config.features.max_data_storage_connections
+        roi_uploader = RoiImageUploadPipeline(
+            download=download_image,
+            process=extract_rois,
+            upload=upload_roi,
+            download_workers=storage_connections,
+            process_workers=Config.features.roi_processing_workers,
+            upload_workers=storage_connections,
+        )
+        roi_uploader.run(filename for filename in self._data_filenames if filename in rois_by_image)
 
-            roi_uploader.process_all(
-                self._data_filenames, put_callback=put_callback, process_callback=process_callback
-            )
+        self.logger.info(f"RoI images uploaded: {roi_uploader.format_stats()}")
 
     def _prepare_gt_roi_dataset(self):
         self._gt_roi_dataset = dm.Dataset(
@@ -1089,43 +1074,52 @@ class BoxesFromPointsTaskBuilder(TaskBuilderBase):
                 ],
             )
 
-            for data_subset in self._split_dataset_per_task(
-                self._roi_filenames_to_be_annotated,
-                subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
-            ):
-                cvat_task = cvat_api.create_task(
-                    cvat_project.id, self.escrow_address, segment_size=segment_size
-                )
+            gt_filenames = [
+                compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
+                for fn in self._gt_roi_filenames
+            ]
 
-                task_id = db_service.create_task(
-                    session, cvat_task.id, cvat_project.id, TaskStatuses[cvat_task.status]
+            def setup_task(task_id: int) -> None:
+                self._setup_gt_job_for_cvat_task(
+                    task_id, self._gt_roi_dataset, dm_export_format="coco"
                 )
-                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
+                self._setup_quality_settings(task_id)
 
-                filenames = [
-                    compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
-                    for fn in data_subset
-                ]
-                gt_filenames = [
-                    compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
-                    for fn in self._gt_roi_filenames
+            cvat_tasks = self._create_cvat_tasks(
+                [
+                    CvatTaskParams(
+                        create=partial(
+                            cvat_api.create_task,
+                            cvat_project.id,
+                            self.escrow_address,
+                            segment_size=segment_size,
+                        ),
+                        upload=partial(
+                            cvat_api.put_task_data,
+                            cloudstorage_id=cvat_cloud_storage.id,
+                            filenames=[
+                                compose_data_bucket_filename(self.escrow_address, self.chain_id, fn)
+                                for fn in data_subset
+                            ],
+                            validation_params={
+                                "gt_filenames": gt_filenames,
+                                "gt_frames_per_job_count": self._job_val_frames_count,
+                            },
+                        ),
+                        setup=setup_task,
+                    )
+                    for data_subset in self._split_dataset_per_task(
+                        self._roi_filenames_to_be_annotated,
+                        subset_size=Config.cvat_config.max_jobs_per_task * segment_size,
+                    )
                 ]
+            )
 
-                cvat_api.put_task_data(
-                    cvat_task.id,
-                    cvat_cloud_storage.id,
-                    filenames=filenames,
-                    validation_params={
-                        "gt_filenames": gt_filenames,
-                        "gt_frames_per_job_count": self._job_val_frames_count,
-                    },
-                )
-
-                self._setup_gt_job_for_cvat_task(
-                    cvat_task.id, self._gt_roi_dataset, dm_export_format="coco"
+            for cvat_task in cvat_tasks:
+                task_id = db_service.create_task(
+                    session, cvat_task.id, cvat_project.id, TaskStatuses[cvat_task.status]
                 )
-                self._setup_quality_settings(cvat_task.id)
-
+                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
                 db_service.create_data_upload(session, cvat_task.id)
 
             db_service.touch(session, Project, [project_id])
@@ -4,11 +4,10 @@ import math
 import os
 import random
 import uuid
-from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from itertools import chain, groupby
 from math import ceil
-from queue import Queue
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 
@@ -30,10 +29,10 @@ from src.models.cvat import Project
 from src.services.cloud.utils import BucketAccessInfo
 from src.utils.annotations import InstanceSegmentsToBbox, ProjectLabels, is_point_in_bbox
 from src.utils.logging import format_sequence
-from src.utils.roi_uploader import BufferedRoiImageUploader
+from src.utils.roi_uploader import RoiImageUploadPipeline
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
 
     from src.core.manifest.v1 import JobManifest
@@ -48,6 +47,7 @@ from src.handlers.job_creation.exceptions import (
     MismatchingAnnotations,
     TooFewSamples,
 )
+from src.handlers.job_creation.task_creation import CvatTaskParams
 from src.handlers.job_creation.utils import (
     MaybeUnset,
     filter_image_files,
@@ -1101,10 +1101,11 @@ class SkeletonsFromBoxesTaskBuilder(TaskBuilderBase):
             if isinstance(bbox, dm.Bbox)
         }
 
-        def process_file(filename: str, image_pixels: np.ndarray):
-            image_roi_infos = roi_info_by_image.get(filename, [])
-            if not image_roi_infos:
-                return
+        def download_image(filename: str) -> bytes:
+            return src_client.download_file(os.path.join(src_prefix, filename))
+
+        def extract_rois(filename: str, image_bytes: bytes) -> Iterator[tuple[str, bytes]]:
+            image_pixels = decode_image(image_bytes)
 
             sample = filename_to_sample[filename]
             if tuple(sample.image.size) != tuple(image_pixels.shape[:2]):
@@ -1115,7 +1116,7 @@ class SkeletonsFromBoxesTaskBuilder(TaskBuilderBase):
                     f"Sample '{filename}': invalid size provided in the point annotations"
                 )
 
-            for roi_info in image_roi_infos:
+            for roi_info in roi_info_by_image[filename]:
                 roi_pixels = self._extract_roi(image_pixels, roi_info)
 
                 if self.config.embed_bbox_in_roi_image:
@@ -1124,41 +1125,31 @@ class SkeletonsFromBoxesTaskBuilder(TaskBuilderBase):
                         roi_pixels, (roi_info.point_x, roi_info.point_y)
                     )
 
-                filename = self._roi_filenames[roi_info.bbox_id]
-                roi_bytes = encode_image(roi_pixels, os.path.splitext(filename)[-1])
-
-                dst_client.create_file(
-                    compose_data_bucket_filename(self.escrow_address, self.chain_id, filename),
-                    data=roi_bytes,
-                )
-
-        def download_and_decode(key: str):
-            image_bytes = src_client.download_file(key)
-            return decode_image(image_bytes)
-
-        pool_size = Config.features.max_data_storage_connections
-        download_queue_size = 4 * pool_size
-        download_queue = Queue[tuple[str, Future[np.ndarray]]](download_queue_size)
-        roi_uploader = BufferedRoiImageUploader(queue=download_queue)
-        with ThreadPoolExecutor(pool_size) as pool:
-
-            def put_callback(filename: str):
-                image_roi_infos = roi_info_by_image.get(filename, [])
-                if not image_roi_infos:
-                    return None
+                roi_filename = self._roi_filenames[roi_info.bbox_id]
+                roi_bytes = encode_image(roi_pixels, os.path.splitext(roi_filename)[-1])
 
-                return (
-                    filename,
-                    pool.submit(download_and_decode, os.path.join(src_prefix, filename)),
+                yield (
+                    compose_data_bucket_filename(self.escrow_address, self.chain_id, roi_filename),
+                    roi_bytes,
                 )
 
-            def process_callback(result: tuple[str, Future]):
-                filename, task = result
-                process_file(filename, task.result())
+        def upload_roi(key: str, roi_bytes: bytes) -> None:
+            dst_client.create_file(key, data=roi_bytes)
+
+        storage_connections = Config.features.max_data_storage_connections
+        roi_uploader = RoiImageUploadPipeline(
+            download=download_image,
+            process=extract_rois,
+            upload=upload_roi,
+            download_workers=storage_connections,
+            process_workers=Config.features.roi_processing_workers,
+            upload_workers=storage_connections,
+        )
+        roi_uploader.run(
+            filename for filename in self._data_filenames if filename in roi_info_by_image
+        )
 
-            roi_uploader.process_all(
-                self._data_filenames, put_callback=put_callback, process_callback=process_callback
-            )
+        self.logger.info(f"RoI images uploaded: {roi_uploader.format_stats()}")
 
     def _prepare_gt_dataset_for_skeleton_point(
         self,
@@ -1283,6 +1274,8 @@ class SkeletonsFromBoxesTaskBuilder(TaskBuilderBase):
                 total_jobs=total_jobs,
             )
             created_projects = []
+            task_params: list[CvatTaskParams] = []
+            task_project_ids: list[int] = []
 
             for skeleton_label_id, skeleton_label_tasks in tasks_by_skeleton_label.items():
                 skeleton_label_filenames: list[list[str]] = []
@@ -1355,47 +1348,53 @@ class SkeletonsFromBoxesTaskBuilder(TaskBuilderBase):
                         list(set(chain.from_iterable(skeleton_label_filenames))),
                     )
 
+                    gt_point_dataset = self._prepare_gt_dataset_for_skeleton_point(
+                        point_label_name=point_label_name,
+                        skeleton_label_id=skeleton_label_id,
+                    )
+
                     for point_label_filenames, gt_point_label_filenames in zip(
                         skeleton_label_filenames, gt_skeleton_label_filenames, strict=False
                     ):
-                        cvat_task = cvat_api.create_task(
-                            cvat_project.id,
-                            name=cvat_project.name,
-                            segment_size=segment_size,
-                        )
-
-                        task_id = db_service.create_task(
-                            session, cvat_task.id, cvat_project.id, TaskStatuses[cvat_task.status]
-                        )
-                        db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
-
-                        # The task is fully created once 'update:task' webhook is received.
-                        cvat_api.put_task_data(
-                            cvat_task.id,
-                            cvat_cloud_storage.id,
-                            filenames=point_label_filenames + gt_point_label_filenames,
-                            validation_params={
-                                "gt_filenames": gt_point_label_filenames,
-                                "gt_frames_per_job_count": self._job_val_frames_count,
-                            },
-                        )
-
-                        gt_point_dataset = self._prepare_gt_dataset_for_skeleton_point(
-                            point_label_name=point_label_name,
-                            skeleton_label_id=skeleton_label_id,
+                        task_params.append(
+                            CvatTaskParams(
+                                create=partial(
+                                    cvat_api.create_task,
+                                    cvat_project.id,
+                                    name=cvat_project.name,
+                                    segment_size=segment_size,
+                                ),
+                                # The task is fully created once 'update:task' webhook is received.
+                                upload=partial(
+                                    cvat_api.put_task_data,
+                                    cloudstorage_id=cvat_cloud_storage.id,
+                                    filenames=point_label_filenames + gt_point_label_filenames,
+                                    validation_params={
+                                        "gt_filenames": gt_point_label_filenames,
+                                        "gt_frames_per_job_count": self._job_val_frames_count,
+                                    },
+                                ),
+                                setup=partial(self._setup_cvat_task, gt_dataset=gt_point_dataset),
+                            )
                         )
+                        task_project_ids.append(cvat_project.id)
 
-                        self._setup_gt_job_for_cvat_task(
-                            cvat_task.id, gt_point_dataset, dm_export_format="cvat"
-                        )
-                        self._setup_quality_settings(
-                            cvat_task.id, oks_sigma=Config.cvat_config.oks_sigma
-                        )
+            # The tasks of all the projects are created together
+            cvat_tasks = self._create_cvat_tasks(task_params)
 
-                        db_service.create_data_upload(session, cvat_task.id)
+            for cvat_task, cvat_project_id in zip(cvat_tasks, task_project_ids, strict=True):
+                task_id = db_service.create_task(
+                    session, cvat_task.id, cvat_project_id, TaskStatuses[cvat_task.status]
+                )
+                db_service.get_task_by_id(session, task_id, for_update=True)  # lock the row
+                db_service.create_data_upload(session, cvat_task.id)
 
             db_service.touch(session, Project, created_projects)
 
+    def _setup_cvat_task(self, task_id: int, *, gt_dataset: dm.Dataset) -> None:
+        self._setup_gt_job_for_cvat_task(task_id, gt_dataset, dm_export_format="cvat")
+        self._setup_quality_settings(task_id, oks_sigma=Config.cvat_config.oks_sigma)
+
     def build(self):
         self._download_input_data()
         self._parse_gt()
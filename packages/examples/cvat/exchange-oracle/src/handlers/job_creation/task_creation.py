@@ -0,0 +1,180 @@
+"""CVAT task creation for the escrow creation flow."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import src.cvat.api_calls as cvat_api
+from src.core.config import Config
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Callable, Sequence
+
+    from cvat_sdk.api_client import models
+
+
+@dataclass
+class CvatTaskParams:
+    create: Callable[[], models.TaskRead]
+    "Creates the CVAT task"
+
+    upload: Callable[[int], Any]
+    "Starts the data upload for the task with the given id"
+
+    setup: Callable[[int], Any]
+    "Configures the task with the given id after its data is uploaded"
+
+
+@dataclass
+class _TaskCreation:
+    params: CvatTaskParams
+    task: models.TaskRead | None = None
+
+
+@dataclass
+class _CreationState:
+    waiting: deque[_TaskCreation]
+    "Tasks to be created"
+
+    uploads: dict[Future, _TaskCreation] = field(default_factory=dict)
+    "Tasks being created, with the data upload being requested"
+
+    checked: list[_TaskCreation] = field(default_factory=list)
+    "Tasks with the data being uploaded in CVAT"
+
+    setups: dict[Future, _TaskCreation] = field(default_factory=dict)
+    "Tasks with the data uploaded, being configured"
+
+    @property
+    def active_count(self) -> int:
+        return len(self.uploads) + len(self.checked) + len(self.setups)
+
+
+class CvatTaskCreator:
+    """
+    Creates many CVAT tasks, keeping up to max_active tasks in creation at once.
+
+    The tasks are created and their data uploads are requested without waiting for
+    the previous ones to be finished, and the upload status of all the tasks in progress is
+    checked together in rounds, each check_interval seconds. Once the data of a task is uploaded,
+    the task is configured with the setup callback in the background. The tasks whose upload
+    has failed are not configured, they are handled in track_task_creation().
+
+    If anything fails, the tasks created so far are removed from CVAT and the error is raised.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        max_active: int | None = None,
+        check_interval: float | None = None,
+    ) -> None:
+        self.logger = logger
+        self.max_active = max_active or Config.cvat_config.max_active_task_creations
+        self.check_interval = (
+            check_interval
+            if check_interval is not None
+            else Config.cvat_config.task_creation_check_interval
+        )
+
+    @staticmethod
+    def _submit(pool: ThreadPoolExecutor, func: Callable, *args) -> Future:
+        return pool.submit(copy_context().run, func, *args)
+
+    @staticmethod
+    def _create_task(creation: _TaskCreation) -> None:
+        creation.task = creation.params.create()
+        creation.params.upload(creation.task.id)
+
+    def _start_creations(self, state: _CreationState, pool: ThreadPoolExecutor) -> None:
+        while state.waiting and state.active_count < self.max_active:
+            creation = state.waiting.popleft()
+            state.uploads[self._submit(pool, self._create_task, creation)] = creation
+
+    def _collect_uploads(self, state: _CreationState) -> None:
+        for upload in [upload for upload in state.uploads if upload.done()]:
+            creation = state.uploads.pop(upload)
+            upload.result()
+            state.checked.append(creation)
+
+    def _check_uploads(self, state: _CreationState, pool: ThreadPoolExecutor) -> None:
+        checked = state.checked
+        state.checked = []
+
+        statuses = [
+            self._submit(pool, cvat_api.get_task_upload_status, creation.task.id)
+            for creation in checked
+        ]
+        for creation, status_check in zip(checked, statuses, strict=True):
+            status, reason = status_check.result()
+            if status in [cvat_api.RequestStatus.STARTED, cvat_api.RequestStatus.QUEUED]:
+                state.checked.append(creation)
+            elif status == cvat_api.RequestStatus.FINISHED:
+                setup = self._submit(pool, creation.params.setup, creation.task.id)
+                state.setups[setup] = creation
+            else:
+                self.logger.warning(
+                    f"Failed to upload the data for CVAT task {creation.task.id}: {reason}"
+                )
+
+    def _collect_setups(self, state: _CreationState) -> None:
+        for setup in [setup for setup in state.setups if setup.done()]:
+            state.setups.pop(setup)
+            setup.result()
+
+    def _remove_created_tasks(self, creations: Sequence[_TaskCreation]) -> None:
+        for creation in creations:
+            if not creation.task:
+                continue
+
+            try:
+                cvat_api.delete_task(creation.task.id)
+            except Exception:
+                self.logger.exception(f"Failed to remove CVAT task {creation.task.id}")
+
+    def create(self, tasks: Sequence[CvatTaskParams]) -> list[models.TaskRead]:
+        """
+        Returns the created CVAT tasks, in the order of the input parameters.
+        """
+
+        creations = [_TaskCreation(params) for params in tasks]
+        state = _CreationState(waiting=deque(creations))
+        next_check = time.monotonic()
+
+        with cvat_api.api_client_context(cvat_api.get_api_client()):
+            pool = ThreadPoolExecutor(self.max_active)
+            try:
+                while state.waiting or state.active_count:
+                    self._start_creations(state, pool)
+
+                    self._collect_uploads(state)
+                    if state.checked and next_check <= time.monotonic():
+                        self._check_uploads(state, pool)
+                        next_check = time.monotonic() + self.check_interval
+
+                    self._collect_setups(state)
+
+                    in_progress = [*state.uploads, *state.setups]
+                    if state.checked:
+                        timeout = max(0, next_check - time.monotonic())
+                        if in_progress:
+                            wait(in_progress, timeout=timeout, return_when=FIRST_COMPLETED)
+                        else:
+                            time.sleep(timeout)
+                    elif in_progress:
+                        wait(in_progress, return_when=FIRST_COMPLETED)
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                self._remove_created_tasks(creations)
+                raise
+            finally:
+                pool.shutdown()
+
+        return [creation.task for creation in creations]
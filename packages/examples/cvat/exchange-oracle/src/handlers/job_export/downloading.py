@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
 from functools import partial
-from typing import TYPE_CHECKING
-
-from datumaro.util import take_by
+from typing import TYPE_CHECKING, Any
 
 import src.cvat.api_calls as cvat_api
-from src.core.config import CronConfig
+from src.core.config import Config, CronConfig
 from src.handlers.job_export.results import FileDescriptor
 
 if TYPE_CHECKING:
     import io
     import logging
     from collections.abc import Callable, Sequence
-    from typing import Any
 
     from src.models.cvat import Job
 
@@ -72,46 +74,203 @@ def download_project_annotations(
     )
 
 
+@dataclass
+class _JobExport:
+    job: Job
+    request_id: str | None = None
+    requested_at: float = 0
+    attempt: int = 0
+
+
+@dataclass
+class _DownloadState:
+    waiting: deque[_JobExport]
+    "Exports to be requested"
+
+    checked: list[_JobExport] = field(default_factory=list)
+    "Exports in progress in CVAT"
+
+    downloads: dict[Future, _JobExport] = field(default_factory=dict)
+    "Finished exports being downloaded"
+
+    results: dict[int, io.RawIOBase] = field(default_factory=dict)
+
+
+class JobAnnotationsDownloader:
+    """
+    Downloads the annotations of many jobs, keeping up to max_active job exports in progress.
+
+    The exports are requested without waiting for the previous ones to be downloaded, and
+    all the exports in progress are checked together in rounds. The interval between the rounds
+    starts at min_check_interval, grows up to max_check_interval while no export is finished
+    and is reset when one is. The finished exports are downloaded in the background,
+    to memory or temporary files (see CVAT_EXPORT_MAX_MEMORY_SIZE).
+
+    As in download_with_retries(), the exports failed with a server error are requested again.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        annotation_format: str,
+        *,
+        max_active: int | None = None,
+        max_attempts: int | None = None,
+        min_check_interval: float = 0.5,
+        max_check_interval: float = 5,
+        timeout: float | None = None,
+    ) -> None:
+        self.logger = logger
+        self.annotation_format = annotation_format
+        self.max_active = (
+            max_active or CronConfig.track_completed_escrows_jobs_downloading_batch_size
+        )
+        self.max_attempts = (
+            max_attempts or CronConfig.track_completed_escrows_max_downloading_retries
+        )
+        self.min_check_interval = min_check_interval
+        self.max_check_interval = max_check_interval
+        self.timeout = timeout if timeout is not None else Config.cvat_config.export_timeout
+
+    def _request_export(self, export: _JobExport) -> None:
+        export.request_id = cvat_api.request_job_annotations(
+            export.job.cvat_id, format_name=self.annotation_format
+        )
+        export.requested_at = time.monotonic()
+
+    def _should_retry(self, export: _JobExport, error: Exception) -> bool:
+        if not (
+            isinstance(error, cvat_api.exceptions.ApiException)
+            and 500 <= error.status < 600
+            and export.attempt + 1 < self.max_attempts
+        ):
+            return False
+
+        export.attempt += 1
+        self.logger.info(
+            f"Retrying downloading of job {export.job.cvat_id}, "
+            f"attempt #{export.attempt} of {self.max_attempts}..."
+        )
+        return True
+
+    @staticmethod
+    def _run_all(
+        pool: ThreadPoolExecutor, func: Callable[[_JobExport], Any], exports: Sequence[_JobExport]
+    ) -> list[tuple[Any, Exception | None]]:
+        futures = [pool.submit(copy_context().run, func, export) for export in exports]
+
+        results = []
+        for future in futures:
+            try:
+                results.append((future.result(), None))
+            except Exception as e:  # noqa: BLE001
+                results.append((None, e))
+
+        return results
+
+    def _start_exports(self, state: _DownloadState, pool: ThreadPoolExecutor) -> None:
+        free_slots = self.max_active - len(state.checked) - len(state.downloads)
+        started = [state.waiting.popleft() for _ in range(min(len(state.waiting), free_slots))]
+
+        for _, error in self._run_all(pool, self._request_export, started):
+            if error:
+                raise error
+
+        state.checked.extend(started)
+
+    def _check_exports(self, state: _DownloadState, pool: ThreadPoolExecutor) -> bool:
+        has_progress = False
+
+        checked = state.checked
+        state.checked = []
+        statuses = self._run_all(pool, lambda e: cvat_api.is_export_finished(e.request_id), checked)
+        for export, (is_finished, error) in zip(checked, statuses, strict=True):
+            if error:
+                if not self._should_retry(export, error):
+                    raise error
+
+                state.waiting.appendleft(export)
+            elif is_finished:
+                download = pool.submit(
+                    copy_context().run, cvat_api.get_job_annotations, request_id=export.request_id
+                )
+                state.downloads[download] = export
+                has_progress = True
+            elif self.timeout < time.monotonic() - export.requested_at:
+                raise Exception(
+                    f"Failed to retrieve the annotations of job {export.job.cvat_id} "
+                    "from CVAT within the timeout interval"
+                )
+            else:
+                state.checked.append(export)
+
+        return has_progress
+
+    def _collect_downloads(self, state: _DownloadState) -> bool:
+        finished = [download for download in state.downloads if download.done()]
+        for download in finished:
+            export = state.downloads.pop(download)
+            if error := download.exception():
+                if not self._should_retry(export, error):
+                    raise error
+
+                state.waiting.appendleft(export)
+            else:
+                state.results[export.job.cvat_id] = download.result()
+
+        return bool(finished)
+
+    def download(self, jobs: Sequence[Job]) -> dict[int, io.RawIOBase]:
+        """
+        Returns the annotation files by job CVAT id.
+        """
+
+        state = _DownloadState(waiting=deque(_JobExport(job) for job in jobs))
+        interval = self.min_check_interval
+
+        with (
+            cvat_api.api_client_context(cvat_api.get_api_client()),
+            ThreadPoolExecutor(self.max_active) as pool,
+        ):
+            while state.waiting or state.checked or state.downloads:
+                self._start_exports(state, pool)
+
+                has_progress = self._check_exports(state, pool)
+                has_progress = self._collect_downloads(state) or has_progress
+                if has_progress:
+                    interval = self.min_check_interval
+                else:
+                    interval = min(interval * 2, self.max_check_interval)
+
+                if state.checked and state.downloads:
+                    wait(state.downloads, timeout=interval, return_when=FIRST_COMPLETED)
+                elif state.checked:
+                    time.sleep(interval)
+                elif state.downloads:
+                    wait(state.downloads, return_when=FIRST_COMPLETED)
+
+        return state.results
+
+
 def download_job_annotations(
     logger: logging.Logger, annotation_format: str, jobs: Sequence[Job]
 ) -> dict[int, FileDescriptor]:
     # Collect raw annotations from CVAT, validate and convert them
     # into a recording oracle suitable format
-    job_annotations: dict[int, FileDescriptor] = {}
-
-    export_ids: list[tuple[Job, str]] = []
+    annotation_files = JobAnnotationsDownloader(logger, annotation_format).download(jobs)
 
-    def _request_export(job: Job):
-        request_id = cvat_api.request_job_annotations(job.cvat_id, format_name=annotation_format)
-        export_ids.append((job, request_id))
-        return request_id
-
-    for jobs_batch in take_by(
-        jobs, count=CronConfig.track_completed_escrows_jobs_downloading_batch_size
-    ):
-        # Request jobs before downloading for faster batch downloading
-        for job in jobs_batch:
-            _request_export(job)
-
-        while export_ids:
-            (job, request_id) = export_ids.pop(0)
-
-            job_annotations_file = download_with_retries(
-                logger,
-                download_callback=partial(cvat_api.get_job_annotations, request_id=request_id),
-                retry_callback=partial(_request_export, job),
-            )
-
-            job_assignment = job.latest_assignment
-            job_annotations[job.cvat_id] = FileDescriptor(
-                filename="project_{}-task_{}-job_{}-user_{}-assignment_{}.zip".format(
-                    job.cvat_project_id,
-                    job.cvat_task_id,
-                    job.cvat_id,
-                    job_assignment.user.cvat_id,
-                    job_assignment.id,
-                ),
-                file=job_annotations_file,
-            )
+    job_annotations: dict[int, FileDescriptor] = {}
+    for job in jobs:
+        job_assignment = job.latest_assignment
+        job_annotations[job.cvat_id] = FileDescriptor(
+            filename="project_{}-task_{}-job_{}-user_{}-assignment_{}.zip".format(
+                job.cvat_project_id,
+                job.cvat_task_id,
+                job.cvat_id,
+                job_assignment.user.cvat_id,
+                job_assignment.id,
+            ),
+            file=annotation_files[job.cvat_id],
+        )
 
     return job_annotations
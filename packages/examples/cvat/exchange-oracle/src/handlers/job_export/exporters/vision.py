@@ -9,10 +9,14 @@ only the parts that differ.
 from __future__ import annotations
 
 import io
+import multiprocessing
 import os
+import shutil
 import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import datumaro as dm
 
@@ -41,6 +45,7 @@ if TYPE_CHECKING:
 
     from datumaro.components.dataset import Dataset
 
+    from src.core.manifest import ManifestBase
     from src.models.cvat import Image
 
 CVAT_EXPORT_FORMAT_MAPPING = {
@@ -62,6 +67,9 @@ class ImageJobExporter(JobExporter):
     """Base image exporter: download the single project + per-job annotations, run the datumaro
     conversion pipeline, upload the results, and notify the recording oracle."""
 
+    _convert_jobs_in_workers: ClassVar[bool] = True
+    "Job annotations are converted independently of each other, so they can use worker processes"
+
     def export(self) -> None:
         escrow_address = self.escrow_address
         chain_id = self.chain_id
@@ -161,30 +169,85 @@ class ImageJobExporter(JobExporter):
         self._run_pipeline(annotations)
 
     def _run_pipeline(self, annotations: Sequence[FileDescriptor]) -> None:
-        with TemporaryDirectory() as tempdir:
-            for ann_descriptor in annotations:
-                if not zipfile.is_zipfile(ann_descriptor.file):
-                    raise ValueError("Annotation files must be zip files")
-                ann_descriptor.file.seek(0)
+        # The converted archives are kept on disk until the exporter is closed
+        output_dir = self.exit_stack.enter_context(TemporaryDirectory())
 
-                extract_dir = os.path.join(
-                    tempdir,
-                    os.path.splitext(os.path.basename(ann_descriptor.filename))[0],
-                )
-                extract_zip_archive(ann_descriptor.file, extract_dir)
+        job_files_count = sum(1 for fd in annotations if not self._is_merged_dataset(fd))
+        workers = min(Config.features.annotation_conversion_workers, job_files_count)
+
+        with TemporaryDirectory() as tempdir, ExitStack() as es:
+            pool = None
+            if self._convert_jobs_in_workers and workers > 1:
+                pool = es.enter_context(self._make_conversion_pool(workers))
 
-                export_dir = os.path.join(
-                    tempdir,
-                    os.path.splitext(os.path.basename(ann_descriptor.filename))[0] + "_conv",
+            conversions: list[tuple[FileDescriptor, str, str]] = []
+            for ann_descriptor in annotations:
+                archive_name = os.path.basename(ann_descriptor.filename)
+                archive_path = os.path.join(tempdir, archive_name)
+                self._save_annotation_archive(ann_descriptor, archive_path)
+                conversions.append(
+                    (ann_descriptor, archive_path, os.path.join(output_dir, archive_name))
                 )
 
-                self._process_annotation_file(ann_descriptor, extract_dir, export_dir)
+            # The job files are sent to the workers first,
+            # so that they run while the rest is converted in this process
+            converted_archives: dict[str, Future[str] | str] = {}
+            if pool:
+                for ann_descriptor, archive_path, output_path in conversions:
+                    if not self._is_merged_dataset(ann_descriptor):
+                        converted_archives[output_path] = pool.submit(
+                            _convert_job_annotations,
+                            ann_descriptor.filename,
+                            archive_path,
+                            output_path,
+                        )
+
+            for ann_descriptor, archive_path, output_path in conversions:
+                if output_path not in converted_archives:
+                    self._convert_annotation_archive(ann_descriptor, archive_path, output_path)
+                    converted_archives[output_path] = output_path
+
+            # Collect the results in the input order, regardless of the finishing order
+            for ann_descriptor, _, output_path in conversions:
+                converted_archive = converted_archives[output_path]
+                if isinstance(converted_archive, Future):
+                    converted_archive = converted_archive.result()
+
+                ann_descriptor.file = self.exit_stack.enter_context(open(converted_archive, "rb"))
+
+    def _make_conversion_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        # The workers are spawned instead of forked,
+        # so that they don't inherit DB connections and other process state
+        return ProcessPoolExecutor(
+            max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_conversion_worker,
+            initargs=(type(self), self.manifest, self.escrow_address, self.chain_id),
+        )
+
+    def _save_annotation_archive(self, ann_descriptor: FileDescriptor, path: str) -> None:
+        if not zipfile.is_zipfile(ann_descriptor.file):
+            raise ValueError("Annotation files must be zip files")
+        ann_descriptor.file.seek(0)
+
+        with open(path, "wb") as archive_file:
+            shutil.copyfileobj(ann_descriptor.file, archive_file)
 
-                converted_dataset_archive = io.BytesIO()
-                write_dir_to_zip_archive(export_dir, converted_dataset_archive)
-                converted_dataset_archive.seek(0)
+    def _convert_annotation_archive(
+        self, ann_descriptor: FileDescriptor, archive_path: str, output_path: str
+    ) -> None:
+        with TemporaryDirectory() as tempdir:
+            dataset_name = os.path.splitext(os.path.basename(ann_descriptor.filename))[0]
+            extract_dir = os.path.join(tempdir, dataset_name)
+            export_dir = os.path.join(tempdir, dataset_name + "_conv")
+
+            with open(archive_path, "rb") as archive_file:
+                extract_zip_archive(archive_file, extract_dir)
+
+            self._process_annotation_file(ann_descriptor, extract_dir, export_dir)
 
-                ann_descriptor.file = converted_dataset_archive
+            with open(output_path, "wb") as output_file:
+                write_dir_to_zip_archive(export_dir, output_file)
 
     def _is_merged_dataset(self, ann_descriptor: FileDescriptor) -> bool:
         return ann_descriptor == self._merged_annotation_file
@@ -223,6 +286,28 @@ class ImageJobExporter(JobExporter):
         )
 
 
+_conversion_worker_exporter: ImageJobExporter | None = None
+
+
+def _init_conversion_worker(
+    exporter_cls: type[ImageJobExporter], manifest: ManifestBase, escrow_address: str, chain_id: int
+) -> None:
+    global _conversion_worker_exporter  # noqa: PLW0603
+
+    # Only the job annotations are converted in the workers, they don't need the DB
+    # or the merged dataset state
+    exporter = exporter_cls(manifest, escrow_address, chain_id, session=None, escrow_projects=())
+    exporter._merged_annotation_file = None
+    _conversion_worker_exporter = exporter
+
+
+def _convert_job_annotations(filename: str, archive_path: str, output_path: str) -> str:
+    _conversion_worker_exporter._convert_annotation_archive(
+        FileDescriptor(filename=filename, file=None), archive_path, output_path
+    )
+    return output_path
+
+
 class LabelsJobExporter(ImageJobExporter):
     pass
 
@@ -359,6 +444,9 @@ class BoxesFromPointsJobExporter(ImageJobExporter):
 class SkeletonsJobExporter(ImageJobExporter):
     # Reconstruct skeletons from per-point annotation jobs
 
+    # The job annotations are accumulated into the merged dataset
+    _convert_jobs_in_workers = False
+
     def _collect_project_annotations(
         self, annotation_format: str
     ) -> tuple[io.RawIOBase | None, list[Image] | None]:
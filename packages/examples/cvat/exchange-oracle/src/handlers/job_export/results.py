@@ -9,13 +9,13 @@ from typing import TYPE_CHECKING
 import src.services.cloud as cloud_service
 from src.core.annotation_meta import (
     ANNOTATION_RESULTS_METAFILE_NAME,
-    RESULTING_ANNOTATIONS_FILE,
     AnnotationMeta,
     JobMeta,
 )
-from src.core.config import StorageConfig
+from src.core.config import FeaturesConfig, StorageConfig
 from src.core.storage import compose_results_bucket_filename
 from src.services.cloud.types import BucketAccessInfo
+from src.services.cloud.utils import upload_files
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -60,24 +60,11 @@ def upload_escrow_results(
     storage_info = BucketAccessInfo.parse_obj(StorageConfig)
     storage_client = cloud_service.make_client(storage_info)
 
-    # always update annotation meta and resulting annotations files
-    # to have actual data for the current epoch
-    existing_storage_files = set(
-        storage_client.list_files(
-            prefix=compose_results_bucket_filename(escrow_address, chain_id, ""),
-            trim_prefix=True,
-        )
-    ) - {ANNOTATION_RESULTS_METAFILE_NAME, RESULTING_ANNOTATIONS_FILE}
-
-    for file_descriptor in files:
-        if file_descriptor.filename in existing_storage_files:
-            continue
-
-        storage_client.create_file(
-            compose_results_bucket_filename(
-                escrow_address,
-                chain_id,
-                file_descriptor.filename,
-            ),
-            file_descriptor.file.read(),
-        )
+    # Only new and changed files are uploaded, e.g. the annotation meta
+    # and the resulting annotations in the next epochs
+    upload_files(
+        storage_client,
+        {file_descriptor.filename: file_descriptor.file for file_descriptor in files},
+        prefix=compose_results_bucket_filename(escrow_address, chain_id, ""),
+        max_workers=FeaturesConfig.max_data_storage_connections,
+    )
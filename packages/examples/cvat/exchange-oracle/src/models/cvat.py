@@ -1,7 +1,18 @@
 # pylint: disable=too-few-public-methods
 from __future__ import annotations
 
-from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.sql import func
 
@@ -131,6 +142,13 @@ class EscrowCreation(BaseUUID):
 
     total_jobs = Column(Integer, nullable=False)
 
+    __table_args__ = (
+        # Polled by the escrow creation cron, only the active creations are indexed
+        Index(
+            "ix_escrow_creations_active", "created_at", postgresql_where=text("finished_at IS NULL")
+        ),
+    )
+
     projects: Mapped[list[Project]] = relationship(
         back_populates="escrow_creation",
         # A custom join is used because the foreign keys do not actually reference any objects
@@ -261,6 +279,17 @@ class Assignment(ChildOf[Job]):
         nullable=False,
     )
 
+    __table_args__ = (
+        # Polled by the expired assignment cron, only the active assignments are indexed
+        Index(
+            "ix_assignments_active_expires_at",
+            "expires_at",
+            postgresql_where=text(
+                f"status = '{AssignmentStatuses.created.value}' AND completed_at IS NULL"
+            ),
+        ),
+    )
+
     user: Mapped[User] = relationship(back_populates="assignments")
     job: Mapped[Job] = relationship(back_populates="assignments")
 
@@ -323,6 +352,15 @@ class CvatWebhook(BaseUUID):
     event_type = Column(String, nullable=False)
     event_data = Column(JSON, nullable=True, server_default=None)
 
+    __table_args__ = (
+        # Polled by the CVAT webhook cron, only the pending webhooks are indexed
+        Index(
+            "ix_cvat_webhooks_pending",
+            "wait_until",
+            postgresql_where=text(f"status = '{CvatWebhookStatuses.pending.value}'"),
+        ),
+    )
+
     project: Mapped[Project] = relationship(back_populates="cvat_webhooks")
     task: Mapped[Task] = relationship(back_populates="cvat_webhooks")
     job: Mapped[Job] = relationship(back_populates="cvat_webhooks")
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from copy import deepcopy
 from typing import Any, ClassVar
 
@@ -99,6 +99,30 @@ class Cache:
 
         return item
 
+    def _get_or_set_many(
+        self,
+        keys: Sequence[str],
+        set_callback: Callable[[list[str]], dict[str, Any]],
+        *,
+        ttl: int | None = None,
+    ) -> dict[str, Any]:
+        if not keys:
+            return {}
+
+        cache = self._get_cache()
+        items = {key: item for key, item in zip(keys, cache.get_many(*keys), strict=True) if item}
+
+        if missing_keys := [key for key in dict.fromkeys(keys) if key not in items]:
+            new_items = set_callback(missing_keys)
+            if new_items:
+                written_keys = cache.set_many(new_items, timeout=ttl)
+                if failed_keys := set(new_items).difference(written_keys):
+                    raise Exception(f"Failed to write keys {sorted(failed_keys)} to the cache")
+
+                items.update(new_items)
+
+        return items
+
     def get_or_set_manifest(
         self, escrow_address: str, chain_id: int, *, set_callback: Callable[[], dict], **kwargs
     ) -> dict:
@@ -106,9 +130,58 @@ class Cache:
         key = self._make_key(escrow_address, chain_id)
         return self._get_or_set(key, set_callback=set_callback, **kwargs)
 
+    def get_or_set_manifests(
+        self,
+        escrow_addresses: Sequence[str],
+        chain_id: int,
+        *,
+        set_callback: Callable[[list[str]], dict[str, dict]],
+        **kwargs,
+    ) -> dict[str, dict]:
+        """
+        Reads all the cached manifests in one request, calls set_callback once
+        with the missing escrow addresses. Returns the manifests by escrow address.
+        """
+
+        kwargs.setdefault("ttl", Config.features.manifest_cache_ttl)
+        keys = {self._make_key(address, chain_id): address for address in escrow_addresses}
+        items = self._get_or_set_many(
+            list(keys),
+            set_callback=lambda missing_keys: {
+                self._make_key(address, chain_id): manifest
+                for address, manifest in set_callback([keys[k] for k in missing_keys]).items()
+            },
+            **kwargs,
+        )
+        return {keys[key]: manifest for key, manifest in items.items()}
+
     def get_or_set_token_symbol(
         self, chain_id: int, token_address: str, *, set_callback: Callable[[], str], **kwargs
     ) -> str:
         kwargs.setdefault("ttl", Config.features.token_symbol_ttl)
         key = self._make_key(token_address, chain_id)
         return self._get_or_set(key, set_callback=set_callback, **kwargs)
+
+    def get_or_set_token_symbols(
+        self,
+        chain_id: int,
+        token_addresses: Sequence[str],
+        *,
+        set_callback: Callable[[str], str],
+        **kwargs,
+    ) -> dict[str, str]:
+        """
+        Reads all the cached token symbols in one request.
+        Returns the token symbols by token address.
+        """
+
+        kwargs.setdefault("ttl", Config.features.token_symbol_ttl)
+        keys = {self._make_key(address, chain_id): address for address in token_addresses}
+        items = self._get_or_set_many(
+            list(keys),
+            set_callback=lambda missing_keys: {
+                key: set_callback(keys[key]) for key in missing_keys
+            },
+            **kwargs,
+        )
+        return {keys[key]: symbol for key, symbol in items.items()}
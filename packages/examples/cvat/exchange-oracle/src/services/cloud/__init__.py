@@ -1,3 +1,3 @@
-from src.services.cloud.client import StorageClient
+from src.services.cloud.client import FileInfo, StorageClient
 from src.services.cloud.types import BucketAccessInfo, BucketCredentials, CloudProviders
-from src.services.cloud.utils import make_client
+from src.services.cloud.utils import make_client, upload_files
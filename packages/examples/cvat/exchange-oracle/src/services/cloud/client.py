@@ -1,7 +1,18 @@
 from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from typing import BinaryIO
 from urllib.parse import unquote
 
 
+@dataclass(frozen=True)
+class FileInfo:
+    key: str
+    size: int
+
+    etag: str | None
+    "Content hash of the file, as reported by the storage. Can be compared with get_etag()"
+
+
 class StorageClient(metaclass=ABCMeta):
     def __init__(
         self,
@@ -12,6 +23,18 @@ class StorageClient(metaclass=ABCMeta):
     @abstractmethod
     def create_file(self, key: str, data: bytes = b"", *, bucket: str | None = None): ...
 
+    @abstractmethod
+    def upload_file(self, key: str, file: BinaryIO, *, bucket: str | None = None):
+        """
+        Uploads the file contents from the beginning. Large files are uploaded in parts.
+        If a previous upload of a large file to the same key was interrupted,
+        the already uploaded parts are reused, when possible.
+        """
+
+    @abstractmethod
+    def get_etag(self, file: BinaryIO) -> str:
+        "Computes the etag the storage would report for the file, if uploaded with upload_file()"
+
     @abstractmethod
     def remove_file(self, key: str, *, bucket: str | None = None): ...
 
@@ -24,6 +47,10 @@ class StorageClient(metaclass=ABCMeta):
     @abstractmethod
     def download_file(self, key: str, *, bucket: str | None = None) -> bytes: ...
 
+    @abstractmethod
+    def download_fileobj(self, key: str, file: BinaryIO, *, bucket: str | None = None):
+        "Downloads the file contents into a file object, without keeping them in memory"
+
     @abstractmethod
     def list_files(
         self,
@@ -33,6 +60,15 @@ class StorageClient(metaclass=ABCMeta):
         trim_prefix: bool = False,
     ) -> list[str]: ...
 
+    @abstractmethod
+    def list_file_infos(
+        self,
+        *,
+        bucket: str | None = None,
+        prefix: str | None = None,
+        trim_prefix: bool = False,
+    ) -> list[FileInfo]: ...
+
     @staticmethod
     def normalize_prefix(prefix: str | None) -> str | None:
         return unquote(prefix).strip("/\\") + "/" if prefix else prefix
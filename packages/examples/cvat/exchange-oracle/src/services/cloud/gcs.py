@@ -1,14 +1,24 @@
+import os
+from base64 import b64encode
+from hashlib import md5
 from io import BytesIO
+from typing import BinaryIO
 from urllib.parse import unquote
 
 from google.cloud import storage
 
-from src.services.cloud.client import StorageClient
+from src.services.cloud.client import FileInfo, StorageClient
 
 DEFAULT_GCS_HOST = "storage.googleapis.com"
 
 
 class GcsClient(StorageClient):
+    multipart_threshold = 8 * 2**20
+    "Files bigger than this are uploaded in chunks with a resumable upload, in bytes"
+
+    multipart_part_size = 8 * 2**20
+    "Chunk size for resumable uploads, in bytes. Must be a multiple of 256 KiB"
+
     def __init__(
         self,
         *,
@@ -27,6 +37,30 @@ class GcsClient(StorageClient):
         bucket_client = self.client.get_bucket(bucket)
         bucket_client.blob(unquote(key)).upload_from_string(data)
 
+    def upload_file(self, key: str, file: BinaryIO, *, bucket: str | None = None) -> None:
+        # Chunks are retried within the resumable upload session,
+        # but the session isn't reused by the next upload
+        bucket = unquote(bucket) if bucket else self._bucket
+        bucket_client = self.client.get_bucket(bucket)
+
+        size = file.seek(0, os.SEEK_END)
+        file.seek(0)
+
+        blob = bucket_client.blob(
+            unquote(key),
+            chunk_size=self.multipart_part_size if size > self.multipart_threshold else None,
+        )
+        blob.upload_from_file(file, size=size)
+
+    def get_etag(self, file: BinaryIO) -> str:
+        file.seek(0)
+
+        file_hash = md5(usedforsecurity=False)
+        while data := file.read(self.multipart_part_size):
+            file_hash.update(data)
+
+        return b64encode(file_hash.digest()).decode()
+
     def remove_file(self, key: str, *, bucket: str | None = None) -> None:
         bucket = unquote(bucket) if bucket else self._bucket
         bucket_client = self.client.get_bucket(bucket)
@@ -60,6 +94,11 @@ class GcsClient(StorageClient):
             self.client.download_blob_to_file(blob, data)
             return data.getvalue()
 
+    def download_fileobj(self, key: str, file: BinaryIO, *, bucket: str | None = None):
+        bucket = unquote(bucket) if bucket else self._bucket
+        bucket_client = self.client.get_bucket(bucket)
+        self.client.download_blob_to_file(bucket_client.blob(unquote(key)), file)
+
     def list_files(
         self, *, bucket: str | None = None, prefix: str | None = None, trim_prefix: bool = False
     ) -> list[str]:
@@ -88,3 +127,33 @@ class GcsClient(StorageClient):
             files = [f[len(prefix) :].strip("/") for f in files]
 
         return files
+
+    def list_file_infos(
+        self, *, bucket: str | None = None, prefix: str | None = None, trim_prefix: bool = False
+    ) -> list[FileInfo]:
+        bucket = unquote(bucket) if bucket else self._bucket
+        prefix = self.normalize_prefix(prefix)
+
+        if trim_prefix:
+            assert prefix, "The trim_prefix option cannot be used without a prefix"
+
+        return [
+            FileInfo(
+                key=blob.name[len(prefix) :].strip("/") if trim_prefix else blob.name,
+                size=blob.size,
+                # md5 is not available for composite objects
+                etag=blob.md5_hash,
+            )
+            for blob in self.client.list_blobs(
+                bucket_or_name=bucket,
+                fields="items(name,size,md5Hash),nextPageToken",
+                **(
+                    {
+                        "prefix": prefix,
+                        "delimiter": "/",
+                    }
+                    if prefix
+                    else {}
+                ),
+            )
+        ]
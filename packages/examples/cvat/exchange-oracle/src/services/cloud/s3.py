@@ -1,5 +1,7 @@
+import os
+from hashlib import md5
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 from urllib.parse import unquote
 
 import boto3
@@ -8,7 +10,7 @@ import boto3.session
 from botocore.exceptions import ClientError
 from botocore.handlers import disable_signing
 
-from src.services.cloud.client import StorageClient
+from src.services.cloud.client import FileInfo, StorageClient
 
 DEFAULT_S3_HOST = "s3.amazonaws.com"
 if TYPE_CHECKING:
@@ -17,6 +19,12 @@ if TYPE_CHECKING:
 
 
 class S3Client(StorageClient):
+    multipart_threshold = 8 * 2**20
+    "Files bigger than this are uploaded in parts, in bytes"
+
+    multipart_part_size = 8 * 2**20
+    "Part size for multipart uploads, in bytes. S3 requires at least 5 MiB"
+
     def __init__(
         self,
         *,
@@ -47,6 +55,77 @@ class S3Client(StorageClient):
         bucket = unquote(bucket) if bucket else self._bucket
         self.client.put_object(Body=data, Bucket=bucket, Key=unquote(key))
 
+    def upload_file(self, key: str, file: BinaryIO, *, bucket: str | None = None):
+        bucket = unquote(bucket) if bucket else self._bucket
+        key = unquote(key)
+
+        size = file.seek(0, os.SEEK_END)
+        file.seek(0)
+
+        if size <= self.multipart_threshold:
+            self.client.put_object(Body=file.read(), Bucket=bucket, Key=key)
+        else:
+            self._upload_multipart(file, size, bucket=bucket, key=key)
+
+    def _upload_multipart(self, file: BinaryIO, size: int, *, bucket: str, key: str):
+        # An interrupted upload is not aborted, so the next upload of the key can continue it
+        upload_id, uploaded_parts = self._find_multipart_upload(bucket=bucket, key=key)
+        if not upload_id:
+            upload_id = self.client.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+
+        parts = []
+        for part_number, offset in enumerate(range(0, size, self.multipart_part_size), start=1):
+            file.seek(offset)
+            data = file.read(self.multipart_part_size)
+
+            etag = f'"{md5(data, usedforsecurity=False).hexdigest()}"'
+            if uploaded_parts.get(part_number) != etag:
+                etag = self.client.upload_part(
+                    Body=data, Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=part_number
+                )["ETag"]
+
+            parts.append({"ETag": etag, "PartNumber": part_number})
+
+        self.client.complete_multipart_upload(
+            Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    def _find_multipart_upload(self, *, bucket: str, key: str) -> tuple[str | None, dict[int, str]]:
+        uploads = [
+            upload
+            for page in self.client.get_paginator("list_multipart_uploads").paginate(
+                Bucket=bucket, Prefix=key
+            )
+            for upload in page.get("Uploads", [])
+            if upload["Key"] == key
+        ]
+        if not uploads:
+            return None, {}
+
+        upload_id = max(uploads, key=lambda upload: upload["Initiated"])["UploadId"]
+        uploaded_parts = {
+            part["PartNumber"]: part["ETag"]
+            for page in self.client.get_paginator("list_parts").paginate(
+                Bucket=bucket, Key=key, UploadId=upload_id
+            )
+            for part in page.get("Parts", [])
+        }
+        return upload_id, uploaded_parts
+
+    def get_etag(self, file: BinaryIO) -> str:
+        size = file.seek(0, os.SEEK_END)
+        file.seek(0)
+
+        if size <= self.multipart_threshold:
+            return md5(file.read(), usedforsecurity=False).hexdigest()
+
+        # The etag of a multipart upload is the hash of the part hashes with the part count
+        part_hashes = []
+        while data := file.read(self.multipart_part_size):
+            part_hashes.append(md5(data, usedforsecurity=False).digest())
+
+        return f"{md5(b''.join(part_hashes), usedforsecurity=False).hexdigest()}-{len(part_hashes)}"
+
     def remove_file(self, key: str, *, bucket: str | None = None):
         bucket = unquote(bucket) if bucket else self._bucket
         self.client.delete_object(Bucket=bucket, Key=unquote(key))
@@ -72,6 +151,10 @@ class S3Client(StorageClient):
             self.client.download_fileobj(Bucket=bucket, Key=unquote(key), Fileobj=data)
             return data.getvalue()
 
+    def download_fileobj(self, key: str, file: BinaryIO, *, bucket: str | None = None):
+        bucket = unquote(bucket) if bucket else self._bucket
+        self.client.download_fileobj(Bucket=bucket, Key=unquote(key), Fileobj=file)
+
     def list_files(
         self, *, bucket: str | None = None, prefix: str | None = None, trim_prefix: bool = False
     ) -> list[str]:
@@ -89,3 +172,27 @@ class S3Client(StorageClient):
                 return [file_info.key[len(prefix) :].strip("/") for file_info in objects]
 
         return [file_info.key for file_info in objects.all()]
+
+    def list_file_infos(
+        self, *, bucket: str | None = None, prefix: str | None = None, trim_prefix: bool = False
+    ) -> list[FileInfo]:
+        bucket = unquote(bucket) if bucket else self._bucket
+        objects = self.resource.Bucket(bucket).objects
+
+        if trim_prefix:
+            assert prefix, "The trim_prefix option cannot be used without a prefix"
+
+        if prefix:
+            prefix = self.normalize_prefix(prefix)
+            objects = objects.filter(Prefix=prefix)
+        else:
+            objects = objects.all()
+
+        return [
+            FileInfo(
+                key=file_info.key[len(prefix) :].strip("/") if trim_prefix else file_info.key,
+                size=file_info.size,
+                etag=file_info.e_tag.strip('"'),
+            )
+            for file_info in objects
+        ]
@@ -1,3 +1,8 @@
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+
 from src.services.cloud.client import StorageClient
 from src.services.cloud.gcs import GcsClient
 from src.services.cloud.s3 import S3Client
@@ -29,3 +34,51 @@ def make_client(
             raise ValueError(f"Unsupported cloud provider ({bucket_info.provider}) was provided")
 
     return client_type(**client_kwargs)
+
+
+def upload_files(
+    client: StorageClient,
+    files: Mapping[str, BinaryIO],
+    *,
+    prefix: str,
+    bucket: str | None = None,
+    max_workers: int = 1,
+) -> list[str]:
+    """
+    Uploads the files to "<prefix>/<filename>", with up to max_workers uploads at once.
+
+    The files that already exist with the same size and etag are skipped, and interrupted
+    uploads of large files are continued, so the upload can be repeated after a failure
+    without uploading the finished files and parts again.
+
+    Returns the names of the uploaded files.
+    """
+
+    existing_files = {
+        file_info.key: file_info
+        for file_info in client.list_file_infos(bucket=bucket, prefix=prefix, trim_prefix=True)
+    }
+    prefix = StorageClient.normalize_prefix(prefix)
+
+    def _upload(filename: str, file: BinaryIO) -> bool:
+        existing_file = existing_files.get(filename)
+        if (
+            existing_file
+            and existing_file.size == file.seek(0, os.SEEK_END)
+            and existing_file.etag == client.get_etag(file)
+        ):
+            return False
+
+        client.upload_file(prefix + filename, file, bucket=bucket)
+        return True
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        uploads = {
+            filename: pool.submit(_upload, filename, file) for filename, file in files.items()
+        }
+
+        try:
+            return [filename for filename, upload in uploads.items() if upload.result()]
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
@@ -5,7 +5,7 @@ Functions in this module are grouped by various categories, look for separators
 import itertools
 import uuid
 from collections.abc import Iterable, Sequence
-from datetime import datetime, timedelta
+from datetime import datetime
 from itertools import islice
 from typing import Any, NamedTuple
 
@@ -14,7 +14,6 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.functions import coalesce
 
-from src.core.config import Config
 from src.core.tasks import TaskTypes
 from src.core.types import (
     AssignmentStatuses,
@@ -40,6 +39,7 @@ from src.models.cvat import (
     Task,
     User,
 )
+from src.services.webhook import get_webhook_retry_time
 from src.utils.time import utcnow
 
 
@@ -1218,7 +1218,7 @@ class CvatWebhookQueue:
             .values(
                 attempts=CvatWebhook.attempts + 1,
                 # no automatic failures by max attempts for CVAT webhooks
-                wait_until=utcnow() + timedelta(seconds=Config.webhook_delay_if_failed),
+                wait_until=get_webhook_retry_time(CvatWebhook.attempts),
             )
         )
         session.execute(upd)
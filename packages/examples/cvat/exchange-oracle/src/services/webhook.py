@@ -1,9 +1,8 @@
-import datetime
 import uuid
 from collections.abc import Sequence
 
 from attrs import define
-from sqlalchemy import case, update
+from sqlalchemy import ColumnElement, case, func, update
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import select
 
@@ -17,6 +16,24 @@ from src.utils.enums import BetterEnumMeta, StrEnum
 from src.utils.time import utcnow
 
 
+def get_webhook_retry_time(attempts: ColumnElement[int]) -> ColumnElement:
+    """
+    Exponential backoff with jitter: after the n-th failed attempt, the webhook is retried
+    in a random time between 1/2 and 1 of
+    min(webhook_delay_if_failed * 2 ** (n - 1), webhook_max_delay_if_failed) seconds,
+    so that the webhooks failed together (e.g. in a receiver outage) don't come back together.
+
+    attempts - the number of attempts before the failed one
+    """
+
+    delay = func.least(
+        Config.webhook_delay_if_failed * func.power(2, func.least(attempts, 30)),
+        Config.webhook_max_delay_if_failed,
+    )
+    jittered_delay = delay * (0.5 + func.random() / 2)
+    return utcnow() + func.make_interval(0, 0, 0, 0, 0, 0, jittered_delay)
+
+
 class OracleWebhookDirectionTags(StrEnum, metaclass=BetterEnumMeta):
     incoming = "incoming"
     outgoing = "outgoing"
@@ -121,35 +138,98 @@ class OracleWebhookQueue:
         session.execute(upd)
 
     def handle_webhook_success(self, session: Session, webhook_id: str) -> None:
-        upd = (
-            update(Webhook)
-            .where(Webhook.id == webhook_id)
-            .values(
-                attempts=Webhook.attempts + 1,
-                status=OracleWebhookStatuses.completed,
-            )
-        )
-        session.execute(upd)
+        self.handle_webhook_results(session, succeeded_ids=[webhook_id])
 
     def handle_webhook_fail(self, session: Session, webhook_id: str) -> None:
+        self.handle_webhook_results(session, failed_ids=[webhook_id])
+
+    def handle_webhook_results(
+        self,
+        session: Session,
+        *,
+        succeeded_ids: Sequence[str] = (),
+        failed_ids: Sequence[str] = (),
+    ) -> None:
+        """
+        Records the results of a batch of webhook attempts in one update
+        """
+
+        if not succeeded_ids and not failed_ids:
+            return
+
+        succeeded = Webhook.id.in_(succeeded_ids)
         upd = (
             update(Webhook)
-            .where(Webhook.id == webhook_id)
+            .where(Webhook.id.in_([*succeeded_ids, *failed_ids]))
             .values(
                 attempts=Webhook.attempts + 1,
                 status=case(
+                    (succeeded, OracleWebhookStatuses.completed.value),
                     (
                         Webhook.attempts + 1 >= Config.webhook_max_retries,
                         OracleWebhookStatuses.failed.value,
                     ),
                     else_=OracleWebhookStatuses.pending.value,
                 ),
-                # TODO: consider exponential strategy
-                wait_until=utcnow() + datetime.timedelta(seconds=Config.webhook_delay_if_failed),
+                wait_until=case(
+                    (succeeded, Webhook.wait_until),
+                    else_=get_webhook_retry_time(Webhook.attempts),
+                ),
             )
         )
         session.execute(upd)
 
+    def get_failed_webhooks(
+        self,
+        session: Session,
+        *,
+        type: OracleWebhookTypes | None = None,
+        limit: int = 100,
+    ) -> list[Webhook]:
+        """
+        Returns the webhooks that ran out of attempts (the dead-letter queue), the latest first
+        """
+
+        return (
+            session.query(Webhook)
+            .where(
+                Webhook.direction == self.direction.value,
+                Webhook.status == OracleWebhookStatuses.failed.value,
+                *([Webhook.type == type.value] if type else []),
+            )
+            .order_by(Webhook.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def requeue_failed_webhooks(
+        self,
+        session: Session,
+        *,
+        webhook_ids: Sequence[str] | None = None,
+        type: OracleWebhookTypes | None = None,
+    ) -> int:
+        """
+        Returns failed webhooks to the queue with all the attempts available again.
+        Returns the number of requeued webhooks.
+        """
+
+        upd = (
+            update(Webhook)
+            .where(
+                Webhook.direction == self.direction.value,
+                Webhook.status == OracleWebhookStatuses.failed.value,
+                *([Webhook.id.in_(webhook_ids)] if webhook_ids is not None else []),
+                *([Webhook.type == type.value] if type else []),
+            )
+            .values(
+                attempts=0,
+                status=OracleWebhookStatuses.pending.value,
+                wait_until=utcnow(),
+            )
+        )
+        return session.execute(upd).rowcount
+
 
 inbox = OracleWebhookQueue(direction=OracleWebhookDirectionTags.incoming)
 outbox = OracleWebhookQueue(
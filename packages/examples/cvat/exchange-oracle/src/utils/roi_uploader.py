@@ -1,47 +1,213 @@
-from collections.abc import Callable, Iterable
-from queue import Queue
-from typing import Generic, TypeVar
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
 
 T = TypeVar("T")
-R = TypeVar("R")
+D = TypeVar("D")
+
+
+@dataclass
+class PipelineStageStats:
+    name: str
+
+    items: int = 0
+    "The number of items that passed the stage"
+
+    busy_time: float = 0
+    "Total time spent by the stage workers, in seconds"
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, busy_time: float, *, items: int = 1) -> None:
+        with self._lock:
+            self.items += items
+            self.busy_time += busy_time
+
+    def format(self, elapsed: float) -> str:
+        throughput = self.items / elapsed if elapsed else 0
+        return (
+            f"{self.name}: {self.items} items, {throughput:.1f} items/s, busy {self.busy_time:.1f}s"
+        )
+
+
+class _PendingTasks:
+    def __init__(self) -> None:
+        self._count = 0
+        self._done = threading.Condition()
+
+    def add(self) -> None:
+        with self._done:
+            self._count += 1
+
+    def remove(self) -> None:
+        with self._done:
+            self._count -= 1
+            if not self._count:
+                self._done.notify_all()
+
+    def wait(self) -> None:
+        with self._done:
+            self._done.wait_for(lambda: not self._count)
+
+
+class RoiImageUploadPipeline(Generic[T, D]):
+    """
+    Downloads source images, extracts RoI images from them and uploads the results.
+    Each stage has its own bounded thread pool:
 
+    - download - I/O, downloads a source image
+    - process - CPU, decodes the image, crops, draws and encodes RoIs.
+      OpenCV and numpy release the GIL for the heavy parts, so threads are enough here.
+    - upload - I/O, uploads an encoded RoI image
 
-class BufferedRoiImageUploader(Generic[R]):
-    def __init__(self, queue: Queue[R]):
-        self.queue = queue
+    The stages are connected with backpressure: no more than max_pending_images source images
+    are downloaded or processed at once, and no more than max_pending_uploads encoded RoI images
+    wait for upload. A processing worker waits for a free upload slot, and the input is not read
+    further until there is a free image slot, so memory use doesn't depend on the dataset size.
 
-    def process_all(
+    The first error stops the pipeline and is raised from run().
+    """
+
+    def __init__(
         self,
-        items: Iterable[T],
         *,
-        put_callback: Callable[[T], R | None],
-        process_callback: Callable[[R], None],
+        download: Callable[[T], D],
+        process: Callable[[T, D], Iterable[tuple[str, bytes]]],
+        upload: Callable[[str, bytes], None],
+        download_workers: int,
+        process_workers: int,
+        upload_workers: int,
+        max_pending_images: int | None = None,
+        max_pending_uploads: int | None = None,
     ):
-        "Put items into the queue and process them until the input items are exhausted"
+        self._download = download
+        self._process = process
+        self._upload = upload
+
+        self.download_workers = download_workers
+        self.process_workers = process_workers
+        self.upload_workers = upload_workers
+        self.max_pending_images = max_pending_images or 2 * (download_workers + process_workers)
+        self.max_pending_uploads = max_pending_uploads or 4 * upload_workers
+
+        self.download_stats = PipelineStageStats("download")
+        self.process_stats = PipelineStageStats("process")
+        self.upload_stats = PipelineStageStats("upload")
+        self.elapsed: float = 0
+
+        self._errors: list[Exception] = []
+        self._failed = threading.Event()
+
+    def format_stats(self) -> str:
+        return "; ".join(
+            stats.format(self.elapsed)
+            for stats in (self.download_stats, self.process_stats, self.upload_stats)
+        )
+
+    def _fail(self, error: Exception) -> None:
+        self._errors.append(error)
+        self._failed.set()
+
+    def run(self, items: Iterable[T]) -> None:
+        self._errors.clear()
+        self._failed.clear()
+
+        image_slots = threading.BoundedSemaphore(self.max_pending_images)
+        upload_slots = threading.BoundedSemaphore(self.max_pending_uploads)
+        pending_tasks = _PendingTasks()
+
+        def _upload(key: str, data: bytes) -> None:
+            try:
+                if self._failed.is_set():
+                    return
+
+                start = perf_counter()
+                self._upload(key, data)
+                self.upload_stats.add(perf_counter() - start)
+            except Exception as e:  # noqa: BLE001
+                self._fail(e)
+            finally:
+                upload_slots.release()
+                pending_tasks.remove()
+
+        def _process(item: T, downloaded: D) -> None:
+            try:
+                if self._failed.is_set():
+                    return
+
+                busy_time = 0
+                rois = iter(self._process(item, downloaded))
+                while True:
+                    start = perf_counter()
+                    roi = next(rois, None)
+                    busy_time += perf_counter() - start
+                    if roi is None:
+                        break
+
+                    upload_slots.acquire()
+                    if self._failed.is_set():
+                        upload_slots.release()
+                        return
+
+                    pending_tasks.add()
+                    upload_pool.submit(_upload, *roi)
+
+                self.process_stats.add(busy_time)
+            except Exception as e:  # noqa: BLE001
+                self._fail(e)
+            finally:
+                image_slots.release()
+                pending_tasks.remove()
 
-        item_iter = iter(items)
-        while True:
-            result = self.fill_and_get(item_iter, put_callback=put_callback)
-            if result is None:
-                break
+        def _download(item: T) -> None:
+            try:
+                if self._failed.is_set():
+                    image_slots.release()
+                    pending_tasks.remove()
+                    return
 
-            process_callback(result)
+                start = perf_counter()
+                downloaded = self._download(item)
+                self.download_stats.add(perf_counter() - start)
+            except Exception as e:  # noqa: BLE001
+                self._fail(e)
+                image_slots.release()
+                pending_tasks.remove()
+                return
 
-    def fill_and_get(
-        self, items: Iterable[T], *, put_callback: Callable[[T], R | None]
-    ) -> R | None:
-        "put() as many items into the queue as possible, try to get() one"
+            # the image slot and the pending task are passed to the processing stage
+            process_pool.submit(_process, item, downloaded)
 
-        queue = self.queue
-        item_iter = iter(items)
-        while not queue.full() and (item := next(item_iter, None)) is not None:
-            task = put_callback(item)
-            if not task:
-                continue
+        start = perf_counter()
+        with ExitStack() as es:
+            download_pool = es.enter_context(ThreadPoolExecutor(self.download_workers))
+            process_pool = es.enter_context(ThreadPoolExecutor(self.process_workers))
+            upload_pool = es.enter_context(ThreadPoolExecutor(self.upload_workers))
 
-            queue.put(task)
+            try:
+                for item in items:
+                    image_slots.acquire()
+                    if self._failed.is_set():
+                        image_slots.release()
+                        break
 
-        if queue.empty():
-            return None
+                    pending_tasks.add()
+                    download_pool.submit(_download, item)
+            except BaseException:
+                self._failed.set()
+                raise
+            finally:
+                # the pools can only be closed when no task can submit new ones
+                pending_tasks.wait()
+                self.elapsed = perf_counter() - start
 
-        return queue.get()
+        if self._errors:
+            raise self._errors[0]
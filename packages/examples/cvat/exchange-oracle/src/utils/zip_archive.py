@@ -1,9 +1,12 @@
 import io
 import os
+import shutil
 import zipfile
 from glob import glob
 from pathlib import Path
 
+_ZIP_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
 
 def extract_zip_archive(data: io.RawIOBase, dst_dir: os.PathLike[str], *, create_dir: bool = True):
     if not isinstance(dst_dir, Path):
@@ -17,6 +20,17 @@ def extract_zip_archive(data: io.RawIOBase, dst_dir: os.PathLike[str], *, create
 
 
 def write_dir_to_zip_archive(src_dir: str, dst_file: io.RawIOBase):
+    # The entries are written in a fixed order and with a fixed time,
+    # so the same directory contents always produce the same archive bytes
     with zipfile.ZipFile(dst_file, "w") as archive_zip_file:
-        for fn in glob(os.path.join(src_dir, "**/*.*"), recursive=True):
-            archive_zip_file.write(fn, os.path.relpath(fn, src_dir))
+        for fn in sorted(glob(os.path.join(src_dir, "**/*.*"), recursive=True)):
+            entry = zipfile.ZipInfo.from_file(fn, os.path.relpath(fn, src_dir))
+            entry.date_time = _ZIP_ENTRY_DATE_TIME
+
+            if entry.is_dir():
+                archive_zip_file.writestr(entry, b"")
+                continue
+
+            entry.compress_type = archive_zip_file.compression
+            with open(fn, "rb") as src, archive_zip_file.open(entry, "w") as dst:
+                shutil.copyfileobj(src, dst)
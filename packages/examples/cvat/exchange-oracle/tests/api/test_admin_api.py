@@ -0,0 +1,92 @@
+import uuid
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.core.types import (
+    ExchangeOracleEventTypes,
+    Networks,
+    OracleWebhookStatuses,
+    OracleWebhookTypes,
+)
+from src.models.webhook import Webhook
+from src.services.webhook import OracleWebhookDirectionTags
+
+ADMIN_API_KEY = "admin-api-key"
+
+
+@pytest.fixture(autouse=True)
+def admin_api_key():
+    with patch("src.core.config.Config.admin_api_key", ADMIN_API_KEY):
+        yield
+
+
+def _add_webhook(
+    session: Session,
+    status: OracleWebhookStatuses,
+    *,
+    type: OracleWebhookTypes = OracleWebhookTypes.recording_oracle,
+) -> Webhook:
+    webhook = Webhook(
+        id=str(uuid.uuid4()),
+        escrow_address="0x1234567890123456789012345678901234567890",
+        chain_id=Networks.localhost.value,
+        type=type.value,
+        status=status.value,
+        attempts=5 if status == OracleWebhookStatuses.failed else 0,
+        event_type=ExchangeOracleEventTypes.job_finished.value,
+        direction=OracleWebhookDirectionTags.outgoing.value,
+    )
+    session.add(webhook)
+    session.commit()
+    return webhook
+
+
+def test_can_list_dead_letter_webhooks(client: TestClient, session: Session) -> None:
+    failed = _add_webhook(session, OracleWebhookStatuses.failed)
+    _add_webhook(session, OracleWebhookStatuses.failed, type=OracleWebhookTypes.job_launcher)
+    _add_webhook(session, OracleWebhookStatuses.pending)
+
+    response = client.get(
+        "/admin/webhooks/dead-letter",
+        params={"type": OracleWebhookTypes.recording_oracle.value},
+        headers={"X-Admin-Key": ADMIN_API_KEY},
+    )
+
+    assert response.status_code == 200
+    assert [w["id"] for w in response.json()] == [failed.id]
+    assert response.json()[0]["attempts"] == 5
+
+
+def test_can_requeue_dead_letter_webhooks(client: TestClient, session: Session) -> None:
+    failed = [_add_webhook(session, OracleWebhookStatuses.failed) for _ in range(3)]
+
+    response = client.post(
+        "/admin/webhooks/dead-letter/requeue",
+        json={
+            "direction": OracleWebhookDirectionTags.outgoing.value,
+            "ids": [failed[0].id, failed[1].id],
+        },
+        headers={"X-Admin-Key": ADMIN_API_KEY},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"requeued": 2}
+
+    session.expire_all()
+    assert [(w.status, w.attempts) for w in failed] == [
+        (OracleWebhookStatuses.pending.value, 0),
+        (OracleWebhookStatuses.pending.value, 0),
+        (OracleWebhookStatuses.failed.value, 5),
+    ]
+
+
+def test_cannot_use_admin_endpoints_without_key(client: TestClient) -> None:
+    response = client.get("/admin/webhooks/dead-letter", headers={"X-Admin-Key": "wrong"})
+    assert response.status_code == 401
+
+    with patch("src.core.config.Config.admin_api_key", ""):
+        response = client.get("/admin/webhooks/dead-letter", headers={"X-Admin-Key": ""})
+        assert response.status_code == 404
@@ -176,14 +176,16 @@ def test_can_list_jobs_200_with_address_and_pagination(
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         # check default pagination parameters
         response = client.get(
@@ -241,14 +243,16 @@ def test_can_list_jobs_200_without_escrows_in_hidden_states(
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         response = client.get(
             "/job",
@@ -299,14 +303,16 @@ def test_can_list_jobs_200_with_only_one_entry_per_escrow_address_if_several_pro
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         response = client.get(
             "/job",
@@ -339,14 +345,16 @@ def test_can_list_jobs_200_with_fields(client: TestClient, session: Session) ->
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         required_fields = {
             "escrow_address",
@@ -402,14 +410,16 @@ def test_can_list_jobs_200_with_fields_comma_separated_and_repeated_are_equivale
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         fields = ["job_description", "created_at", "reward_amount"]
 
@@ -469,14 +479,16 @@ def test_can_list_jobs_200_with_sorting(client: TestClient, session: Session) ->
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         for sort_field, case_converter in product(
             (
@@ -589,14 +601,16 @@ def test_can_list_jobs_200_with_filters(client: TestClient, session: Session):
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         for filter_key, filter_values in {
             "status": (
@@ -680,14 +694,16 @@ def test_can_list_jobs_200_can_show_only_active_jobs_with_free_assignments(
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         response = client.get(
             "/job",
@@ -729,14 +745,16 @@ def test_can_list_jobs_200_check_values(client: TestClient, session: Session) ->
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         response = client.get(
             "/job",
@@ -788,14 +806,16 @@ def test_can_list_jobs_200_without_address(client: TestClient, session: Session)
 
     with (
         open("tests/assets/cloud/manifests/manifest-v1.json") as data,
-        patch("src.endpoints.serializers.get_escrow_manifest") as mock_get_manifest,
+        patch("src.endpoints.serializers.get_escrow_manifests") as mock_get_manifests,
         patch(
-            "src.endpoints.serializers.get_escrow_fund_token_symbol"
-        ) as mock_get_escrow_fund_token_symbol,
+            "src.endpoints.serializers.get_escrow_fund_token_symbols"
+        ) as mock_get_escrow_fund_token_symbols,
     ):
         manifest = json.load(data)
-        mock_get_manifest.return_value = manifest
-        mock_get_escrow_fund_token_symbol.return_value = "HMT"
+        mock_get_manifests.side_effect = lambda _, addresses: dict.fromkeys(addresses, manifest)
+        mock_get_escrow_fund_token_symbols.side_effect = lambda _, addresses: dict.fromkeys(
+            addresses, "HMT"
+        )
 
         response = client.get(
             "/job",
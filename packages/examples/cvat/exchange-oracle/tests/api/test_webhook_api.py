@@ -2,9 +2,8 @@ from unittest.mock import Mock, patch
 
 from fastapi.testclient import TestClient
 from sqlalchemy.sql import select
-from web3 import HTTPProvider, Web3
 
-from src.core.types import JobLauncherEventTypes, Networks
+from src.core.types import JobLauncherEventTypes
 from src.db import SessionLocal
 from src.models.webhook import Webhook
 
@@ -17,10 +16,8 @@ escrow_address = "0x12E66A452f95bff49eD5a30b0d06Ebc37C5A94B6"
 def test_incoming_webhook_200(client: TestClient) -> None:
     with (
         SessionLocal.begin() as session,
-        patch("src.chain.web3.get_web3") as mock_get_web3,
         patch("src.chain.escrow.get_escrow") as mock_get_escrow,
     ):
-        mock_get_web3.return_value = Web3(HTTPProvider(Networks.localhost))
         mock_escrow = Mock()
         mock_escrow.launcher = JOB_LAUNCHER
         mock_escrow.recording_oracle = RECORDING_ORACLE_ADDRESS
@@ -38,7 +35,6 @@ def test_incoming_webhook_200(client: TestClient) -> None:
         webhook = session.execute(db_query).scalars().first()
         assert response.json() == {"id": webhook.id}
 
-        mock_get_web3.assert_called()
         mock_get_escrow.assert_called_with(
             WEBHOOK_MESSAGE["chain_id"],
             WEBHOOK_MESSAGE["escrow_address"],
@@ -124,10 +120,8 @@ def test_incoming_webhook_400_invalid_chain_id(client: TestClient) -> None:
 
 def test_incoming_webhook_401(client: TestClient) -> None:
     with (
-        patch("src.chain.web3.get_web3") as mock_get_web3,
         patch("src.chain.escrow.get_escrow") as mock_get_escrow,
     ):
-        mock_get_web3.return_value = Web3(HTTPProvider(Networks.localhost))
         mock_escrow = Mock()
         mock_escrow.launcher = escrow_address
         mock_escrow.recording_oracle = RECORDING_ORACLE_ADDRESS
@@ -0,0 +1,136 @@
+"""Throughput of converting the job annotations of an escrow in escrow export.
+
+Generates JOBS synthetic COCO job archives with IMAGES images and ANNOTATIONS boxes per image,
+and a merged archive with all of them, then runs the ``BoxesJobExporter`` datumaro conversion
+pipeline on them in this process and with WORKERS worker processes. The worker process startup
+is included in the time. Checks that the converted archives are the same in both cases.
+
+Call from the exchange-oracle dir:
+
+    PYTHONPATH=. python tests/benchmarks/bench_annotation_conversion.py \
+        [JOBS] [IMAGES] [ANNOTATIONS] [WORKERS]
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import mock
+
+import datumaro as dm
+
+from src.core.annotation_meta import RESULTING_ANNOTATIONS_FILE
+from src.core.config import Config
+from src.core.manifest import parse_manifest
+from src.core.types import Networks
+from src.handlers.job_export.exporters.vision import BoxesJobExporter
+from src.handlers.job_export.results import FileDescriptor
+from src.utils.zip_archive import write_dir_to_zip_archive
+
+ESCROW_ADDRESS = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+LABELS = ["cat", "dog", "bird"]
+
+
+def _make_coco_archive(image_ids: range, annotations_count: int) -> bytes:
+    dataset = dm.Dataset(
+        media_type=dm.Image,
+        categories={dm.AnnotationType.label: dm.LabelCategories.from_iterable(LABELS)},
+    )
+    for image_id in image_ids:
+        dataset.put(
+            dm.DatasetItem(
+                id=f"image_{image_id}",
+                annotations=[
+                    dm.Bbox((image_id + i) % 600, i % 400, 20, 30, label=i % len(LABELS), id=i + 1)
+                    for i in range(annotations_count)
+                ],
+            )
+        )
+
+    archive = io.BytesIO()
+    with TemporaryDirectory() as tempdir:
+        dataset.export(tempdir, format="coco_instances")
+        write_dir_to_zip_archive(tempdir, archive)
+
+    return archive.getvalue()
+
+
+def _make_archives(
+    jobs_count: int, images_count: int, annotations_count: int
+) -> list[tuple[str, bytes]]:
+    job_archives = [
+        (
+            f"project_1-task_1-job_{job_id}-user_1-assignment_{job_id}.zip",
+            _make_coco_archive(
+                range(job_id * images_count, (job_id + 1) * images_count), annotations_count
+            ),
+        )
+        for job_id in range(jobs_count)
+    ]
+    merged_archive = (
+        RESULTING_ANNOTATIONS_FILE,
+        _make_coco_archive(range(jobs_count * images_count), annotations_count),
+    )
+    return [merged_archive, *job_archives]
+
+
+def _convert(
+    archives: list[tuple[str, bytes]], project_images_count: int, conversion_workers: int
+) -> tuple[float, list[bytes]]:
+    with open("tests/assets/cloud/manifests/manifest-v1.json") as manifest_data:
+        manifest = parse_manifest(json.load(manifest_data))
+
+    annotations = [FileDescriptor(filename, io.BytesIO(data)) for filename, data in archives]
+
+    with (
+        mock.patch.object(Config.features, "annotation_conversion_workers", conversion_workers),
+        BoxesJobExporter(
+            manifest, ESCROW_ADDRESS, Networks.localhost, session=mock.Mock(), escrow_projects=[]
+        ) as exporter,
+    ):
+        exporter._merged_annotation_file = annotations[0]
+        exporter._project_images = [
+            SimpleNamespace(filename=f"image_{i}.jpg") for i in range(project_images_count)
+        ]
+        exporter._prepare()
+
+        start = time.perf_counter()
+        exporter._postprocess(annotations)
+        elapsed = time.perf_counter() - start
+
+        return elapsed, [fd.file.read() for fd in annotations]
+
+
+def main(
+    jobs_count: int = 200,
+    images_count: int = 10,
+    annotations_count: int = 50,
+    workers: int = os.cpu_count() or 1,
+) -> None:
+    archives = _make_archives(jobs_count, images_count, annotations_count)
+
+    print(
+        f"{jobs_count} jobs, {images_count} images per job, "
+        f"{annotations_count} boxes per image, {sum(len(a) for _, a in archives) // 1024} KB"
+    )
+
+    results = {}
+    for conversion_workers in (1, workers):
+        elapsed, results[conversion_workers] = _convert(
+            archives, jobs_count * images_count, conversion_workers
+        )
+        print(
+            f"  {conversion_workers:>3} workers  {elapsed:>7.1f} s  "
+            f"{jobs_count / elapsed:>7.1f} jobs/s"
+        )
+
+    assert results[1] == results[workers], "The converted archives differ"
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:5]))
@@ -0,0 +1,235 @@
+"""Wall time and peak memory of downloading the job annotations of an escrow from CVAT.
+
+A fake CVAT server prepares each job export in EXPORT_S seconds on EXPORT_WORKERS workers,
+like the CVAT export queue, and returns a zip archive of ARCHIVE_KB kilobytes for each job.
+Compares the previous scheme (the exports are requested in batches, then each of them is
+checked every 5 seconds until it is finished and downloaded into memory) with
+``JobAnnotationsDownloader``, which requests the next export as soon as one is finished,
+checks all the exports in progress together in growing intervals and streams the big
+archives to temporary files. The downloader is run with the default number of active exports
+(TRACK_COMPLETED_ESCROWS_JOBS_DOWNLOADING_BATCH_SIZE) and with all the exports requested at once.
+Each variant is run in a separate process to measure its peak RSS.
+
+Call from the exchange-oracle dir:
+
+    PYTHONPATH=. python tests/benchmarks/bench_annotation_download.py \
+        [JOBS] [ARCHIVE_KB] [EXPORT_S] [EXPORT_WORKERS]
+"""
+
+from __future__ import annotations
+
+import heapq
+import io
+import json
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import threading
+import time
+import zipfile
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import urlsplit
+
+from datumaro.util import take_by
+
+import src.cvat.api_calls as cvat_api
+from src.core.config import Config, CronConfig
+from src.handlers.job_export.downloading import JobAnnotationsDownloader
+
+ANNOTATION_FORMAT = "CVAT for images 1.1"
+PREVIOUS_CHECK_INTERVAL = 5
+
+
+class _FakeCvat(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, archive: bytes, export_time: float, export_workers: int) -> None:
+        super().__init__(("127.0.0.1", 0), _FakeCvatHandler)
+        self.archive = archive
+        self.export_time = export_time
+        self.workers_free_at = [0.0] * export_workers
+        self.exports: dict[str, tuple[int, float]] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def add_export(self, job_id: int) -> str:
+        with self.lock:
+            request_id = f"export-job-{job_id}-{len(self.exports)}"
+            started_at = max(time.monotonic(), heapq.heappop(self.workers_free_at))
+            finished_at = started_at + self.export_time
+            heapq.heappush(self.workers_free_at, finished_at)
+            self.exports[request_id] = (job_id, finished_at)
+            return request_id
+
+    def get_export(self, request_id: str) -> dict:
+        job_id, finished_at = self.exports[request_id]
+        is_finished = finished_at <= time.monotonic()
+        return {
+            "status": "finished" if is_finished else "started",
+            "message": "",
+            "id": request_id,
+            "operation": {
+                "type": "export:dataset",
+                "target": "job",
+                "project_id": None,
+                "task_id": None,
+                "job_id": job_id,
+                "format": ANNOTATION_FORMAT,
+                "function_id": None,
+            },
+            "created_date": "2026-01-01T00:00:00Z",
+            "result_url": f"{self.url}/api/requests/{request_id}/result" if is_finished else None,
+        }
+
+
+class _FakeCvatHandler(BaseHTTPRequestHandler):
+    server: _FakeCvat
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: HTTPStatus, data: dict) -> None:
+        self._send(status, json.dumps(data).encode(), "application/json")
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        if match := re.fullmatch(r"/api/jobs/(\d+)/dataset/export", urlsplit(self.path).path):
+            request_id = self.server.add_export(int(match[1]))
+            self._send_json(HTTPStatus.ACCEPTED, {"rq_id": request_id})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {})
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if match := re.fullmatch(r"/api/requests/([\w-]+)", path):
+            self._send_json(HTTPStatus.OK, self.server.get_export(match[1]))
+        elif re.fullmatch(r"/api/requests/([\w-]+)/result", path):
+            self._send(HTTPStatus.OK, self.server.archive, "application/zip")
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {})
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _make_archive(size: int) -> bytes:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("annotations.xml", os.urandom(size))
+
+    return archive.getvalue()
+
+
+def _previous_get_job_annotations(request_id: str) -> io.RawIOBase:
+    with cvat_api.get_api_client() as api_client:
+        while True:
+            request_info = api_client.requests_api.retrieve(request_id)[0]
+            if cvat_api._is_export_finished(request_info):
+                break
+
+            sleep(PREVIOUS_CHECK_INTERVAL)
+
+        response = api_client.rest_client.GET(
+            request_info.result_url, headers=api_client.get_common_headers()
+        )
+        file_buffer = io.BytesIO(response.data)
+        assert zipfile.is_zipfile(file_buffer)
+        file_buffer.seek(0)
+        return file_buffer
+
+
+def _download_previous(jobs: list[SimpleNamespace]) -> dict[int, io.RawIOBase]:
+    results = {}
+    for jobs_batch in take_by(
+        jobs, count=CronConfig.track_completed_escrows_jobs_downloading_batch_size
+    ):
+        request_ids = [
+            (job, cvat_api.request_job_annotations(job.cvat_id, ANNOTATION_FORMAT))
+            for job in jobs_batch
+        ]
+        for job, request_id in request_ids:
+            results[job.cvat_id] = _previous_get_job_annotations(request_id)
+
+    return results
+
+
+def _download_with_downloader(jobs: list[SimpleNamespace]) -> dict[int, io.RawIOBase]:
+    return JobAnnotationsDownloader(mock.Mock(), ANNOTATION_FORMAT).download(jobs)
+
+
+def _download_all_at_once(jobs: list[SimpleNamespace]) -> dict[int, io.RawIOBase]:
+    return JobAnnotationsDownloader(mock.Mock(), ANNOTATION_FORMAT, max_active=len(jobs)).download(
+        jobs
+    )
+
+
+VARIANTS = {
+    "previous, batches": _download_previous,
+    "downloader": _download_with_downloader,
+    "downloader, all at once": _download_all_at_once,
+}
+
+
+def _run_variant(
+    name: str, cvat_url: str, jobs_count: int, archive_size: int, results: multiprocessing.Queue
+) -> None:
+    jobs = [SimpleNamespace(cvat_id=i) for i in range(jobs_count)]
+
+    with mock.patch.object(Config.cvat_config, "host_url", cvat_url):
+        start = time.perf_counter()
+        files = VARIANTS[name](jobs)
+        elapsed = time.perf_counter() - start
+
+    assert sorted(files) == list(range(jobs_count))
+    assert all(len(f.read()) == archive_size for f in files.values())
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    results.put((elapsed, peak_rss))
+
+
+def main(
+    jobs_count: int = 500, archive_kb: int = 2048, export_s: float = 0.2, export_workers: int = 8
+) -> None:
+    archive = _make_archive(archive_kb * 1024)
+    server = _FakeCvat(archive, export_s, export_workers)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(
+        f"{jobs_count} jobs, {len(archive) // 1024} KB archives, "
+        f"exports take {export_s} s on {export_workers} workers"
+    )
+
+    context = multiprocessing.get_context("spawn")
+    for name in VARIANTS:
+        results = context.Queue()
+        process = context.Process(
+            target=_run_variant, args=(name, server.url, jobs_count, len(archive), results)
+        )
+        process.start()
+        elapsed, peak_rss = results.get()
+        process.join()
+
+        print(f"  {name:<24} wall time {elapsed:>7.1f} s  peak RSS {peak_rss:>7.0f} MB")
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:5]
+    main(*(int(arg) if i != 2 else float(arg) for i, arg in enumerate(args)))
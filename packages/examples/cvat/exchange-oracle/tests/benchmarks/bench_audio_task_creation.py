@@ -0,0 +1,171 @@
+"""Throughput of the media processing in the audio transcription task creation.
+
+Generates FILES synthetic sine-tone recordings and region/GT TSVs for an escrow of CLIPS
+assignment clips, uploads them to the oracle bucket (a local MinIO in the dev setup,
+see the .env file) under a temporary prefix, and runs the media download, GT probing, clip cutting
+and clip upload stages of ``AudioTranscriptionTaskBuilder`` on them. This is done with one ffmpeg
+process and one storage connection, which is close to the previous serial scheme, and with WORKERS
+ffmpeg processes and the configured number of storage connections. The inputs and the escrow
+files are removed after the run.
+
+Call from the exchange-oracle dir:
+
+    PYTHONPATH=. python tests/benchmarks/bench_audio_task_creation.py [CLIPS] [FILES] [WORKERS]
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from src.core.config import Config
+from src.core.manifest import parse_manifest
+from src.core.storage import compose_data_bucket_prefix
+from src.core.types import Networks
+from src.handlers.job_creation.builders.audio.transcription import AudioTranscriptionTaskBuilder
+from src.handlers.job_creation.builders.vision.base import TaskBuilderBase
+from src.services.cloud.utils import BucketAccessInfo
+
+from tests.utils.audio_transcription import build_gt_tsv, build_regions_tsv
+
+ESCROW_ADDRESS = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+CHAIN_ID = Networks.localhost.value
+MANIFEST_PATH = "tests/assets/cloud/manifests/audio_manifest.json"
+
+MEDIA_DURATION_S = 300
+MEDIA_SAMPLE_RATE = 16000
+DS_LEN = 10.0
+DS_STRIDE = 12.0
+DS_AREA_S = 250.0
+DS_PER_CLIP = 4  # fits the 48 s DS budget of a 60 s assignment with 20% validation overhead
+GT_CUES = [(270.0, 276.0), (278.0, 284.0), (286.0, 292.0)]
+
+
+def _generate_wav(path: Path, frequency: int) -> None:
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency={frequency}:duration={MEDIA_DURATION_S}",
+            "-ar",
+            str(MEDIA_SAMPLE_RATE),
+            "-ac",
+            "1",
+            str(path),
+        ],
+        check=True,
+    )
+
+
+def _make_inputs(clips: int, files: int) -> tuple[dict[str, list[float]], list]:
+    filenames = [f"recording_{i}.wav" for i in range(files)]
+    slots = int(DS_AREA_S // DS_STRIDE)
+
+    # the regions are cycled over the recordings, repeating when the slots are exhausted
+    ds_rois: dict[str, list[float]] = {}
+    for i in range(clips * DS_PER_CLIP):
+        ds_rois.setdefault(filenames[i % files], []).append((i // files) % slots * DS_STRIDE)
+
+    gt_rois = [(f"s{i}", filename, GT_CUES) for i, filename in enumerate(filenames)]
+    return ds_rois, gt_rois
+
+
+def _make_bucket_url(path: str) -> dict:
+    cfg = Config.storage_config
+
+    return {
+        "provider": cfg.provider.upper(),
+        "host_url": f"{cfg.get_scheme()}{cfg.endpoint_url}",
+        "bucket_name": cfg.data_bucket_name,
+        "path": path,
+        "access_key": cfg.access_key,
+        "secret_key": cfg.secret_key,
+    }
+
+
+def _run(manifest: dict, audio_workers: int, storage_connections: int) -> tuple[float, float, int]:
+    with (
+        mock.patch.object(Config.features, "audio_processing_workers", audio_workers),
+        mock.patch.object(Config.features, "max_data_storage_connections", storage_connections),
+        AudioTranscriptionTaskBuilder(
+            parse_manifest(manifest), ESCROW_ADDRESS, CHAIN_ID
+        ) as builder,
+    ):
+        start = time.perf_counter()
+        builder._download_input_data()
+        download_time = time.perf_counter() - start
+
+        builder._prepare_rois()
+        builder._prepare_assignments()
+
+        start = time.perf_counter()
+        builder._upload_clips_and_meta()
+        upload_time = time.perf_counter() - start
+
+        return download_time, upload_time, len(builder._assignments)
+
+
+def main(clips: int = 1000, files: int = 20, workers: int = os.cpu_count() or 1) -> None:
+    client = TaskBuilderBase._make_cloud_storage_client(
+        BucketAccessInfo.parse_obj(Config.storage_config)
+    )
+    storage_connections = Config.features.max_data_storage_connections
+    prefix = f"bench-audio-task-creation-{uuid.uuid4().hex}"
+    escrow_prefix = compose_data_bucket_prefix(ESCROW_ADDRESS, CHAIN_ID)
+
+    with open(MANIFEST_PATH) as manifest_file:
+        manifest = json.load(manifest_file)
+
+    manifest["data"] = {
+        "media_url": _make_bucket_url(f"{prefix}/media"),
+        "regions_url": _make_bucket_url(f"{prefix}/regions.tsv"),
+        "gt_url": _make_bucket_url(f"{prefix}/gt.tsv"),
+    }
+
+    ds_rois, gt_rois = _make_inputs(clips, files)
+
+    try:
+        with TemporaryDirectory() as tempdir:
+            for i in range(files):
+                wav_path = Path(tempdir, f"recording_{i}.wav")
+                _generate_wav(wav_path, frequency=220 + 20 * i)
+                with wav_path.open("rb") as wav_file:
+                    client.upload_file(f"{prefix}/media/{wav_path.name}", wav_file)
+
+        client.create_file(f"{prefix}/regions.tsv", build_regions_tsv(ds_rois, DS_LEN).encode())
+        client.create_file(f"{prefix}/gt.tsv", build_gt_tsv(gt_rois).encode())
+
+        print(
+            f"{files} recordings of {MEDIA_DURATION_S} s, "
+            f"{clips * DS_PER_CLIP} regions, {storage_connections} storage connections"
+        )
+
+        for audio_workers, connections in ((1, 1), (workers, storage_connections)):
+            download_time, upload_time, clips_count = _run(manifest, audio_workers, connections)
+            client.remove_files(escrow_prefix)
+
+            print(
+                f"  {audio_workers:>3} ffmpeg processes, {connections:>3} connections  "
+                f"download and probe {download_time:>7.1f} s  "
+                f"cut and upload {clips_count} clips {upload_time:>7.1f} s  "
+                f"{clips_count / upload_time:>7.1f} clips/s"
+            )
+    finally:
+        client.remove_files(prefix)
+        client.remove_files(escrow_prefix)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
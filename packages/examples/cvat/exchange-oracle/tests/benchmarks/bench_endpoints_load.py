@@ -0,0 +1,116 @@
+"""Load test for the async API endpoints with blocking DB and CVAT calls.
+
+Sends concurrent ``GET /stats/assignment`` requests (a few quick DB queries) while slow
+``POST /register`` requests wait for a CVAT API call in the background. The CVAT call is replaced
+with a fake that sleeps for a fixed time and rejects the email, so no CVAT instance is needed
+and the DB is not modified. Compares running the blocking code on the event loop (the previous
+behavior of the endpoints) with ``run_blocking`` and prints p50/p99 latencies per endpoint.
+
+The app is called in-process, the test DB from the .env file is used. Call from the
+exchange-oracle dir:
+
+    DEBUG=1 PYTHONPATH=. python tests/benchmarks/bench_endpoints_load.py \
+        [REQUESTS] [CONCURRENCY] [CVAT_MS]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import sys
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import httpx
+
+import src.cvat.api_calls as cvat_api
+from src.apps.exchange_oracle import app
+
+from tests.api.test_exchange_api import get_auth_header
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _make_slow_get_user_id(delay: float) -> Callable[[str], int]:
+    def _get_user_id(user_email: str) -> int:
+        time.sleep(delay)
+
+        error = cvat_api.exceptions.ApiException(status=400, reason="Bad Request")
+        error.body = '{"email": ["Enter a valid email address."]}'
+        raise error
+
+    return _get_user_id
+
+
+async def _run_inline(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    return func(*args, **kwargs)
+
+
+async def _measure(
+    client: httpx.AsyncClient, method: str, url: str, latencies: list[float]
+) -> None:
+    start = time.perf_counter()
+    await client.request(method, url, headers=get_auth_header())
+    latencies.append(time.perf_counter() - start)
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+async def _run(requests: int, concurrency: int) -> dict[str, list[float]]:
+    latencies: dict[str, list[float]] = {"GET /stats/assignment": [], "POST /register": []}
+    limit = asyncio.Semaphore(concurrency)
+
+    async def _call(method: str, url: str, key: str) -> None:
+        async with limit:
+            await _measure(client, method, url, latencies[key])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/stats/assignment", headers=get_auth_header())  # warm up
+
+        calls = []
+        for i in range(requests):
+            if i % 10 == 0:
+                calls.append(_call("POST", "/register", "POST /register"))
+            calls.append(_call("GET", "/stats/assignment", "GET /stats/assignment"))
+
+        await asyncio.gather(*calls)
+
+    return latencies
+
+
+def _report(name: str, latencies: dict[str, list[float]], elapsed: float) -> None:
+    total = sum(len(values) for values in latencies.values())
+    print(f"{name}: {total / elapsed:.1f} req/s")
+    for endpoint, values in latencies.items():
+        print(
+            f"  {endpoint:<22}"
+            f" p50 {_percentile(values, 50) * 1e3:>8.1f} ms"
+            f"  p99 {_percentile(values, 99) * 1e3:>8.1f} ms"
+        )
+
+
+def main(requests: int = 200, concurrency: int = 20, cvat_ms: int = 200) -> None:
+    with mock.patch(
+        "src.endpoints.exchange.cvat_api.get_user_id", _make_slow_get_user_id(cvat_ms / 1e3)
+    ):
+        for name, patch in (
+            (
+                "before (on the event loop)",
+                mock.patch("src.endpoints.exchange.run_blocking", _run_inline),
+            ),
+            ("after (run_blocking)", nullcontext()),
+        ):
+            with patch:
+                start = time.perf_counter()
+                latencies = asyncio.run(_run(requests, concurrency))
+                _report(name, latencies, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,182 @@
+"""Latency benchmark for serializing a page of the /job listing.
+
+Compares serializing every job separately (``serialize_job``, the previous behavior of
+``list_jobs``) with the page-level bulk loader (``serialize_jobs``) for page sizes 10/50/100.
+
+Redis and the subgraph are replaced with in-memory fakes that sleep for a fixed round trip
+time per request, so the numbers show how the number of round trips scales with the page size.
+Manifests and token symbols are cached, as for most of the requests in production.
+
+Call from the exchange-oracle dir:
+
+    PYTHONPATH=. python tests/benchmarks/bench_job_listing.py [REDIS_RTT_MS] [SUBGRAPH_RTT_MS]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+from unittest import mock
+
+from human_protocol_sdk.constants import ChainId, Status
+from human_protocol_sdk.escrow import EscrowData, EscrowUtils
+
+from src.chain.escrow import escrow_memo
+from src.core.tasks import TaskTypes
+from src.core.types import Networks, ProjectStatuses
+from src.endpoints.serializers import serialize_job, serialize_jobs
+from src.models.cvat import Project
+
+PAGE_SIZES = (10, 50, 100)
+MANIFEST_PATH = "tests/assets/cloud/manifests/manifest-v1.json"
+TOKEN_ADDRESS = "0x" + "2" * 40
+
+
+class _FakeRedisCache:
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+        self.data: dict[str, Any] = {}
+        self.requests = 0
+
+    def _round_trip(self) -> None:
+        self.requests += 1
+        time.sleep(self.rtt)
+
+    def get(self, key: str) -> Any:
+        self._round_trip()
+        return self.data.get(key)
+
+    def get_many(self, *keys: str) -> list[Any]:
+        self._round_trip()
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, timeout: int | None = None) -> bool:  # noqa: ARG002
+        self._round_trip()
+        self.data[key] = value
+        return True
+
+    def set_many(self, mapping: dict[str, Any], timeout: int | None = None) -> list[str]:  # noqa: ARG002
+        self._round_trip()
+        self.data.update(mapping)
+        return list(mapping)
+
+
+class _FakeSubgraph:
+    def __init__(self, rtt: float, escrows: dict[str, EscrowData]) -> None:
+        self.rtt = rtt
+        self.escrows = escrows
+        self.requests = 0
+
+    def get_escrow(self, chain_id: ChainId, escrow_address: str) -> EscrowData | None:  # noqa: ARG002
+        self.requests += 1
+        time.sleep(self.rtt)
+        return self.escrows.get(escrow_address.lower())
+
+    def get_escrows_by_addresses(
+        self,
+        chain_id: ChainId,  # noqa: ARG002
+        escrow_addresses: list[str],
+    ) -> dict[str, EscrowData]:
+        self.requests += 1
+        time.sleep(self.rtt)
+        return {
+            address.lower(): self.escrows[address.lower()]
+            for address in escrow_addresses
+            if address.lower() in self.escrows
+        }
+
+
+def _make_page(page_size: int) -> tuple[list[Project], dict[str, EscrowData]]:
+    chain_id = Networks.localhost.value
+    now = datetime.now(timezone.utc)
+
+    projects = []
+    escrows = {}
+    for cvat_id in range(page_size):
+        escrow_address = "0x" + uuid.uuid4().hex + "0" * 8
+        projects.append(
+            Project(
+                id=str(uuid.uuid4()),
+                cvat_id=cvat_id,
+                cvat_cloudstorage_id=1,
+                status=ProjectStatuses.annotation.value,
+                job_type=TaskTypes.image_boxes.value,
+                escrow_address=escrow_address,
+                chain_id=chain_id,
+                bucket_url="https://test.storage.googleapis.com/",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        escrows[escrow_address.lower()] = EscrowData(
+            chain_id=ChainId(chain_id),
+            id=escrow_address,
+            address=escrow_address,
+            amount_paid=0,
+            balance=10,
+            count=0,
+            factory_address="",
+            launcher="",
+            job_requester_id="",
+            status=Status.Pending.name,
+            token=TOKEN_ADDRESS,
+            total_funded_amount=10,
+            created_at=0,
+        )
+
+    return projects, escrows
+
+
+def _measure(name: str, serialize, cache: _FakeRedisCache, subgraph: _FakeSubgraph) -> float:
+    cache.requests = subgraph.requests = 0
+
+    start = time.perf_counter()
+    with escrow_memo():
+        serialize()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"  {name:<8} {elapsed * 1e3:>9.1f} ms"
+        f"  redis requests: {cache.requests:>4}  subgraph requests: {subgraph.requests:>4}"
+    )
+    return elapsed
+
+
+def main(redis_rtt_ms: float = 1, subgraph_rtt_ms: float = 50) -> None:
+    with open(MANIFEST_PATH) as f:
+        manifest = json.load(f)
+
+    for page_size in PAGE_SIZES:
+        projects, escrows = _make_page(page_size)
+
+        cache = _FakeRedisCache(redis_rtt_ms / 1e3)
+        for project in projects:
+            cache.data[f"{project.escrow_address}@{project.chain_id}"] = manifest
+        cache.data[f"{TOKEN_ADDRESS}@{Networks.localhost.value}"] = "HMT"
+
+        subgraph = _FakeSubgraph(subgraph_rtt_ms / 1e3, escrows)
+
+        with (
+            mock.patch("src.services.cache.get_cache", return_value=cache),
+            mock.patch.object(EscrowUtils, "get_escrow", subgraph.get_escrow),
+            mock.patch.object(
+                EscrowUtils, "get_escrows_by_addresses", subgraph.get_escrows_by_addresses
+            ),
+        ):
+            print(f"page size {page_size}:")
+            before = _measure(
+                "before",
+                lambda: [serialize_job(p, session=mock.Mock()) for p in projects],  # noqa: B023
+                cache,
+                subgraph,
+            )
+            after = _measure("after", lambda: serialize_jobs(projects), cache, subgraph)  # noqa: B023
+            print(f"  speedup  {before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) for arg in sys.argv[1:3]))
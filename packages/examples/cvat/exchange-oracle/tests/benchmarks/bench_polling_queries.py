@@ -0,0 +1,273 @@
+"""Query plans and timings of the cron polling queries on large tables.
+
+Seeds the webhooks, cvat_webhooks, escrow_creations and assignments tables of the test DB
+(from the .env file) with ROWS rows each, of which only one in PENDING_EVERY still has to be
+processed, as in an oracle that has been running for a long time. Then runs the polling queries
+of the crons with and without the partial indexes, and prints the EXPLAIN ANALYZE plans and
+the median query times. The SQL is captured from the service functions the crons call.
+Everything is done in one transaction, which is rolled back at the end.
+
+get_active_task_uploads is not included: the finished uploads are deleted, so the data_uploads
+table only contains the active ones.
+
+Call from the exchange-oracle dir, after the test DB has been created by the tests:
+
+    DEBUG=1 PYTHONPATH=. python tests/benchmarks/bench_polling_queries.py [ROWS] [PENDING_EVERY]
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+import src.services.cvat as cvat_service
+import src.services.webhook as oracle_db_service
+from src.core.tasks import TaskTypes
+from src.core.types import (
+    AssignmentStatuses,
+    CvatWebhookStatuses,
+    JobStatuses,
+    Networks,
+    OracleWebhookStatuses,
+    OracleWebhookTypes,
+    ProjectStatuses,
+    RecordingOracleEventTypes,
+    TaskStatuses,
+)
+from src.db import Base, engine
+from src.db.utils import ForUpdateParams
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Connection, Index
+
+CHUNK_SIZE = 10
+REPEATS = 20
+JOBS = 1000
+CVAT_ID_BASE = 10**9
+WALLET_ADDRESS = "0x" + "b" * 40
+
+INDEX_NAMES = (
+    "ix_webhooks_pending",
+    "ix_cvat_webhooks_pending",
+    "ix_escrow_creations_active",
+    "ix_assignments_active_expires_at",
+)
+
+_SEED_SQL = (
+    """
+    INSERT INTO projects (
+        cvat_id, cvat_cloudstorage_id, status, job_type, escrow_address, chain_id, bucket_url
+    )
+    VALUES (:base, :base, :project_status, :job_type, :wallet, :chain_id, 'http://localhost')
+    """,
+    "INSERT INTO tasks (cvat_id, cvat_project_id, status) VALUES (:base, :base, :task_status)",
+    """
+    INSERT INTO jobs (cvat_id, cvat_task_id, cvat_project_id, status, start_frame, stop_frame)
+    SELECT :base + i, :base, :base, :job_status, 0, 0 FROM generate_series(1, :jobs) AS i
+    """,
+    "INSERT INTO users (wallet_address, cvat_id) VALUES (:wallet, :base)",
+    """
+    INSERT INTO webhooks (
+        escrow_address, chain_id, type, status, attempts, wait_until, event_type, direction
+    )
+    SELECT
+        '0x' || lpad(to_hex(i), 40, '0'),
+        :chain_id,
+        (CAST(:webhook_types AS text[]))[1 + floor(random() * :webhook_type_count)::int],
+        CASE WHEN pending THEN :webhook_pending ELSE :webhook_completed END,
+        1,
+        now() + (random() - 0.9) * interval '1 hour',
+        'job_finished',
+        CASE WHEN random() < 0.5 THEN 'incoming' ELSE 'outgoing' END
+    FROM (
+        SELECT i, i % :pending_every = 0 AS pending FROM generate_series(1, :rows) AS i
+    ) AS s
+    """,
+    """
+    INSERT INTO cvat_webhooks (
+        cvat_project_id, cvat_task_id, cvat_job_id, status, wait_until, event_type
+    )
+    SELECT
+        :base,
+        :base,
+        CASE WHEN pending THEN :base + 1 ELSE :base + 1 + i % :jobs END,
+        CASE WHEN pending THEN :cvat_webhook_pending ELSE :cvat_webhook_completed END,
+        now() + (random() - 0.9) * interval '1 hour',
+        'update:job'
+    FROM (
+        SELECT i, i % :pending_every = 0 AS pending FROM generate_series(1, :rows) AS i
+    ) AS s
+    """,
+    """
+    INSERT INTO escrow_creations (escrow_address, chain_id, total_jobs, finished_at)
+    SELECT
+        '0x' || lpad(to_hex(i), 40, '0'),
+        :chain_id,
+        1,
+        CASE WHEN pending THEN NULL ELSE now() END
+    FROM (
+        SELECT i, i % :pending_every = 0 AS pending FROM generate_series(1, :rows) AS i
+    ) AS s
+    """,
+    """
+    INSERT INTO assignments (expires_at, completed_at, user_wallet_address, cvat_job_id, status)
+    SELECT
+        now() + (random() - 0.5) * interval '1 day',
+        CASE WHEN pending THEN NULL ELSE now() END,
+        :wallet,
+        :base + 1 + i % :jobs,
+        CASE WHEN pending THEN :assignment_created ELSE :assignment_completed END
+    FROM (
+        SELECT i, i % :pending_every = 0 AS pending FROM generate_series(1, :rows) AS i
+    ) AS s
+    """,
+    "ANALYZE webhooks, cvat_webhooks, escrow_creations, assignments",
+)
+
+QUERIES: dict[str, Callable[[Session], Any]] = {
+    "incoming webhooks": lambda session: oracle_db_service.inbox.get_pending_webhooks(
+        session,
+        OracleWebhookTypes.recording_oracle,
+        event_type_not_in=[RecordingOracleEventTypes.job_completed],
+        limit=CHUNK_SIZE,
+        for_update=ForUpdateParams(skip_locked=True),
+    ),
+    "outgoing webhooks": lambda session: oracle_db_service.outbox.get_pending_webhooks(
+        session,
+        OracleWebhookTypes.job_launcher,
+        limit=CHUNK_SIZE,
+        for_update=ForUpdateParams(skip_locked=True),
+    ),
+    "CVAT webhooks": lambda session: cvat_service.incoming_webhooks.get_pending_webhooks(
+        session, limit=CHUNK_SIZE, for_update=ForUpdateParams(skip_locked=True)
+    ),
+    "escrow creations": lambda session: cvat_service.get_active_escrow_creations(
+        session, limit=CHUNK_SIZE, for_update=ForUpdateParams(skip_locked=True)
+    ),
+    "expired assignments": lambda session: cvat_service.get_unprocessed_expired_assignments(
+        session, limit=CHUNK_SIZE, for_update=ForUpdateParams(skip_locked=True)
+    ),
+}
+
+
+def _get_indexes() -> list[Index]:
+    indexes = {
+        index.name: index for table in Base.metadata.tables.values() for index in table.indexes
+    }
+    return [indexes[name] for name in INDEX_NAMES]
+
+
+def _seed(connection: Connection, rows: int, pending_every: int) -> None:
+    webhook_types = [t.value for t in OracleWebhookTypes]
+    params = {
+        "rows": rows,
+        "pending_every": pending_every,
+        "jobs": JOBS,
+        "base": CVAT_ID_BASE,
+        "wallet": WALLET_ADDRESS,
+        "chain_id": Networks.localhost.value,
+        "project_status": ProjectStatuses.annotation.value,
+        "job_type": next(iter(TaskTypes)).value,
+        "task_status": TaskStatuses.annotation.value,
+        "job_status": JobStatuses.in_progress.value,
+        "webhook_types": webhook_types,
+        "webhook_type_count": len(webhook_types),
+        "webhook_pending": OracleWebhookStatuses.pending.value,
+        "webhook_completed": OracleWebhookStatuses.completed.value,
+        "cvat_webhook_pending": CvatWebhookStatuses.pending.value,
+        "cvat_webhook_completed": CvatWebhookStatuses.completed.value,
+        "assignment_created": AssignmentStatuses.created.value,
+        "assignment_completed": AssignmentStatuses.completed.value,
+    }
+
+    connection.execute(text("SELECT setseed(0.5)"))
+    for statement in _SEED_SQL:
+        connection.execute(text(statement), params)
+
+
+def _capture_sql(connection: Connection, query: Callable[[Session], Any]) -> tuple[str, Any]:
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", _on_execute)
+    try:
+        with Session(bind=connection) as session:
+            query(session)
+    finally:
+        event.remove(connection, "before_cursor_execute", _on_execute)
+
+    assert len(statements) == 1, statements
+    return statements[0]
+
+
+def _run_queries(connection: Connection, sql: dict[str, tuple[str, Any]]) -> dict[str, tuple]:
+    results = {}
+    for name, (statement, parameters) in sql.items():
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+        ).scalars()
+
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            connection.exec_driver_sql(statement, parameters).all()
+            timings.append(time.perf_counter() - start)
+
+        results[name] = ("\n".join(plan), statistics.median(timings))
+
+    return results
+
+
+def main(rows: int = 1_000_000, pending_every: int = 1000) -> None:
+    assert "test" in engine.url.database, "The test database must be used for benchmarking."
+
+    indexes = _get_indexes()
+
+    with engine.connect() as connection, connection.begin() as transaction:
+        for index in indexes:
+            index.create(connection, checkfirst=True)
+
+        start = time.perf_counter()
+        _seed(connection, rows, pending_every)
+        print(f"Seeded {rows} rows per table in {time.perf_counter() - start:.1f} s")
+
+        sql = {name: _capture_sql(connection, query) for name, query in QUERIES.items()}
+        indexed = _run_queries(connection, sql)
+
+        with connection.begin_nested() as savepoint:
+            for index in indexes:
+                index.drop(connection)
+
+            not_indexed = _run_queries(connection, sql)
+            savepoint.rollback()
+
+        transaction.rollback()
+
+    for name in QUERIES:
+        for title, (plan, _) in (
+            ("without indexes", not_indexed[name]),
+            ("with indexes", indexed[name]),
+        ):
+            print(f"\n=== {name}, {title}\n{plan}")
+
+    print(f"\nMedian query times, ms ({rows} rows, 1 in {pending_every} pending):")
+    for name in QUERIES:
+        before, after = not_indexed[name][1], indexed[name][1]
+        print(
+            f"  {name:<20} without indexes {1000 * before:>9.2f}"
+            f"  with indexes {1000 * after:>7.2f}"
+            f"  speedup {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
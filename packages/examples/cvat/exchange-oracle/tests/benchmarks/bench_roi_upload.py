@@ -0,0 +1,113 @@
+"""Throughput benchmark for the RoI extraction and upload in the vision task builders.
+
+Compares the previous scheme (only downloads run in a thread pool, decoding, cropping, encoding
+and uploads run serially on the calling thread) with ``RoiImageUploadPipeline``, which uses
+separate pools for each stage. Synthetic source images are uploaded to the oracle bucket
+(a local MinIO in the dev setup, see the .env file) under a temporary prefix, which is removed
+after the run.
+
+Call from the exchange-oracle dir:
+
+    PYTHONPATH=. python tests/benchmarks/bench_roi_upload.py [IMAGES] [ROIS_PER_IMAGE]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+from datumaro.util.image import decode_image, encode_image
+
+from src.core.config import Config
+from src.handlers.job_creation.builders.vision.base import TaskBuilderBase
+from src.services.cloud.utils import BucketAccessInfo
+from src.utils.roi_uploader import RoiImageUploadPipeline
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from src.services.cloud import StorageClient
+
+IMAGE_SIZE = (1080, 1920)
+ROI_SIZE = 256
+
+
+def _make_rois(
+    filename: str, image_bytes: bytes, rois_per_image: int
+) -> Iterator[tuple[str, bytes]]:
+    image = decode_image(image_bytes)
+
+    rng = np.random.default_rng(len(image_bytes))
+    for roi_id in range(rois_per_image):
+        y = rng.integers(0, image.shape[0] - ROI_SIZE)
+        x = rng.integers(0, image.shape[1] - ROI_SIZE)
+        roi = image[y : y + ROI_SIZE, x : x + ROI_SIZE]
+        yield f"{filename}.rois/{roi_id}.png", encode_image(roi, ".png")
+
+
+def _run_serial(
+    client: StorageClient, filenames: list[str], rois_per_image: int, pool_size: int
+) -> None:
+    with ThreadPoolExecutor(pool_size) as pool:
+        downloads = [(f, pool.submit(client.download_file, f)) for f in filenames]
+        for filename, download in downloads:
+            for key, roi_bytes in _make_rois(filename, download.result(), rois_per_image):
+                client.create_file(key, roi_bytes)
+
+
+def _run_pipeline(
+    client: StorageClient, filenames: list[str], rois_per_image: int, pool_size: int
+) -> RoiImageUploadPipeline:
+    pipeline = RoiImageUploadPipeline(
+        download=client.download_file,
+        process=lambda filename, image_bytes: _make_rois(filename, image_bytes, rois_per_image),
+        upload=client.create_file,
+        download_workers=pool_size,
+        process_workers=Config.features.roi_processing_workers,
+        upload_workers=pool_size,
+    )
+    pipeline.run(filenames)
+    return pipeline
+
+
+def main(images: int = 200, rois_per_image: int = 20) -> None:
+    client = TaskBuilderBase._make_cloud_storage_client(
+        BucketAccessInfo.parse_obj(Config.storage_config)
+    )
+    pool_size = Config.features.max_data_storage_connections
+    prefix = f"bench-roi-upload-{uuid.uuid4().hex}"
+
+    rng = np.random.default_rng(0)
+    filenames = []
+    for i in range(images):
+        image = rng.integers(0, 256, size=(*IMAGE_SIZE, 3), dtype=np.uint8)
+        filename = f"{prefix}/images/{i}.jpg"
+        client.create_file(filename, encode_image(image, ".jpg"))
+        filenames.append(filename)
+
+    total_rois = images * rois_per_image
+    print(f"{images} images, {total_rois} RoIs, {pool_size} storage connections")
+
+    try:
+        start = time.perf_counter()
+        _run_serial(client, filenames, rois_per_image, pool_size)
+        before = time.perf_counter() - start
+        print(f"before (serial):   {before:>7.2f} s  {total_rois / before:>8.1f} RoIs/s")
+
+        start = time.perf_counter()
+        pipeline = _run_pipeline(client, filenames, rois_per_image, pool_size)
+        after = time.perf_counter() - start
+        print(f"after (pipeline):  {after:>7.2f} s  {total_rois / after:>8.1f} RoIs/s")
+        print(f"  {pipeline.format_stats()}")
+
+        print(f"speedup: {before / after:.1f}x")
+    finally:
+        client.remove_files(prefix)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
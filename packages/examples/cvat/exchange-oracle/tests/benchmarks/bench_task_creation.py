@@ -0,0 +1,130 @@
+"""Time of creating the CVAT tasks of an escrow in the vision task builders.
+
+Compares the previous scheme (each task is created, its data upload is waited for with
+a sleep-poll loop and its GT job is configured before the next task is started) with
+``CvatTaskCreator``, against a fake CVAT server with LATENCY seconds per request and UPLOAD
+seconds of data processing per task.
+
+Call from the exchange-oracle dir:
+
+    PYTHONPATH=. python tests/benchmarks/bench_task_creation.py \
+        [TASKS] [MAX_ACTIVE] [LATENCY] [UPLOAD] [CHECK_INTERVAL]
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from functools import partial
+from types import SimpleNamespace
+from unittest import mock
+
+from src.cvat.api_calls import RequestStatus
+from src.handlers.job_creation.task_creation import CvatTaskCreator, CvatTaskParams
+
+
+class _FakeCvat:
+    def __init__(self, latency: float, upload_time: float) -> None:
+        self.latency = latency
+        self.upload_time = upload_time
+        self.lock = threading.Lock()
+        self.uploads: dict[int, float] = {}  # task id -> finish time
+        self.requests = 0
+
+    def _request(self) -> None:
+        with self.lock:
+            self.requests += 1
+
+        time.sleep(self.latency)
+
+    def create_task(self) -> SimpleNamespace:
+        self._request()
+
+        with self.lock:
+            return SimpleNamespace(id=len(self.uploads) + 1, status="annotation")
+
+    def put_task_data(self, task_id: int) -> None:
+        self._request()
+
+        with self.lock:
+            self.uploads[task_id] = time.monotonic() + self.upload_time
+
+    def get_task_upload_status(self, task_id: int) -> tuple[RequestStatus, str]:
+        self._request()
+
+        if self.uploads[task_id] <= time.monotonic():
+            return RequestStatus.FINISHED, ""
+
+        return RequestStatus.STARTED, ""
+
+    def setup_task(self, task_id: int) -> None:  # noqa: ARG002
+        for _ in range(4):  # get the GT job, upload GT, finish the GT job, update the settings
+            self._request()
+
+
+def _create_serially(cvat: _FakeCvat, tasks: int, check_interval: float) -> None:
+    for _ in range(tasks):
+        task = cvat.create_task()
+        cvat.put_task_data(task.id)
+
+        while cvat.get_task_upload_status(task.id)[0] != RequestStatus.FINISHED:
+            time.sleep(check_interval)
+
+        cvat.setup_task(task.id)
+
+
+def _create_concurrently(
+    cvat: _FakeCvat, tasks: int, max_active: int, check_interval: float
+) -> None:
+    creator = CvatTaskCreator(mock.Mock(), max_active=max_active, check_interval=check_interval)
+
+    with mock.patch("src.handlers.job_creation.task_creation.cvat_api") as mock_cvat_api:
+        mock_cvat_api.RequestStatus = RequestStatus
+        mock_cvat_api.get_task_upload_status.side_effect = cvat.get_task_upload_status
+
+        creator.create(
+            [
+                CvatTaskParams(
+                    create=cvat.create_task, upload=cvat.put_task_data, setup=cvat.setup_task
+                )
+                for _ in range(tasks)
+            ]
+        )
+
+
+def main(
+    tasks: int = 50,
+    max_active: int = 4,
+    latency: float = 0.05,
+    upload_time: float = 2,
+    check_interval: float = 1,
+) -> None:
+    print(
+        f"{tasks} tasks, {latency * 1000:.0f} ms per request, {upload_time} s per data upload, "
+        f"checked each {check_interval} s"
+    )
+
+    for name, create in (
+        ("before (serial):", partial(_create_serially, tasks=tasks, check_interval=check_interval)),
+        (
+            f"after ({max_active} active):",
+            partial(
+                _create_concurrently,
+                tasks=tasks,
+                max_active=max_active,
+                check_interval=check_interval,
+            ),
+        ),
+    ):
+        cvat = _FakeCvat(latency, upload_time)
+
+        start = time.perf_counter()
+        create(cvat)
+        elapsed = time.perf_counter() - start
+
+        print(f"  {name:<20} {elapsed:>7.1f} s  {cvat.requests:>5} requests")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]), *(float(arg) for arg in sys.argv[3:6]))
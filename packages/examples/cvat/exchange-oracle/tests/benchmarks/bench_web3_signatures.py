@@ -0,0 +1,87 @@
+"""Micro-benchmark for webhook signature checks.
+
+Compares recovering the signer of an incoming webhook the way it was done before the Web3
+instances were cached (a new provider and signing middleware per call) with the current
+provider-free ``recover_signer``. No RPC node is needed, providers are never connected.
+
+Call from the exchange-oracle dir:
+
+    PYTHONPATH=. python tests/benchmarks/bench_web3_signatures.py [ITERATIONS]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from eth_account.messages import encode_defunct
+from web3 import Web3
+from web3.middleware import SignAndSendRawMiddlewareBuilder
+from web3.providers.rpc import HTTPProvider
+
+from src.chain.web3 import get_web3, recover_signer, serialize_message, sign_message
+from src.core.config import Config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MESSAGE = {
+    "escrow_address": "0x12E66A452f95bff49eD5a30b0d06Ebc37C5A94B6",
+    "chain_id": Config.localhost.chain_id,
+    "event_type": "escrow_created",
+    "event_data": {},
+}
+
+
+def _recover_signer_uncached(chain_id: int, message, signature: str) -> str:
+    network = Config.localhost
+    assert chain_id == network.chain_id
+
+    w3 = Web3(HTTPProvider(network.rpc_api))
+    gas_payer = w3.eth.account.from_key(network.private_key)
+    w3.middleware_onion.inject(
+        SignAndSendRawMiddlewareBuilder.build(network.private_key),
+        "SignAndSendRawMiddlewareBuilder",
+        layer=0,
+    )
+    w3.eth.default_account = gas_payer.address
+
+    message_hash = encode_defunct(text=serialize_message(message))
+    return w3.eth.account.recover_message(message_hash, signature=signature)
+
+
+def _measure(name: str, check: Callable[[], object], iterations: int) -> float:
+    check()  # warm up
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        check()
+    elapsed = time.perf_counter() - start
+
+    rate = iterations / elapsed
+    print(f"{name:<24} {rate:>10.1f} checks/s  ({elapsed / iterations * 1e3:.3f} ms/check)")
+    return rate
+
+
+def main(iterations: int = 2000) -> None:
+    chain_id = Config.localhost.chain_id
+    signature, _ = sign_message(chain_id, MESSAGE)
+
+    before = _measure(
+        "before (new Web3)",
+        lambda: _recover_signer_uncached(chain_id, MESSAGE, signature),
+        iterations,
+    )
+    after = _measure(
+        "after (provider-free)",
+        lambda: recover_signer(chain_id, MESSAGE, signature),
+        iterations,
+    )
+    cached_web3 = _measure("get_web3 (cached)", lambda: get_web3(chain_id), iterations)
+
+    print(f"speedup: {after / before:.1f}x signature checks, get_web3: {cached_web3:.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
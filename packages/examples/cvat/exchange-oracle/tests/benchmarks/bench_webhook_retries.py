@@ -0,0 +1,153 @@
+"""Load test for the outgoing webhook retries during a receiver outage.
+
+A local receiver rejects all the requests (503) for the first OUTAGE_S seconds and accepts them
+afterwards. WEBHOOKS outgoing webhooks are created in the test DB (from the .env file), and
+the outgoing webhook cron is run in a loop until all of them are delivered. Compares the
+previous fixed retry delay with the exponential backoff with jitter, and prints the requests
+the receiver gets during the outage, the peak request rate after the recovery and
+the delivery time. The delays are scaled down: the first retry is in 1 s, the max delay is 8 s.
+The webhooks are removed after each run.
+
+Call from the exchange-oracle dir:
+
+    DEBUG=1 PYTHONPATH=. python tests/benchmarks/bench_webhook_retries.py [WEBHOOKS] [OUTAGE_S]
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import nullcontext
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from src.core.config import Config
+from src.core.types import ExchangeOracleEventTypes, Networks, OracleWebhookTypes
+from src.crons.webhooks._common import process_outgoing_webhooks
+from src.db import SessionLocal, engine
+from src.models.webhook import Webhook
+from src.services.webhook import OracleWebhookDirectionTags
+from src.utils.time import utcnow
+
+CHUNK_SIZE = 100
+POLL_INTERVAL = 0.1
+BUCKET_SIZE = 0.5
+
+
+class _Receiver(ThreadingHTTPServer):
+    def __init__(self, outage: float) -> None:
+        super().__init__(("127.0.0.1", 0), _ReceiverHandler)
+        self.recovered_at = time.monotonic() + outage
+        self.requests: list[tuple[float, bool]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/webhook"
+
+
+class _ReceiverHandler(BaseHTTPRequestHandler):
+    server: _Receiver
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+
+        now = time.monotonic()
+        accepted = now >= self.server.recovered_at
+        with self.server.lock:
+            self.server.requests.append((now, accepted))
+
+        self.send_response(200 if accepted else 503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _add_webhooks(count: int) -> None:
+    with SessionLocal.begin() as session:
+        session.add_all(
+            Webhook(
+                id=str(uuid.uuid4()),
+                escrow_address=f"0x{i:040x}",
+                chain_id=Networks.localhost.value,
+                type=OracleWebhookTypes.job_launcher.value,
+                event_type=ExchangeOracleEventTypes.job_finished.value,
+                direction=OracleWebhookDirectionTags.outgoing.value,
+            )
+            for i in range(count)
+        )
+
+
+def _fixed_retry_time(attempts):
+    return utcnow() + timedelta(seconds=Config.webhook_delay_if_failed)
+
+
+def _run(name: str, webhooks: int, outage: float, *, fixed_delay: bool) -> None:
+    logger = logging.getLogger("bench")
+    _add_webhooks(webhooks)
+
+    receiver = _Receiver(outage)
+    threading.Thread(target=receiver.serve_forever, daemon=True).start()
+
+    def get_url(chain_id: int, escrow_address: str) -> str:
+        return receiver.url
+
+    retry_time_patch = (
+        mock.patch("src.services.webhook.get_webhook_retry_time", _fixed_retry_time)
+        if fixed_delay
+        else nullcontext()
+    )
+    with retry_time_patch:
+        deadline = time.monotonic() + outage + 120
+        while time.monotonic() < deadline:
+            with SessionLocal.begin() as session:
+                process_outgoing_webhooks(
+                    logger, session, OracleWebhookTypes.job_launcher, get_url, CHUNK_SIZE
+                )
+
+            with receiver.lock:
+                delivered = sum(accepted for _, accepted in receiver.requests)
+            if delivered == webhooks:
+                break
+
+            time.sleep(POLL_INTERVAL)
+
+    receiver.shutdown()
+    receiver.server_close()
+    with SessionLocal.begin() as session:
+        session.query(Webhook).delete()
+
+    rejected = sum(not accepted for _, accepted in receiver.requests)
+    after_recovery = [t for t, _ in receiver.requests if t >= receiver.recovered_at]
+    buckets = Counter(int((t - receiver.recovered_at) / BUCKET_SIZE) for t in after_recovery)
+    delivery_time = max(after_recovery) - receiver.recovered_at if after_recovery else 0
+    print(
+        f"{name:<28} delivered {delivered:>5}/{webhooks}"
+        f"  rejected requests {rejected:>6}"
+        f"  peak after recovery {max(buckets.values(), default=0) / BUCKET_SIZE:>7.1f} req/s"
+        f"  delivered {delivery_time:>5.1f} s after recovery"
+    )
+
+
+def main(webhooks: int = 500, outage: float = 10) -> None:
+    assert "test" in engine.url.database, "The test database must be used for benchmarking."
+
+    with (
+        mock.patch("src.crons.webhooks._common.prepare_signed_message", return_value=("", "sig")),
+        mock.patch("src.core.config.Config.webhook_max_retries", 1000),
+        mock.patch("src.core.config.Config.webhook_delay_if_failed", 1),
+        mock.patch("src.core.config.Config.webhook_max_delay_if_failed", 8),
+    ):
+        _run("fixed delay", webhooks, outage, fixed_delay=True)
+        _run("exponential backoff, jitter", webhooks, outage, fixed_delay=False)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -1,5 +1,7 @@
+import copy
 import json
 import unittest
+import uuid
 from unittest.mock import patch
 
 import pytest
@@ -8,8 +10,13 @@ from human_protocol_sdk.encryption import EncryptionUtils
 from human_protocol_sdk.escrow import EscrowClientError, EscrowData
 
 from src.chain.escrow import (
+    escrow_memo,
     get_available_webhook_types,
+    get_escrow,
+    get_escrow_fund_token_symbols,
     get_escrow_manifest,
+    get_escrow_manifests,
+    get_escrows,
     validate_escrow,
 )
 from src.core.types import OracleWebhookTypes
@@ -144,3 +151,91 @@ class ServiceIntegrationTest(unittest.TestCase):
             mock_function.return_value = None
             with pytest.raises(Exception, match=f"Can't find escrow {ESCROW_ADDRESS}"):
                 get_available_webhook_types(chain_id, escrow_address)
+
+    def test_get_escrow_memoized(self):
+        with patch("src.chain.escrow.EscrowUtils.get_escrow") as mock_function:
+            mock_function.return_value = self.escrow_data
+
+            with escrow_memo():
+                validate_escrow(chain_id, escrow_address)
+                get_available_webhook_types(chain_id, escrow_address.upper())
+                assert get_escrow(chain_id, escrow_address) is self.escrow_data
+
+            assert mock_function.call_count == 1
+
+            get_escrow(chain_id, escrow_address)
+            assert mock_function.call_count == 2
+
+    def test_get_escrow_memo_expires(self):
+        with (
+            patch("src.chain.escrow.EscrowUtils.get_escrow") as mock_function,
+            patch("src.core.config.Config.features.escrow_memo_ttl", -1),
+        ):
+            mock_function.return_value = self.escrow_data
+
+            with escrow_memo():
+                get_escrow(chain_id, escrow_address)
+                get_escrow(chain_id, escrow_address)
+
+            assert mock_function.call_count == 2
+
+    def test_get_escrows(self):
+        other_escrow_address = "0x" + "1" * 40
+
+        with (
+            patch("src.chain.escrow.EscrowUtils.get_escrow") as mock_get_escrow,
+            patch("src.chain.escrow.EscrowUtils.get_escrows_by_addresses") as mock_get_escrows,
+        ):
+            mock_get_escrow.return_value = self.escrow_data
+            mock_get_escrows.return_value = {}
+
+            with escrow_memo():
+                get_escrow(chain_id, escrow_address)
+                escrows = get_escrows(chain_id, [escrow_address, other_escrow_address])
+
+        assert escrows == {escrow_address.lower(): self.escrow_data}
+        mock_get_escrows.assert_called_once_with(ChainId(chain_id), [other_escrow_address])
+
+    def test_get_escrow_manifests(self):
+        escrow_addresses = ["0x" + uuid.uuid4().hex + "0" * 8 for _ in range(3)]
+        escrows = {}
+        for address in escrow_addresses:
+            escrows[address] = copy.copy(self.escrow_data)
+            escrows[address].address = address
+
+        with (
+            patch("src.chain.escrow.EscrowUtils.get_escrows_by_addresses") as mock_get_escrows,
+            patch("src.chain.escrow._get_manifest_content") as mock_download,
+        ):
+            mock_get_escrows.side_effect = lambda _, addresses: {
+                address.lower(): escrows[address] for address in addresses
+            }
+            mock_download.return_value = json.dumps({"title": "test"})
+
+            get_escrow_manifests(chain_id, escrow_addresses[:1])
+            manifests = get_escrow_manifests(chain_id, escrow_addresses)
+
+        assert manifests == {address: {"title": "test"} for address in escrow_addresses}
+        assert mock_get_escrows.call_count == 2
+        assert mock_get_escrows.call_args.args == (ChainId(chain_id), escrow_addresses[1:])
+        assert mock_download.call_count == len(escrow_addresses)
+
+    def test_get_escrow_fund_token_symbols(self):
+        other_escrow_address = "0x" + "1" * 40
+
+        with (
+            patch("src.chain.escrow.EscrowUtils.get_escrows_by_addresses") as mock_get_escrows,
+            patch("src.chain.escrow.get_token_symbol") as mock_get_token_symbol,
+        ):
+            mock_get_escrows.return_value = {
+                escrow_address.lower(): self.escrow_data,
+                other_escrow_address: self.escrow_data,
+            }
+            mock_get_token_symbol.return_value = "HMT"
+
+            token_symbols = get_escrow_fund_token_symbols(
+                chain_id, [escrow_address, other_escrow_address]
+            )
+
+        assert token_symbols == {escrow_address: "HMT", other_escrow_address: "HMT"}
+        mock_get_escrows.assert_called_once()
@@ -57,6 +57,20 @@ class ServiceIntegrationTest(unittest.TestCase):
         assert w3.eth.default_account == DEFAULT_GAS_PAYER
         assert w3.manager._provider.endpoint_uri == LocalhostConfig.rpc_api
 
+    def test_get_web3_cached(self):
+        w3 = get_web3(ChainId.LOCALHOST.value)
+        assert get_web3(ChainId.LOCALHOST.value) is w3
+
+        class LocalhostConfig:
+            chain_id = 1338
+            rpc_api = "http://other-blockchain-node:8545"
+            private_key = DEFAULT_GAS_PAYER_PRIV
+
+        with patch("src.chain.web3.Config.localhost", LocalhostConfig):
+            other_w3 = get_web3(ChainId.LOCALHOST.value)
+        assert other_w3 is not w3
+        assert other_w3.manager._provider.endpoint_uri == LocalhostConfig.rpc_api
+
     def test_get_web3_invalid_chain_id(self):
         with pytest.raises(
             ValueError, match=re.escape("1234 is not in available list of networks.")
@@ -97,6 +111,18 @@ class ServiceIntegrationTest(unittest.TestCase):
             signer = recover_signer(ChainId.POLYGON.value, "message", SIGNATURE)
         assert signer == DEFAULT_GAS_PAYER
 
+    def test_sign_and_recover_without_provider(self):
+        with (
+            patch("src.chain.web3.get_web3") as mock_function,
+            patch("src.chain.web3.Config.localhost.private_key", DEFAULT_GAS_PAYER_PRIV),
+        ):
+            signature, _ = sign_message(ChainId.LOCALHOST.value, "message")
+            signer = recover_signer(ChainId.LOCALHOST.value, "message", signature)
+
+        assert signature == SIGNATURE
+        assert signer == DEFAULT_GAS_PAYER
+        mock_function.assert_not_called()
+
     def test_recover_signer_invalid_signature(self):
         with patch("src.chain.web3.get_web3") as mock_function:
             mock_function.return_value = self.w3
@@ -272,8 +272,8 @@ class ServiceIntegrationTest(unittest.TestCase):
             patch("src.handlers.job_export.results.cloud_service") as mock_cloud_service,
         ):
             mock_storage_client = Mock()
-            mock_storage_client.create_file = Mock()
-            mock_storage_client.list_files = Mock(return_value=[])
+            mock_storage_client.upload_file = Mock()
+            mock_storage_client.list_file_infos = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
 
             track_escrow_validations()
@@ -387,11 +387,11 @@ class ServiceIntegrationTest(unittest.TestCase):
             patch("src.handlers.job_export.results.cloud_service") as mock_cloud_service,
             patch("src.services.cloud.make_client"),
         ):
-            mock_cloud_service.make_client.return_value.create_file.side_effect = _TestException()
+            mock_cloud_service.make_client.return_value.upload_file.side_effect = _TestException()
 
             track_escrow_validations()
 
-            mock_cloud_service.make_client.return_value.create_file.assert_called()
+            mock_cloud_service.make_client.return_value.upload_file.assert_called()
 
         webhook = (
             self.session.query(Webhook)
@@ -485,8 +485,8 @@ class ServiceIntegrationTest(unittest.TestCase):
             patch("src.handlers.job_export.results.cloud_service") as mock_cloud_service,
         ):
             mock_storage_client = Mock()
-            mock_storage_client.create_file = Mock()
-            mock_storage_client.list_files = Mock(return_value=[])
+            mock_storage_client.upload_file = Mock()
+            mock_storage_client.list_file_infos = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
 
             track_escrow_validations()
@@ -616,8 +616,8 @@ class ServiceIntegrationTest(unittest.TestCase):
             mock_cvat_api.get_project_annotations.return_value = dummy_zip_file
 
             mock_storage_client = Mock()
-            mock_storage_client.create_file = Mock()
-            mock_storage_client.list_files = Mock(return_value=[])
+            mock_storage_client.upload_file = Mock()
+            mock_storage_client.list_file_infos = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
 
             handle_escrow_export(
@@ -639,7 +639,7 @@ class ServiceIntegrationTest(unittest.TestCase):
             mock_cvat_api.get_job_annotations.call_count
             or mock_cvat_api.get_project_annotations.call_count
         )
-        assert mock_storage_client.create_file.call_count == 3  # meta + merged + per job anns
+        assert mock_storage_client.upload_file.call_count == 3  # meta + merged + per job anns
 
     def test_can_export_escrow_error_getting_annotations(self):
         escrow_address = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
@@ -726,9 +726,9 @@ class ServiceIntegrationTest(unittest.TestCase):
             manifest = json.load(data)
             mock_get_manifest.return_value = manifest
 
-            mock_create_file = Mock()
+            mock_upload_file = Mock()
             mock_storage_client = Mock()
-            mock_storage_client.create_file = mock_create_file
+            mock_storage_client.upload_file = mock_upload_file
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
 
             mock_request_job_annotations.side_effect = _TestException()
@@ -750,7 +750,7 @@ class ServiceIntegrationTest(unittest.TestCase):
         )
         assert webhook is None
 
-        mock_storage_client.create_file.assert_not_called()
+        mock_storage_client.upload_file.assert_not_called()
 
         db_project = self.session.query(Project).filter_by(id=project_id).first()
         assert db_project.status == ProjectStatuses.validation
@@ -865,7 +865,7 @@ class ServiceIntegrationTest(unittest.TestCase):
 
             mock_cvat_api.get_job_annotations.return_value = dummy_zip_file
             mock_cvat_api.get_project_annotations.return_value = dummy_zip_file
-            mock_cloud_service.make_client.return_value.create_file.side_effect = _TestException()
+            mock_cloud_service.make_client.return_value.upload_file.side_effect = _TestException()
 
             with pytest.raises(_TestException):
                 handle_escrow_export(
@@ -875,7 +875,7 @@ class ServiceIntegrationTest(unittest.TestCase):
                     chain_id=chain_id,
                 )
 
-        mock_cloud_service.make_client.return_value.create_file.assert_called()
+        mock_cloud_service.make_client.return_value.upload_file.assert_called()
 
         webhook = (
             self.session.query(Webhook)
@@ -1012,8 +1012,8 @@ class ServiceIntegrationTest(unittest.TestCase):
             mock_postprocess_annotations.side_effect = _fake_postprocess_annotations
 
             mock_storage_client = Mock()
-            mock_storage_client.create_file = Mock()
-            mock_storage_client.list_files = Mock(return_value=[])
+            mock_storage_client.upload_file = Mock()
+            mock_storage_client.list_file_infos = Mock(return_value=[])
             mock_cloud_service.make_client = Mock(return_value=mock_storage_client)
 
             handle_escrow_export(
@@ -1033,4 +1033,4 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         assert mock_cvat_api.get_job_annotations.call_count >= 3
         assert mock_cvat_api.get_project_annotations.call_count == 0
-        assert mock_storage_client.create_file.call_count == 5  # meta + jobs + merged
+        assert mock_storage_client.upload_file.call_count == 5  # meta + jobs + merged
@@ -0,0 +1,103 @@
+import io
+import os
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from src.core.config import StorageConfig
+from src.services.cloud import BucketAccessInfo, make_client, upload_files
+from src.services.cloud.s3 import S3Client
+
+PART_SIZE = 5 * 2**20
+
+
+class _TestException(RuntimeError): ...
+
+
+@pytest.fixture
+def storage_client():
+    client = make_client(BucketAccessInfo.parse_obj(StorageConfig))
+    prefix = f"upload_test_{uuid.uuid4().hex}"
+
+    try:
+        yield client, prefix
+    finally:
+        client.remove_files(prefix)
+
+
+@pytest.fixture
+def small_parts():
+    with (
+        patch.object(S3Client, "multipart_threshold", PART_SIZE),
+        patch.object(S3Client, "multipart_part_size", PART_SIZE),
+    ):
+        yield
+
+
+def test_can_upload_only_new_and_changed_files(storage_client):
+    client, prefix = storage_client
+    files = {
+        "meta.json": io.BytesIO(b'{"jobs": [1]}'),
+        "job_1.zip": io.BytesIO(b"1" * 100),
+        "job_2.zip": io.BytesIO(b"2" * 100),
+    }
+
+    assert sorted(upload_files(client, files, prefix=prefix, max_workers=2)) == sorted(files)
+    assert upload_files(client, files, prefix=prefix, max_workers=2) == []
+
+    # the same size, but other contents
+    files["meta.json"] = io.BytesIO(b'{"jobs": [2]}')
+    files["job_3.zip"] = io.BytesIO(b"3" * 100)
+
+    assert sorted(upload_files(client, files, prefix=prefix, max_workers=2)) == [
+        "job_3.zip",
+        "meta.json",
+    ]
+    assert client.download_file(f"{prefix}/meta.json") == b'{"jobs": [2]}'
+    assert {
+        file_info.key: file_info.size
+        for file_info in client.list_file_infos(prefix=prefix, trim_prefix=True)
+    } == {"meta.json": 13, "job_1.zip": 100, "job_2.zip": 100, "job_3.zip": 100}
+
+
+@pytest.mark.usefixtures("small_parts")
+def test_can_skip_uploaded_multipart_file(storage_client):
+    client, prefix = storage_client
+    data = os.urandom(2 * PART_SIZE + 100)
+    files = {"resulting_annotations.zip": io.BytesIO(data)}
+
+    assert upload_files(client, files, prefix=prefix) == ["resulting_annotations.zip"]
+    assert upload_files(client, files, prefix=prefix) == []
+    assert client.download_file(f"{prefix}/resulting_annotations.zip") == data
+
+
+@pytest.mark.usefixtures("small_parts")
+def test_can_resume_interrupted_multipart_upload(storage_client):
+    client, prefix = storage_client
+    data = os.urandom(2 * PART_SIZE + 100)
+    files = {
+        "meta.json": io.BytesIO(b"{}"),
+        "resulting_annotations.zip": io.BytesIO(data),
+    }
+
+    upload_part = client.client.upload_part
+    uploaded_parts = []
+
+    def _fail_once_on_second_part(**kwargs):
+        uploaded_parts.append(kwargs["PartNumber"])
+        if uploaded_parts == [1, 2]:
+            raise _TestException
+
+        return upload_part(**kwargs)
+
+    with patch.object(client.client, "upload_part", side_effect=_fail_once_on_second_part):
+        with pytest.raises(_TestException):
+            upload_files(client, files, prefix=prefix)
+
+        assert upload_files(client, files, prefix=prefix) == ["resulting_annotations.zip"]
+
+    # the first part is reused from the interrupted upload
+    assert uploaded_parts == [1, 2, 2, 3]
+    assert client.download_file(f"{prefix}/resulting_annotations.zip") == data
+    assert upload_files(client, files, prefix=prefix) == []
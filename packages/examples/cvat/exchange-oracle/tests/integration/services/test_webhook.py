@@ -1,5 +1,6 @@
 import unittest
 import uuid
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
@@ -16,6 +17,7 @@ from src.core.types import (
 )
 from src.db import SessionLocal
 from src.models.webhook import Webhook
+from src.utils.time import utcnow
 
 
 class ServiceIntegrationTest(unittest.TestCase):
@@ -357,3 +359,86 @@ class ServiceIntegrationTest(unittest.TestCase):
         assert webhook.signature == signature
         assert webhook.type == OracleWebhookTypes.job_launcher.value
         assert webhook.status == OracleWebhookStatuses.failed.value
+
+    def test_handle_webhook_results(self):
+        webhook_ids = [
+            webhook_service.inbox.create_webhook(
+                self.session,
+                escrow_address="0x1234567890123456789012345678901234567890",
+                chain_id=Networks.localhost.value,
+                signature=f"signature{i}",
+                type=OracleWebhookTypes.job_launcher,
+                event_type=JobLauncherEventTypes.escrow_created.value,
+            )
+            for i in range(3)
+        ]
+        succeeded_id, failed_id, untouched_id = webhook_ids
+
+        webhook_service.inbox.handle_webhook_results(
+            self.session, succeeded_ids=[succeeded_id], failed_ids=[failed_id]
+        )
+
+        webhooks = {w.id: w for w in self.session.query(Webhook).all()}
+        assert webhooks[succeeded_id].attempts == 1
+        assert webhooks[succeeded_id].status == OracleWebhookStatuses.completed.value
+        assert webhooks[failed_id].attempts == 1
+        assert webhooks[failed_id].status == OracleWebhookStatuses.pending.value
+        assert webhooks[failed_id].wait_until > webhooks[succeeded_id].wait_until
+        assert webhooks[untouched_id].attempts == 0
+
+    def test_handle_webhook_fail_with_backoff(self):
+        webhook_id = webhook_service.outbox.create_webhook(
+            self.session,
+            escrow_address="0x1234567890123456789012345678901234567890",
+            chain_id=Networks.localhost.value,
+            type=OracleWebhookTypes.job_launcher,
+            event=ExchangeOracleEvent_JobFinished(),
+        )
+
+        with (
+            patch("src.core.config.Config.webhook_max_retries", 10),
+            patch("src.core.config.Config.webhook_delay_if_failed", 60),
+            patch("src.core.config.Config.webhook_max_delay_if_failed", 300),
+        ):
+            for expected_delay in [60, 120, 240, 300, 300]:
+                started_at = utcnow()
+                webhook_service.outbox.handle_webhook_fail(self.session, webhook_id)
+
+                webhook = self.session.query(Webhook).filter_by(id=webhook_id).first()
+                delay = (webhook.wait_until - started_at).total_seconds()
+                assert expected_delay / 2 - 1 <= delay <= expected_delay + 1
+
+    def test_requeue_failed_webhooks(self):
+        webhook_ids = [
+            webhook_service.outbox.create_webhook(
+                self.session,
+                escrow_address="0x1234567890123456789012345678901234567890",
+                chain_id=Networks.localhost.value,
+                type=webhook_type,
+                event=ExchangeOracleEvent_JobFinished(),
+            )
+            for webhook_type in [OracleWebhookTypes.job_launcher] * 2
+            + [OracleWebhookTypes.recording_oracle]
+        ]
+        for webhook_id in webhook_ids:
+            webhook_service.outbox.update_webhook_status(
+                self.session, webhook_id, OracleWebhookStatuses.failed
+            )
+
+        failed_webhooks = webhook_service.outbox.get_failed_webhooks(
+            self.session, type=OracleWebhookTypes.job_launcher
+        )
+        assert {w.id for w in failed_webhooks} == set(webhook_ids[:2])
+
+        requeued = webhook_service.outbox.requeue_failed_webhooks(
+            self.session, type=OracleWebhookTypes.job_launcher
+        )
+
+        assert requeued == 2
+        webhooks = {w.id: w for w in self.session.query(Webhook).all()}
+        assert [webhooks[i].status for i in webhook_ids] == [
+            OracleWebhookStatuses.pending.value,
+            OracleWebhookStatuses.pending.value,
+            OracleWebhookStatuses.failed.value,
+        ]
+        assert webhook_service.inbox.requeue_failed_webhooks(self.session) == 0
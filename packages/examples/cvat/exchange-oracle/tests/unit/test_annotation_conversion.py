@@ -0,0 +1,104 @@
+import io
+import json
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import mock
+
+import datumaro as dm
+
+from src.core.annotation_meta import RESULTING_ANNOTATIONS_FILE
+from src.core.config import Config
+from src.core.manifest import parse_manifest
+from src.core.types import Networks
+from src.handlers.job_export.exporters.vision import BoxesJobExporter, ImageJobExporter
+from src.handlers.job_export.results import FileDescriptor
+from src.utils.zip_archive import write_dir_to_zip_archive
+
+ESCROW_ADDRESS = "0x86e83d346041E8806e352681f3F14549C0d2BC67"
+JOBS_COUNT = 6
+JOB_IMAGES_COUNT = 3
+
+
+def _make_coco_archive(image_ids: list[int]) -> io.BytesIO:
+    dataset = dm.Dataset(
+        media_type=dm.Image,
+        categories={dm.AnnotationType.label: dm.LabelCategories.from_iterable(["cat", "dog"])},
+    )
+    for image_id in image_ids:
+        dataset.put(
+            dm.DatasetItem(
+                id=f"image_{image_id}",
+                annotations=[
+                    dm.Bbox(image_id, 2, 10, 20, label=image_id % 2, id=1),
+                    dm.Bbox(5, image_id, 30, 10, label=0, id=2),
+                ],
+            )
+        )
+
+    archive = io.BytesIO()
+    with TemporaryDirectory() as tempdir:
+        dataset.export(tempdir, format="coco_instances")
+        write_dir_to_zip_archive(tempdir, archive)
+
+    archive.seek(0)
+    return archive
+
+
+def _make_annotations() -> list[FileDescriptor]:
+    job_annotations = [
+        FileDescriptor(
+            filename=f"project_1-task_1-job_{job_id}-user_1-assignment_{job_id}.zip",
+            file=_make_coco_archive(
+                list(range(job_id * JOB_IMAGES_COUNT, (job_id + 1) * JOB_IMAGES_COUNT))
+            ),
+        )
+        for job_id in range(JOBS_COUNT)
+    ]
+    merged_annotations = FileDescriptor(
+        filename=RESULTING_ANNOTATIONS_FILE,
+        file=_make_coco_archive(list(range(JOBS_COUNT * JOB_IMAGES_COUNT))),
+    )
+    return [merged_annotations, *job_annotations]
+
+
+def _convert_annotations(conversion_workers: int) -> list[tuple[str, bytes]]:
+    with open("tests/assets/cloud/manifests/manifest-v1.json") as manifest_data:
+        manifest = parse_manifest(json.load(manifest_data))
+
+    annotations = _make_annotations()
+
+    with (
+        mock.patch.object(Config.features, "annotation_conversion_workers", conversion_workers),
+        BoxesJobExporter(
+            manifest, ESCROW_ADDRESS, Networks.localhost, session=mock.Mock(), escrow_projects=[]
+        ) as exporter,
+    ):
+        exporter._merged_annotation_file = annotations[0]
+        exporter._project_images = [
+            SimpleNamespace(filename=f"image_{i}.jpg") for i in range(JOBS_COUNT * JOB_IMAGES_COUNT)
+        ]
+        exporter._prepare()
+        exporter._postprocess(annotations)
+
+        return [(fd.filename, fd.file.read()) for fd in annotations]
+
+
+def test_can_convert_job_annotations_in_worker_processes():
+    serial_results = _convert_annotations(conversion_workers=1)
+
+    with mock.patch.object(
+        BoxesJobExporter,
+        "_make_conversion_pool",
+        autospec=True,
+        side_effect=ImageJobExporter._make_conversion_pool,
+    ) as make_conversion_pool:
+        parallel_results = _convert_annotations(conversion_workers=3)
+
+    make_conversion_pool.assert_called_once_with(mock.ANY, 3)
+
+    # the converted archives must be the same, byte for byte, and in the same order
+    assert [fn for fn, _ in parallel_results] == [fn for fn, _ in serial_results]
+    for (filename, parallel_result), (_, serial_result) in zip(
+        parallel_results, serial_results, strict=True
+    ):
+        assert parallel_result == serial_result, filename
@@ -0,0 +1,139 @@
+import io
+import threading
+import time
+from unittest import mock
+
+import pytest
+from cvat_sdk.api_client import exceptions
+
+from src.cvat.api_calls import _spool_chunks
+from src.handlers.job_export.downloading import JobAnnotationsDownloader
+
+ANNOTATION_FORMAT = "CVAT for images 1.1"
+
+
+class _FakeCvat:
+    def __init__(self, *, checks_to_finish: int = 2) -> None:
+        self.checks_to_finish = checks_to_finish
+        self.lock = threading.Lock()
+        self.requests: dict[str, int] = {}
+        self.requested_jobs: list[int] = []
+        self.active = 0
+        self.max_active = 0
+        self.failing_checks: set[str] = set()
+        self.status_checks = 0
+
+    def request_job_annotations(self, cvat_id: int, *, format_name: str) -> str:
+        assert format_name == ANNOTATION_FORMAT
+
+        with self.lock:
+            request_id = f"{cvat_id}-{self.requested_jobs.count(cvat_id)}"
+            self.requested_jobs.append(cvat_id)
+            # some exports take longer, so they are finished out of order
+            self.requests[request_id] = self.checks_to_finish + (cvat_id % 3 == 0)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            return request_id
+
+    def is_export_finished(self, request_id: str) -> bool:
+        with self.lock:
+            self.status_checks += 1
+            if request_id in self.failing_checks:
+                self.failing_checks.discard(request_id)
+                self.active -= 1
+                raise exceptions.ServiceException(status=500, reason="Internal Server Error")
+
+            self.requests[request_id] -= 1
+            return self.requests[request_id] <= 0
+
+    def get_job_annotations(self, *, request_id: str) -> io.BytesIO:
+        with self.lock:
+            assert self.requests[request_id] <= 0
+            self.active -= 1
+            return io.BytesIO(request_id.split("-", maxsplit=1)[0].encode())
+
+
+@pytest.fixture
+def fake_cvat():
+    fake_cvat = _FakeCvat()
+    with mock.patch("src.handlers.job_export.downloading.cvat_api") as mock_cvat_api:
+        mock_cvat_api.exceptions = exceptions
+        mock_cvat_api.request_job_annotations.side_effect = fake_cvat.request_job_annotations
+        mock_cvat_api.is_export_finished.side_effect = fake_cvat.is_export_finished
+        mock_cvat_api.get_job_annotations.side_effect = fake_cvat.get_job_annotations
+        yield fake_cvat
+
+
+def _make_downloader(**kwargs) -> JobAnnotationsDownloader:
+    return JobAnnotationsDownloader(
+        mock.Mock(),
+        ANNOTATION_FORMAT,
+        min_check_interval=0.001,
+        max_check_interval=0.01,
+        **kwargs,
+    )
+
+
+def test_can_download_job_annotations(fake_cvat: _FakeCvat):
+    jobs = [mock.Mock(cvat_id=i) for i in range(20)]
+
+    results = _make_downloader(max_active=4).download(jobs)
+
+    assert {cvat_id: f.read() for cvat_id, f in results.items()} == {
+        i: str(i).encode() for i in range(20)
+    }
+    assert sorted(fake_cvat.requested_jobs) == list(range(20))
+    assert fake_cvat.max_active == 4
+
+
+def test_can_retry_failed_job_annotation_exports(fake_cvat: _FakeCvat):
+    jobs = [mock.Mock(cvat_id=i) for i in range(3)]
+    fake_cvat.failing_checks.add("1-0")
+
+    results = _make_downloader(max_active=3).download(jobs)
+
+    assert results[1].read() == b"1"
+    assert sorted(fake_cvat.requested_jobs) == [0, 1, 1, 2]
+
+
+def test_can_raise_on_job_annotation_export_errors(fake_cvat: _FakeCvat):
+    jobs = [mock.Mock(cvat_id=i) for i in range(3)]
+    fake_cvat.failing_checks.add("1-0")
+
+    with pytest.raises(exceptions.ServiceException):
+        _make_downloader(max_active=3, max_attempts=1).download(jobs)
+
+
+def test_can_wait_between_export_checks_without_downloads(fake_cvat: _FakeCvat):
+    # the exports are finished together, so no download is running between the checks
+    jobs = [mock.Mock(cvat_id=i) for i in (1, 2)]
+    fake_cvat.checks_to_finish = 10
+    check_interval = 0.02
+
+    downloader = JobAnnotationsDownloader(
+        mock.Mock(),
+        ANNOTATION_FORMAT,
+        min_check_interval=check_interval,
+        max_check_interval=check_interval,
+    )
+
+    start = time.monotonic()
+    results = downloader.download(jobs)
+    elapsed = time.monotonic() - start
+
+    assert sorted(results) == [1, 2]
+
+    # the export rounds are not more often than requested
+    assert fake_cvat.status_checks <= (elapsed / check_interval + 1) * len(jobs)
+
+
+def test_can_spool_large_downloads_to_disk():
+    chunks = [b"a" * 100, b"b" * 100]
+
+    in_memory = _spool_chunks(chunks, max_memory_size=200)
+    assert isinstance(in_memory, io.BytesIO)
+    assert in_memory.read() == b"".join(chunks)
+
+    on_disk = _spool_chunks(chunks, max_memory_size=150)
+    assert not isinstance(on_disk, io.BytesIO)
+    assert on_disk.read() == b"".join(chunks)
@@ -0,0 +1,148 @@
+import threading
+import time
+from functools import partial
+from itertools import pairwise
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.cvat.api_calls import RequestStatus
+from src.handlers.job_creation.task_creation import CvatTaskCreator, CvatTaskParams
+
+CHECK_INTERVAL = 0.02
+
+
+class _TestException(RuntimeError): ...
+
+
+class _FakeCvat:
+    def __init__(self, *, latency: float = 0.005, checks_to_finish: int = 2) -> None:
+        self.latency = latency
+        self.checks_to_finish = checks_to_finish
+        self.lock = threading.Lock()
+        self.tasks: dict[int, str] = {}  # id -> name
+        self.uploads: dict[int, int] = {}  # id -> checks left
+        self.setup_tasks: list[int] = []
+        self.deleted_tasks: list[int] = []
+        self.failing_uploads: set[str] = set()
+        self.active = 0
+        self.max_active = 0
+        self.status_checks = 0
+
+    def create_task(self, name: str) -> SimpleNamespace:
+        time.sleep(self.latency)
+
+        with self.lock:
+            task_id = len(self.tasks) + 1
+            self.tasks[task_id] = name
+            return SimpleNamespace(id=task_id, name=name, status="annotation")
+
+    def put_task_data(self, task_id: int) -> None:
+        time.sleep(self.latency)
+
+        with self.lock:
+            # some uploads take longer, so they are finished out of order
+            self.uploads[task_id] = self.checks_to_finish + (task_id % 3 == 0)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def get_task_upload_status(self, task_id: int) -> tuple[RequestStatus, str]:
+        time.sleep(self.latency)
+
+        with self.lock:
+            self.status_checks += 1
+            self.uploads[task_id] -= 1
+            if self.uploads[task_id] > 0:
+                return RequestStatus.STARTED, ""
+
+            if self.tasks[task_id] in self.failing_uploads:
+                self.active -= 1
+                return RequestStatus.FAILED, "Can't read the files"
+
+            return RequestStatus.FINISHED, ""
+
+    def setup_task(self, task_id: int) -> None:
+        time.sleep(self.latency)
+
+        with self.lock:
+            assert self.uploads[task_id] <= 0
+            self.setup_tasks.append(task_id)
+            self.active -= 1
+
+    def delete_task(self, task_id: int) -> None:
+        with self.lock:
+            self.deleted_tasks.append(task_id)
+
+    def make_params(self, name: str) -> CvatTaskParams:
+        return CvatTaskParams(
+            create=partial(self.create_task, name),
+            upload=self.put_task_data,
+            setup=self.setup_task,
+        )
+
+
+@pytest.fixture
+def fake_cvat():
+    fake_cvat = _FakeCvat()
+    with mock.patch("src.handlers.job_creation.task_creation.cvat_api") as mock_cvat_api:
+        mock_cvat_api.RequestStatus = RequestStatus
+        mock_cvat_api.get_task_upload_status.side_effect = fake_cvat.get_task_upload_status
+        mock_cvat_api.delete_task.side_effect = fake_cvat.delete_task
+        yield fake_cvat
+
+
+def _make_creator(**kwargs) -> CvatTaskCreator:
+    return CvatTaskCreator(mock.Mock(), check_interval=CHECK_INTERVAL, **kwargs)
+
+
+def test_can_create_tasks(fake_cvat: _FakeCvat):
+    names = [f"task_{i}" for i in range(20)]
+
+    check_uploads = CvatTaskCreator._check_uploads
+    check_rounds = []
+
+    def _check_uploads(self, state, pool):
+        check_rounds.append(time.monotonic())
+        check_uploads(self, state, pool)
+
+    with mock.patch.object(CvatTaskCreator, "_check_uploads", _check_uploads):
+        tasks = _make_creator(max_active=4).create([fake_cvat.make_params(name) for name in names])
+
+    assert [task.name for task in tasks] == names
+    assert sorted(fake_cvat.setup_tasks) == sorted(task.id for task in tasks)
+    assert fake_cvat.max_active == 4
+    assert fake_cvat.deleted_tasks == []
+
+    # the uploads in progress are checked together, the rounds are not more often than requested
+    assert len(check_rounds) < fake_cvat.status_checks
+    assert all(later - earlier >= CHECK_INTERVAL for earlier, later in pairwise(check_rounds))
+
+
+def test_can_skip_setup_for_failed_uploads(fake_cvat: _FakeCvat):
+    fake_cvat.failing_uploads.add("task_1")
+
+    tasks = _make_creator(max_active=2).create(
+        [fake_cvat.make_params(f"task_{i}") for i in range(3)]
+    )
+
+    failed_task = next(task for task in tasks if task.name == "task_1")
+    assert failed_task.id not in fake_cvat.setup_tasks
+    assert len(fake_cvat.setup_tasks) == 2
+    assert fake_cvat.deleted_tasks == []
+
+
+@pytest.mark.parametrize("failing_step", ["upload", "setup"])
+def test_can_remove_created_tasks_on_error(fake_cvat: _FakeCvat, failing_step: str):
+    def _fail(task_id: int):
+        raise _TestException
+
+    params = [fake_cvat.make_params(f"task_{i}") for i in range(10)]
+    setattr(params[5], failing_step, _fail)
+
+    with pytest.raises(_TestException):
+        _make_creator(max_active=3).create(params)
+
+    # all the tasks created until the error, including the failed one, are removed
+    assert len(fake_cvat.tasks) >= 6
+    assert sorted(fake_cvat.deleted_tasks) == sorted(fake_cvat.tasks)
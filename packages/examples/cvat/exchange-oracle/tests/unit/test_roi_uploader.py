@@ -0,0 +1,85 @@
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from src.utils.roi_uploader import RoiImageUploadPipeline
+
+
+def _make_pipeline(uploaded: dict[str, bytes], **kwargs) -> RoiImageUploadPipeline:
+    def process(item: int, data: bytes) -> Iterator[tuple[str, bytes]]:
+        for roi_id in range(3):
+            yield f"{item}/{roi_id}", data
+
+    return RoiImageUploadPipeline(
+        **{
+            "download": lambda item: str(item).encode(),
+            "process": process,
+            "upload": uploaded.__setitem__,
+            "download_workers": 2,
+            "process_workers": 2,
+            "upload_workers": 2,
+            **kwargs,
+        }
+    )
+
+
+def test_can_process_all_items():
+    uploaded = {}
+    pipeline = _make_pipeline(uploaded, max_pending_images=1, max_pending_uploads=1)
+
+    pipeline.run(range(20))
+
+    assert uploaded == {f"{i}/{roi_id}": str(i).encode() for i in range(20) for roi_id in range(3)}
+    assert pipeline.download_stats.items == 20
+    assert pipeline.process_stats.items == 20
+    assert pipeline.upload_stats.items == 60
+
+
+def test_can_limit_pending_uploads():
+    max_pending_uploads = 2
+    pending = 0
+    max_seen_pending = 0
+    lock = threading.Lock()
+    release_upload = threading.Semaphore(0)
+
+    def upload(key: str, data: bytes) -> None:
+        nonlocal pending, max_seen_pending
+        with lock:
+            pending += 1
+            max_seen_pending = max(max_seen_pending, pending)
+
+        release_upload.acquire()
+
+        with lock:
+            pending -= 1
+
+    pipeline = _make_pipeline(
+        {}, upload=upload, upload_workers=4, max_pending_uploads=max_pending_uploads
+    )
+
+    runner = threading.Thread(target=pipeline.run, args=(range(10),))
+    runner.start()
+    for _ in range(30):
+        release_upload.release()
+    runner.join(timeout=10)
+
+    assert not runner.is_alive()
+    assert max_seen_pending <= max_pending_uploads
+
+
+def test_can_raise_first_error():
+    def process(item: int, data: bytes) -> Iterator[tuple[str, bytes]]:
+        if item == 5:
+            raise ValueError("bad image")
+
+        yield str(item), data
+
+    uploaded = {}
+    pipeline = _make_pipeline(uploaded, process=process)
+
+    with pytest.raises(ValueError, match="bad image"):
+        pipeline.run(range(1000))
+
+    assert "5" not in uploaded
+    assert len(uploaded) < 1000
@@ -0,0 +1,37 @@
+"""Add a partial index for the pending webhooks
+
+Only the pending webhooks polled by the webhook crons are indexed, so the index stays small
+while the processed webhooks accumulate. On large tables, it can be created beforehand with
+CREATE INDEX CONCURRENTLY under the same name to avoid blocking writes,
+the migration skips an existing index.
+
+Revision ID: 5564719f39a5
+Revises: b7c1f0a4d2e3
+Create Date: 2026-10-18 11:24:37.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5564719f39a5"
+down_revision = "b7c1f0a4d2e3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_webhooks_pending",
+        "webhooks",
+        ["direction", "type", "wait_until"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhooks_pending", table_name="webhooks")
@@ -19,6 +19,7 @@ from .config import (
     TranscriptionRequirement,
 )
 from .data import (
+    AlignEngine,
     AlignMode,
     EditOp,
     Granularity,
@@ -58,6 +59,7 @@ __all__ = [
     "Granularity",
     "GroupKey",
     "AlignMode",
+    "AlignEngine",
     "EditOp",
     "GroupingStrategy",
     "Metric",
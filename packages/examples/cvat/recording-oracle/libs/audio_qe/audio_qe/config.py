@@ -7,7 +7,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
-from .data import AlignMode, Granularity, GroupingStrategy, Metric, NormalizerMode
+from .data import AlignEngine, AlignMode, Granularity, GroupingStrategy, Metric, NormalizerMode
 
 
 @dataclass
@@ -55,6 +55,17 @@ class TranscriptionRequirement:
     #          detection; equivalent to plain WER when granularity=word)
     align: AlignMode = AlignMode.CHAR
 
+    # DP implementation. FAST applies when the substitution cost is the unit
+    # cost: always for the char-level DP, and for metric=EQUALITY without a
+    # threshold. Other metrics fall back to the reference DP. Both engines
+    # give identical edits.
+    align_engine: AlignEngine = AlignEngine.FAST
+
+    # Memory cap (MB) for the alignment DP tables of one group. Over the cap,
+    # the FAST engine recomputes the traceback from checkpoints (same edits,
+    # ~2x time); the reference DP raises MemoryError. None — no cap.
+    align_memory_limit_mb: float | None = None
+
     # Per-chunk cost function. Softness is a property of the metric
     # itself rather than a side-channel knob.
     # For granularity=CHARACTER (atomic units): all three metrics
@@ -40,6 +40,16 @@ class AlignMode(str, Enum):
     "word-level Levenshtein DP, no boundary detection"
 
 
+class AlignEngine(str, Enum):
+    """Implementation of the Levenshtein DP. All engines produce identical edits."""
+
+    FAST = "fast"
+    "token ids + row-vectorized NumPy recurrence for unit substitution costs"
+
+    DP = "dp"
+    "reference cell-by-cell DP, supports any substitution cost"
+
+
 class Metric(str, Enum):
     """Per-chunk cost function for L2 scoring."""
 
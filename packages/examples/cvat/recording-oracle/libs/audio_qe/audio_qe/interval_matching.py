@@ -4,12 +4,16 @@
 
 from __future__ import annotations
 
-from typing import Callable, Sequence
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Sequence
 
 from .config import IntervalMatchingConfig
 from .data import Interval
 from .reports import BoundaryAgreement, IntervalPairMetrics, IntervalReport
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def iou(a: Interval, b: Interval) -> float:
     lo = max(a.start, b.start)
@@ -25,11 +29,86 @@ def _label_eq(a: Interval, b: Interval) -> bool:
     return a.label == b.label
 
 
+def _overlapping_pairs(
+    a_segms: Sequence[Interval], b_segms: Sequence[Interval]
+) -> tuple[list[int], list[int]]:
+    """Sweep line over the interval endpoints. Returns the (a_idx, b_idx) lists
+    of all pairs with a positive overlap, in O((A + B) log(A + B) + pairs)
+    instead of scoring all A x B pairs. Only these pairs can have a non-zero IoU."""
+
+    events: list[tuple[float, int, int, int]] = []  # (time, 0 - stop / 1 - start, side, idx)
+    for side, segms in enumerate((a_segms, b_segms)):
+        for idx, iv in enumerate(segms):
+            if iv.start < iv.stop:  # empty intervals overlap nothing
+                events.append((iv.start, 1, side, idx))
+                events.append((iv.stop, 0, side, idx))
+
+    # Stops go before starts at the same time: touching intervals don't overlap
+    events.sort()
+
+    active: tuple[set[int], set[int]] = (set(), set())
+    a_idx: list[int] = []
+    b_idx: list[int] = []
+    for _, is_start, side, idx in events:
+        if not is_start:
+            active[side].discard(idx)
+            continue
+
+        others = active[1 - side]
+        if side == 0:
+            a_idx.extend(idx for _ in others)
+            b_idx.extend(others)
+        else:
+            a_idx.extend(others)
+            b_idx.extend(idx for _ in others)
+        active[side].add(idx)
+
+    return a_idx, b_idx
+
+
+def iou_matrix(
+    a_segms: Sequence[Interval], b_segms: Sequence[Interval], *, same_label: bool = False
+) -> np.ndarray:
+    """(A, B) matrix of pairwise IoU, equal to calling `iou()` for each pair.
+    Only the overlapping pairs are scored. With `same_label`, pairs with
+    different labels get 0."""
+
+    import numpy as np
+
+    result = np.zeros((len(a_segms), len(b_segms)))
+    a_idx, b_idx = _overlapping_pairs(a_segms, b_segms)
+    if not a_idx:
+        return result
+
+    a_idx = np.array(a_idx, dtype=np.intp)
+    b_idx = np.array(b_idx, dtype=np.intp)
+
+    a_bounds = np.array([(iv.start, iv.stop) for iv in a_segms], dtype=float)
+    b_bounds = np.array([(iv.start, iv.stop) for iv in b_segms], dtype=float)
+    a_start, a_stop = a_bounds[a_idx, 0], a_bounds[a_idx, 1]
+    b_start, b_stop = b_bounds[b_idx, 0], b_bounds[b_idx, 1]
+
+    # Same operations as in iou(); the union of overlapping intervals is positive
+    inter = np.minimum(a_stop, b_stop) - np.maximum(a_start, b_start)
+    uni = np.maximum(a_stop, b_stop) - np.minimum(a_start, b_start)
+    values = inter / uni
+
+    if same_label:
+        label_ids: dict[str, int] = {}
+        a_labels = np.array([label_ids.setdefault(iv.label, len(label_ids)) for iv in a_segms])
+        b_labels = np.array([label_ids.setdefault(iv.label, len(label_ids)) for iv in b_segms])
+        values[a_labels[a_idx] != b_labels[b_idx]] = 0.0
+
+    result[a_idx, b_idx] = values
+    return result
+
+
 def match_segments(
     a_segms: Sequence[Interval],
     b_segms: Sequence[Interval],
     *,
-    distance: Callable[[Interval, Interval], float],
+    distance: Callable[[Interval, Interval], float] | None = None,
+    similarity_matrix: np.ndarray | None = None,
     dist_thresh: float = 1.0,
     label_matcher: Callable[[Interval, Interval], bool] = _label_eq,
 ) -> tuple[
@@ -38,24 +117,26 @@ def match_segments(
     list[Interval],
     list[Interval],
 ]:
+    """`distance(a, b)` is a pair similarity in [0, 1] (1 - the assignment
+    cost). Instead of the callable, a precomputed (A, B) `similarity_matrix`
+    can be passed, e.g. from `iou_matrix()`, which gives the same result
+    without a Python call per pair."""
+
     # Ported verbatim from cvat.apps.quality_control.quality_reports.match_segments
     # (numpy + scipy are imported lazily so the package imports without scipy when the
     # Hungarian/FILTER path is unused).
-    import itertools
-
     import numpy as np
     from scipy.optimize import linear_sum_assignment
 
+    if similarity_matrix is None:
+        assert distance is not None, "either distance or similarity_matrix is required"
+        similarity_matrix = np.array(
+            [[distance(a, b) for b in b_segms] for a in a_segms], dtype=float
+        ).reshape(len(a_segms), len(b_segms))
+
     max_anns = max(len(a_segms), len(b_segms))
-    distances = np.array(
-        [
-            [
-                1 - distance(a, b) if a is not None and b is not None else 1
-                for b, _ in itertools.zip_longest(b_segms, range(max_anns), fillvalue=None)
-            ]
-            for a, _ in itertools.zip_longest(a_segms, range(max_anns), fillvalue=None)
-        ]
-    )
+    distances = np.ones((max_anns, max_anns))
+    distances[: len(a_segms), : len(b_segms)] = 1 - similarity_matrix
     distances[~np.isfinite(distances)] = 1
     distances[distances > 1 - dist_thresh] = 1
 
@@ -96,7 +177,7 @@ def _hungarian_match(
     gt: Sequence[Interval],
     ds: Sequence[Interval],
     *,
-    distance: Callable[[Interval, Interval], float],
+    same_label: bool,
     iou_thresh: float,
     label_matcher: Callable[[Interval, Interval], bool] = _label_eq,
 ) -> tuple[
@@ -106,11 +187,17 @@ def _hungarian_match(
     list[Interval],
 ]:
     return match_segments(
-        gt, ds, distance=distance, dist_thresh=iou_thresh, label_matcher=label_matcher
+        gt,
+        ds,
+        similarity_matrix=iou_matrix(gt, ds, same_label=same_label),
+        dist_thresh=iou_thresh,
+        label_matcher=label_matcher,
     )
 
 
-def _two_stage_match(gt: Sequence[Interval], ds: Sequence[Interval], *, iou_thresh: float) -> tuple[
+def _two_stage_match(
+    gt: Sequence[Interval], ds: Sequence[Interval], *, iou_thresh: float
+) -> tuple[
     list[tuple[Interval, Interval]],
     list[tuple[Interval, Interval]],
     list[Interval],
@@ -120,13 +207,8 @@ def _two_stage_match(gt: Sequence[Interval], ds: Sequence[Interval], *, iou_thre
     picks up remaining different-label pairs. Keeps high-quality label
     matches from getting outbid by IoU-only matches with the wrong label."""
 
-    def iou_with_label(a: Interval, b: Interval) -> float:
-        return iou(a, b) if _label_eq(a, b) else 0.0
-
-    matches, _, gt_u, ds_u = _hungarian_match(
-        gt, ds, distance=iou_with_label, iou_thresh=iou_thresh
-    )
-    _, mispred, gt_u, ds_u = _hungarian_match(gt_u, ds_u, distance=iou, iou_thresh=iou_thresh)
+    matches, _, gt_u, ds_u = _hungarian_match(gt, ds, same_label=True, iou_thresh=iou_thresh)
+    _, mispred, gt_u, ds_u = _hungarian_match(gt_u, ds_u, same_label=False, iou_thresh=iou_thresh)
     return matches, mispred, gt_u, ds_u
 
 
@@ -148,21 +230,56 @@ def boundary_f1(
     fixed temporal tolerance. Returns precision / recall / F1 plus
     raw tp / fp / fn counts."""
 
-    matched: set[int] = set()
+    # Hyp boundaries in the sorted order, the nearest ones to r are found by bisection.
+    # Matched positions are skipped with "next unmatched to the left / right" links
+    # (path-compressed), so the whole matching is O((R + H) log H).
+    # This is the same as the quadratic greedy scan: each r takes the nearest unmatched
+    # hyp boundary, on equal distances - the one with the greatest index in hyp_boundaries.
+    order = sorted(range(len(hyp_boundaries)), key=hyp_boundaries.__getitem__)
+    values = [hyp_boundaries[i] for i in order]
+    n = len(values)
+    right_link = list(range(n + 1))  # n - no unmatched positions to the right
+    left_link = list(range(n + 1))  # shifted by 1, 0 - no unmatched positions to the left
+
+    def _find(links: list[int], pos: int) -> int:
+        root = pos
+        while links[root] != root:
+            root = links[root]
+        while links[pos] != root:
+            links[pos], pos = root, links[pos]
+        return root
+
     tp = 0
     for r in ref_boundaries:
-        best_idx = -1
-        best_d = tolerance_ms + 1e-9
-        for i, h in enumerate(hyp_boundaries):
-            if i in matched:
-                continue
-            d = abs(r - h)
-            if d <= best_d:
-                best_idx, best_d = i, d
-        if best_idx >= 0 and best_d <= tolerance_ms:
-            matched.add(best_idx)
+        best_pos = -1
+        best_d = tolerance_ms
+
+        # Distances don't decrease away from r, so each side is scanned only while
+        # there can be a nearer boundary or an equally near one with a greater index
+        split = bisect_left(values, r)
+        pos = _find(right_link, split)
+        while pos < n:
+            d = abs(r - values[pos])
+            if d > best_d:
+                break
+            if best_pos < 0 or d < best_d or order[pos] > order[best_pos]:
+                best_pos, best_d = pos, d
+            pos = _find(right_link, pos + 1)
+
+        pos = _find(left_link, split) - 1
+        while pos >= 0:
+            d = abs(r - values[pos])
+            if d > best_d:
+                break
+            if best_pos < 0 or d < best_d or order[pos] > order[best_pos]:
+                best_pos, best_d = pos, d
+            pos = _find(left_link, pos) - 1
+
+        if best_pos >= 0:
+            right_link[best_pos] = best_pos + 1
+            left_link[best_pos + 1] = best_pos
             tp += 1
-    fp = len(hyp_boundaries) - len(matched)
+    fp = len(hyp_boundaries) - tp
     fn = len(ref_boundaries) - tp
     precision = tp / (tp + fp) if (tp + fp) else 1.0
     recall = tp / (tp + fn) if (tp + fn) else 1.0
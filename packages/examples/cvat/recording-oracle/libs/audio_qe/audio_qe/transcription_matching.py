@@ -21,6 +21,7 @@ Tokenize, group, align, score. Owns:
 
 from __future__ import annotations
 
+import math
 from collections import defaultdict
 from collections.abc import Iterator
 from typing import Callable, Sequence
@@ -30,6 +31,7 @@ import regex
 
 from .config import TranscriptionRequirement
 from .data import (
+    AlignEngine,
     AlignMode,
     EditOp,
     Granularity,
@@ -142,6 +144,10 @@ def _unit_sub_cost(a: str, b: str) -> float:
     return 1.0
 
 
+# Substitution costs that are 1 for any non-identical pair
+_UNIT_SUB_COSTS: tuple[TokenCost, ...] = (_unit_sub_cost, _cost_equality)
+
+
 def make_token_cost(metric: Metric | str, threshold: float | None) -> TokenCost:
     try:
         metric = Metric(metric)
@@ -266,6 +272,8 @@ def _align_pair(
     granularity: Granularity,
     normalizer: Normalizer,
     sub_cost: TokenCost = _unit_sub_cost,
+    engine: AlignEngine = AlignEngine.FAST,
+    memory_limit: int | None = None,
 ) -> AlignmentResult:
     ref_n = normalizer(ref_text)
     hyp_n = normalizer(hyp_text)
@@ -314,6 +322,8 @@ def _align_pair(
         [0] * len(hyp_units),
         overlap,
         sub_cost=sub_cost,
+        engine=engine,
+        memory_limit=memory_limit,
     )
     error_rate = total_cost / len(ref_units)
 
@@ -437,6 +447,10 @@ def _overlap_matrix(
     return hi > lo - tolerance_ms
 
 
+# One DP step on the traceback path: (op, ref_start, ref_end, hyp_start, hyp_end)
+_EditStep = tuple[EditOp, int, int, int, int]
+
+
 def _overlap_constrained_align(
     ref_units: Sequence[str],
     ref_origins: Sequence[int],
@@ -445,6 +459,8 @@ def _overlap_constrained_align(
     overlap: np.ndarray,
     *,
     sub_cost: TokenCost = _unit_sub_cost,
+    engine: AlignEngine = AlignEngine.FAST,
+    memory_limit: int | None = None,
 ) -> tuple[list[AlignmentEdit], int, int, int, int, int, float]:
     """Levenshtein DP that forbids match/substitute between tokens whose source
     intervals do not temporally overlap.
@@ -455,6 +471,12 @@ def _overlap_constrained_align(
     Insert / delete stay at cost 1. Identical tokens always cost 0 (a match),
     independent of `sub_cost`.
 
+    `engine` selects the DP implementation. AlignEngine.FAST only handles the
+    unit cost; with any other `sub_cost` the reference DP is used. Both break
+    ties the same way (delete, then insert, then diagonal), so the edits are
+    identical. `memory_limit` (bytes) caps the DP tables: the fast engine
+    switches to a checkpointed traceback, the reference DP raises MemoryError.
+
     Returns (edits, hits, substitutions, insertions, deletions, total_cost).
     `total_cost` is the optimal DP cost — the metric-weighted error mass, used
     to form the rate. The hits / subs / ins / dels are plain edit-op counts
@@ -463,7 +485,49 @@ def _overlap_constrained_align(
     by `_reconstruct_word_edits_from_chars` on a char-level alignment).
     """
 
+    if engine == AlignEngine.FAST and sub_cost in _UNIT_SUB_COSTS:
+        ops, total_cost = _unit_cost_align_fast(
+            ref_units, ref_origins, hyp_units, hyp_origins, overlap, memory_limit=memory_limit
+        )
+    else:
+        ops, total_cost = _overlap_constrained_align_dp(
+            ref_units,
+            ref_origins,
+            hyp_units,
+            hyp_origins,
+            overlap,
+            sub_cost=sub_cost,
+            memory_limit=memory_limit,
+        )
+
+    edits = _merge_edit_steps(ops, ref_units, hyp_units)
+
+    hits = sum(e.ref_end - e.ref_start for e in edits if e.op == EditOp.EQUAL)
+    subs = sum(e.ref_end - e.ref_start for e in edits if e.op == EditOp.SUBSTITUTE)
+    dels = sum(e.ref_end - e.ref_start for e in edits if e.op == EditOp.DELETE)
+    ins = sum(e.hyp_end - e.hyp_start for e in edits if e.op == EditOp.INSERT)
+    return edits, hits, subs, ins, dels, total_cost
+
+
+def _overlap_constrained_align_dp(
+    ref_units: Sequence[str],
+    ref_origins: Sequence[int],
+    hyp_units: Sequence[str],
+    hyp_origins: Sequence[int],
+    overlap: np.ndarray,
+    *,
+    sub_cost: TokenCost,
+    memory_limit: int | None = None,
+) -> tuple[list[_EditStep], float]:
+    """Reference cell-by-cell DP. Returns (traceback steps in order, total_cost)."""
+
     n, m = len(ref_units), len(hyp_units)
+    required = (n + 1) * (m + 1) * 5  # float32 cost + int8 back
+    if memory_limit is not None and required > memory_limit:
+        raise MemoryError(
+            f"Aligning {n}x{m} tokens needs {required / 2**20:.1f} MB, "
+            f"the limit is {memory_limit / 2**20:.1f} MB"
+        )
     INF = float("inf")
     DEL, INS, MATCH, SUB = 1, 2, 3, 4
 
@@ -500,7 +564,7 @@ def _overlap_constrained_align(
             cost[i, j] = best
             back[i, j] = op
 
-    ops_rev: list[tuple[str, int, int, int, int]] = []
+    ops_rev: list[_EditStep] = []
     i, j = n, m
     while i > 0 or j > 0:
         op = back[i, j]
@@ -520,7 +584,187 @@ def _overlap_constrained_align(
             j -= 1
         else:
             break
-    ops = list(reversed(ops_rev))
+
+    return list(reversed(ops_rev)), float(cost[n, m])
+
+
+def _intern_tokens(*sequences: Sequence[str]) -> list[np.ndarray]:
+    """Map tokens to integer ids shared across the sequences, so token
+    comparisons become vectorized integer comparisons."""
+    token_ids: dict[str, int] = {}
+    return [
+        np.fromiter(
+            (token_ids.setdefault(t, len(token_ids)) for t in seq), dtype=np.int32, count=len(seq)
+        )
+        for seq in sequences
+    ]
+
+
+def _unit_cost_rows(
+    ref_ids: np.ndarray,
+    ref_origins: Sequence[int],
+    hyp_ids: np.ndarray,
+    allowed_by_origin: np.ndarray,
+    row: np.ndarray,
+    start: int,
+    stop: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Yields (cost row, packed diagonal bits, packed insert bits) for DP rows
+    start + 1 .. stop, given the cost row `start`.
+
+    Within a row, only the insert term depends on the row itself:
+    cost[i, j] = min(best[j], cost[i, j-1] + 1), where best = min(delete, diagonal)
+    comes from the previous row. Unrolled, this is a prefix minimum:
+    cost[i, j] = j + min_{k<=j} (best[k] - k), i.e. one `np.minimum.accumulate`.
+    """
+
+    m = len(hyp_ids)
+    forbidden = np.int32(len(ref_ids) + m + 1)  # above any reachable cost
+    steps = np.arange(m + 1, dtype=np.int32)
+
+    best = np.empty(m + 1, dtype=np.int32)
+    chosen = np.zeros(m + 1, dtype=bool)  # column 0 is always a delete
+    for i in range(start + 1, stop + 1):
+        del_c = row[1:] + 1
+        diag_c = row[:-1] + (hyp_ids != ref_ids[i - 1])
+        diag_c[~allowed_by_origin[ref_origins[i - 1]]] = forbidden
+
+        best[0] = i
+        np.minimum(del_c, diag_c, out=best[1:])
+        best -= steps
+        row = np.minimum.accumulate(best)
+        row += steps
+
+        # Same tie-breaking as the reference DP: delete, then a strictly
+        # cheaper insert, then a strictly cheaper diagonal.
+        ins_c = row[:-1] + 1
+        is_ins = ins_c < del_c
+        is_diag = diag_c < np.minimum(ins_c, del_c)
+
+        chosen[1:] = is_diag
+        diag_bits = np.packbits(chosen)
+        chosen[1:] = is_ins & ~is_diag
+        yield row, diag_bits, np.packbits(chosen)
+
+
+def _traceback_block_rows(n: int, m: int, memory_limit: int | None) -> int:
+    """Number of DP rows whose back pointers are kept in memory at once.
+
+    Returns n when the whole traceback fits into `memory_limit` bytes.
+    Otherwise the forward pass keeps one cost row per block of rows, and the
+    traceback recomputes the back pointers block by block. The block size
+    minimizing checkpoints + one block of back pointers is used.
+    """
+
+    bits_row_size = 2 * ((m + 8) // 8)
+    cost_row_size = 4 * (m + 1)
+    if memory_limit is None or n * bits_row_size <= memory_limit:
+        return n
+
+    block_rows = max(1, round(math.sqrt(n * cost_row_size / bits_row_size)))
+    required = math.ceil(n / block_rows) * cost_row_size + block_rows * bits_row_size
+    if required > memory_limit:
+        raise MemoryError(
+            f"Aligning {n}x{m} tokens needs at least {required / 2**20:.1f} MB, "
+            f"the limit is {memory_limit / 2**20:.1f} MB"
+        )
+
+    return block_rows
+
+
+def _unit_cost_align_fast(
+    ref_units: Sequence[str],
+    ref_origins: Sequence[int],
+    hyp_units: Sequence[str],
+    hyp_origins: Sequence[int],
+    overlap: np.ndarray,
+    *,
+    memory_limit: int | None = None,
+) -> tuple[list[_EditStep], float]:
+    """Unit-cost variant of `_overlap_constrained_align_dp`, one NumPy pass per
+    ref token instead of a Python loop over cells (see `_unit_cost_rows`).
+
+    Instead of the full cost matrix, the traceback keeps two bit-packed masks
+    per cell (diagonal chosen, insert chosen), 1/16 of the memory of the
+    reference DP's float32 cost + int8 back matrices. If even that exceeds
+    `memory_limit` bytes, the masks are recomputed block by block from cost
+    row checkpoints, O(sqrt(n) * m) memory for twice the time. The traceback
+    decisions are the same in all cases. A bit-parallel (Myers) recurrence is
+    not used: it can't express the overlap mask, which forbids substitutions
+    as well as matches.
+    """
+
+    n, m = len(ref_units), len(hyp_units)
+    ref_ids, hyp_ids = _intern_tokens(ref_units, hyp_units)
+    # overlap gate per (ref interval, hyp token)
+    allowed_by_origin = np.asarray(overlap, dtype=bool)[:, np.asarray(hyp_origins, dtype=np.intp)]
+
+    def _rows(row: np.ndarray, start: int, stop: int):
+        return _unit_cost_rows(ref_ids, ref_origins, hyp_ids, allowed_by_origin, row, start, stop)
+
+    block_rows = _traceback_block_rows(n, m, memory_limit)
+    row_size = (m + 8) // 8
+    diag_bits = np.zeros((block_rows + 1, row_size), dtype=np.uint8)
+    ins_bits = np.zeros((block_rows + 1, row_size), dtype=np.uint8)
+
+    # Forward pass, keeps the cost row at the start of each block
+    checkpoints = [np.arange(m + 1, dtype=np.int32)]  # cost[0, j] = j, all inserts
+    row = checkpoints[0]
+    for i, (row, row_diag_bits, row_ins_bits) in enumerate(_rows(row, 0, n), start=1):
+        if block_rows == n:
+            # Everything fits, keep the back pointers right away
+            diag_bits[i] = row_diag_bits
+            ins_bits[i] = row_ins_bits
+        elif i % block_rows == 0 and i < n:
+            checkpoints.append(row)
+    total_cost = float(row[m])
+
+    def _load_block(block: int) -> int:
+        block_start = block * block_rows
+        block_stop = min(block_start + block_rows, n)
+        for k, (_, row_diag_bits, row_ins_bits) in enumerate(
+            _rows(checkpoints[block], block_start, block_stop), start=1
+        ):
+            diag_bits[k] = row_diag_bits
+            ins_bits[k] = row_ins_bits
+        return block_start
+
+    block = len(checkpoints) - 1
+    block_start = 0 if block_rows == n else _load_block(block)
+
+    ops_rev: list[_EditStep] = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        if i == 0:
+            ops_rev.append((EditOp.INSERT, i, i, j - 1, j))
+            j -= 1
+            continue
+
+        if i <= block_start:
+            block -= 1
+            block_start = _load_block(block)
+
+        k = i - block_start
+        byte, bit = j >> 3, 7 - (j & 7)
+        if (diag_bits[k, byte] >> bit) & 1:
+            op = EditOp.EQUAL if ref_ids[i - 1] == hyp_ids[j - 1] else EditOp.SUBSTITUTE
+            ops_rev.append((op, i - 1, i, j - 1, j))
+            i -= 1
+            j -= 1
+        elif (ins_bits[k, byte] >> bit) & 1:
+            ops_rev.append((EditOp.INSERT, i, i, j - 1, j))
+            j -= 1
+        else:
+            ops_rev.append((EditOp.DELETE, i - 1, i, j, j))
+            i -= 1
+
+    return list(reversed(ops_rev)), total_cost
+
+
+def _merge_edit_steps(
+    ops: Sequence[_EditStep], ref_units: Sequence[str], hyp_units: Sequence[str]
+) -> list[AlignmentEdit]:
+    """Merge consecutive DP steps of the same kind into AlignmentEdit chunks."""
 
     edits: list[AlignmentEdit] = []
     for op_name, r_s, r_e, h_s, h_e in ops:
@@ -565,12 +809,7 @@ def _overlap_constrained_align(
                 )
             )
 
-    hits = sum(e.ref_end - e.ref_start for e in edits if e.op == EditOp.EQUAL)
-    subs = sum(e.ref_end - e.ref_start for e in edits if e.op == EditOp.SUBSTITUTE)
-    dels = sum(e.ref_end - e.ref_start for e in edits if e.op == EditOp.DELETE)
-    ins = sum(e.hyp_end - e.hyp_start for e in edits if e.op == EditOp.INSERT)
-    total_cost = float(cost[n, m])
-    return edits, hits, subs, ins, dels, total_cost
+    return edits
 
 
 def _tokenize_with_ranges(chars: Sequence[str]) -> tuple[list[tuple[int, int, str]], list[int]]:
@@ -792,6 +1031,8 @@ def _align_group_via_chars(
     separator: str = " ",
     sub_cost: TokenCost = _unit_sub_cost,
     overlap_tolerance_ms: float = 0.0,
+    engine: AlignEngine = AlignEngine.FAST,
+    memory_limit: int | None = None,
 ) -> AlignmentResult:
     """Char-level overlap-constrained alignment with word-level edit
     reconstruction. Resulting AlignmentResult looks like a word-mode
@@ -849,6 +1090,8 @@ def _align_group_via_chars(
         hyp_chars,
         hyp_origins,
         overlaps,
+        engine=engine,
+        memory_limit=memory_limit,
     )
 
     ref_word_strs, hyp_word_strs, word_edits = _reconstruct_word_edits_from_chars(
@@ -906,6 +1149,8 @@ def _align_group_with_overlap(
     separator: str,
     sub_cost: TokenCost = _unit_sub_cost,
     overlap_tolerance_ms: float = 0.0,
+    engine: AlignEngine = AlignEngine.FAST,
+    memory_limit: int | None = None,
 ) -> AlignmentResult:
     """Join mode alignment that forbids token-level matches between intervals
     whose time spans don't overlap. Catches the most obvious spurious matches
@@ -976,6 +1221,8 @@ def _align_group_with_overlap(
         hyp_origins,
         overlap,
         sub_cost=sub_cost,
+        engine=engine,
+        memory_limit=memory_limit,
     )
     # Rate uses the metric-weighted DP cost (total_cost), not the raw edit
     # count, so it is consistent with the objective the alignment minimized.
@@ -1005,6 +1252,9 @@ def match_transcriptions(
 ) -> TranscriptionReport:
     normalizer = Normalizer(req.normalizer)
     token_cost = make_token_cost(req.metric, req.threshold)
+    memory_limit = (
+        int(req.align_memory_limit_mb * 2**20) if req.align_memory_limit_mb is not None else None
+    )
 
     gt_groups = group_intervals(gt, attribute=req.grouping.attribute)
     ds_groups = group_intervals(ds, attribute=req.grouping.attribute)
@@ -1037,6 +1287,8 @@ def match_transcriptions(
                         "separator": req.grouping.join_separator,
                         "sub_cost": token_cost,
                         "overlap_tolerance_ms": req.overlap_tolerance_ms,
+                        "engine": req.align_engine,
+                        "memory_limit": memory_limit,
                     }
 
                     match (req.align, req.granularity):
@@ -1071,6 +1323,8 @@ def match_transcriptions(
                         granularity=req.granularity,
                         normalizer=normalizer,
                         sub_cost=token_cost,
+                        engine=req.align_engine,
+                        memory_limit=memory_limit,
                     )
                 groups.append(GroupAlignment(key, gt_group, ds_group, alignment))
 
@@ -1097,6 +1351,8 @@ def match_transcriptions(
                                 granularity=req.granularity,
                                 normalizer=normalizer,
                                 sub_cost=token_cost,
+                                engine=req.align_engine,
+                                memory_limit=memory_limit,
                             ),
                         )
                     )
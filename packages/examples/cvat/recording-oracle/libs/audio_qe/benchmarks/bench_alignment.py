@@ -0,0 +1,126 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Alignment engine benchmark: CER of one long transcript (a "honeypot" job)
+with the reference cell-by-cell DP vs the fast engine.
+
+The transcript is split into 5-second intervals, the annotation has ~10%
+grapheme errors and shifted interval boundaries, so the overlap mask is
+exercised. The reference DP is quadratic in Python and is only run for sizes
+up to DP_MAX_SIZE; where both engines run, the reports are checked to be
+identical.
+
+Call from the libs/audio_qe dir:
+
+    PYTHONPATH=. python benchmarks/bench_alignment.py [SIZE ...] [--dp-max DP_MAX_SIZE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from audio_qe import (
+    AlignEngine,
+    AlignMode,
+    Granularity,
+    Interval,
+    TranscriptionRequirement,
+    match_transcriptions,
+)
+
+SIZES = (1_000, 10_000, 50_000)
+DP_MAX_SIZE = 1_000
+INTERVAL_GRAPHEMES = 80  # ~5 s of speech
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _make_text(rng: random.Random, size: int) -> str:
+    words = []
+    length = 0
+    while length < size:
+        word = "".join(rng.choices(ALPHABET, k=rng.randint(2, 9)))
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def _add_errors(rng: random.Random, text: str, rate: float = 0.1) -> str:
+    out = []
+    for ch in text:
+        r = rng.random()
+        if r < rate / 3:
+            continue  # delete
+        if r < 2 * rate / 3:
+            out.append(rng.choice(ALPHABET))  # substitute
+        elif r < rate:
+            out.append(ch + rng.choice(ALPHABET))  # insert
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _split(text: str) -> list[Interval]:
+    return [
+        Interval(
+            id=i,
+            start=i * 5000,
+            stop=(i + 1) * 5000,
+            label="speech",
+            extra={"transcription": text[start : start + INTERVAL_GRAPHEMES]},
+        )
+        for i, start in enumerate(range(0, len(text), INTERVAL_GRAPHEMES))
+    ]
+
+
+def _annotate(rng: random.Random, gt: list[Interval], *, shift_ms: float) -> list[Interval]:
+    return [
+        Interval(
+            id=iv.id,
+            start=iv.start + shift_ms,
+            stop=iv.stop + shift_ms,
+            label=iv.label,
+            extra={"transcription": _add_errors(rng, iv.extra["transcription"])},
+        )
+        for iv in gt
+    ]
+
+
+def _measure(gt, ds, engine: AlignEngine):
+    req = TranscriptionRequirement(
+        granularity=Granularity.CHARACTER, align=AlignMode.CHAR, align_engine=engine
+    )
+    start = time.perf_counter()
+    report = match_transcriptions(gt, ds, req=req)
+    return report, time.perf_counter() - start
+
+
+def main(sizes: tuple[int, ...], dp_max_size: int) -> None:
+    rng = random.Random(0)
+    for size in sizes:
+        text = _make_text(rng, size)
+        gt = _split(text)
+        ds = _annotate(rng, gt, shift_ms=700)
+
+        fast_report, fast_time = _measure(gt, ds, AlignEngine.FAST)
+        line = f"{size:>7} graphemes: fast {fast_time:>8.3f} s"
+
+        if size <= dp_max_size:
+            dp_report, dp_time = _measure(gt, ds, AlignEngine.DP)
+            assert dp_report.groups == fast_report.groups, "engines disagree"
+            line += f"  dp {dp_time:>8.3f} s  speedup {dp_time / fast_time:>6.1f}x"
+        else:
+            line += "  dp skipped"
+
+        print(f"{line}  CER {fast_report.corpus_rate:.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--dp-max", type=int, default=DP_MAX_SIZE)
+    args = parser.parse_args()
+    main(tuple(args.sizes), args.dp_max)
@@ -0,0 +1,83 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Peak memory benchmark for the CER alignment of one long transcript, with and
+without `TranscriptionRequirement.align_memory_limit_mb`.
+
+Each run happens in a fresh process, so the reported peak RSS belongs to that
+run only (the baseline is an interpreter with audio_qe and NumPy imported).
+The capped and uncapped runs are checked to produce identical reports.
+
+Call from the libs/audio_qe dir:
+
+    PYTHONPATH=. python benchmarks/bench_alignment_memory.py [SIZE ...] [--limit-mb MB]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import random
+import resource
+import time
+
+from bench_alignment import _annotate, _make_text, _split
+
+from audio_qe import (
+    AlignMode,
+    Granularity,
+    TranscriptionRequirement,
+    match_transcriptions,
+)
+
+SIZES = (10_000, 50_000)
+LIMIT_MB = 64
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+
+
+def _run(size: int, limit_mb: float | None):
+    rng = random.Random(0)
+    gt = _split(_make_text(rng, size))
+    ds = _annotate(rng, gt, shift_ms=700)
+    req = TranscriptionRequirement(
+        granularity=Granularity.CHARACTER,
+        align=AlignMode.CHAR,
+        align_memory_limit_mb=limit_mb,
+    )
+
+    start = time.perf_counter()
+    report = match_transcriptions(gt, ds, req=req)
+    elapsed = time.perf_counter() - start
+    return report.groups, elapsed, _peak_rss_mb()
+
+
+def main(sizes: tuple[int, ...], limit_mb: float) -> None:
+    context = multiprocessing.get_context("spawn")
+
+    with context.Pool(1) as pool:
+        print(f"baseline: peak RSS {pool.apply(_peak_rss_mb):>7.1f} MB")
+
+    for size in sizes:
+        results = {}
+        for name, limit in (("no limit", None), (f"limit {limit_mb:g} MB", limit_mb)):
+            with context.Pool(1) as pool:
+                groups, elapsed, peak_rss = pool.apply(_run, (size, limit))
+
+            results[name] = groups
+            print(f"{size:>7} graphemes, {name:<14} {elapsed:>8.2f} s  peak RSS {peak_rss:>7.1f} MB")
+
+        first, *others = results.values()
+        assert all(groups == first for groups in others), "reports differ"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--limit-mb", type=float, default=LIMIT_MB)
+    args = parser.parse_args()
+    main(tuple(args.sizes), args.limit_mb)
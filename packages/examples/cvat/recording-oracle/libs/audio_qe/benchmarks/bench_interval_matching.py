@@ -0,0 +1,166 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Interval matching benchmark: the IoU matrix for the Hungarian assignment and
+the boundary F1 of one long annotation, per-pair Python scoring vs the sweep
+line + vectorized IoU, and the quadratic greedy boundary scan vs the sorted one.
+
+The Hungarian assignment itself still takes a dense (N, N) cost matrix, so
+the sizes are limited by its memory (~0.2 GB for 5000 intervals).
+
+The annotation is a GT segmentation with jittered boundaries, some dropped
+and some extra intervals, and a few label changes. The reference
+implementations are quadratic and are only run for sizes up to REF_MAX_SIZE;
+where they run, the results are checked to be identical.
+
+Call from the libs/audio_qe dir:
+
+    PYTHONPATH=. python benchmarks/bench_interval_matching.py [SIZE ...] [--ref-max REF_MAX_SIZE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Sequence
+
+import scipy.optimize  # noqa: F401 - imported lazily by audio_qe, keep it out of the timings
+
+from audio_qe import Interval, IntervalMatchingConfig
+from audio_qe.interval_matching import (
+    _collect_boundaries,
+    _label_eq,
+    _two_stage_match,
+    boundary_f1,
+    iou,
+    match_intervals,
+    match_segments,
+)
+from audio_qe.reports import BoundaryAgreement
+
+SIZES = (1_000, 2_000, 5_000)
+REF_MAX_SIZE = 5_000
+LABELS = ("speech", "music", "noise")
+
+
+def _make_intervals(rng: random.Random, size: int) -> list[Interval]:
+    intervals = []
+    start = 0.0
+    for i in range(size):
+        stop = start + rng.uniform(500, 5000)
+        intervals.append(Interval(id=i, start=start, stop=stop, label=rng.choice(LABELS)))
+        start = stop + rng.uniform(0, 500)
+    return intervals
+
+
+def _annotate(rng: random.Random, gt: list[Interval]) -> list[Interval]:
+    ds = []
+    for iv in gt:
+        r = rng.random()
+        if r < 0.05:
+            continue  # missed
+
+        start = iv.start + rng.gauss(0, 100)
+        stop = max(start + 1, iv.stop + rng.gauss(0, 100))
+        label = rng.choice(LABELS) if r < 0.1 else iv.label
+        ds.append(Interval(id=len(ds), start=start, stop=stop, label=label))
+
+        if r > 0.95:  # extra
+            ds.append(Interval(id=len(ds), start=stop + 10, stop=stop + 300, label=iv.label))
+    return ds
+
+
+def _reference_two_stage_match(gt: Sequence[Interval], ds: Sequence[Interval], iou_thresh: float):
+    def iou_with_label(a: Interval, b: Interval) -> float:
+        return iou(a, b) if _label_eq(a, b) else 0.0
+
+    matches, _, gt_u, ds_u = match_segments(gt, ds, distance=iou_with_label, dist_thresh=iou_thresh)
+    _, mispred, gt_u, ds_u = match_segments(gt_u, ds_u, distance=iou, dist_thresh=iou_thresh)
+    return matches, mispred, gt_u, ds_u
+
+
+def _reference_boundary_f1(
+    ref_boundaries: Sequence[float], hyp_boundaries: Sequence[float], *, tolerance_ms: float
+) -> BoundaryAgreement:
+    matched: set[int] = set()
+    tp = 0
+    for r in ref_boundaries:
+        best_idx = -1
+        best_d = tolerance_ms + 1e-9
+        for i, h in enumerate(hyp_boundaries):
+            if i in matched:
+                continue
+            d = abs(r - h)
+            if d <= best_d:
+                best_idx, best_d = i, d
+        if best_idx >= 0 and best_d <= tolerance_ms:
+            matched.add(best_idx)
+            tp += 1
+    fp = len(hyp_boundaries) - len(matched)
+    fn = len(ref_boundaries) - tp
+    precision = tp / (tp + fp) if (tp + fp) else 1.0
+    recall = tp / (tp + fn) if (tp + fn) else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) else 0.0
+    return BoundaryAgreement(tp=tp, fp=fp, fn=fn, precision=precision, recall=recall, f1=f1)
+
+
+def _measure(func: Callable, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(sizes: tuple[int, ...], ref_max_size: int) -> None:
+    config = IntervalMatchingConfig()
+    rng = random.Random(0)
+    for size in sizes:
+        gt = _make_intervals(rng, size)
+        ds = _annotate(rng, gt)
+        gt_boundaries = _collect_boundaries(gt)
+        ds_boundaries = _collect_boundaries(ds)
+
+        print(f"{size:>6} intervals:")
+
+        matching, matching_time = _measure(
+            _two_stage_match, gt, ds, iou_thresh=config.iou_threshold
+        )
+        boundary, boundary_time = _measure(
+            boundary_f1, gt_boundaries, ds_boundaries, tolerance_ms=config.boundary_tolerance_ms
+        )
+        _, total_time = _measure(match_intervals, gt, ds, config=config)
+
+        line = f"  hungarian matching {matching_time:>8.3f} s"
+        if size <= ref_max_size:
+            ref_matching, ref_matching_time = _measure(
+                _reference_two_stage_match, gt, ds, config.iou_threshold
+            )
+            assert ref_matching == matching, "matchings differ"
+            line += f"  per-pair scoring {ref_matching_time:>8.3f} s"
+            line += f"  speedup {ref_matching_time / matching_time:>6.1f}x"
+        print(line)
+
+        line = f"  boundary F1        {boundary_time:>8.3f} s"
+        if size <= ref_max_size:
+            ref_boundary, ref_boundary_time = _measure(
+                _reference_boundary_f1,
+                gt_boundaries,
+                ds_boundaries,
+                tolerance_ms=config.boundary_tolerance_ms,
+            )
+            assert ref_boundary == boundary, "boundary F1 differs"
+            line += f"  greedy scan      {ref_boundary_time:>8.3f} s"
+            line += f"  speedup {ref_boundary_time / boundary_time:>6.1f}x"
+        print(line)
+
+        print(f"  match_intervals    {total_time:>8.3f} s  boundary F1 {boundary.f1:.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--ref-max", type=int, default=REF_MAX_SIZE)
+    args = parser.parse_args()
+    main(tuple(args.sizes), args.ref_max)
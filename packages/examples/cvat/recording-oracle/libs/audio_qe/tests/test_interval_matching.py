@@ -0,0 +1,174 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import random
+from typing import Sequence
+
+import numpy as np
+import pytest
+
+from audio_qe.data import Interval
+from audio_qe.interval_matching import (
+    _label_eq,
+    _overlapping_pairs,
+    boundary_f1,
+    iou,
+    iou_matrix,
+)
+from audio_qe.reports import BoundaryAgreement
+
+LABELS = ("speech", "noise")
+
+
+def _reference_iou_matrix(
+    a_segms: Sequence[Interval], b_segms: Sequence[Interval], *, same_label: bool = False
+) -> np.ndarray:
+    return np.array(
+        [
+            [iou(a, b) if not same_label or _label_eq(a, b) else 0.0 for b in b_segms]
+            for a in a_segms
+        ],
+        dtype=float,
+    ).reshape(len(a_segms), len(b_segms))
+
+
+def _reference_boundary_f1(
+    ref_boundaries: Sequence[float], hyp_boundaries: Sequence[float], *, tolerance_ms: float
+) -> BoundaryAgreement:
+    matched: set[int] = set()
+    tp = 0
+    for r in ref_boundaries:
+        best_idx = -1
+        best_d = tolerance_ms + 1e-9
+        for i, h in enumerate(hyp_boundaries):
+            if i in matched:
+                continue
+            d = abs(r - h)
+            if d <= best_d:
+                best_idx, best_d = i, d
+        if best_idx >= 0 and best_d <= tolerance_ms:
+            matched.add(best_idx)
+            tp += 1
+    fp = len(hyp_boundaries) - len(matched)
+    fn = len(ref_boundaries) - tp
+    precision = tp / (tp + fp) if (tp + fp) else 1.0
+    recall = tp / (tp + fn) if (tp + fn) else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) else 0.0
+    return BoundaryAgreement(tp=tp, fp=fp, fn=fn, precision=precision, recall=recall, f1=f1)
+
+
+def _make_intervals(rng: random.Random, size: int) -> list[Interval]:
+    # Integer bounds on a short range, so there are many touching, nested,
+    # identical and zero-length intervals. The list is not sorted.
+    intervals = []
+    for i in range(size):
+        start = rng.randint(0, 50)
+        intervals.append(
+            Interval(id=i, start=start, stop=start + rng.randint(0, 10), label=rng.choice(LABELS))
+        )
+    return intervals
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_iou_matrix_matches_pairwise_iou(seed: int):
+    rng = random.Random(seed)
+
+    for _ in range(20):
+        a_segms = _make_intervals(rng, rng.randint(0, 15))
+        b_segms = _make_intervals(rng, rng.randint(0, 15))
+
+        for same_label in (False, True):
+            np.testing.assert_array_equal(
+                iou_matrix(a_segms, b_segms, same_label=same_label),
+                _reference_iou_matrix(a_segms, b_segms, same_label=same_label),
+            )
+
+        expected_pairs = {
+            (a_idx, b_idx)
+            for a_idx, a in enumerate(a_segms)
+            for b_idx, b in enumerate(b_segms)
+            if min(a.stop, b.stop) > max(a.start, b.start)
+        }
+        a_idx, b_idx = _overlapping_pairs(a_segms, b_segms)
+        assert len(a_idx) == len(expected_pairs)
+        assert set(zip(a_idx, b_idx)) == expected_pairs
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "expected_iou"),
+    [
+        ((0, 10), (10, 20), 0.0),
+        ((10, 20), (0, 10), 0.0),
+        ((5, 5), (0, 10), 0.0),
+        ((5, 5), (5, 5), 0.0),
+        ((0, 10), (0, 10), 1.0),
+        ((0, 10), (5, 15), 1 / 3),
+        ((0, 20), (5, 10), 0.25),
+    ],
+    ids=[
+        "touching",
+        "touching, reversed",
+        "zero-length inside",
+        "zero-length identical",
+        "identical",
+        "overlapping",
+        "nested",
+    ],
+)
+def test_iou_matrix_edge_cases(a: tuple[float, float], b: tuple[float, float], expected_iou: float):
+    a_segms = [Interval(id=0, start=a[0], stop=a[1], label="speech")]
+    b_segms = [Interval(id=0, start=b[0], stop=b[1], label="speech")]
+
+    assert iou_matrix(a_segms, b_segms)[0, 0] == pytest.approx(expected_iou)
+    np.testing.assert_array_equal(
+        iou_matrix(a_segms, b_segms), _reference_iou_matrix(a_segms, b_segms)
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_boundary_f1_matches_greedy_scan(seed: int):
+    rng = random.Random(seed)
+
+    for _ in range(50):
+        # Integer timestamps and tolerance: many boundaries are exactly at the
+        # tolerance distance or equally near to several others. Unsorted.
+        ref_boundaries = [rng.randint(0, 60) for _ in range(rng.randint(0, 20))]
+        hyp_boundaries = [rng.randint(0, 60) for _ in range(rng.randint(0, 20))]
+        tolerance_ms = rng.choice([0, 1, 3, 5])
+
+        assert boundary_f1(
+            ref_boundaries, hyp_boundaries, tolerance_ms=tolerance_ms
+        ) == _reference_boundary_f1(ref_boundaries, hyp_boundaries, tolerance_ms=tolerance_ms)
+
+
+@pytest.mark.parametrize(
+    ("ref", "hyp", "tolerance_ms", "expected_tp"),
+    [
+        ([100], [300], 200, 1),
+        ([300], [100], 200, 1),
+        ([100], [300.5], 200, 0),
+        ([100, 500], [300, 300], 200, 2),
+        ([200, 100], [400, 0, 300], 100, 2),
+        ([], [100], 200, 0),
+        ([100], [], 200, 0),
+    ],
+    ids=[
+        "at tolerance",
+        "at tolerance, before",
+        "over tolerance",
+        "equally near duplicates",
+        "unsorted",
+        "empty ref",
+        "empty hyp",
+    ],
+)
+def test_boundary_f1_edge_cases(
+    ref: list[float], hyp: list[float], tolerance_ms: float, expected_tp: int
+):
+    result = boundary_f1(ref, hyp, tolerance_ms=tolerance_ms)
+
+    assert result.tp == expected_tp
+    assert result == _reference_boundary_f1(ref, hyp, tolerance_ms=tolerance_ms)
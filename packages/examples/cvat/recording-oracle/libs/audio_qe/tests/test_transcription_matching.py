@@ -0,0 +1,168 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import random
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from audio_qe import transcription_matching
+from audio_qe.config import TranscriptionRequirement
+from audio_qe.data import AlignEngine, AlignMode, Granularity, Interval
+from audio_qe.transcription_matching import (
+    _overlap_constrained_align,
+    _overlap_constrained_align_dp,
+    _traceback_block_rows,
+    _unit_cost_align_fast,
+    _unit_sub_cost,
+    match_transcriptions,
+)
+
+ALPHABET = "abcd"  # small, so that random sequences have many matches
+
+
+def _make_units(rng: random.Random, size: int, intervals: int) -> tuple[list[str], list[int]]:
+    units = rng.choices(ALPHABET, k=size)
+    origins = sorted(rng.randrange(intervals) for _ in range(size))
+    return units, origins
+
+
+def _make_case(
+    rng: random.Random,
+    *,
+    ref_size: tuple[int, int] = (0, 30),
+    hyp_size: tuple[int, int] = (0, 30),
+):
+    ref_intervals = rng.randint(1, 4)
+    hyp_intervals = rng.randint(1, 4)
+    ref_units, ref_origins = _make_units(rng, rng.randint(*ref_size), ref_intervals)
+    hyp_units, hyp_origins = _make_units(rng, rng.randint(*hyp_size), hyp_intervals)
+    overlap = np.array(
+        [[rng.random() < 0.7 for _ in range(hyp_intervals)] for _ in range(ref_intervals)]
+    )
+    return ref_units, ref_origins, hyp_units, hyp_origins, overlap
+
+
+def _assert_engines_match(ref_units, ref_origins, hyp_units, hyp_origins, overlap):
+    expected = _overlap_constrained_align_dp(
+        ref_units, ref_origins, hyp_units, hyp_origins, overlap, sub_cost=_unit_sub_cost
+    )
+    assert (
+        _unit_cost_align_fast(ref_units, ref_origins, hyp_units, hyp_origins, overlap) == expected
+    )
+
+    assert _overlap_constrained_align(
+        ref_units, ref_origins, hyp_units, hyp_origins, overlap, engine=AlignEngine.FAST
+    ) == _overlap_constrained_align(
+        ref_units, ref_origins, hyp_units, hyp_origins, overlap, engine=AlignEngine.DP
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fast_alignment_matches_reference_dp(seed: int):
+    rng = random.Random(seed)
+
+    for _ in range(50):
+        _assert_engines_match(*_make_case(rng))
+
+
+@pytest.mark.parametrize(
+    ("ref", "hyp"),
+    [
+        ("", ""),
+        ("", "abc"),
+        ("abc", ""),
+        ("aaaa", "aaaa"),
+        ("aaaa", "aa"),
+        ("abcd", "abcd"),
+        ("aaaa", "bbbbbb"),
+        ("abab", "cdcdc"),
+    ],
+    ids=[
+        "both empty",
+        "empty ref",
+        "empty hyp",
+        "all equal",
+        "all equal, shorter hyp",
+        "identical",
+        "all different",
+        "all different, interleaved",
+    ],
+)
+@pytest.mark.parametrize("overlap", [True, False], ids=["overlapping", "not overlapping"])
+def test_fast_alignment_matches_reference_dp_on_edge_cases(ref: str, hyp: str, overlap: bool):
+    _assert_engines_match(
+        list(ref), [0] * len(ref), list(hyp), [0] * len(hyp), np.array([[overlap]])
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fast_alignment_with_memory_limit_matches_full_traceback(seed: int):
+    rng = random.Random(seed)
+
+    for _ in range(10):
+        # the checkpoints only save memory when the ref is much longer than the hyp
+        case = _make_case(rng, ref_size=(200, 300), hyp_size=(0, 16))
+        n, m = len(case[0]), len(case[2])
+        memory_limit = n * 2 * ((m + 8) // 8) - 1  # just below the full traceback masks
+        assert _traceback_block_rows(n, m, memory_limit) < n
+
+        expected = _overlap_constrained_align_dp(*case, sub_cost=_unit_sub_cost)
+        assert _unit_cost_align_fast(*case) == expected
+        assert _unit_cost_align_fast(*case, memory_limit=memory_limit) == expected
+
+
+def test_can_match_transcriptions_with_memory_limit():
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 9))) for _ in range(300)
+    ]
+    gt = [
+        Interval(
+            id=i,
+            start=i * 5000,
+            stop=(i + 1) * 5000,
+            label="speech",
+            extra={"transcription": " ".join(words[i * 10 : (i + 1) * 10])},
+        )
+        for i in range(30)
+    ]
+    ds = [
+        Interval(
+            id=iv.id,
+            start=iv.start + 700,
+            stop=iv.stop + 700,
+            label=iv.label,
+            extra={"transcription": iv.extra["transcription"].replace("a", "o")},
+        )
+        for iv in gt
+    ]
+
+    def match(align_memory_limit_mb: float | None):
+        req = TranscriptionRequirement(
+            granularity=Granularity.CHARACTER,
+            align=AlignMode.CHAR,
+            align_memory_limit_mb=align_memory_limit_mb,
+        )
+        return match_transcriptions(gt, ds, req=req)
+
+    is_blocked = []
+
+    def _traceback_block_rows_spy(n: int, m: int, memory_limit: int | None) -> int:
+        block_rows = _traceback_block_rows(n, m, memory_limit)
+        is_blocked.append(block_rows < n)
+        return block_rows
+
+    full_report = match(None)
+    with mock.patch.object(
+        transcription_matching, "_traceback_block_rows", _traceback_block_rows_spy
+    ):
+        limited_report = match(0.5)  # the full traceback needs ~1 MB
+
+    assert any(is_blocked)
+    assert limited_report.groups == full_report.groups
+    assert limited_report.corpus_rate == full_report.corpus_rate
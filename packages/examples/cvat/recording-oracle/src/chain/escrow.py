@@ -1,5 +1,7 @@
 import json
+from contextlib import ExitStack
 from decimal import Decimal
+from functools import cache, partial
 
 import httpx2
 from human_protocol_sdk.constants import ChainId, Status
@@ -10,6 +12,7 @@ from human_protocol_sdk.utils import validate_url
 from src.chain.web3 import get_token_decimals, get_web3
 from src.core.config import Config
 from src.core.types import OracleWebhookTypes
+from src.services.cache import Cache
 
 
 class ManifestNotAvailableError(Exception):
@@ -63,21 +66,50 @@ def validate_escrow(
         raise ValueError("Escrow doesn't have funds")
 
 
-def get_escrow_manifest(chain_id: int, escrow_address: str) -> dict:
+_unlocked_keys = ExitStack()
+
+
+@cache
+def get_encryption() -> Encryption:
+    """
+    Returns the oracle Encryption. The private key is parsed and unlocked once per process
+    and stays unlocked, so that decryption doesn't repeat the passphrase key derivation.
+    """
+
+    encryption = Encryption(
+        Config.encryption_config.pgp_private_key,
+        Config.encryption_config.pgp_passphrase,
+    )
+
+    if not encryption.private_key.is_unlocked:
+        # The unlock context is never exited
+        _unlocked_keys.enter_context(
+            encryption.private_key.unlock(Config.encryption_config.pgp_passphrase)
+        )
+
+    return encryption
+
+
+def download_manifest(chain_id: int, escrow_address: str) -> dict:
     escrow = get_escrow(chain_id, escrow_address)
 
     manifest_content = _get_manifest_content(escrow.manifest)
 
     if EncryptionUtils.is_encrypted(manifest_content):
-        encryption = Encryption(
-            Config.encryption_config.pgp_private_key,
-            Config.encryption_config.pgp_passphrase,
-        )
-        manifest_content = encryption.decrypt(manifest_content).decode("utf-8")
+        manifest_content = get_encryption().decrypt(manifest_content).decode("utf-8")
 
     return json.loads(manifest_content)
 
 
+def get_escrow_manifest(chain_id: int, escrow_address: str) -> dict:
+    cache = Cache()
+    return cache.get_or_set_manifest(
+        escrow_address=escrow_address,
+        chain_id=chain_id,
+        set_callback=partial(download_manifest, chain_id, escrow_address),
+    )
+
+
 def get_escrow_fund_token_decimals(chain_id: int, escrow_address: str) -> int:
     """
     ERC-20 decimals: divide the raw token amount by 10**decimals for the user representation
@@ -57,6 +57,21 @@ class Postgres:
         return f"postgresql://{cls.user}:{cls.password}@{cls.host}:{cls.port}/{cls.database}"
 
 
+class RedisConfig:
+    host = getenv("REDIS_HOST", "")
+    "Redis for the shared cache. Leave empty to cache only in the process memory"
+
+    port = int(getenv("REDIS_PORT", "6379"))
+    database = int(getenv("REDIS_DB", "0"))
+    user = getenv("REDIS_USER", "")
+    password = getenv("REDIS_PASSWORD", "")
+    use_ssl = to_bool(getenv("REDIS_USE_SSL", "false"))
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(cls.host)
+
+
 class _NetworkConfig:
     chain_id: ClassVar[int]
     rpc_api: ClassVar[str | None]
@@ -177,6 +192,15 @@ class FeaturesConfig:
     enable_custom_cloud_host = to_bool(getenv("ENABLE_CUSTOM_CLOUD_HOST", "no"))
     "Allows using a custom host in manifest bucket urls"
 
+    max_data_storage_connections = int(getenv("MAX_DATA_STORAGE_CONNECTIONS", 5))
+    "Max parallel data storage connections in 1 client (annotation downloads, ...)"
+
+    manifest_cache_ttl = int(getenv("MANIFEST_CACHE_TTL", str(2 * 24 * 60 * 60)))
+    "TTL for cached manifests, in seconds"
+
+    manifest_cache_size = int(getenv("MANIFEST_CACHE_SIZE", "128"))
+    "The number of manifests cached in the process memory, in front of the Redis cache"
+
 
 class ValidationConfig:
     min_available_gt_threshold = float(getenv("MIN_AVAILABLE_GT_THRESHOLD", "0.3"))
@@ -225,6 +249,19 @@ class ValidationConfig:
     If the value is lower, the escrow annotation is paused for manual investigation.
     """
 
+    audio_alignment_memory_limit_mb = float(getenv("AUDIO_ALIGNMENT_MEMORY_LIMIT_MB", "256"))
+    """
+    Memory limit for the transcription alignment tables of one honeypot, in MB.
+    Longer honeypots are aligned with a slower, checkpointed traceback.
+    """
+
+    audio_scoring_workers = int(getenv("AUDIO_SCORING_WORKERS", os.cpu_count() or 1))
+    """
+    The number of worker processes scoring the audio transcription assignments of an escrow.
+    Use 1 to score in the calling process. Each worker can use up to
+    AUDIO_ALIGNMENT_MEMORY_LIMIT_MB for the alignment tables.
+    """
+
 
 class EncryptionConfig(_BaseConfig):
     pgp_passphrase = getenv("PGP_PASSPHRASE", "")
@@ -264,7 +301,19 @@ class Config:
     environment = getenv("ENVIRONMENT", "development")
     workers_amount = int(getenv("WORKERS_AMOUNT", 1))
     webhook_max_retries = int(getenv("WEBHOOK_MAX_RETRIES", 5))
+    "Retry budget: failed webhooks are moved to the dead-letter queue after so many attempts"
     webhook_delay_if_failed = int(getenv("WEBHOOK_DELAY_IF_FAILED", 60))
+    "Delay before the first retry of a failed webhook, doubled for each next retry, in seconds"
+    webhook_max_delay_if_failed = int(getenv("WEBHOOK_MAX_DELAY_IF_FAILED", 60 * 60))
+    "Max delay between the retries of a failed webhook, in seconds"
+    webhook_send_workers = int(getenv("WEBHOOK_SEND_WORKERS", 10))
+    "Max outgoing webhooks sent in parallel"
+    webhook_max_host_connections = int(getenv("WEBHOOK_MAX_HOST_CONNECTIONS", 2))
+    "Max outgoing webhooks sent in parallel to one receiver host"
+    webhook_url_cache_ttl = int(getenv("WEBHOOK_URL_CACHE_TTL", 5 * 60))
+    "TTL for cached webhook receiver URLs, in seconds"
+    admin_api_key = getenv("ADMIN_API_KEY", "")
+    "Key for the admin endpoints (X-Admin-Key header). The endpoints are disabled if empty"
     loglevel = parse_log_level(getenv("LOGLEVEL", "info"))
 
     polygon_mainnet = PolygonMainnetConfig
@@ -272,6 +321,7 @@ class Config:
     localhost = LocalhostConfig
 
     postgres_config = Postgres
+    redis_config = RedisConfig
     cron_config = CronConfig
     storage_config = StorageConfig
     exchange_oracle_storage_config = ExchangeOracleStorageConfig
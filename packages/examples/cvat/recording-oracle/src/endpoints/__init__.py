@@ -3,6 +3,7 @@
 from fastapi import APIRouter, FastAPI
 
 from src.core.config import Config
+from src.endpoints.admin import router as admin_router
 from src.endpoints.webhook import router as webhook_router
 from src.schemas import MetaResponse, ResponseError, ValidationErrorResponse
 
@@ -42,5 +43,6 @@ def init_api(app: FastAPI) -> FastAPI:
 
     app.include_router(greet_router)
     app.include_router(webhook_router, responses=default_responses)
+    app.include_router(admin_router, responses=default_responses)
 
     return app
@@ -0,0 +1,64 @@
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+import src.services.webhook as oracle_db_service
+from src.core.config import Config
+from src.core.types import OracleWebhookTypes
+from src.db import SessionLocal
+from src.endpoints.utils import run_blocking
+from src.schemas.webhook import (
+    DeadLetterWebhook,
+    RequeueWebhooksRequest,
+    RequeueWebhooksResponse,
+)
+from src.services.webhook import OracleWebhookDirectionTags
+
+
+def _check_admin_key(x_admin_key: Annotated[str | None, Header()] = None) -> None:
+    if not Config.admin_api_key:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    if not x_admin_key or not secrets.compare_digest(x_admin_key, Config.admin_api_key):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin key")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(_check_admin_key)])
+
+_QUEUES = {
+    OracleWebhookDirectionTags.incoming: oracle_db_service.inbox,
+    OracleWebhookDirectionTags.outgoing: oracle_db_service.outbox,
+}
+
+
+@router.get(
+    "/webhooks/dead-letter", description="Lists the webhooks that ran out of delivery attempts"
+)
+async def list_dead_letter_webhooks(
+    direction: OracleWebhookDirectionTags = OracleWebhookDirectionTags.outgoing,
+    type: OracleWebhookTypes | None = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+) -> list[DeadLetterWebhook]:
+    def _get_webhooks() -> list[DeadLetterWebhook]:
+        with SessionLocal.begin() as session:
+            webhooks = _QUEUES[direction].get_failed_webhooks(session, type=type, limit=limit)
+            return [DeadLetterWebhook.model_validate(webhook) for webhook in webhooks]
+
+    return await run_blocking(_get_webhooks)
+
+
+@router.post(
+    "/webhooks/dead-letter/requeue",
+    description="Returns dead-letter webhooks to the queue with all the attempts available again",
+)
+async def requeue_dead_letter_webhooks(
+    request: RequeueWebhooksRequest,
+) -> RequeueWebhooksResponse:
+    def _requeue() -> int:
+        with SessionLocal.begin() as session:
+            return _QUEUES[request.direction].requeue_failed_webhooks(
+                session, webhook_ids=request.ids, type=request.type
+            )
+
+    return RequeueWebhooksResponse(requeued=await run_blocking(_requeue))
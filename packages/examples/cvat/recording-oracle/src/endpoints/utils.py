@@ -0,0 +1,19 @@
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+_T = TypeVar("_T")
+_P = ParamSpec("_P")
+
+
+async def run_blocking(func: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+    """
+    Runs a blocking function (DB session etc.) in the thread pool of the API,
+    so that it doesn't stall the other requests on the event loop.
+
+    The function runs in a copy of the current context, so context variables
+    are available inside.
+    """
+
+    return await run_in_threadpool(func, *args, **kwargs)
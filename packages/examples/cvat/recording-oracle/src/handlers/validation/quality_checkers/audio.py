@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import csv
 import io
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 from audio_qe import (
@@ -36,10 +39,11 @@ from src.core.tasks.audio_transcription.spec import NormalizerPreset, parse_audi
 from src.core.validation_errors import LowQualityError, TooFewGtError
 from src.handlers.validation.common import UNKNOWN_QUALITY
 from src.handlers.validation.quality_checkers.base import TaskQualityChecker
-from src.services.cloud import make_client as make_cloud_client
 from src.services.cloud.utils import BucketAccessInfo
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from src.core.annotation_meta import JobMeta
     from src.core.tasks.audio_transcription.meta import Clip, PlacedRegion
     from src.services.cloud.client import StorageClient
@@ -94,41 +98,51 @@ class AudioTaskQualityChecker(TaskQualityChecker):
             normalizer=self._normalizer_config(spec.details.normalizer),
             grouping=GroupingConfig(attribute=_GROUP_ATTR, strategy=GroupingStrategy.JOIN),
             overlap_tolerance_ms=round(spec.details.boundary_tolerance.total_seconds() * 1000),
+            align_memory_limit_mb=Config.validation.audio_alignment_memory_limit_mb,
         )
-        normalizer = Normalizer(req.normalizer)
 
-        client = make_cloud_client(
+        client = self._make_cloud_storage_client(
             BucketAccessInfo.parse_obj(Config.exchange_oracle_storage_config)
         )
-        gt_annotations = self._load_gt(client)
-        clips_by_id = self._load_clips_meta(client)
-        task_clips = self._load_task_clips(client)
-        annotation_bytes = self._download_assignment_annotations(client)
+        gt_annotations, clips_by_id, task_clips = self._load_task_meta(client)
+
+        jobs_without_gt: set[int] = set()
+
+        def _iter_job_intervals() -> Iterator[tuple[int, list[Interval], list[Interval]]]:
+            # The annotations are parsed and scored as they are downloaded
+            for job_meta, annotation in self._download_assignment_annotations(client):
+                ds_annotations = self._parse_annotations(annotation)
+                # Each CVAT task holds exactly one clip; join the job to its clip via the
+                # EO-recorded task -> clip mapping. An empty submission still resolves here,
+                # so its honeypots score as full deletions (rate 1.0) instead of being treated
+                # as unverifiable.
+                clip_meta = clips_by_id[task_clips[job_meta.task_id]]
+
+                gt_intervals, hyp_intervals = self._build_intervals(
+                    ds_annotations,
+                    gt_annotations,
+                    clip_meta=clip_meta,
+                    transcription_attr=transcription_attr,
+                )
+                if not gt_intervals:
+                    # No honeypots available - not expected by construction.
+                    jobs_without_gt.add(job_meta.job_id)
+                    continue
+
+                yield job_meta.job_id, gt_intervals, hyp_intervals
+
+        job_rates = self._score_jobs(_iter_job_intervals(), req, job_count=len(self._meta.jobs))
 
+        # The jobs are scored in the download order, the results are collected in the job order
         job_results: dict[int, float] = {}
         rejected_jobs: dict[int, object] = {}
-
         for job_meta in self._meta.jobs:
-            ds_annotations = self._parse_annotations(annotation_bytes[job_meta.job_id])
-            # Each CVAT task holds exactly one clip; join the job to its clip via the EO-recorded
-            # task -> clip mapping. An empty submission still resolves here, so its honeypots score
-            # as full deletions (rate 1.0) instead of being treated as unverifiable.
-            clip_meta = clips_by_id[task_clips[job_meta.task_id]]
-
-            gt_intervals, hyp_intervals = self._build_intervals(
-                ds_annotations,
-                gt_annotations,
-                clip_meta=clip_meta,
-                transcription_attr=transcription_attr,
-            )
-            if not gt_intervals:
-                # No honeypots available - not expected by construction.
+            if job_meta.job_id in jobs_without_gt:
                 job_results[job_meta.job_id] = UNKNOWN_QUALITY
                 rejected_jobs[job_meta.job_id] = TooFewGtError()
                 continue
 
-            report = match_transcriptions(gt_intervals, hyp_intervals, req=req)
-            rate = self._job_error_rate(report, req, normalizer)
+            rate = job_rates[job_meta.job_id]
             job_results[job_meta.job_id] = rate
 
             # WER/CER are lower-is-better; reject when the error rate exceeds the target.
@@ -156,33 +170,35 @@ class AudioTaskQualityChecker(TaskQualityChecker):
             return NormalizerConfig(mode=NormalizerMode.BASIC)
         return lang_preset(preset.value)
 
-    def _load_gt(self, client: StorageClient) -> dict[str, InputGtRegion]:
-        data = client.download_file(
-            compose_data_bucket_filename(
-                self.escrow_address, self.chain_id, TaskMetaLayout.GT_FILENAME
-            )
-        )
-        return {region.id: region for region in parse_gt_tsv(data)}
-
-    def _load_clips_meta(self, client: StorageClient) -> dict[str, Clip]:
-        "Returns clip id -> clip meta mapping."
+    def _load_task_meta(
+        self, client: StorageClient
+    ) -> tuple[dict[str, InputGtRegion], dict[str, Clip], dict[int, str]]:
+        """
+        Returns GT region id -> GT region, clip id -> clip meta and CVAT task id -> clip id
+        mappings.
+        """
 
-        data = client.download_file(
-            compose_data_bucket_filename(
-                self.escrow_address, self.chain_id, TaskMetaLayout.CLIPS_FILENAME
+        filenames = {
+            compose_data_bucket_filename(self.escrow_address, self.chain_id, filename): filename
+            for filename in (
+                TaskMetaLayout.GT_FILENAME,
+                TaskMetaLayout.CLIPS_FILENAME,
+                TaskMetaLayout.TASK_CLIPS_FILENAME,
             )
-        )
-        return {a.id: a for a in TaskMetaSerializer().parse_clips(data)}
-
-    def _load_task_clips(self, client: StorageClient) -> dict[int, str]:
-        "Returns CVAT task id -> clip id mapping."
-
-        data = client.download_file(
-            compose_data_bucket_filename(
-                self.escrow_address, self.chain_id, TaskMetaLayout.TASK_CLIPS_FILENAME
+        }
+        files = {
+            filenames[key]: data
+            for key, data in client.download_files(
+                filenames, max_concurrency=Config.features.max_data_storage_connections
             )
+        }
+
+        serializer = TaskMetaSerializer()
+        return (
+            {region.id: region for region in parse_gt_tsv(files[TaskMetaLayout.GT_FILENAME])},
+            {a.id: a for a in serializer.parse_clips(files[TaskMetaLayout.CLIPS_FILENAME])},
+            serializer.parse_task_clips(files[TaskMetaLayout.TASK_CLIPS_FILENAME]),
         )
-        return TaskMetaSerializer().parse_task_clips(data)
 
     @staticmethod
     def _parse_annotations(annotation: bytes) -> list[dict]:
@@ -249,22 +265,26 @@ class AudioTaskQualityChecker(TaskQualityChecker):
 
         return gt_intervals, hyp_intervals
 
-    def _download_assignment_annotations(self, client: StorageClient) -> dict[int, bytes]:
-        "Download every job's per-assignment annotation TSV up front, keyed by cvat job id."
-        return {
-            job_meta.job_id: self._download_assignment_tsv(client, job_meta)
-            for job_meta in self._meta.jobs
-        }
+    def _download_assignment_annotations(
+        self, client: StorageClient
+    ) -> Iterator[tuple[JobMeta, bytes]]:
+        "Download every job's per-assignment annotation TSV, yielding them as they arrive."
 
-    def _download_assignment_tsv(self, client: StorageClient, job_meta: JobMeta) -> bytes:
-        return client.download_file(
-            compose_results_bucket_filename(
-                self.escrow_address,
-                self.chain_id,
-                TaskResultsLayout.assignment_annotation_filename(
-                    job_meta.job_id, job_meta.assignment_id
-                ),
-            )
+        jobs_by_filename = {
+            self._assignment_tsv_filename(job_meta): job_meta for job_meta in self._meta.jobs
+        }
+        for filename, data in client.download_files(
+            jobs_by_filename, max_concurrency=Config.features.max_data_storage_connections
+        ):
+            yield jobs_by_filename[filename], data
+
+    def _assignment_tsv_filename(self, job_meta: JobMeta) -> str:
+        return compose_results_bucket_filename(
+            self.escrow_address,
+            self.chain_id,
+            TaskResultsLayout.assignment_annotation_filename(
+                job_meta.job_id, job_meta.assignment_id
+            ),
         )
 
     @staticmethod
@@ -300,7 +320,46 @@ class AudioTaskQualityChecker(TaskQualityChecker):
                 return p
         return None
 
-    def _job_error_rate(self, report, req: TranscriptionRequirement, normalizer) -> float:
+    @classmethod
+    def _score_jobs(
+        cls,
+        job_intervals: Iterable[tuple[int, list[Interval], list[Interval]]],
+        req: TranscriptionRequirement,
+        *,
+        job_count: int,
+    ) -> dict[int, float]:
+        """
+        Computes the error rates of the (job id, GT intervals, annotation intervals) jobs.
+        The scoring is CPU-bound, so with several workers configured the jobs are scored in
+        a process pool, as they are read from the input.
+        """
+        workers = min(Config.validation.audio_scoring_workers, job_count)
+        if workers <= 1:
+            return dict(cls._score_job(job, req) for job in job_intervals)
+
+        # Spawned workers don't inherit the threads, locks and DB connections of this process
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return dict(
+                pool.map(
+                    cls._score_job,
+                    job_intervals,
+                    itertools.repeat(req),
+                    chunksize=max(1, job_count // (4 * workers)),
+                )
+            )
+
+    @classmethod
+    def _score_job(
+        cls,
+        job: tuple[int, list[Interval], list[Interval]],
+        req: TranscriptionRequirement,
+    ) -> tuple[int, float]:
+        job_id, gt_intervals, hyp_intervals = job
+        report = match_transcriptions(gt_intervals, hyp_intervals, req=req)
+        return job_id, cls._job_error_rate(report, req, Normalizer(req.normalizer))
+
+    @classmethod
+    def _job_error_rate(cls, report, req: TranscriptionRequirement, normalizer) -> float:
         """
         Micro-averaged error rate over the assignment's honeypots. The library's ``corpus_rate``
         only aggregates matched groups, so missing groups (honeypot the annotator left empty) are
@@ -321,12 +380,12 @@ class AudioTaskQualityChecker(TaskQualityChecker):
             total_ref += matched_ref
 
         for _key, gt_group in report.missing_groups:
-            units = self._group_units(gt_group, req, normalizer)
+            units = cls._group_units(gt_group, req, normalizer)
             total_err += len(units)
             total_ref += len(units)
 
         for _key, ds_group in report.extra_groups:
-            total_err += len(self._group_units(ds_group, req, normalizer))
+            total_err += len(cls._group_units(ds_group, req, normalizer))
 
         return total_err / total_ref if total_ref else 0.0
 
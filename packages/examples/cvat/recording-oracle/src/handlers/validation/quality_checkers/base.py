@@ -5,13 +5,17 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
 
+from src.core.config import Config
 from src.handlers.validation.common import _TaskHandler, _ValidationResult
+from src.services.cloud import CloudProviders
+from src.services.cloud import make_client as make_cloud_client
 
 if TYPE_CHECKING:
     from src.core.annotation_meta import AnnotationMeta
     from src.core.gt_stats import GtStats
     from src.core.manifest import ManifestBase
     from src.handlers.validation.common import _JobResults, _RejectedJobs
+    from src.services.cloud import BucketAccessInfo, StorageClient
 
 
 class TaskQualityChecker(_TaskHandler, metaclass=ABCMeta):
@@ -34,6 +38,21 @@ class TaskQualityChecker(_TaskHandler, metaclass=ABCMeta):
         self._temp_dir: Path | None = None
         self._meta: AnnotationMeta = meta
 
+    @classmethod
+    def _make_cloud_storage_client(cls, bucket_info: BucketAccessInfo) -> StorageClient:
+        "Creates a client that can be used for up to max_data_storage_connections downloads at once"
+
+        extra_args = {}
+
+        if bucket_info.provider == CloudProviders.aws:
+            import boto3.session
+
+            extra_args["config"] = boto3.session.Config(
+                max_pool_connections=Config.features.max_data_storage_connections
+            )
+
+        return make_cloud_client(bucket_info, **extra_args)
+
     @abstractmethod
     def _validate_jobs(self) -> None:
         """
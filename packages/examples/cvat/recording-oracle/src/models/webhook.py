@@ -1,5 +1,5 @@
 # pylint: disable=too-few-public-methods
-from sqlalchemy import JSON, Column, DateTime, Enum, Integer, String
+from sqlalchemy import JSON, Column, DateTime, Enum, Index, Integer, String, text
 from sqlalchemy.sql import func
 
 from src.core.types import Networks, OracleWebhookStatuses, OracleWebhookTypes
@@ -26,5 +26,16 @@ class Webhook(Base):
     event_data = Column(JSON, nullable=True, server_default=None)
     direction = Column(String, nullable=False)
 
+    __table_args__ = (
+        # Polled by the webhook crons, only the pending webhooks are indexed
+        Index(
+            "ix_webhooks_pending",
+            "direction",
+            "type",
+            "wait_until",
+            postgresql_where=text(f"status = '{OracleWebhookStatuses.pending.value}'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"Webhook. id={self.id} type={self.type}.{self.event_type}"
@@ -3,7 +3,8 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from src.chain.web3 import validate_address
-from src.core.types import ExchangeOracleEventTypes, Networks
+from src.core.types import ExchangeOracleEventTypes, Networks, OracleWebhookTypes
+from src.services.webhook import OracleWebhookDirectionTags
 
 
 class OracleWebhook(BaseModel):
@@ -32,3 +33,29 @@ class OracleWebhook(BaseModel):
 
 class OracleWebhookResponse(BaseModel):
     id: str
+
+
+class DeadLetterWebhook(BaseModel):
+    id: str
+    escrow_address: str
+    chain_id: int
+    type: str
+    direction: str
+    event_type: str
+    event_data: dict | None = None
+    attempts: int
+    created_at: datetime
+    updated_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RequeueWebhooksRequest(BaseModel):
+    direction: OracleWebhookDirectionTags
+    ids: list[str] | None = None
+    "Webhooks to requeue, all the dead-letter webhooks of the direction (and type) if not set"
+    type: OracleWebhookTypes | None = None
+
+
+class RequeueWebhooksResponse(BaseModel):
+    requeued: int
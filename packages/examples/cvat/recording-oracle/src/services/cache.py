@@ -0,0 +1,205 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+import aiocache.serializers
+import cachelib.serializers
+from cachelib import BaseCache, RedisCache
+
+from src.core.config import Config
+
+
+class _RedisSerializer(cachelib.serializers.RedisSerializer):
+    # The default Pickle-based serializer is not safe, here we use MsgPack as a safer alternative.
+    # JSON could also be used, but it is less efficient and has restrictions on message contents.
+
+    def __init__(self):
+        super().__init__()
+        self._impl = aiocache.serializers.MsgPackSerializer()
+
+    def dump(self, *args, **kwargs):  # noqa: ARG002
+        raise AssertionError("This method must not be called")
+
+    def load(self, *args, **kwargs):  # noqa: ARG002
+        raise AssertionError("This method must not be called")
+
+    def dumps(self, value: Any) -> bytes:
+        return self._impl.dumps(value)
+
+    def loads(self, bvalue: bytes) -> Any:
+        return self._impl.loads(bvalue)
+
+
+class _RedisCache(RedisCache):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("decode_responses", False)
+        kwargs.setdefault("key_prefix", kwargs.pop("namespace", ""))
+
+        self.serializer = kwargs.pop("serializer", None) or _RedisSerializer()
+
+        super().__init__(*args, **kwargs)
+
+
+class CacheManager:
+    _configs: ClassVar[dict[str, dict]] = {
+        "default": {
+            "class": _RedisCache,
+            "host": Config.redis_config.host,
+            "port": Config.redis_config.port,
+            **({"password": Config.redis_config.password} if Config.redis_config.password else {}),
+            **({"username": Config.redis_config.user} if Config.redis_config.user else {}),
+            "ssl": Config.redis_config.use_ssl,
+            "db": Config.redis_config.database,
+            "namespace": "cache",
+        },
+    }
+
+    _caches: ClassVar[dict[str, BaseCache]] = {}
+
+    def create_cache(self, name: str, **kwargs) -> BaseCache:
+        cache_config = deepcopy(self._configs[name])
+        cache_config.setdefault("default_timeout", 0)
+        cache_config.update(kwargs)
+
+        klass = cache_config.pop("class")
+        return klass(**cache_config)
+
+    def get_cache(self, name: str = "default") -> BaseCache:
+        # Implements a singleton pattern, doesn't support multithreading
+        cache = self._caches.get(name)
+        if cache is None:
+            cache = self.create_cache(name)
+            self._caches[name] = cache
+
+        return cache
+
+
+def get_cache(name: str = "default") -> BaseCache:
+    manager = CacheManager()
+    return manager.get_cache(name)
+
+
+@dataclass
+class CacheStats:
+    local_hits: int = 0
+    "Items found in the process memory"
+
+    shared_hits: int = 0
+    "Items found in Redis"
+
+    misses: int = 0
+    "Items computed by the callback"
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def count(self, kind: str) -> None:
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.local_hits = self.shared_hits = self.misses = 0
+
+
+class _LruCache:
+    """A thread-safe in-process LRU cache with item expiration"""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+
+            expires_at, item = entry
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return item
+
+    def set(self, key: str, item: Any, *, ttl: float) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl, item)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+class Cache:
+    """
+    Two-tier cache: items are looked up in the process memory first, then in the shared
+    Redis cache (if Redis is configured), and are computed with the callback only when both miss.
+    The callers get their own copies of the items.
+    """
+
+    _local_manifests: ClassVar[_LruCache] = _LruCache(Config.features.manifest_cache_size)
+    manifest_stats: ClassVar[CacheStats] = CacheStats()
+
+    def _get_shared_cache(self) -> BaseCache | None:
+        if not Config.redis_config.is_configured():
+            return None
+
+        return get_cache()
+
+    @staticmethod
+    def _make_key(address: str, chain_id: int) -> str:
+        return f"{address}@{chain_id}"
+
+    def _get_or_set(
+        self,
+        key: str,
+        set_callback: Callable[[], Any],
+        *,
+        local_cache: _LruCache,
+        stats: CacheStats,
+        ttl: int,
+    ) -> Any:
+        item = local_cache.get(key)
+        if item is not None:
+            stats.count("local_hits")
+            return deepcopy(item)
+
+        shared_cache = self._get_shared_cache()
+        item = shared_cache.get(key) if shared_cache else None
+        if item:
+            stats.count("shared_hits")
+        else:
+            stats.count("misses")
+            item = set_callback()
+            if shared_cache and not shared_cache.set(key, item, timeout=ttl):
+                raise Exception(f"Failed to write key {key} to the cache")
+
+        local_cache.set(key, deepcopy(item), ttl=ttl)
+        return item
+
+    def get_or_set_manifest(
+        self, escrow_address: str, chain_id: int, *, set_callback: Callable[[], dict], **kwargs
+    ) -> dict:
+        kwargs.setdefault("ttl", Config.features.manifest_cache_ttl)
+        key = self._make_key(escrow_address, chain_id)
+        return self._get_or_set(
+            key,
+            set_callback=set_callback,
+            local_cache=self._local_manifests,
+            stats=self.manifest_stats,
+            **kwargs,
+        )
+
+    @classmethod
+    def clear_local(cls) -> None:
+        "Clears the process memory tier"
+        cls._local_manifests.clear()
@@ -1,6 +1,13 @@
+from __future__ import annotations
+
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 class StorageClient(metaclass=ABCMeta):
     def __init__(
@@ -24,6 +31,41 @@ class StorageClient(metaclass=ABCMeta):
     @abstractmethod
     def download_file(self, key: str, *, bucket: str | None = None) -> bytes: ...
 
+    def download_files(
+        self, keys: Iterable[str], *, bucket: str | None = None, max_concurrency: int = 5
+    ) -> Iterator[tuple[str, bytes]]:
+        """
+        Downloads the files concurrently, yielding (key, data) as the downloads finish,
+        in the order of completion. The caller can process the results while the next files
+        are being downloaded.
+
+        No more than max_concurrency downloads run at once, and no more than 2 * max_concurrency
+        downloaded files wait to be consumed. The first download error is raised from
+        the iterator, the remaining downloads are cancelled.
+        """
+        max_pending = 2 * max_concurrency
+        keys = iter(keys)
+
+        with ThreadPoolExecutor(max_concurrency, thread_name_prefix="download") as pool:
+            pending = {}
+            try:
+                while True:
+                    for key in keys:
+                        pending[pool.submit(self.download_file, key, bucket=bucket)] = key
+                        if len(pending) == max_pending:
+                            break
+
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key = pending.pop(future)
+                        yield key, future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
     @abstractmethod
     def list_files(self, *, bucket: str | None = None, prefix: str | None = None) -> list[str]: ...
 
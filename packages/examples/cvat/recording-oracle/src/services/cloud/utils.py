@@ -16,10 +16,9 @@ def compose_bucket_url(
 
 def make_client(
     bucket_info: BucketAccessInfo,
+    **kwargs,
 ) -> StorageClient:
-    client_kwargs = {
-        "bucket": bucket_info.bucket_name,
-    }
+    client_kwargs = {"bucket": bucket_info.bucket_name, **kwargs}
 
     match bucket_info.provider:
         case CloudProviders.aws:
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import httpx2
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+UrlGetter = Callable[[int, str], str]
+
+
+@dataclass(frozen=True)
+class OutgoingWebhookRequest:
+    webhook_id: str
+    chain_id: int
+    escrow_address: str
+    headers: dict[str, str]
+    body: dict
+
+
+class WebhookDispatcher:
+    """
+    Sends outgoing webhooks concurrently through one pooled HTTP client.
+
+    The number of parallel requests to one receiver host is limited, so that a slow receiver
+    only occupies its own share of the workers. Receiver URLs are cached for each
+    (url getter, chain, escrow) for url_ttl seconds, and are dropped from the cache
+    when a request to them fails.
+    """
+
+    def __init__(self, *, max_workers: int, max_host_connections: int, url_ttl: float) -> None:
+        self.max_workers = max_workers
+        self.max_host_connections = max_host_connections
+        self.url_ttl = url_ttl
+
+        self._lock = threading.Lock()
+        self._client: httpx2.Client | None = None
+        self._host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self._urls: dict[tuple[UrlGetter, int, str], tuple[float, str]] = {}
+
+    def _get_client(self) -> httpx2.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx2.Client(
+                    limits=httpx2.Limits(
+                        max_connections=self.max_workers,
+                        max_keepalive_connections=self.max_workers,
+                    )
+                )
+
+            return self._client
+
+    def _get_host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = threading.BoundedSemaphore(self.max_host_connections)
+                self._host_limits[host] = limit
+
+            return limit
+
+    def get_url(self, url_getter: UrlGetter, chain_id: int, escrow_address: str) -> str:
+        key = (url_getter, chain_id, escrow_address.lower())
+        now = time.monotonic()
+        with self._lock:
+            entry = self._urls.get(key)
+
+        if entry and now < entry[0]:
+            return entry[1]
+
+        url = url_getter(chain_id, escrow_address)
+
+        with self._lock:
+            for expired_key in [
+                k for k, (expires_at, _) in self._urls.items() if expires_at <= now
+            ]:
+                del self._urls[expired_key]
+
+            self._urls[key] = (now + self.url_ttl, url)
+
+        return url
+
+    def forget_url(self, url_getter: UrlGetter, chain_id: int, escrow_address: str) -> None:
+        with self._lock:
+            self._urls.pop((url_getter, chain_id, escrow_address.lower()), None)
+
+    def _post(self, request: OutgoingWebhookRequest, url: str) -> None:
+        with self._get_host_limit(url):
+            response = self._get_client().post(url, headers=request.headers, json=request.body)
+            response.raise_for_status()
+
+    def send(
+        self, requests: Sequence[OutgoingWebhookRequest], url_getter: UrlGetter
+    ) -> list[Exception | None]:
+        """
+        Sends the webhooks and returns the error for each of them, None for the successful ones.
+
+        The receiver URLs are resolved first, in the caller's context, then the requests to
+        each host are started in the input order, at most max_host_connections at a time.
+        The requests waiting for a busy host don't occupy the workers.
+        """
+
+        errors: list[Exception | None] = [None] * len(requests)
+        if not requests:
+            return errors
+
+        with ThreadPoolExecutor(min(self.max_workers, len(requests))) as pool:
+            # A copy of the context for each call, so that the url getter sees the caller's
+            # context variables, e.g. memoized escrows
+            url_futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self.get_url,
+                    url_getter,
+                    request.chain_id,
+                    request.escrow_address,
+                )
+                for request in requests
+            ]
+
+            urls: list[str | None] = [None] * len(requests)
+            host_queues: dict[str, deque[int]] = {}
+            for i, future in enumerate(url_futures):
+                try:
+                    urls[i] = future.result()
+                except Exception as e:  # noqa: BLE001
+                    errors[i] = e
+                    continue
+
+                host_queues.setdefault(urlsplit(urls[i]).netloc, deque()).append(i)
+
+            running: dict[Future, tuple[int, str]] = {}
+
+            def _start_next(host: str) -> None:
+                i = host_queues[host].popleft()
+                running[pool.submit(self._post, requests[i], urls[i])] = (i, host)
+
+            for host, queue in host_queues.items():
+                for _ in range(min(self.max_host_connections, len(queue))):
+                    _start_next(host)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, host = running.pop(future)
+                    if e := future.exception():
+                        errors[i] = e
+                        request = requests[i]
+                        self.forget_url(url_getter, request.chain_id, request.escrow_address)
+
+                    if host_queues[host]:
+                        _start_next(host)
+
+        return errors
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
@@ -6,7 +6,9 @@ from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 
 from src.apps.recording_oracle import app
+from src.chain.escrow import get_encryption
 from src.db import Base, SessionLocal, engine
+from src.services.cache import Cache
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -45,6 +47,14 @@ def db(_create_schema) -> None:
         connection.execute(_CLEANUP_SQL)
 
 
+@pytest.fixture(autouse=True)
+def _reset_caches() -> None:
+    """Tests patch the escrows and the encryption config, so nothing is reused between them."""
+    Cache.clear_local()
+    Cache.manifest_stats.reset()
+    get_encryption.cache_clear()
+
+
 @pytest.fixture(scope="module")
 def client() -> Generator:
     with TestClient(app) as c:
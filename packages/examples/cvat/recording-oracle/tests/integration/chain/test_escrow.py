@@ -12,6 +12,7 @@ from src.chain.escrow import (
     store_results,
     validate_escrow,
 )
+from src.services.cache import Cache
 
 from tests.utils.constants import (
     DEFAULT_HASH,
@@ -94,6 +95,24 @@ class ServiceIntegrationTest(unittest.TestCase):
             assert isinstance(manifest, dict)
             assert manifest is not None
 
+    def test_can_cache_escrow_manifest(self):
+        with (
+            patch("src.chain.escrow.EscrowUtils.get_escrow") as mock_function,
+            patch("src.chain.escrow._get_manifest_content") as mock_download,
+        ):
+            mock_download.return_value = json.dumps({"title": "test"})
+            mock_function.return_value = self.escrow_data
+
+            manifest = get_escrow_manifest(chain_id, escrow_address)
+            manifest["title"] = "changed"
+            cached_manifest = get_escrow_manifest(chain_id, escrow_address)
+
+            assert cached_manifest == {"title": "test"}
+            mock_function.assert_called_once()
+            mock_download.assert_called_once()
+            assert Cache.manifest_stats.misses == 1
+            assert Cache.manifest_stats.local_hits == 1
+
     def test_get_escrow_manifest_invalid_address(self):
         with pytest.raises(EscrowClientError, match="Invalid escrow address: invalid_address"):
             get_escrow_manifest(chain_id, "invalid_address")
@@ -0,0 +1,144 @@
+import uuid
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.core.types import (
+    ExchangeOracleEventTypes,
+    Networks,
+    OracleWebhookStatuses,
+    OracleWebhookTypes,
+)
+from src.models.webhook import Webhook
+from src.services.webhook import OracleWebhookDirectionTags
+
+ADMIN_API_KEY = "admin-api-key"
+
+DEAD_LETTER_URL = "/admin/webhooks/dead-letter"
+REQUEUE_URL = "/admin/webhooks/dead-letter/requeue"
+
+
+@pytest.fixture(autouse=True)
+def admin_api_key():
+    with patch("src.core.config.Config.admin_api_key", ADMIN_API_KEY):
+        yield
+
+
+def _add_webhook(
+    session: Session,
+    status: OracleWebhookStatuses,
+    *,
+    direction: OracleWebhookDirectionTags = OracleWebhookDirectionTags.outgoing,
+    type: OracleWebhookTypes = OracleWebhookTypes.exchange_oracle,
+) -> Webhook:
+    webhook = Webhook(
+        id=str(uuid.uuid4()),
+        escrow_address="0x1234567890123456789012345678901234567890",
+        chain_id=Networks.localhost.value,
+        type=type.value,
+        status=status.value,
+        attempts=5 if status == OracleWebhookStatuses.failed else 0,
+        event_type=ExchangeOracleEventTypes.job_finished.value,
+        direction=direction.value,
+    )
+    session.add(webhook)
+    session.commit()
+    return webhook
+
+
+def _request_admin_endpoints(client: TestClient, headers: dict[str, str]) -> list[int]:
+    return [
+        client.get(DEAD_LETTER_URL, headers=headers).status_code,
+        client.post(
+            REQUEUE_URL,
+            json={"direction": OracleWebhookDirectionTags.outgoing.value},
+            headers=headers,
+        ).status_code,
+    ]
+
+
+def test_admin_endpoints_are_disabled_without_configured_key(client: TestClient) -> None:
+    with patch("src.core.config.Config.admin_api_key", ""):
+        assert _request_admin_endpoints(client, {"X-Admin-Key": ""}) == [404, 404]
+        assert _request_admin_endpoints(client, {"X-Admin-Key": ADMIN_API_KEY}) == [404, 404]
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Key": "wrong"}], ids=["missing", "wrong"])
+def test_cannot_use_admin_endpoints_without_valid_key(
+    client: TestClient, session: Session, headers: dict[str, str]
+) -> None:
+    failed = _add_webhook(session, OracleWebhookStatuses.failed)
+
+    assert _request_admin_endpoints(client, headers) == [401, 401]
+
+    session.expire_all()
+    assert failed.status == OracleWebhookStatuses.failed.value
+
+
+def test_can_list_dead_letter_webhooks(client: TestClient, session: Session) -> None:
+    outgoing_exchange = _add_webhook(session, OracleWebhookStatuses.failed)
+    outgoing_reputation = _add_webhook(
+        session, OracleWebhookStatuses.failed, type=OracleWebhookTypes.reputation_oracle
+    )
+    incoming_exchange = _add_webhook(
+        session, OracleWebhookStatuses.failed, direction=OracleWebhookDirectionTags.incoming
+    )
+    _add_webhook(session, OracleWebhookStatuses.pending)
+    _add_webhook(session, OracleWebhookStatuses.completed)
+
+    def list_webhook_ids(**params) -> set[str]:
+        response = client.get(
+            DEAD_LETTER_URL, params=params, headers={"X-Admin-Key": ADMIN_API_KEY}
+        )
+        assert response.status_code == 200
+        return {w["id"] for w in response.json()}
+
+    assert list_webhook_ids() == {outgoing_exchange.id, outgoing_reputation.id}
+    assert list_webhook_ids(type=OracleWebhookTypes.reputation_oracle.value) == {
+        outgoing_reputation.id
+    }
+    assert list_webhook_ids(direction=OracleWebhookDirectionTags.incoming.value) == {
+        incoming_exchange.id
+    }
+    assert (
+        list_webhook_ids(
+            direction=OracleWebhookDirectionTags.incoming.value,
+            type=OracleWebhookTypes.reputation_oracle.value,
+        )
+        == set()
+    )
+
+
+def test_can_requeue_only_failed_webhooks(client: TestClient, session: Session) -> None:
+    failed = _add_webhook(session, OracleWebhookStatuses.failed)
+    other_failed = _add_webhook(session, OracleWebhookStatuses.failed)
+    pending = _add_webhook(session, OracleWebhookStatuses.pending)
+    completed = _add_webhook(session, OracleWebhookStatuses.completed)
+    incoming_failed = _add_webhook(
+        session, OracleWebhookStatuses.failed, direction=OracleWebhookDirectionTags.incoming
+    )
+
+    response = client.post(
+        REQUEUE_URL,
+        json={
+            "direction": OracleWebhookDirectionTags.outgoing.value,
+            "ids": [failed.id, pending.id, completed.id, incoming_failed.id],
+        },
+        headers={"X-Admin-Key": ADMIN_API_KEY},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"requeued": 1}
+
+    session.expire_all()
+    assert [
+        (w.status, w.attempts) for w in (failed, other_failed, pending, completed, incoming_failed)
+    ] == [
+        (OracleWebhookStatuses.pending.value, 0),
+        (OracleWebhookStatuses.failed.value, 5),
+        (OracleWebhookStatuses.pending.value, 0),
+        (OracleWebhookStatuses.completed.value, 0),
+        (OracleWebhookStatuses.failed.value, 5),
+    ]
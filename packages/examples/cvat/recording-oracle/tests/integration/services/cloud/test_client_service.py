@@ -48,6 +48,27 @@ class ServiceIntegrationTest(unittest.TestCase):
         client.remove_file(file_name)
         assert not client.file_exists(file_name)
 
+    def test_can_download_files(self):
+        client = S3Client(
+            endpoint_url=self.url,
+            bucket=self.bucket_name,
+            access_key=self.access_key,
+            secret_key=self.secret,
+        )
+
+        files = {f"dir/file_{i}": f"data {i}".encode() for i in range(20)}
+        for file_name, data in files.items():
+            client.create_file(file_name, data)
+
+        try:
+            downloaded = client.download_files(files, max_concurrency=3)
+            assert dict(downloaded) == files
+
+            with pytest.raises(ClientError):
+                dict(client.download_files([*files, "non-existent-file"], max_concurrency=3))
+        finally:
+            client.remove_files("dir/")
+
     def test_degenerate_file_operations(self):
         client = S3Client(endpoint_url=self.url, access_key=self.access_key, secret_key=self.secret)
         invalid_bucket = "non-existent-bucket"
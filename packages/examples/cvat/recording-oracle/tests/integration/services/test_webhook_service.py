@@ -1,6 +1,7 @@
 import random
 import unittest
 import uuid
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
@@ -9,6 +10,7 @@ from src.core.types import Networks, OracleWebhookStatuses, OracleWebhookTypes
 from src.db import SessionLocal
 from src.models.webhook import Webhook
 from src.services.webhook import OracleWebhookDirectionTags, inbox
+from src.utils.time import utcnow
 
 
 class ServiceIntegrationTest(unittest.TestCase):
@@ -148,3 +150,50 @@ class ServiceIntegrationTest(unittest.TestCase):
 
         assert webhook.attempts == 5
         assert webhook.status == OracleWebhookStatuses.failed.value
+
+    def test_handle_webhook_results(self):
+        succeeded_id = inbox.create_webhook(**{**self.webhook_kwargs, "signature": "signature1"})
+        failed_id = inbox.create_webhook(**{**self.webhook_kwargs, "signature": "signature2"})
+        untouched_id = inbox.create_webhook(**{**self.webhook_kwargs, "signature": "signature3"})
+
+        inbox.handle_webhook_results(
+            self.session, succeeded_ids=[succeeded_id], failed_ids=[failed_id]
+        )
+
+        webhooks = {w.id: w for w in self.session.query(Webhook).all()}
+        assert webhooks[succeeded_id].attempts == 1
+        assert webhooks[succeeded_id].status == OracleWebhookStatuses.completed.value
+        assert webhooks[failed_id].attempts == 1
+        assert webhooks[failed_id].status == OracleWebhookStatuses.pending.value
+        assert webhooks[failed_id].wait_until > webhooks[succeeded_id].wait_until
+        assert webhooks[untouched_id].attempts == 0
+
+    def test_handle_webhook_fail_with_backoff(self):
+        webhook_id = inbox.create_webhook(**self.webhook_kwargs)
+
+        with (
+            patch("src.core.config.Config.webhook_max_retries", 10),
+            patch("src.core.config.Config.webhook_delay_if_failed", 60),
+            patch("src.core.config.Config.webhook_max_delay_if_failed", 300),
+        ):
+            for expected_delay in [60, 120, 240, 300, 300]:
+                started_at = utcnow()
+                inbox.handle_webhook_fail(self.session, webhook_id)
+
+                webhook = self.session.query(Webhook).filter_by(id=webhook_id).first()
+                delay = (webhook.wait_until - started_at).total_seconds()
+                assert expected_delay / 2 - 1 <= delay <= expected_delay + 1
+
+    def test_requeue_failed_webhooks(self):
+        failed_id = inbox.create_webhook(**{**self.webhook_kwargs, "signature": "signature1"})
+        pending_id = inbox.create_webhook(**{**self.webhook_kwargs, "signature": "signature2"})
+        inbox.update_webhook_status(self.session, failed_id, OracleWebhookStatuses.failed)
+
+        assert [w.id for w in inbox.get_failed_webhooks(self.session)] == [failed_id]
+
+        assert inbox.requeue_failed_webhooks(self.session, webhook_ids=[failed_id, pending_id]) == 1
+
+        webhook = self.session.query(Webhook).filter_by(id=failed_id).first()
+        assert webhook.status == OracleWebhookStatuses.pending.value
+        assert webhook.attempts == 0
+        assert inbox.get_failed_webhooks(self.session) == []
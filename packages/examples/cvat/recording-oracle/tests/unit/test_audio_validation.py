@@ -3,6 +3,7 @@ import logging
 from collections.abc import Callable
 from pathlib import Path
 from types import SimpleNamespace
+from unittest import mock
 
 import pytest
 from sqlalchemy.orm import Session
@@ -160,3 +161,28 @@ class AudioValidationTest:
         assert isinstance(result, ValidationFailure)
         assert set(result.rejected_jobs) == {job.job_id for job in jobs}
         assert result.job_results == {job.job_id: 1.0 for job in jobs}
+
+    def test_can_score_jobs_in_process_pool(self, session: Session, fxt_published_task):
+        # Odd jobs are perfect, even jobs are empty
+        perfect_clip_ids = {
+            clip_id
+            for job_id, (_, clip_id) in enumerate(
+                sorted(fxt_published_task.task_clips.items()), start=1
+            )
+            if job_id % 2
+        }
+
+        def build_annotation(clip: Clip) -> str:
+            if clip.id in perfect_clip_ids:
+                return build_perfect_annotation(
+                    clip, fxt_published_task.gt, transcription_attr=TRANSCRIPTION_ATTR
+                )
+
+            return build_empty_annotation(TRANSCRIPTION_ATTR)
+
+        with mock.patch("src.core.config.ValidationConfig.audio_scoring_workers", 2):
+            result, jobs = self._validate(session, fxt_published_task, build_annotation)
+
+        assert isinstance(result, ValidationFailure)
+        assert set(result.rejected_jobs) == {job.job_id for job in jobs if not job.job_id % 2}
+        assert result.job_results == {job.job_id: 0.0 if job.job_id % 2 else 1.0 for job in jobs}
@@ -0,0 +1,122 @@
+import contextvars
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.utils.webhook_dispatcher import OutgoingWebhookRequest, WebhookDispatcher
+
+
+def _make_requests(count: int) -> list[OutgoingWebhookRequest]:
+    return [
+        OutgoingWebhookRequest(
+            webhook_id=str(i),
+            chain_id=1,
+            escrow_address=f"0x{i:040x}",
+            headers={"human-signature": "signature"},
+            body={"id": i},
+        )
+        for i in range(count)
+    ]
+
+
+def _get_url(chain_id: int, escrow_address: str) -> str:
+    return f"https://host{int(escrow_address, 16) % 2}.example/{chain_id}/{escrow_address}"
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = WebhookDispatcher(max_workers=4, max_host_connections=1, url_ttl=60)
+    yield dispatcher
+    dispatcher.close()
+
+
+def test_can_send_webhooks(dispatcher: WebhookDispatcher):
+    def post(url: str, *, headers: dict, json: dict):
+        if json["id"] == 3:
+            raise ValueError("receiver is down")
+
+        return mock.Mock()
+
+    requests = _make_requests(6)
+    with mock.patch("httpx2.Client.post", side_effect=post) as mock_post:
+        errors = dispatcher.send(requests, _get_url)
+
+    assert [str(e) if e else None for e in errors] == [
+        None,
+        None,
+        None,
+        "receiver is down",
+        None,
+        None,
+    ]
+    mock_post.assert_any_call(
+        _get_url(1, requests[0].escrow_address),
+        headers={"human-signature": "signature"},
+        json={"id": 0},
+    )
+    assert mock_post.call_count == 6
+
+
+def test_can_limit_host_connections(dispatcher: WebhookDispatcher):
+    active: dict[str, int] = {}
+    max_active: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def post(url: str, **_kwargs):
+        host = url.split("/")[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            max_active[host] = max(max_active.get(host, 0), active[host])
+
+        time.sleep(0.01)
+
+        with lock:
+            active[host] -= 1
+
+        return mock.Mock()
+
+    with mock.patch("httpx2.Client.post", side_effect=post):
+        errors = dispatcher.send(_make_requests(10), _get_url)
+
+    assert errors == [None] * 10
+    assert max_active == {"host0.example": 1, "host1.example": 1}
+
+
+def test_can_cache_urls(dispatcher: WebhookDispatcher):
+    url_getter = mock.Mock(side_effect=_get_url)
+    requests = _make_requests(2)
+
+    with mock.patch("httpx2.Client.post"):
+        dispatcher.send(requests, url_getter)
+        dispatcher.send(requests, url_getter)
+
+    assert url_getter.call_count == 2
+
+    with mock.patch("httpx2.Client.post", side_effect=ValueError("receiver has moved")):
+        dispatcher.send(requests[:1], url_getter)
+
+    with mock.patch("httpx2.Client.post"):
+        dispatcher.send(requests, url_getter)
+
+    assert url_getter.call_count == 3
+
+
+def test_can_get_urls_in_caller_context(dispatcher: WebhookDispatcher):
+    memo: contextvars.ContextVar[set | None] = contextvars.ContextVar("memo", default=None)
+
+    def url_getter(chain_id: int, escrow_address: str) -> str:
+        memo.get().add(escrow_address)
+        return _get_url(chain_id, escrow_address)
+
+    requests = _make_requests(4)
+    token = memo.set(set())
+    try:
+        with mock.patch("httpx2.Client.post"):
+            errors = dispatcher.send(requests, url_getter)
+
+        assert errors == [None] * 4
+        assert memo.get() == {request.escrow_address for request in requests}
+    finally:
+        memo.reset(token)
@@ -0,0 +1,109 @@
+"""
+Per-message cost of PGP encryption and decryption with the same keys:
+a new `Encryption` / `EncryptionUtils` call per message (as the oracles do for
+every manifest), vs a `Keyring` with the keys parsed and unlocked once.
+
+The keys are the test keys, the private key of the recipient is protected with
+a passphrase. The decrypted messages are checked to be identical.
+
+Call from the SDK dir:
+
+    python benchmarks/bench_encryption.py [--messages N] [--size BYTES]
+"""
+
+import argparse
+import os
+import time
+import warnings
+from test.human_protocol_sdk.utils.encryption import (
+    passphrase,
+    private_key,
+    private_key3,
+    public_key,
+    public_key3,
+)
+
+from human_protocol_sdk.encryption import Encryption, EncryptionUtils, Keyring
+
+MESSAGES = 50
+SIZE = 4096
+
+
+def _measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _encrypt_per_message(messages):
+    return [EncryptionUtils.encrypt(m, [public_key3]) for m in messages]
+
+
+def _decrypt_per_message(messages):
+    return [Encryption(private_key3, passphrase).decrypt(m) for m in messages]
+
+
+def _sign_and_encrypt_per_message(messages):
+    return [
+        Encryption(private_key).sign_and_encrypt(m, [public_key3]) for m in messages
+    ]
+
+
+def _decrypt_and_verify_per_message(messages):
+    return [
+        Encryption(private_key3, passphrase).decrypt(m, public_key) for m in messages
+    ]
+
+
+def main(count: int, size: int) -> None:
+    warnings.simplefilter("ignore")  # pgpy deprecation and TODO warnings
+    messages = [os.urandom(size // 2).hex() for _ in range(count)]
+
+    with Keyring() as keyring:
+        signer = keyring.add_private_key(private_key)
+        keyring.add_private_key(private_key3, passphrase)
+
+        cases = (
+            (
+                "encrypt",
+                _encrypt_per_message,
+                lambda ms: keyring.encrypt_many(ms, [public_key3]),
+                "decrypt",
+                _decrypt_per_message,
+                keyring.decrypt_many,
+            ),
+            (
+                "sign+encrypt",
+                _sign_and_encrypt_per_message,
+                lambda ms: keyring.encrypt_many(ms, [public_key3], private_key=signer),
+                "decrypt+verify",
+                _decrypt_and_verify_per_message,
+                lambda ms: keyring.decrypt_many(ms, public_key),
+            ),
+        )
+
+        print(f"{count} messages of {size} bytes, ms per message:")
+        for enc_name, enc_before, enc_after, dec_name, dec_before, dec_after in cases:
+            encrypted, enc_before_time = _measure(enc_before, messages)
+            _, enc_after_time = _measure(enc_after, messages)
+            decrypted_before, dec_before_time = _measure(dec_before, encrypted)
+            decrypted_after, dec_after_time = _measure(dec_after, encrypted)
+            assert decrypted_before == decrypted_after == [m.encode() for m in messages]
+
+            for name, before, after in (
+                (enc_name, enc_before_time, enc_after_time),
+                (dec_name, dec_before_time, dec_after_time),
+            ):
+                print(
+                    f"  {name:<15} per call {1000 * before / count:>8.2f}"
+                    f"  keyring {1000 * after / count:>8.2f}"
+                    f"  speedup {before / after:>6.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=MESSAGES)
+    parser.add_argument("--size", type=int, default=SIZE)
+    args = parser.parse_args()
+    main(args.messages, args.size)
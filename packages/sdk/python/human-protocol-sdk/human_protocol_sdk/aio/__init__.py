@@ -0,0 +1,13 @@
+"""
+This module provides awaitable versions of the subgraph utils for asyncio
+applications. Query building and response parsing are shared with the sync utils.
+"""
+
+from .escrow import EscrowUtils
+from .kvstore import KVStoreUtils
+from .operator import OperatorUtils
+from .staking import StakingUtils
+from .statistics import StatisticsUtils
+from .transaction import TransactionUtils
+from .worker import WorkerUtils
+from .utils import close_http_sessions, custom_gql_fetch, get_http_session
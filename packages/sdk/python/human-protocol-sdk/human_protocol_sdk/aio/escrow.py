@@ -0,0 +1,170 @@
+"""Async escrow subgraph queries.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.escrow import EscrowUtils
+    from human_protocol_sdk.constants import ChainId
+    from human_protocol_sdk.filter import EscrowFilter
+
+    escrows = await EscrowUtils.get_escrows(
+        EscrowFilter(chain_id=ChainId.POLYGON_AMOY)
+    )
+    ```
+"""
+
+from typing import AsyncIterator, Dict, List, Optional
+
+from human_protocol_sdk.aio.utils import (
+    custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
+)
+from human_protocol_sdk.constants import SUBGRAPH_PAGE_SIZE, ChainId
+from human_protocol_sdk.escrow import escrow_utils
+from human_protocol_sdk.escrow.escrow_utils import (
+    CancellationRefund,
+    EscrowData,
+    Payout,
+    StatusEvent,
+)
+from human_protocol_sdk.filter import (
+    CancellationRefundFilter,
+    EscrowFilter,
+    PayoutFilter,
+    StatusEventFilter,
+)
+from human_protocol_sdk.utils import SubgraphOptions
+
+
+class EscrowUtils:
+    """Async counterpart of `human_protocol_sdk.escrow.EscrowUtils`."""
+
+    @staticmethod
+    async def get_escrows(
+        filter: EscrowFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[EscrowData]:
+        """Async version of `EscrowUtils.get_escrows`."""
+        return await run_query_steps(
+            escrow_utils.EscrowUtils._get_escrows_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def iter_escrows(
+        filter: EscrowFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[EscrowData]:
+        """Async version of `EscrowUtils.iter_escrows`, used with ``async for``."""
+        return iter_query_pages(
+            escrow_utils.EscrowUtils._get_escrows_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    async def get_escrow(
+        chain_id: ChainId,
+        escrow_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> Optional[EscrowData]:
+        """Async version of `EscrowUtils.get_escrow`."""
+        return await run_query_steps(
+            escrow_utils.EscrowUtils._get_escrow_steps(
+                chain_id, escrow_address, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_escrows_by_addresses(
+        chain_id: ChainId,
+        escrow_addresses: List[str],
+        options: Optional[SubgraphOptions] = None,
+    ) -> Dict[str, EscrowData]:
+        """Async version of `EscrowUtils.get_escrows_by_addresses`."""
+        return await run_query_steps(
+            escrow_utils.EscrowUtils._get_escrows_by_addresses_steps(
+                chain_id, escrow_addresses, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_status_events(
+        filter: StatusEventFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[StatusEvent]:
+        """Async version of `EscrowUtils.get_status_events`."""
+        return await run_query_steps(
+            escrow_utils.EscrowUtils._get_status_events_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def iter_status_events(
+        filter: StatusEventFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[StatusEvent]:
+        """Async version of `EscrowUtils.iter_status_events`, used with ``async for``."""
+        return iter_query_pages(
+            escrow_utils.EscrowUtils._get_status_events_pages(
+                filter, options, page_size
+            ),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    async def get_payouts(
+        filter: PayoutFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[Payout]:
+        """Async version of `EscrowUtils.get_payouts`."""
+        return await run_query_steps(
+            escrow_utils.EscrowUtils._get_payouts_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def iter_payouts(
+        filter: PayoutFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Payout]:
+        """Async version of `EscrowUtils.iter_payouts`, used with ``async for``."""
+        return iter_query_pages(
+            escrow_utils.EscrowUtils._get_payouts_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    async def get_cancellation_refunds(
+        filter: CancellationRefundFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[CancellationRefund]:
+        """Async version of `EscrowUtils.get_cancellation_refunds`."""
+        return await run_query_steps(
+            escrow_utils.EscrowUtils._get_cancellation_refunds_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_cancellation_refund(
+        chain_id: ChainId,
+        escrow_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> CancellationRefund:
+        """Async version of `EscrowUtils.get_cancellation_refund`."""
+        return await run_query_steps(
+            escrow_utils.EscrowUtils._get_cancellation_refund_steps(
+                chain_id, escrow_address, options
+            ),
+            custom_gql_fetch,
+        )
@@ -0,0 +1,91 @@
+"""Async KVStore subgraph queries.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.kvstore import KVStoreUtils
+    from human_protocol_sdk.constants import ChainId
+
+    public_key = await KVStoreUtils.get_public_key(
+        ChainId.POLYGON_AMOY, "0x62dD51230A30401C455c8398d06F85e4EaB6309f"
+    )
+    ```
+"""
+
+from typing import List, Optional
+
+from web3 import Web3
+
+from human_protocol_sdk.aio.utils import custom_gql_fetch, fetch_text, run_query_steps
+from human_protocol_sdk.constants import ChainId, KVStoreKeys
+from human_protocol_sdk.kvstore import kvstore_utils
+from human_protocol_sdk.kvstore.kvstore_client import KVStoreClientError
+from human_protocol_sdk.kvstore.kvstore_utils import KVStoreData
+from human_protocol_sdk.utils import SubgraphOptions
+
+
+class KVStoreUtils:
+    """Async counterpart of `human_protocol_sdk.kvstore.KVStoreUtils`."""
+
+    @staticmethod
+    async def get_kvstore_data(
+        chain_id: ChainId,
+        address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> Optional[List[KVStoreData]]:
+        """Async version of `KVStoreUtils.get_kvstore_data`."""
+        return await run_query_steps(
+            kvstore_utils.KVStoreUtils._get_kvstore_data_steps(
+                chain_id, address, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get(
+        chain_id: ChainId,
+        address: str,
+        key: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> str:
+        """Async version of `KVStoreUtils.get`."""
+        return await run_query_steps(
+            kvstore_utils.KVStoreUtils._get_steps(chain_id, address, key, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_file_url_and_verify_hash(
+        chain_id: ChainId,
+        address: str,
+        key: Optional[str] = "url",
+        options: Optional[SubgraphOptions] = None,
+    ) -> str:
+        """Async version of `KVStoreUtils.get_file_url_and_verify_hash`."""
+        if not Web3.is_address(address):
+            raise KVStoreClientError(f"Invalid address: {address}")
+
+        url = await KVStoreUtils.get(chain_id, address, key, options=options)
+        if url == "":
+            raise KVStoreClientError("No URL found for the given address and key")
+
+        hash = await KVStoreUtils.get(chain_id, address, key + "_hash", options=options)
+
+        if hash == "":
+            raise KVStoreClientError("No hash found for the given address and url")
+
+        content = await fetch_text(url)
+        kvstore_utils.KVStoreUtils._verify_content_hash(content, hash)
+
+        return url
+
+    @staticmethod
+    async def get_public_key(chain_id: ChainId, address: str) -> str:
+        """Async version of `KVStoreUtils.get_public_key`."""
+        public_key_url = await KVStoreUtils.get_file_url_and_verify_hash(
+            chain_id, address, KVStoreKeys.public_key.value
+        )
+
+        if public_key_url == "":
+            return ""
+
+        return await fetch_text(public_key_url)
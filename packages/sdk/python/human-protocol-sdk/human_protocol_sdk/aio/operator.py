@@ -0,0 +1,83 @@
+"""Async operator subgraph queries.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.operator import OperatorUtils
+    from human_protocol_sdk.constants import ChainId
+    from human_protocol_sdk.operator import OperatorFilter
+
+    operators = await OperatorUtils.get_operators(
+        OperatorFilter(chain_id=ChainId.POLYGON_AMOY, roles=["Job Launcher"])
+    )
+    ```
+"""
+
+from typing import List, Optional
+
+from human_protocol_sdk.aio.utils import custom_gql_fetch, run_query_steps
+from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.operator import operator_utils
+from human_protocol_sdk.operator.operator_utils import (
+    OperatorData,
+    OperatorFilter,
+    RewardData,
+)
+from human_protocol_sdk.utils import SubgraphOptions
+
+
+class OperatorUtils:
+    """Async counterpart of `human_protocol_sdk.operator.OperatorUtils`."""
+
+    @staticmethod
+    async def get_operators(
+        filter: OperatorFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[OperatorData]:
+        """Async version of `OperatorUtils.get_operators`."""
+        return await run_query_steps(
+            operator_utils.OperatorUtils._get_operators_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_operator(
+        chain_id: ChainId,
+        operator_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> Optional[OperatorData]:
+        """Async version of `OperatorUtils.get_operator`."""
+        return await run_query_steps(
+            operator_utils.OperatorUtils._get_operator_steps(
+                chain_id, operator_address, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_reputation_network_operators(
+        chain_id: ChainId,
+        address: str,
+        role: Optional[str] = None,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[OperatorData]:
+        """Async version of `OperatorUtils.get_reputation_network_operators`."""
+        return await run_query_steps(
+            operator_utils.OperatorUtils._get_reputation_network_operators_steps(
+                chain_id, address, role, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_rewards_info(
+        chain_id: ChainId,
+        slasher: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[RewardData]:
+        """Async version of `OperatorUtils.get_rewards_info`."""
+        return await run_query_steps(
+            operator_utils.OperatorUtils._get_rewards_info_steps(
+                chain_id, slasher, options
+            ),
+            custom_gql_fetch,
+        )
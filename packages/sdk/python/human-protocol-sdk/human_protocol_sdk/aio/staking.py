@@ -0,0 +1,66 @@
+"""Async staking subgraph queries.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.staking import StakingUtils
+    from human_protocol_sdk.constants import ChainId
+
+    staker = await StakingUtils.get_staker(
+        ChainId.POLYGON_AMOY, "0x62dD51230A30401C455c8398d06F85e4EaB6309f"
+    )
+    ```
+"""
+
+from typing import AsyncIterator, List, Optional
+
+from human_protocol_sdk.aio.utils import (
+    custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
+)
+from human_protocol_sdk.constants import SUBGRAPH_PAGE_SIZE, ChainId
+from human_protocol_sdk.filter import StakersFilter
+from human_protocol_sdk.staking import staking_utils
+from human_protocol_sdk.staking.staking_utils import StakerData
+from human_protocol_sdk.utils import SubgraphOptions
+
+
+class StakingUtils:
+    """Async counterpart of `human_protocol_sdk.staking.StakingUtils`."""
+
+    @staticmethod
+    async def get_staker(
+        chain_id: ChainId,
+        address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> Optional[StakerData]:
+        """Async version of `StakingUtils.get_staker`."""
+        return await run_query_steps(
+            staking_utils.StakingUtils._get_staker_steps(chain_id, address, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_stakers(
+        filter: StakersFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[StakerData]:
+        """Async version of `StakingUtils.get_stakers`."""
+        return await run_query_steps(
+            staking_utils.StakingUtils._get_stakers_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def iter_stakers(
+        filter: StakersFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[StakerData]:
+        """Async version of `StakingUtils.iter_stakers`, used with ``async for``."""
+        return iter_query_pages(
+            staking_utils.StakingUtils._get_stakers_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
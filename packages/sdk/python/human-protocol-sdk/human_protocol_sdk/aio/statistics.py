@@ -0,0 +1,113 @@
+"""Async statistics subgraph queries.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.statistics import StatisticsUtils
+    from human_protocol_sdk.constants import ChainId
+
+    stats = await StatisticsUtils.get_escrow_statistics(ChainId.POLYGON_AMOY)
+    ```
+"""
+
+from typing import List, Optional
+
+from human_protocol_sdk.aio.utils import custom_gql_fetch, run_query_steps
+from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.filter import StatisticsFilter
+from human_protocol_sdk.statistics import statistics_utils
+from human_protocol_sdk.statistics.statistics_utils import (
+    DailyHMTData,
+    EscrowStatistics,
+    HMTHolder,
+    HMTHoldersParam,
+    HMTStatistics,
+    PaymentStatistics,
+    WorkerStatistics,
+)
+from human_protocol_sdk.utils import SubgraphOptions
+
+
+class StatisticsUtils:
+    """Async counterpart of `human_protocol_sdk.statistics.StatisticsUtils`."""
+
+    @staticmethod
+    async def get_escrow_statistics(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> EscrowStatistics:
+        """Async version of `StatisticsUtils.get_escrow_statistics`."""
+        return await run_query_steps(
+            statistics_utils.StatisticsUtils._get_escrow_statistics_steps(
+                chain_id, filter, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_worker_statistics(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> WorkerStatistics:
+        """Async version of `StatisticsUtils.get_worker_statistics`."""
+        return await run_query_steps(
+            statistics_utils.StatisticsUtils._get_worker_statistics_steps(
+                chain_id, filter, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_payment_statistics(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> PaymentStatistics:
+        """Async version of `StatisticsUtils.get_payment_statistics`."""
+        return await run_query_steps(
+            statistics_utils.StatisticsUtils._get_payment_statistics_steps(
+                chain_id, filter, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_hmt_statistics(
+        chain_id: ChainId, options: Optional[SubgraphOptions] = None
+    ) -> HMTStatistics:
+        """Async version of `StatisticsUtils.get_hmt_statistics`."""
+        return await run_query_steps(
+            statistics_utils.StatisticsUtils._get_hmt_statistics_steps(
+                chain_id, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_hmt_holders(
+        chain_id: ChainId,
+        param: HMTHoldersParam = HMTHoldersParam(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[HMTHolder]:
+        """Async version of `StatisticsUtils.get_hmt_holders`."""
+        return await run_query_steps(
+            statistics_utils.StatisticsUtils._get_hmt_holders_steps(
+                chain_id, param, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_hmt_daily_data(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[DailyHMTData]:
+        """Async version of `StatisticsUtils.get_hmt_daily_data`."""
+        return await run_query_steps(
+            statistics_utils.StatisticsUtils._get_hmt_daily_data_steps(
+                chain_id, filter, options
+            ),
+            custom_gql_fetch,
+        )
@@ -0,0 +1,68 @@
+"""Async transaction subgraph queries.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.transaction import TransactionUtils
+    from human_protocol_sdk.constants import ChainId
+
+    transaction = await TransactionUtils.get_transaction(
+        ChainId.POLYGON_AMOY,
+        "0x1234567890123456789012345678901234567891234567890123456789012345",
+    )
+    ```
+"""
+
+from typing import AsyncIterator, List, Optional
+
+from human_protocol_sdk.aio.utils import (
+    custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
+)
+from human_protocol_sdk.constants import SUBGRAPH_PAGE_SIZE, ChainId
+from human_protocol_sdk.filter import TransactionFilter
+from human_protocol_sdk.transaction import transaction_utils
+from human_protocol_sdk.transaction.transaction_utils import TransactionData
+from human_protocol_sdk.utils import SubgraphOptions
+
+
+class TransactionUtils:
+    """Async counterpart of `human_protocol_sdk.transaction.TransactionUtils`."""
+
+    @staticmethod
+    async def get_transaction(
+        chain_id: ChainId, hash: str, options: Optional[SubgraphOptions] = None
+    ) -> Optional[TransactionData]:
+        """Async version of `TransactionUtils.get_transaction`."""
+        return await run_query_steps(
+            transaction_utils.TransactionUtils._get_transaction_steps(
+                chain_id, hash, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    async def get_transactions(
+        filter: TransactionFilter, options: Optional[SubgraphOptions] = None
+    ) -> List[TransactionData]:
+        """Async version of `TransactionUtils.get_transactions`."""
+        return await run_query_steps(
+            transaction_utils.TransactionUtils._get_transactions_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def iter_transactions(
+        filter: TransactionFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[TransactionData]:
+        """Async version of `TransactionUtils.iter_transactions`, used with ``async for``."""
+        return iter_query_pages(
+            transaction_utils.TransactionUtils._get_transactions_pages(
+                filter, options, page_size
+            ),
+            custom_gql_fetch,
+            prefetch,
+        )
@@ -0,0 +1,271 @@
+"""Async transport for subgraph queries.
+
+Queries share one pooled `aiohttp.ClientSession` per event loop. Transport settings,
+retries with jittered exponential backoff and metrics reporting follow
+`human_protocol_sdk.utils.custom_gql_fetch`, configured with
+`human_protocol_sdk.utils.configure_subgraph_transport`.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.utils import close_http_sessions, custom_gql_fetch
+    from human_protocol_sdk.constants import NETWORKS, ChainId
+
+    async def main():
+        try:
+            data = await custom_gql_fetch(
+                NETWORKS[ChainId.POLYGON_AMOY], "{ escrows(first: 10) { id } }"
+            )
+        finally:
+            await close_http_sessions()
+    ```
+"""
+
+import asyncio
+import time
+import weakref
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import aiohttp
+
+from human_protocol_sdk import utils
+from human_protocol_sdk.utils import (
+    PageCursor,
+    QueryPages,
+    QuerySteps,
+    SubgraphOptions,
+    SubgraphTransportOptions,
+    _get_backoff_delay,
+    _get_retry_settings,
+    _get_subgraph_request,
+    _report_subgraph_metrics,
+    is_indexer_error,
+)
+
+T = TypeVar("T")
+
+_http_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[SubgraphTransportOptions, aiohttp.ClientSession]]" = (weakref.WeakKeyDictionary())
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Get the pooled HTTP session shared by async queries on the running event loop.
+
+    The session is recreated when the subgraph transport is reconfigured.
+
+    Returns:
+        Shared client session.
+    """
+    loop = asyncio.get_running_loop()
+    transport = utils._subgraph_transport
+
+    entry = _http_sessions.get(loop)
+    if entry is not None:
+        options, session = entry
+        if options is transport and not session.closed:
+            return session
+        await session.close()
+
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=transport.pool_maxsize),
+        timeout=aiohttp.ClientTimeout(total=transport.timeout),
+    )
+    _http_sessions[loop] = (transport, session)
+    return session
+
+
+async def close_http_sessions() -> None:
+    """Close the shared HTTP session of the running event loop.
+
+    Call it on application shutdown to release pooled connections.
+    """
+    entry = _http_sessions.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].close()
+
+
+async def fetch_text(url: str) -> str:
+    """Download the content of a URL as text using the shared HTTP session.
+
+    Args:
+        url (str): URL to download.
+
+    Returns:
+        Response body.
+    """
+    session = await get_http_session()
+    async with session.get(url) as response:
+        return await response.text()
+
+
+async def custom_gql_fetch(
+    network: Dict[str, Any],
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    options: Optional[SubgraphOptions] = None,
+    use_hmt_subgraph: bool = False,
+) -> Dict[str, Any]:
+    """Async version of `human_protocol_sdk.utils.custom_gql_fetch`.
+
+    Args:
+        network (Dict[str, Any]): Network configuration dictionary containing subgraph URLs.
+        query (str): GraphQL query string to execute.
+        params (Optional[Dict[str, Any]]): Optional query parameters/variables dictionary.
+        options (Optional[SubgraphOptions]): Optional subgraph configuration for retries and indexer selection.
+        use_hmt_subgraph (bool): If true, resolves URL using HMT subgraph keys with fallback.
+
+    Returns:
+        JSON response from the subgraph containing the query results.
+
+    Raises:
+        ValueError: If retry configuration is incomplete or indexer routing requires missing API key.
+        Exception: If the subgraph query fails after all retry attempts.
+    """
+    start_time = time.monotonic()
+
+    if not options:
+        try:
+            data = await _fetch_subgraph_data(
+                network,
+                query,
+                params,
+                use_hmt_subgraph=use_hmt_subgraph,
+            )
+        except Exception:
+            _report_subgraph_metrics(query, start_time, 0, False)
+            raise
+        _report_subgraph_metrics(query, start_time, 0, True)
+        return data
+
+    max_retries, base_delay_seconds = _get_retry_settings(options)
+
+    last_error = None
+
+    for attempt in range(max_retries + 1):
+        try:
+            data = await _fetch_subgraph_data(
+                network,
+                query,
+                params,
+                options.indexer_id,
+                use_hmt_subgraph,
+            )
+            _report_subgraph_metrics(query, start_time, attempt, True)
+            return data
+        except Exception as error:
+            last_error = error
+
+            if not _is_retryable_subgraph_error(error) or attempt == max_retries:
+                break
+
+            await asyncio.sleep(_get_backoff_delay(base_delay_seconds, attempt))
+
+    _report_subgraph_metrics(query, start_time, attempt, False)
+    raise last_error
+
+
+def _is_retryable_subgraph_error(error: Exception) -> bool:
+    return is_indexer_error(error) or isinstance(
+        error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+    )
+
+
+async def _fetch_subgraph_data(
+    network: Dict[str, Any],
+    query: str,
+    params: Optional[Dict[str, Any]] = None,
+    indexer_id: Optional[str] = None,
+    use_hmt_subgraph: bool = False,
+) -> Dict[str, Any]:
+    subgraph_url, headers = _get_subgraph_request(network, indexer_id, use_hmt_subgraph)
+
+    session = await get_http_session()
+    async with session.post(
+        subgraph_url,
+        json={"query": query, "variables": params},
+        headers=headers,
+    ) as response:
+        if response.status == 200:
+            return await response.json(content_type=None)
+
+        raise Exception(
+            "Subgraph query failed. return code is {}. \n{}".format(
+                response.status, query
+            )
+        )
+
+
+async def run_query_steps(
+    steps: QuerySteps[T],
+    fetch: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
+) -> T:
+    """Drive query steps by awaiting every yielded request.
+
+    Args:
+        steps (QuerySteps[T]): Query steps shared with the sync utils.
+        fetch (Callable[..., Awaitable[Dict[str, Any]]]): Async fetch function,
+            `custom_gql_fetch` of this module by default.
+
+    Returns:
+        The value returned by the query steps.
+    """
+    fetch = fetch or custom_gql_fetch
+    try:
+        query = next(steps)
+        while True:
+            query = steps.send(await fetch(*query.args, **query.kwargs))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def iter_query_pages(
+    pages: QueryPages[T],
+    fetch: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
+    prefetch: bool = False,
+) -> AsyncIterator[T]:
+    """Async version of `human_protocol_sdk.utils.iter_query_pages`.
+
+    Args:
+        pages (QueryPages[T]): Pagination of the query.
+        fetch (Callable[..., Awaitable[Dict[str, Any]]]): Async fetch function,
+            `custom_gql_fetch` of this module by default.
+        prefetch (bool): Fetch the next page in a background task while the current
+            one is being consumed.
+
+    Yields:
+        Parsed records, page by page.
+    """
+    fetch = fetch or custom_gql_fetch
+
+    async def load(cursor: Optional[PageCursor]) -> List[T]:
+        return await run_query_steps(pages.get_steps(cursor), fetch)
+
+    next_page = None
+    try:
+        page = await load(None)
+        while True:
+            has_more = len(page) >= pages.page_size
+            if has_more and prefetch:
+                next_page = asyncio.ensure_future(load(pages.get_cursor(page[-1])))
+
+            for record in page:
+                yield record
+
+            if not has_more:
+                return
+            if next_page is not None:
+                page = await next_page
+                next_page = None
+            else:
+                page = await load(pages.get_cursor(page[-1]))
+    finally:
+        if next_page is not None:
+            next_page.cancel()
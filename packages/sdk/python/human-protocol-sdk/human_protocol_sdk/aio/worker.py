@@ -0,0 +1,67 @@
+"""Async worker subgraph queries.
+
+Example:
+    ```python
+    from human_protocol_sdk.aio.worker import WorkerUtils
+    from human_protocol_sdk.constants import ChainId
+    from human_protocol_sdk.worker import WorkerFilter
+
+    workers = await WorkerUtils.get_workers(WorkerFilter(chain_id=ChainId.POLYGON_AMOY))
+    ```
+"""
+
+from typing import AsyncIterator, List, Optional
+
+from human_protocol_sdk.aio.utils import (
+    custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
+)
+from human_protocol_sdk.constants import SUBGRAPH_PAGE_SIZE, ChainId
+from human_protocol_sdk.filter import WorkerFilter
+from human_protocol_sdk.utils import SubgraphOptions
+from human_protocol_sdk.worker import worker_utils
+from human_protocol_sdk.worker.worker_utils import WorkerData
+
+
+class WorkerUtils:
+    """Async counterpart of `human_protocol_sdk.worker.WorkerUtils`."""
+
+    @staticmethod
+    async def get_workers(
+        filter: WorkerFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> List[WorkerData]:
+        """Async version of `WorkerUtils.get_workers`."""
+        return await run_query_steps(
+            worker_utils.WorkerUtils._get_workers_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def iter_workers(
+        filter: WorkerFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> AsyncIterator[WorkerData]:
+        """Async version of `WorkerUtils.iter_workers`, used with ``async for``."""
+        return iter_query_pages(
+            worker_utils.WorkerUtils._get_workers_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    async def get_worker(
+        chain_id: ChainId,
+        worker_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> Optional[WorkerData]:
+        """Async version of `WorkerUtils.get_worker`."""
+        return await run_query_steps(
+            worker_utils.WorkerUtils._get_worker_steps(
+                chain_id, worker_address, options
+            ),
+            custom_gql_fetch,
+        )
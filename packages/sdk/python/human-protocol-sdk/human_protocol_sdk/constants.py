@@ -169,9 +169,9 @@ NETWORKS = {
         "subgraph_url": "http://localhost:8000/subgraphs/name/humanprotocol/localhost",
         "subgraph_url_api_key": "",
         "hmt_address": "0x5FbDB2315678afecb367f032d93F642f64180aa3",
-        "factory_address": "0xCf7Ed3AccA5a467e9e704C703E8D87F634fB0Fc9",
+        "factory_address": "0xDc64a140Aa3E981100a9becA4E685f962f0cF6C9",
         "staking_address": "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512",
-        "kvstore_address": "0xDc64a140Aa3E981100a9becA4E685f962f0cF6C9",
+        "kvstore_address": "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0",
         "old_subgraph_url": "",
         "old_factory_address": "",
     },
@@ -259,3 +259,15 @@ ESCROW_BULK_PAYOUT_MAX_ITEMS = 99
 
 DEFAULT_CONFIRMATION_POLL_INTERVAL = 4
 """Default interval (in seconds) between polling attempts for transaction confirmation."""
+
+CONTRACT_CACHE_MAX_SIZE = 1024
+"""Maximum number of contract instances kept in the process-wide contract cache."""
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+"""Address of the Multicall3 contract, deployed at the same address on all supported public networks."""
+
+MULTICALL_BATCH_SIZE = 500
+"""Maximum number of contract calls aggregated into a single RPC request."""
+
+SUBGRAPH_PAGE_SIZE = 1000
+"""Maximum number of records returned by a single subgraph query, used as the page size of `iter_*` methods."""
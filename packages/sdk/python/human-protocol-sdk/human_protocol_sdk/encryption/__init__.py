@@ -4,3 +4,4 @@ Encryption utility to encrypt/decrypt and sign/verify messages and secure protoc
 
 from .encryption import Encryption
 from .encryption_utils import EncryptionUtils
+from .keyring import Keyring
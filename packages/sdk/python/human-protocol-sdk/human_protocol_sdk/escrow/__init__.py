@@ -7,5 +7,6 @@ from .escrow_client import (
     EscrowClient,
     EscrowClientError,
     EscrowConfig,
+    EscrowState,
 )
 from .escrow_utils import EscrowData, EscrowUtils
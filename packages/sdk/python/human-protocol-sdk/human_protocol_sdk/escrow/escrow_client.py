@@ -43,7 +43,8 @@ Examples:
 """
 
 import logging
-from typing import Any, List, Optional, Tuple, Union
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from human_protocol_sdk.constants import (
     ESCROW_BULK_PAYOUT_MAX_ITEMS,
@@ -53,11 +54,14 @@ from human_protocol_sdk.constants import (
 )
 from human_protocol_sdk.utils import (
     TransactionOptions,
+    aggregate_calls,
+    get_contract,
     get_error_message,
     get_escrow_interface,
     get_factory_interface,
     get_erc20_interface,
     handle_error,
+    is_multicall_available,
     transact_and_wait,
     validate_json,
     validate_url,
@@ -99,6 +103,71 @@ class EscrowWithdraw:
         self.withdrawn_amount = withdrawn_amount
 
 
+@dataclass
+class EscrowState:
+    """On-chain state of an escrow read by `EscrowClient.get_escrows_state`.
+
+    Fields that were not requested, or whose call failed, are None.
+
+    Attributes:
+        address (str): Address of the escrow.
+        is_escrow (bool): Whether the escrow was created by the network's escrow factory.
+        balance (Optional[int]): Remaining balance in token's smallest unit.
+        fund_amount (Optional[int]): Original funded amount in token's smallest unit.
+        reserved_funds (Optional[int]): Reserved funds in token's smallest unit.
+        status (Optional[Status]): Current escrow status.
+        token_address (Optional[str]): Address of the token used to fund the escrow.
+        manifest (Optional[str]): Manifest data (URL or JSON string).
+        manifest_hash (Optional[str]): Manifest file hash.
+        intermediate_results_url (Optional[str]): Intermediate results URL.
+        intermediate_results_hash (Optional[str]): Intermediate results file hash.
+        results_url (Optional[str]): Final results URL.
+        recording_oracle_address (Optional[str]): Recording oracle address.
+        reputation_oracle_address (Optional[str]): Reputation oracle address.
+        exchange_oracle_address (Optional[str]): Exchange oracle address.
+        job_launcher_address (Optional[str]): Job launcher address.
+        factory_address (Optional[str]): Escrow factory address.
+    """
+
+    address: str
+    is_escrow: bool
+    balance: Optional[int] = None
+    fund_amount: Optional[int] = None
+    reserved_funds: Optional[int] = None
+    status: Optional[Status] = None
+    token_address: Optional[str] = None
+    manifest: Optional[str] = None
+    manifest_hash: Optional[str] = None
+    intermediate_results_url: Optional[str] = None
+    intermediate_results_hash: Optional[str] = None
+    results_url: Optional[str] = None
+    recording_oracle_address: Optional[str] = None
+    reputation_oracle_address: Optional[str] = None
+    exchange_oracle_address: Optional[str] = None
+    job_launcher_address: Optional[str] = None
+    factory_address: Optional[str] = None
+
+
+ESCROW_STATE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "balance": ("remainingFunds", "getBalance"),
+    "fund_amount": ("fundAmount",),
+    "reserved_funds": ("reservedFunds",),
+    "status": ("status",),
+    "token_address": ("token",),
+    "manifest": ("manifest", "manifestUrl"),
+    "manifest_hash": ("manifestHash",),
+    "intermediate_results_url": ("intermediateResultsUrl",),
+    "intermediate_results_hash": ("intermediateResultsHash",),
+    "results_url": ("finalResultsUrl",),
+    "recording_oracle_address": ("recordingOracle",),
+    "reputation_oracle_address": ("reputationOracle",),
+    "exchange_oracle_address": ("exchangeOracle",),
+    "job_launcher_address": ("launcher",),
+    "factory_address": ("escrowFactory",),
+}
+"""Escrow contract getters backing each `EscrowState` field, followed by legacy fallbacks."""
+
+
 class EscrowClientError(Exception):
     """Exception raised when errors occur during escrow operations."""
 
@@ -162,6 +231,7 @@ class EscrowClient:
 
     Attributes:
         w3 (Web3): Web3 instance configured for the target network.
+        chain_id (int): Chain id of the target network.
         network (dict): Network configuration for the current chain.
         factory_contract (Contract): Contract instance for the escrow factory.
     """
@@ -194,11 +264,12 @@ class EscrowClient:
                 raise EscrowClientError(f"Invalid ChainId: {chain_id}")
             else:
                 raise EscrowClientError(f"Invalid Web3 Instance")
+        self.chain_id = chain_id
+        self._multicall_available: Optional[bool] = None
 
         # Initialize contract instances
-        factory_interface = get_factory_interface()
-        self.factory_contract = self.w3.eth.contract(
-            address=self.network["factory_address"], abi=factory_interface["abi"]
+        self.factory_contract = get_contract(
+            self.w3, chain_id, self.network["factory_address"], get_factory_interface
         )
 
     @requires_signer
@@ -403,8 +474,9 @@ class EscrowClient:
             raise EscrowClientError("Amount must be positive")
 
         token_address = self.get_token_address(escrow_address)
-        erc20_interface = get_erc20_interface()
-        token_contract = self.w3.eth.contract(token_address, abi=erc20_interface["abi"])
+        token_contract = get_contract(
+            self.w3, self.chain_id, token_address, get_erc20_interface
+        )
 
         try:
             transact_and_wait(
@@ -892,9 +964,8 @@ class EscrowClient:
             )
 
             amount_transferred = None
-            erc20_interface = get_erc20_interface()
-            token_contract = self.w3.eth.contract(
-                token_address, abi=erc20_interface["abi"]
+            token_contract = get_contract(
+                self.w3, self.chain_id, token_address, get_erc20_interface
             )
 
             for log in receipt["logs"]:
@@ -1283,6 +1354,97 @@ class EscrowClient:
             self._get_escrow_contract(escrow_address).functions.escrowFactory().call()
         )
 
+    def get_escrows_state(
+        self,
+        escrow_addresses: Sequence[str],
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[EscrowState]:
+        """Get the on-chain state of many escrows in batched RPC requests.
+
+        All reads, including the factory `hasEscrow` check, are aggregated into
+        Multicall3 `aggregate3` calls. When Multicall3 is not deployed on the network
+        (e.g. a local Hardhat node), JSON-RPC batch requests are used instead.
+        Fields whose getter reverts are retried with the legacy getter, if any.
+
+        Args:
+            escrow_addresses (Sequence[str]): Addresses of the escrows.
+            fields (Optional[Sequence[str]]): `EscrowState` fields to read, see
+                `ESCROW_STATE_FIELDS`. All fields are read by default.
+
+        Returns:
+            Escrow states in the order of `escrow_addresses`.
+
+        Raises:
+            EscrowClientError: If an escrow address or a field name is invalid.
+
+        Example:
+            ```python
+            states = escrow_client.get_escrows_state(
+                ["0x62dD51230A30401C455c8398d06F85e4EaB6309f"],
+                fields=["status", "balance", "manifest"],
+            )
+            for state in states:
+                print(state.address, state.status, state.balance)
+            ```
+        """
+
+        for escrow_address in escrow_addresses:
+            if not Web3.is_address(escrow_address):
+                raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        fields = list(ESCROW_STATE_FIELDS) if fields is None else list(fields)
+        for field in fields:
+            if field not in ESCROW_STATE_FIELDS:
+                raise EscrowClientError(f"Invalid escrow state field: {field}")
+
+        if self._multicall_available is None:
+            self._multicall_available = is_multicall_available(self.w3)
+
+        states = [
+            EscrowState(
+                address=Web3.to_checksum_address(escrow_address), is_escrow=False
+            )
+            for escrow_address in escrow_addresses
+        ]
+        # (state, field, remaining fallback getters) for each pending field call
+        pending: List[Tuple[EscrowState, Optional[str], Tuple[str, ...]]] = []
+        calls = []
+        for state in states:
+            pending.append((state, None, ()))
+            calls.append(self.factory_contract.functions.hasEscrow(state.address))
+
+            escrow_contract = get_contract(
+                self.w3, self.chain_id, state.address, get_escrow_interface
+            )
+            for field in fields:
+                getter, *fallbacks = ESCROW_STATE_FIELDS[field]
+                pending.append((state, field, tuple(fallbacks)))
+                calls.append(getattr(escrow_contract.functions, getter)())
+
+        while calls:
+            results = aggregate_calls(
+                self.w3, self.chain_id, calls, use_multicall=self._multicall_available
+            )
+            retry_pending, retry_calls = [], []
+            for (state, field, fallbacks), (success, value) in zip(pending, results):
+                if field is None:
+                    state.is_escrow = bool(success and value)
+                elif not state.is_escrow:
+                    continue
+                elif success:
+                    setattr(state, field, Status(value) if field == "status" else value)
+                elif fallbacks:
+                    escrow_contract = get_contract(
+                        self.w3, self.chain_id, state.address, get_escrow_interface
+                    )
+                    getter = getattr(escrow_contract.functions, fallbacks[0], None)
+                    if getter is not None:
+                        retry_pending.append((state, field, fallbacks[1:]))
+                        retry_calls.append(getter())
+            pending, calls = retry_pending, retry_calls
+
+        return states
+
     def _get_escrow_contract(self, address: str) -> contract.Contract:
         """Get the escrow contract instance.
 
@@ -1301,6 +1463,4 @@ class EscrowClient:
 
         if not self.factory_contract.functions.hasEscrow(address):
             raise EscrowClientError("Escrow address is not provided by the factory")
-        # Initialize contract instance
-        escrow_interface = get_escrow_interface()
-        return self.w3.eth.contract(address=address, abi=escrow_interface["abi"])
+        return get_contract(self.w3, self.chain_id, address, get_escrow_interface)
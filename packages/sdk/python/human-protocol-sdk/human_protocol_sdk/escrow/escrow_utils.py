@@ -19,11 +19,12 @@ Example:
 """
 
 import logging
-from typing import List, Optional
+import copy
+from typing import Dict, Iterator, List, Optional
 
 from web3 import Web3
 
-from human_protocol_sdk.constants import NETWORKS, ChainId
+from human_protocol_sdk.constants import NETWORKS, SUBGRAPH_PAGE_SIZE, ChainId
 from human_protocol_sdk.filter import (
     CancellationRefundFilter,
     EscrowFilter,
@@ -31,8 +32,14 @@ from human_protocol_sdk.filter import (
     PayoutFilter,
 )
 from human_protocol_sdk.utils import (
+    PageCursor,
+    QueryPages,
+    QuerySteps,
     SubgraphOptions,
+    SubgraphQuery,
     custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
 )
 
 from human_protocol_sdk.escrow.escrow_client import EscrowClientError
@@ -144,6 +151,7 @@ class StatusEvent:
     """Represents an escrow status change event.
 
     Attributes:
+        id (Optional[str]): Subgraph ID of the event.
         timestamp (int): Event timestamp in milliseconds.
         status (str): The new status of the escrow.
         chain_id (ChainId): Chain where the event occurred.
@@ -158,7 +166,9 @@ class StatusEvent:
         escrow_address: str,
         block: str,
         tx_hash: str,
+        id: Optional[str] = None,
     ):
+        self.id = id
         self.timestamp = timestamp * 1000
         self.status = status
         self.chain_id = chain_id
@@ -264,6 +274,16 @@ class EscrowUtils:
             )
             ```
         """
+        return run_query_steps(
+            EscrowUtils._get_escrows_steps(filter, options), custom_gql_fetch
+        )
+
+    @staticmethod
+    def _get_escrows_steps(
+        filter: EscrowFilter,
+        options: Optional[SubgraphOptions] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> QuerySteps[List[EscrowData]]:
         from human_protocol_sdk.gql.escrow import get_escrows_query
 
         chain_id = filter.chain_id
@@ -278,9 +298,9 @@ class EscrowUtils:
             else:
                 statuses = [filter.status.name]
 
-        escrows_data = custom_gql_fetch(
+        escrows_data = yield SubgraphQuery(
             network,
-            query=get_escrows_query(filter),
+            query=get_escrows_query(filter, cursor is not None),
             params={
                 "launcher": filter.launcher.lower() if filter.launcher else None,
                 "reputationOracle": (
@@ -303,6 +323,7 @@ class EscrowUtils:
                 "first": filter.first,
                 "skip": filter.skip,
                 "orderDirection": filter.order_direction.value,
+                **(cursor.to_params() if cursor else {}),
             },
             options=options,
         )
@@ -318,41 +339,73 @@ class EscrowUtils:
         escrows_raw = escrows_data["data"]["escrows"]
 
         escrows.extend(
-            [
-                EscrowData(
-                    chain_id=chain_id,
-                    id=escrow.get("id"),
-                    address=escrow.get("address"),
-                    amount_paid=escrow.get("amountPaid"),
-                    balance=escrow.get("balance"),
-                    count=escrow.get("count"),
-                    factory_address=escrow.get("factoryAddress"),
-                    launcher=escrow.get("launcher"),
-                    job_requester_id=escrow.get("jobRequesterId"),
-                    status=escrow.get("status"),
-                    token=escrow.get("token"),
-                    total_funded_amount=escrow.get("totalFundedAmount"),
-                    created_at=escrow.get("createdAt"),
-                    cancellation_requested_at=escrow.get("cancellationRequestedAt"),
-                    final_results_url=escrow.get("finalResultsUrl"),
-                    final_results_hash=escrow.get("finalResultsHash"),
-                    intermediate_results_url=escrow.get("intermediateResultsUrl"),
-                    intermediate_results_hash=escrow.get("intermediateResultsHash"),
-                    manifest_hash=escrow.get("manifestHash"),
-                    manifest=escrow.get("manifest"),
-                    recording_oracle=escrow.get("recordingOracle"),
-                    reputation_oracle=escrow.get("reputationOracle"),
-                    exchange_oracle=escrow.get("exchangeOracle"),
-                    recording_oracle_fee=escrow.get("recordingOracleFee"),
-                    reputation_oracle_fee=escrow.get("reputationOracleFee"),
-                    exchange_oracle_fee=escrow.get("exchangeOracleFee"),
-                )
-                for escrow in escrows_raw
-            ]
+            [EscrowUtils._parse_escrow(chain_id, escrow) for escrow in escrows_raw]
         )
 
         return escrows
 
+    @staticmethod
+    def iter_escrows(
+        filter: EscrowFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[EscrowData]:
+        """Iterate over all escrows matching the provided filter criteria.
+
+        Pages through the subgraph by creation time instead of ``skip``, so deep pages
+        are as fast as the first one and there is no limit on the number of results.
+        Records are parsed and yielded lazily, holding one page in memory.
+        ``first`` and ``skip`` of the filter are ignored.
+
+        Args:
+            filter (EscrowFilter): Filter parameters including chain ID, status, date range,
+                and oracle addresses.
+            options (Optional[SubgraphOptions]): Optional configuration for subgraph requests.
+            page_size (int): Number of records requested per page (max 1000).
+            prefetch (bool): Fetch the next page in a background thread while the
+                current one is being consumed.
+
+        Returns:
+            Iterator over all matching records.
+
+        Raises:
+            EscrowClientError: Raised on first iteration for the same reasons as ``get_escrows``.
+
+        Example:
+            ```python
+            from human_protocol_sdk.constants import ChainId
+            from human_protocol_sdk.escrow import EscrowUtils, EscrowFilter, Status
+
+            for escrow in EscrowUtils.iter_escrows(
+                EscrowFilter(chain_id=ChainId.POLYGON_AMOY, status=Status.Complete),
+                prefetch=True,
+            ):
+                print(escrow.address, escrow.amount_paid)
+            ```
+        """
+        return iter_query_pages(
+            EscrowUtils._get_escrows_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    def _get_escrows_pages(
+        filter: EscrowFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+    ) -> QueryPages[EscrowData]:
+        page_filter = copy.copy(filter)
+        page_filter.first = min(max(page_size, 1), SUBGRAPH_PAGE_SIZE)
+        page_filter.skip = 0
+
+        return QueryPages(
+            lambda cursor: EscrowUtils._get_escrows_steps(page_filter, options, cursor),
+            lambda escrow: PageCursor(escrow.id, str(escrow.created_at // 1000)),
+            page_filter.first,
+        )
+
     @staticmethod
     def get_escrow(
         chain_id: ChainId,
@@ -387,6 +440,17 @@ class EscrowUtils:
             )
             ```
         """
+        return run_query_steps(
+            EscrowUtils._get_escrow_steps(chain_id, escrow_address, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_escrow_steps(
+        chain_id: ChainId,
+        escrow_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[Optional[EscrowData]]:
         from human_protocol_sdk.gql.escrow import (
             get_escrow_query,
         )
@@ -399,7 +463,7 @@ class EscrowUtils:
 
         network = NETWORKS[ChainId(chain_id)]
 
-        escrow_data = custom_gql_fetch(
+        escrow_data = yield SubgraphQuery(
             network,
             query=get_escrow_query(),
             params={
@@ -418,6 +482,99 @@ class EscrowUtils:
 
         escrow = escrow_data["data"]["escrow"]
 
+        return EscrowUtils._parse_escrow(chain_id, escrow)
+
+    @staticmethod
+    def get_escrows_by_addresses(
+        chain_id: ChainId,
+        escrow_addresses: List[str],
+        options: Optional[SubgraphOptions] = None,
+    ) -> Dict[str, EscrowData]:
+        """Fetch several escrows by their addresses.
+
+        Resolves all the escrows with ``id_in`` queries of up to 1000 addresses each,
+        instead of one ``get_escrow`` round trip per address. Duplicated addresses
+        are requested once.
+
+        Args:
+            chain_id (ChainId): Network where the escrows have been deployed.
+            escrow_addresses (List[str]): Addresses of the escrow contracts.
+            options (Optional[SubgraphOptions]): Optional configuration for subgraph requests.
+
+        Returns:
+            Escrow data of the found escrows, keyed by lowercase escrow address.
+                Addresses without an escrow in the subgraph are not included.
+
+        Raises:
+            EscrowClientError: If the chain ID is invalid or any escrow address is malformed.
+
+        Example:
+            ```python
+            from human_protocol_sdk.constants import ChainId
+            from human_protocol_sdk.escrow import EscrowUtils
+
+            escrows = EscrowUtils.get_escrows_by_addresses(
+                ChainId.POLYGON_AMOY,
+                [
+                    "0x1234567890123456789012345678901234567890",
+                    "0x1234567890123456789012345678901234567891",
+                ],
+            )
+            print(escrows.get("0x1234567890123456789012345678901234567890"))
+            ```
+        """
+        return run_query_steps(
+            EscrowUtils._get_escrows_by_addresses_steps(
+                chain_id, escrow_addresses, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_escrows_by_addresses_steps(
+        chain_id: ChainId,
+        escrow_addresses: List[str],
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[Dict[str, EscrowData]]:
+        from human_protocol_sdk.gql.escrow import get_escrows_by_addresses_query
+
+        if chain_id.value not in set(chain_id.value for chain_id in ChainId):
+            raise EscrowClientError(f"Invalid ChainId")
+
+        for escrow_address in escrow_addresses:
+            if not Web3.is_address(escrow_address):
+                raise EscrowClientError(f"Invalid escrow address: {escrow_address}")
+
+        network = NETWORKS[ChainId(chain_id)]
+        addresses = list(dict.fromkeys(address.lower() for address in escrow_addresses))
+
+        escrows = {}
+        for chunk_start in range(0, len(addresses), SUBGRAPH_PAGE_SIZE):
+            chunk = addresses[chunk_start : chunk_start + SUBGRAPH_PAGE_SIZE]
+
+            escrows_data = yield SubgraphQuery(
+                network,
+                query=get_escrows_by_addresses_query(),
+                params={"escrowAddresses": chunk, "first": len(chunk)},
+                options=options,
+            )
+
+            if (
+                not escrows_data
+                or "data" not in escrows_data
+                or not escrows_data["data"].get("escrows")
+            ):
+                continue
+
+            for escrow in escrows_data["data"]["escrows"]:
+                escrows[escrow["address"].lower()] = EscrowUtils._parse_escrow(
+                    chain_id, escrow
+                )
+
+        return escrows
+
+    @staticmethod
+    def _parse_escrow(chain_id: ChainId, escrow: dict) -> EscrowData:
         return EscrowData(
             chain_id=chain_id,
             id=escrow.get("id"),
@@ -486,6 +643,16 @@ class EscrowUtils:
             )
             ```
         """
+        return run_query_steps(
+            EscrowUtils._get_status_events_steps(filter, options), custom_gql_fetch
+        )
+
+    @staticmethod
+    def _get_status_events_steps(
+        filter: StatusEventFilter,
+        options: Optional[SubgraphOptions] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> QuerySteps[List[StatusEvent]]:
         from human_protocol_sdk.gql.escrow import get_status_query
 
         if filter.launcher and not Web3.is_address(filter.launcher):
@@ -500,10 +667,15 @@ class EscrowUtils:
 
         status_names = [status.name for status in filter.statuses]
 
-        data = custom_gql_fetch(
+        data = yield SubgraphQuery(
             network,
             get_status_query(
-                filter.date_from, filter.date_to, filter.launcher, filter.escrow_address
+                filter.date_from,
+                filter.date_to,
+                filter.launcher,
+                filter.escrow_address,
+                cursor is not None,
+                filter.order_direction,
             ),
             {
                 "status": status_names,
@@ -516,6 +688,7 @@ class EscrowUtils:
                 "first": filter.first,
                 "skip": filter.skip,
                 "orderDirection": filter.order_direction.value,
+                **(cursor.to_params() if cursor else {}),
             },
             options=options,
         )
@@ -538,12 +711,77 @@ class EscrowUtils:
                 chain_id=filter.chain_id,
                 block=event["block"],
                 tx_hash=event["txHash"],
+                id=event.get("id"),
             )
             for event in status_events
         ]
 
         return events_with_chain_id
 
+    @staticmethod
+    def iter_status_events(
+        filter: StatusEventFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[StatusEvent]:
+        """Iterate over all status change events matching the provided filter criteria.
+
+        Pages through the subgraph by timestamp instead of ``skip``, so deep pages are as
+        fast as the first one and there is no limit on the number of results. Records
+        are parsed and yielded lazily, holding one page in memory.
+        ``first`` and ``skip`` of the filter are ignored.
+
+        Args:
+            filter (StatusEventFilter): Filter parameters including chain ID, statuses,
+                date range, and oracle addresses.
+            options (Optional[SubgraphOptions]): Optional configuration for subgraph requests.
+            page_size (int): Number of records requested per page (max 1000).
+            prefetch (bool): Fetch the next page in a background thread while the
+                current one is being consumed.
+
+        Returns:
+            Iterator over all matching records.
+
+        Raises:
+            EscrowClientError: Raised on first iteration for the same reasons as ``get_status_events``.
+
+        Example:
+            ```python
+            from human_protocol_sdk.constants import ChainId, Status
+            from human_protocol_sdk.escrow import EscrowUtils
+            from human_protocol_sdk.filter import StatusEventFilter
+
+            for event in EscrowUtils.iter_status_events(
+                StatusEventFilter(chain_id=ChainId.POLYGON_AMOY, statuses=[Status.Paid])
+            ):
+                print(event.escrow_address, event.timestamp)
+            ```
+        """
+        return iter_query_pages(
+            EscrowUtils._get_status_events_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    def _get_status_events_pages(
+        filter: StatusEventFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+    ) -> QueryPages[StatusEvent]:
+        page_filter = copy.copy(filter)
+        page_filter.first = min(max(page_size, 1), SUBGRAPH_PAGE_SIZE)
+        page_filter.skip = 0
+
+        return QueryPages(
+            lambda cursor: EscrowUtils._get_status_events_steps(
+                page_filter, options, cursor
+            ),
+            lambda event: PageCursor(event.id, str(event.timestamp // 1000)),
+            page_filter.first,
+        )
+
     @staticmethod
     def get_payouts(
         filter: PayoutFilter,
@@ -580,6 +818,16 @@ class EscrowUtils:
             )
             ```
         """
+        return run_query_steps(
+            EscrowUtils._get_payouts_steps(filter, options), custom_gql_fetch
+        )
+
+    @staticmethod
+    def _get_payouts_steps(
+        filter: PayoutFilter,
+        options: Optional[SubgraphOptions] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> QuerySteps[List[Payout]]:
         from human_protocol_sdk.gql.payout import get_payouts_query
 
         if filter.escrow_address and not Web3.is_address(filter.escrow_address):
@@ -592,9 +840,9 @@ class EscrowUtils:
         if not network:
             raise EscrowClientError("Unsupported Chain ID")
 
-        data = custom_gql_fetch(
+        data = yield SubgraphQuery(
             network,
-            get_payouts_query(filter),
+            get_payouts_query(filter, cursor is not None),
             {
                 "escrowAddress": (
                     filter.escrow_address.lower() if filter.escrow_address else None
@@ -605,6 +853,7 @@ class EscrowUtils:
                 "first": min(filter.first, 1000),
                 "skip": filter.skip,
                 "orderDirection": filter.order_direction.value,
+                **(cursor.to_params() if cursor else {}),
             },
             options=options,
         )
@@ -632,6 +881,73 @@ class EscrowUtils:
 
         return payouts
 
+    @staticmethod
+    def iter_payouts(
+        filter: PayoutFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[Payout]:
+        """Iterate over all payouts matching the provided filter criteria.
+
+        Pages through the subgraph by creation time instead of ``skip``, so deep pages
+        are as fast as the first one and there is no limit on the number of results.
+        Records are parsed and yielded lazily, holding one page in memory.
+        ``first`` and ``skip`` of the filter are ignored.
+
+        Args:
+            filter (PayoutFilter): Filter parameters including chain ID, escrow address,
+                recipient address and date range.
+            options (Optional[SubgraphOptions]): Optional configuration for subgraph requests.
+            page_size (int): Number of records requested per page (max 1000).
+            prefetch (bool): Fetch the next page in a background thread while the
+                current one is being consumed.
+
+        Returns:
+            Iterator over all matching records.
+
+        Raises:
+            EscrowClientError: Raised on first iteration for the same reasons as ``get_payouts``.
+
+        Example:
+            ```python
+            from human_protocol_sdk.constants import ChainId
+            from human_protocol_sdk.escrow import EscrowUtils
+            from human_protocol_sdk.filter import PayoutFilter
+
+            total = sum(
+                payout.amount
+                for payout in EscrowUtils.iter_payouts(
+                    PayoutFilter(
+                        chain_id=ChainId.POLYGON_AMOY,
+                        escrow_address="0x1234567890123456789012345678901234567890",
+                    )
+                )
+            )
+            ```
+        """
+        return iter_query_pages(
+            EscrowUtils._get_payouts_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    def _get_payouts_pages(
+        filter: PayoutFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+    ) -> QueryPages[Payout]:
+        page_filter = copy.copy(filter)
+        page_filter.first = min(max(page_size, 1), SUBGRAPH_PAGE_SIZE)
+        page_filter.skip = 0
+
+        return QueryPages(
+            lambda cursor: EscrowUtils._get_payouts_steps(page_filter, options, cursor),
+            lambda payout: PageCursor(payout.id, str(payout.created_at // 1000)),
+            page_filter.first,
+        )
+
     @staticmethod
     def get_cancellation_refunds(
         filter: CancellationRefundFilter,
@@ -668,6 +984,16 @@ class EscrowUtils:
             )
             ```
         """
+        return run_query_steps(
+            EscrowUtils._get_cancellation_refunds_steps(filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_cancellation_refunds_steps(
+        filter: CancellationRefundFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[List[CancellationRefund]]:
         from human_protocol_sdk.gql.cancel import get_cancellation_refunds_query
 
         if filter.escrow_address and not Web3.is_address(filter.escrow_address):
@@ -680,7 +1006,7 @@ class EscrowUtils:
         if not network:
             raise EscrowClientError("Unsupported Chain ID")
 
-        data = custom_gql_fetch(
+        data = yield SubgraphQuery(
             network,
             get_cancellation_refunds_query(filter),
             {
@@ -755,6 +1081,19 @@ class EscrowUtils:
             )
             ```
         """
+        return run_query_steps(
+            EscrowUtils._get_cancellation_refund_steps(
+                chain_id, escrow_address, options
+            ),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_cancellation_refund_steps(
+        chain_id: ChainId,
+        escrow_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[CancellationRefund]:
         from human_protocol_sdk.gql.cancel import (
             get_cancellation_refund_by_escrow_query,
         )
@@ -766,7 +1105,7 @@ class EscrowUtils:
         if not network:
             raise EscrowClientError("Unsupported Chain ID")
 
-        data = custom_gql_fetch(
+        data = yield SubgraphQuery(
             network,
             get_cancellation_refund_by_escrow_query(),
             {
@@ -1,5 +1,7 @@
 from datetime import datetime
+from human_protocol_sdk.constants import OrderDirection
 from human_protocol_sdk.filter import EscrowFilter
+from human_protocol_sdk.gql.pagination import cursor_variables, get_cursor_clause
 
 escrow_fragment = """
 fragment EscrowFields on Escrow {
@@ -32,7 +34,7 @@ fragment EscrowFields on Escrow {
 """
 
 
-def get_escrows_query(filter: EscrowFilter):
+def get_escrows_query(filter: EscrowFilter, cursor: bool = False):
     return """
 query GetEscrows(
     $launcher: String
@@ -46,9 +48,11 @@ query GetEscrows(
     $orderDirection: String
     $first: Int
     $skip: Int
+    {cursor_variables}
 ) {{
     escrows(
       where: {{
+        {and_open}
         {launcher_clause}
         {reputation_oracle_clause}
         {recording_oracle_clause}
@@ -57,6 +61,7 @@ query GetEscrows(
         {status_clause}
         {from_clause}
         {to_clause}
+        {and_close}
       }}
       orderBy: createdAt
       orderDirection: $orderDirection
@@ -69,6 +74,13 @@ query GetEscrows(
 {escrow_fragment}
 """.format(
         escrow_fragment=escrow_fragment,
+        cursor_variables=cursor_variables if cursor else "",
+        and_open="and: [{" if cursor else "",
+        and_close=(
+            f"}}, {{ {get_cursor_clause('createdAt', filter.order_direction)} }}]"
+            if cursor
+            else ""
+        ),
         launcher_clause="launcher: $launcher" if filter.launcher else "",
         reputation_oracle_clause=(
             "reputationOracle: $reputationOracle" if filter.reputation_oracle else ""
@@ -103,11 +115,32 @@ query GetEscrow(
     )
 
 
+def get_escrows_by_addresses_query():
+    return """
+query GetEscrowsByAddresses(
+    $escrowAddresses: [String!]!
+    $first: Int
+) {{
+    escrows(
+      where: {{ id_in: $escrowAddresses }}
+      first: $first
+    ) {{
+      ...EscrowFields
+    }}
+}}
+{escrow_fragment}
+""".format(
+        escrow_fragment=escrow_fragment
+    )
+
+
 def get_status_query(
     from_: datetime = None,
     to_: datetime = None,
     launcher: str = None,
     escrow_address: str = None,
+    cursor: bool = False,
+    order_direction: OrderDirection = OrderDirection.DESC,
 ):
     return """
 query getStatus(
@@ -119,20 +152,24 @@ query getStatus(
     $orderDirection: String
     $first: Int
     $skip: Int
+    {cursor_variables}
 ) {{
     escrowStatusEvents(
         where: {{
+            {and_open}
             status_in: $status
             {from_clause}
             {to_clause}
             {launcher_clause}
             {escrow_address_clause}
+            {and_close}
         }}
         orderBy: timestamp
         orderDirection: $orderDirection
         first: $first
         skip: $skip
     ) {{
+        id
         escrowAddress
         timestamp
         status
@@ -141,6 +178,13 @@ query getStatus(
     }}
 }}
 """.format(
+        cursor_variables=cursor_variables if cursor else "",
+        and_open="and: [{" if cursor else "",
+        and_close=(
+            f"}}, {{ {get_cursor_clause('timestamp', order_direction)} }}]"
+            if cursor
+            else ""
+        ),
         from_clause="timestamp_gte: $from" if from_ else "",
         to_clause="timestamp_lte: $to" if to_ else "",
         launcher_clause=f"launcher: $launcher" if launcher else "",
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from human_protocol_sdk.constants import OrderDirection
+
+cursor_variables = """
+    $cursorValue: BigInt
+    $cursorId: Bytes
+"""
+
+# Variables of `get_cursor_clause` without an order field, GraphQL rejects unused ones
+id_cursor_variables = """
+    $cursorId: Bytes
+"""
+
+
+def get_cursor_clause(
+    order_field: Optional[str], order_direction: OrderDirection
+) -> str:
+    """Filter continuing a keyset-paginated query after `$cursorValue`/`$cursorId`.
+
+    The Graph sorts by `id` after the order field, so (order field, id) is a unique
+    position. Without an order field, records are paginated by `id` only.
+    """
+    operator = "gt" if order_direction == OrderDirection.ASC else "lt"
+
+    if not order_field:
+        return f"id_{operator}: $cursorId"
+
+    return (
+        f"or: [{{ {order_field}_{operator}: $cursorValue }}, "
+        f"{{ {order_field}: $cursorValue, id_{operator}: $cursorId }}]"
+    )
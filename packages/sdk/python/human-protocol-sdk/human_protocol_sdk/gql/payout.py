@@ -1,4 +1,5 @@
 from human_protocol_sdk.filter import PayoutFilter
+from human_protocol_sdk.gql.pagination import cursor_variables, get_cursor_clause
 
 payout_fragment = """
 fragment PayoutFields on Payout {
@@ -11,7 +12,7 @@ fragment PayoutFields on Payout {
 """
 
 
-def get_payouts_query(filter: PayoutFilter) -> str:
+def get_payouts_query(filter: PayoutFilter, cursor: bool = False) -> str:
     return """
 query GetPayouts(
     $escrowAddress: String,
@@ -21,13 +22,16 @@ query GetPayouts(
     $first: Int,
     $skip: Int,
     $orderDirection: String
+    {cursor_variables}
 ) {{
     payouts(
       where: {{
+        {and_open}
         {escrow_address_clause}
         {recipient_clause}
         {from_clause}
         {to_clause}
+        {and_close}
       }}
       orderBy: createdAt
       orderDirection: $orderDirection
@@ -40,6 +44,13 @@ query GetPayouts(
 {payout_fragment}
 """.format(
         payout_fragment=payout_fragment,
+        cursor_variables=cursor_variables if cursor else "",
+        and_open="and: [{" if cursor else "",
+        and_close=(
+            f"}}, {{ {get_cursor_clause('createdAt', filter.order_direction)} }}]"
+            if cursor
+            else ""
+        ),
         escrow_address_clause=(
             "escrowAddress: $escrowAddress" if filter.escrow_address else ""
         ),
@@ -1,4 +1,5 @@
 from human_protocol_sdk.filter import StakersFilter
+from human_protocol_sdk.gql.pagination import get_cursor_clause, id_cursor_variables
 
 staker_fragment = """
 fragment StakerFields on Staker {
@@ -14,7 +15,7 @@ fragment StakerFields on Staker {
 """
 
 
-def get_stakers_query(filter: StakersFilter) -> str:
+def get_stakers_query(filter: StakersFilter, cursor: bool = False) -> str:
     where_fields = []
     if filter.min_staked_amount:
         where_fields.append("stakedAmount_gte: $minStakedAmount")
@@ -32,6 +33,8 @@ def get_stakers_query(filter: StakersFilter) -> str:
         where_fields.append("slashedAmount_gte: $minSlashedAmount")
     if filter.max_slashed_amount:
         where_fields.append("slashedAmount_lte: $maxSlashedAmount")
+    if cursor:
+        where_fields.append(get_cursor_clause(None, filter.order_direction))
 
     where_clause = f"where: {{ {', '.join(where_fields)} }}" if where_fields else ""
 
@@ -49,6 +52,7 @@ query GetStakers(
     $orderDirection: OrderDirection
     $first: Int
     $skip: Int
+    {id_cursor_variables if cursor else ''}
 ) {{
     stakers(
         {where_clause}
@@ -1,4 +1,5 @@
 from human_protocol_sdk.filter import TransactionFilter
+from human_protocol_sdk.gql.pagination import cursor_variables, get_cursor_clause
 
 transaction_fragment = """
 fragment TransactionFields on Transaction {
@@ -26,7 +27,7 @@ fragment TransactionFields on Transaction {
 """
 
 
-def get_transactions_query(filter: TransactionFilter) -> str:
+def get_transactions_query(filter: TransactionFilter, cursor: bool = False) -> str:
     start_date = filter.start_date
     end_date = filter.end_date
     start_block = filter.start_block
@@ -36,6 +37,7 @@ def get_transactions_query(filter: TransactionFilter) -> str:
     method = filter.method
     escrow = filter.escrow
     token = filter.token
+    cursor_clause = get_cursor_clause("timestamp", filter.order_direction)
 
     address_condition = (
         f"""
@@ -60,6 +62,7 @@ def get_transactions_query(filter: TransactionFilter) -> str:
             {f'{{ method: $method }},' if method else ''}
             {f'{{ escrow: $escrow }},' if escrow else ''}
             {f'{{ token: $token }}' if token else ''}
+            {f'{{ {cursor_clause} }}' if cursor else ''}
         ]
     }}
     """
@@ -78,6 +81,7 @@ query GetTransactions(
     $orderDirection: String
     $first: Int
     $skip: Int
+    {cursor_variables if cursor else ''}
 ) {{
     transactions(
         {where_clause}
@@ -1,4 +1,5 @@
 from human_protocol_sdk.filter import WorkerFilter
+from human_protocol_sdk.gql.pagination import get_cursor_clause, id_cursor_variables
 
 worker_fragment = """
 fragment WorkerFields on Worker {
@@ -22,7 +23,7 @@ query GetWorker($address: String!) {{
     )
 
 
-def get_workers_query(filter: WorkerFilter) -> str:
+def get_workers_query(filter: WorkerFilter, cursor: bool = False) -> str:
     return """
 query GetWorkers(
     $address: String
@@ -30,10 +31,12 @@ query GetWorkers(
     $orderDirection: String
     $first: Int
     $skip: Int
+    {cursor_variables}
 ) {{
     workers(
         where: {{
             {address_clause}
+            {cursor_clause}
         }}
         orderBy: $orderBy
         orderDirection: $orderDirection
@@ -47,4 +50,8 @@ query GetWorkers(
 """.format(
         worker_fragment=worker_fragment,
         address_clause=("address: $address" if filter.worker_address else ""),
+        cursor_variables=id_cursor_variables if cursor else "",
+        cursor_clause=(
+            get_cursor_clause(None, filter.order_direction) if cursor else ""
+        ),
     )
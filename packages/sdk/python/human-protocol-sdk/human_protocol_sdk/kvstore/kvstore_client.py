@@ -48,6 +48,7 @@ from human_protocol_sdk.constants import NETWORKS, ChainId
 from human_protocol_sdk.decorators import requires_signer
 from human_protocol_sdk.utils import (
     TransactionOptions,
+    get_contract,
     get_kvstore_interface,
     handle_error,
     transact_and_wait,
@@ -119,9 +120,8 @@ class KVStoreClient:
                 raise KVStoreClientError(f"Invalid Web3 Instance")
 
         # Initialize contract instances
-        kvstore_interface = get_kvstore_interface()
-        self.kvstore_contract = self.w3.eth.contract(
-            address=self.network["kvstore_address"], abi=kvstore_interface["abi"]
+        self.kvstore_contract = get_contract(
+            self.w3, chain_id, self.network["kvstore_address"], get_kvstore_interface
         )
         self.gas_limit = gas_limit
 
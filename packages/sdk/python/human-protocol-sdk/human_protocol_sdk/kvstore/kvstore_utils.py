@@ -23,7 +23,13 @@ from web3 import Web3
 import requests
 
 from human_protocol_sdk.constants import NETWORKS, ChainId, KVStoreKeys
-from human_protocol_sdk.utils import SubgraphOptions, custom_gql_fetch
+from human_protocol_sdk.utils import (
+    QuerySteps,
+    SubgraphOptions,
+    SubgraphQuery,
+    custom_gql_fetch,
+    run_query_steps,
+)
 
 from human_protocol_sdk.kvstore.kvstore_client import KVStoreClientError
 
@@ -86,6 +92,17 @@ class KVStoreUtils:
                 print(f"{item.key}: {item.value}")
             ```
         """
+        return run_query_steps(
+            KVStoreUtils._get_kvstore_data_steps(chain_id, address, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_kvstore_data_steps(
+        chain_id: ChainId,
+        address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[Optional[List[KVStoreData]]]:
         from human_protocol_sdk.gql.kvstore import get_kvstore_by_address_query
 
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
@@ -96,7 +113,7 @@ class KVStoreUtils:
 
         network = NETWORKS[ChainId(chain_id)]
 
-        kvstore_data = custom_gql_fetch(
+        kvstore_data = yield SubgraphQuery(
             network,
             query=get_kvstore_by_address_query(),
             params={
@@ -156,6 +173,17 @@ class KVStoreUtils:
             print(role)
             ```
         """
+        return run_query_steps(
+            KVStoreUtils._get_steps(chain_id, address, key, options), custom_gql_fetch
+        )
+
+    @staticmethod
+    def _get_steps(
+        chain_id: ChainId,
+        address: str,
+        key: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[str]:
         from human_protocol_sdk.gql.kvstore import get_kvstore_by_address_and_key_query
 
         if not key:
@@ -165,7 +193,7 @@ class KVStoreUtils:
 
         network = NETWORKS[ChainId(chain_id)]
 
-        kvstore_data = custom_gql_fetch(
+        kvstore_data = yield SubgraphQuery(
             network,
             query=get_kvstore_by_address_and_key_query(),
             params={
@@ -241,6 +269,12 @@ class KVStoreUtils:
             raise KVStoreClientError("No hash found for the given address and url")
 
         content = requests.get(url).text
+        KVStoreUtils._verify_content_hash(content, hash)
+
+        return url
+
+    @staticmethod
+    def _verify_content_hash(content: str, hash: str) -> None:
         content_hash = Web3.keccak(text=content).hex()
 
         formatted_hash = hash.replace("0x", "")
@@ -249,8 +283,6 @@ class KVStoreUtils:
         if formatted_hash != formatted_content_hash:
             raise KVStoreClientError(f"Invalid hash")
 
-        return url
-
     @staticmethod
     def get_public_key(chain_id: ChainId, address: str) -> str:
         """Get the public key of an entity from KVStore.
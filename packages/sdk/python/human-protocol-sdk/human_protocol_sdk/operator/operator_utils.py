@@ -19,7 +19,13 @@ from typing import List, Optional, Union
 
 from human_protocol_sdk.constants import NETWORKS, ChainId, OrderDirection
 from human_protocol_sdk.gql.reward import get_reward_added_events_query
-from human_protocol_sdk.utils import SubgraphOptions, custom_gql_fetch
+from human_protocol_sdk.utils import (
+    QuerySteps,
+    SubgraphOptions,
+    SubgraphQuery,
+    custom_gql_fetch,
+    run_query_steps,
+)
 from web3 import Web3
 
 LOG = logging.getLogger("human_protocol_sdk.operator")
@@ -261,7 +267,15 @@ class OperatorUtils:
                 print(f"{operator.address}: {operator.role}")
             ```
         """
+        return run_query_steps(
+            OperatorUtils._get_operators_steps(filter, options), custom_gql_fetch
+        )
 
+    @staticmethod
+    def _get_operators_steps(
+        filter: OperatorFilter,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[List[OperatorData]]:
         from human_protocol_sdk.gql.operator import get_operators_query
 
         operators = []
@@ -270,7 +284,7 @@ class OperatorUtils:
         if not network.get("subgraph_url"):
             return []
 
-        operators_data = custom_gql_fetch(
+        operators_data = yield SubgraphQuery(
             network,
             query=get_operators_query(filter),
             params={
@@ -359,7 +373,17 @@ class OperatorUtils:
                 print(f"Staked: {operator_data.staked_amount}")
             ```
         """
+        return run_query_steps(
+            OperatorUtils._get_operator_steps(chain_id, operator_address, options),
+            custom_gql_fetch,
+        )
 
+    @staticmethod
+    def _get_operator_steps(
+        chain_id: ChainId,
+        operator_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[Optional[OperatorData]]:
         from human_protocol_sdk.gql.operator import get_operator_query
 
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
@@ -370,7 +394,7 @@ class OperatorUtils:
 
         network = NETWORKS[chain_id]
 
-        operator_data = custom_gql_fetch(
+        operator_data = yield SubgraphQuery(
             network,
             query=get_operator_query,
             params={"address": operator_address.lower()},
@@ -449,7 +473,20 @@ class OperatorUtils:
             print(f"Found {len(operators)} operators")
             ```
         """
+        return run_query_steps(
+            OperatorUtils._get_reputation_network_operators_steps(
+                chain_id, address, role, options
+            ),
+            custom_gql_fetch,
+        )
 
+    @staticmethod
+    def _get_reputation_network_operators_steps(
+        chain_id: ChainId,
+        address: str,
+        role: Optional[str] = None,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[List[OperatorData]]:
         from human_protocol_sdk.gql.operator import get_reputation_network_query
 
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
@@ -460,7 +497,7 @@ class OperatorUtils:
 
         network = NETWORKS[chain_id]
 
-        reputation_network_data = custom_gql_fetch(
+        reputation_network_data = yield SubgraphQuery(
             network,
             query=get_reputation_network_query(role),
             params={"address": address.lower(), "role": role},
@@ -543,7 +580,17 @@ class OperatorUtils:
             print(f"Total rewards: {total_rewards}")
             ```
         """
+        return run_query_steps(
+            OperatorUtils._get_rewards_info_steps(chain_id, slasher, options),
+            custom_gql_fetch,
+        )
 
+    @staticmethod
+    def _get_rewards_info_steps(
+        chain_id: ChainId,
+        slasher: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[List[RewardData]]:
         if chain_id.value not in set(chain_id.value for chain_id in ChainId):
             raise OperatorUtilsError(f"Invalid ChainId")
 
@@ -552,7 +599,7 @@ class OperatorUtils:
 
         network = NETWORKS[chain_id]
 
-        reward_added_events_data = custom_gql_fetch(
+        reward_added_events_data = yield SubgraphQuery(
             network,
             query=get_reward_added_events_query,
             params={"slasherAddress": slasher.lower()},
@@ -35,6 +35,7 @@ from human_protocol_sdk.constants import ChainId, NETWORKS
 from human_protocol_sdk.decorators import requires_signer
 from human_protocol_sdk.utils import (
     TransactionOptions,
+    get_contract,
     get_erc20_interface,
     get_factory_interface,
     get_staking_interface,
@@ -110,19 +111,14 @@ class StakingClient:
             raise StakingClientError("Empty network configuration")
 
         # Initialize contract instances
-        erc20_interface = get_erc20_interface()
-        self.hmtoken_contract = self.w3.eth.contract(
-            address=self.network["hmt_address"], abi=erc20_interface["abi"]
+        self.hmtoken_contract = get_contract(
+            self.w3, chain_id, self.network["hmt_address"], get_erc20_interface
         )
-
-        factory_interface = get_factory_interface()
-        self.factory_contract = self.w3.eth.contract(
-            address=self.network["factory_address"], abi=factory_interface["abi"]
+        self.factory_contract = get_contract(
+            self.w3, chain_id, self.network["factory_address"], get_factory_interface
         )
-
-        staking_interface = get_staking_interface()
-        self.staking_contract = self.w3.eth.contract(
-            address=self.network["staking_address"], abi=staking_interface["abi"]
+        self.staking_contract = get_contract(
+            self.w3, chain_id, self.network["staking_address"], get_staking_interface
         )
 
     @requires_signer
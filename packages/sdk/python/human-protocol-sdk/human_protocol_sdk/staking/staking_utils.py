@@ -1,9 +1,19 @@
 """Utility helpers for staking-related queries."""
 
-from typing import List, Optional
-from human_protocol_sdk.constants import NETWORKS, ChainId
+import copy
+from typing import Iterator, List, Optional
+from human_protocol_sdk.constants import NETWORKS, SUBGRAPH_PAGE_SIZE, ChainId
 from human_protocol_sdk.filter import StakersFilter
-from human_protocol_sdk.utils import SubgraphOptions, custom_gql_fetch
+from human_protocol_sdk.utils import (
+    PageCursor,
+    QueryPages,
+    QuerySteps,
+    SubgraphOptions,
+    SubgraphQuery,
+    custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
+)
 from human_protocol_sdk.gql.staking import get_staker_query, get_stakers_query
 
 
@@ -88,11 +98,21 @@ class StakingUtils:
                 print(f"Locked: {staker.locked_amount}")
             ```
         """
+        return run_query_steps(
+            StakingUtils._get_staker_steps(chain_id, address, options), custom_gql_fetch
+        )
+
+    @staticmethod
+    def _get_staker_steps(
+        chain_id: ChainId,
+        address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[Optional[StakerData]]:
         network = NETWORKS.get(chain_id)
         if not network:
             raise StakingUtilsError("Unsupported Chain ID")
 
-        data = custom_gql_fetch(
+        data = yield SubgraphQuery(
             network,
             query=get_staker_query(),
             params={"id": address.lower()},
@@ -157,13 +177,23 @@ class StakingUtils:
                 print(f"{staker.address}: {staker.staked_amount}")
             ```
         """
+        return run_query_steps(
+            StakingUtils._get_stakers_steps(filter, options), custom_gql_fetch
+        )
+
+    @staticmethod
+    def _get_stakers_steps(
+        filter: StakersFilter,
+        options: Optional[SubgraphOptions] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> QuerySteps[List[StakerData]]:
         network_data = NETWORKS.get(filter.chain_id)
         if not network_data:
             raise StakingUtilsError("Unsupported Chain ID")
 
-        data = custom_gql_fetch(
+        data = yield SubgraphQuery(
             network_data,
-            query=get_stakers_query(filter),
+            query=get_stakers_query(filter, cursor is not None),
             params={
                 "minStakedAmount": filter.min_staked_amount,
                 "maxStakedAmount": filter.max_staked_amount,
@@ -177,6 +207,7 @@ class StakingUtils:
                 "orderDirection": filter.order_direction.value,
                 "first": filter.first,
                 "skip": filter.skip,
+                **(cursor.to_params() if cursor else {}),
             },
             options=options,
         )
@@ -202,3 +233,68 @@ class StakingUtils:
             )
             for staker in stakers_raw
         ]
+
+    @staticmethod
+    def iter_stakers(
+        filter: StakersFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[StakerData]:
+        """Iterate over all stakers matching the provided filter criteria.
+
+        Pages through the subgraph by ID instead of ``skip``, so deep pages are as
+        fast as the first one and there is no limit on the number of results. Records
+        are parsed and yielded lazily, holding one page in memory.
+        ``first``, ``skip`` and ``order_by`` of the filter are ignored.
+
+        Args:
+            filter (StakersFilter): Filter parameters including chain ID and staked,
+                locked, withdrawn and slashed amount ranges.
+            options (Optional[SubgraphOptions]): Optional configuration for subgraph requests.
+            page_size (int): Number of records requested per page (max 1000).
+            prefetch (bool): Fetch the next page in a background thread while the
+                current one is being consumed.
+
+        Returns:
+            Iterator over all matching records.
+
+        Raises:
+            StakingUtilsError: Raised on first iteration for the same reasons as ``get_stakers``.
+
+        Example:
+            ```python
+            from human_protocol_sdk.constants import ChainId
+            from human_protocol_sdk.filter import StakersFilter
+            from human_protocol_sdk.staking import StakingUtils
+
+            for staker in StakingUtils.iter_stakers(
+                StakersFilter(chain_id=ChainId.POLYGON_AMOY, min_staked_amount="1")
+            ):
+                print(staker.address, staker.staked_amount)
+            ```
+        """
+        return iter_query_pages(
+            StakingUtils._get_stakers_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    def _get_stakers_pages(
+        filter: StakersFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+    ) -> QueryPages[StakerData]:
+        page_filter = copy.copy(filter)
+        page_filter.first = min(max(page_size, 1), SUBGRAPH_PAGE_SIZE)
+        page_filter.skip = 0
+        page_filter.order_by = "id"
+
+        return QueryPages(
+            lambda cursor: StakingUtils._get_stakers_steps(
+                page_filter, options, cursor
+            ),
+            lambda staker: PageCursor(staker.id),
+            page_filter.first,
+        )
@@ -16,7 +16,13 @@ from typing import List, Optional
 
 from human_protocol_sdk.constants import ChainId, NETWORKS
 
-from human_protocol_sdk.utils import SubgraphOptions, custom_gql_fetch
+from human_protocol_sdk.utils import (
+    QuerySteps,
+    SubgraphOptions,
+    SubgraphQuery,
+    custom_gql_fetch,
+    run_query_steps,
+)
 from human_protocol_sdk.filter import StatisticsFilter
 
 LOG = logging.getLogger("human_protocol_sdk.statistics")
@@ -268,6 +274,17 @@ class StatisticsUtils:
                 print(f"{day_data.timestamp}: {day_data.escrows_total} escrows")
             ```
         """
+        return run_query_steps(
+            StatisticsUtils._get_escrow_statistics_steps(chain_id, filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_escrow_statistics_steps(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[EscrowStatistics]:
         if chain_id.value not in [cid.value for cid in ChainId]:
             raise StatisticsUtilsError(f"Invalid ChainId: {chain_id}")
 
@@ -280,14 +297,14 @@ class StatisticsUtils:
             get_escrow_statistics_query,
         )
 
-        escrow_statistics_data = custom_gql_fetch(
+        escrow_statistics_data = yield SubgraphQuery(
             network,
             query=get_escrow_statistics_query,
             options=options,
         )
         escrow_statistics = escrow_statistics_data["data"]["escrowStatistics"]
 
-        event_day_datas_data = custom_gql_fetch(
+        event_day_datas_data = yield SubgraphQuery(
             network,
             query=get_event_day_data_query(filter),
             params={
@@ -366,6 +383,17 @@ class StatisticsUtils:
                 print(f"{day_data.timestamp}: {day_data.active_workers} workers")
             ```
         """
+        return run_query_steps(
+            StatisticsUtils._get_worker_statistics_steps(chain_id, filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_worker_statistics_steps(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[WorkerStatistics]:
         if chain_id.value not in [cid.value for cid in ChainId]:
             raise StatisticsUtilsError(f"Invalid ChainId: {chain_id}")
 
@@ -377,7 +405,7 @@ class StatisticsUtils:
             get_event_day_data_query,
         )
 
-        event_day_datas_data = custom_gql_fetch(
+        event_day_datas_data = yield SubgraphQuery(
             network,
             query=get_event_day_data_query(filter),
             params={
@@ -443,6 +471,17 @@ class StatisticsUtils:
                 print(f"{day_data.total_count}: {day_data.total_count} payments")
             ```
         """
+        return run_query_steps(
+            StatisticsUtils._get_payment_statistics_steps(chain_id, filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_payment_statistics_steps(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[PaymentStatistics]:
         if chain_id.value not in [cid.value for cid in ChainId]:
             raise StatisticsUtilsError(f"Invalid ChainId: {chain_id}")
 
@@ -454,7 +493,7 @@ class StatisticsUtils:
             get_event_day_data_query,
         )
 
-        event_day_datas_data = custom_gql_fetch(
+        event_day_datas_data = yield SubgraphQuery(
             network,
             query=get_event_day_data_query(filter),
             params={
@@ -509,6 +548,15 @@ class StatisticsUtils:
             print(f"Total amount transferred: {stats.total_transfer_amount}")
             ```
         """
+        return run_query_steps(
+            StatisticsUtils._get_hmt_statistics_steps(chain_id, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_hmt_statistics_steps(
+        chain_id: ChainId, options: Optional[SubgraphOptions] = None
+    ) -> QuerySteps[HMTStatistics]:
         if chain_id.value not in [cid.value for cid in ChainId]:
             raise StatisticsUtilsError(f"Invalid ChainId: {chain_id}")
 
@@ -520,7 +568,7 @@ class StatisticsUtils:
             get_hmtoken_statistics_query,
         )
 
-        hmtoken_statistics_data = custom_gql_fetch(
+        hmtoken_statistics_data = yield SubgraphQuery(
             network,
             query=get_hmtoken_statistics_query,
             options=options,
@@ -579,6 +627,17 @@ class StatisticsUtils:
             )
             ```
         """
+        return run_query_steps(
+            StatisticsUtils._get_hmt_holders_steps(chain_id, param, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_hmt_holders_steps(
+        chain_id: ChainId,
+        param: HMTHoldersParam = HMTHoldersParam(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[List[HMTHolder]]:
         if chain_id.value not in [cid.value for cid in ChainId]:
             raise StatisticsUtilsError(f"Invalid ChainId: {chain_id}")
 
@@ -588,7 +647,7 @@ class StatisticsUtils:
 
         from human_protocol_sdk.gql.hmtoken import get_holders_query
 
-        holders_data = custom_gql_fetch(
+        holders_data = yield SubgraphQuery(
             network,
             query=get_holders_query(address=param.address),
             params={
@@ -653,6 +712,17 @@ class StatisticsUtils:
                 print(f"  Unique senders: {day.daily_unique_senders}")
             ```
         """
+        return run_query_steps(
+            StatisticsUtils._get_hmt_daily_data_steps(chain_id, filter, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_hmt_daily_data_steps(
+        chain_id: ChainId,
+        filter: StatisticsFilter = StatisticsFilter(),
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[List[DailyHMTData]]:
         if chain_id.value not in [cid.value for cid in ChainId]:
             raise StatisticsUtilsError(f"Invalid ChainId: {chain_id}")
 
@@ -664,7 +734,7 @@ class StatisticsUtils:
             get_hmt_event_day_data_query,
         )
 
-        event_day_datas_data = custom_gql_fetch(
+        event_day_datas_data = yield SubgraphQuery(
             network,
             query=get_hmt_event_day_data_query(filter),
             params={
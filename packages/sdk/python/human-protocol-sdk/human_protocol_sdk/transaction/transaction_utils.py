@@ -17,12 +17,22 @@ Example:
     ```
 """
 
-from typing import List, Optional
+import copy
+from typing import Iterator, List, Optional
 
-from human_protocol_sdk.constants import NETWORKS, ChainId
+from human_protocol_sdk.constants import NETWORKS, SUBGRAPH_PAGE_SIZE, ChainId
 from web3 import Web3
 from human_protocol_sdk.filter import TransactionFilter
-from human_protocol_sdk.utils import SubgraphOptions, custom_gql_fetch
+from human_protocol_sdk.utils import (
+    PageCursor,
+    QueryPages,
+    QuerySteps,
+    SubgraphOptions,
+    SubgraphQuery,
+    custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
+)
 
 
 class InternalTransaction:
@@ -158,13 +168,22 @@ class TransactionUtils:
                 print(f"Internal txs: {len(tx.internal_transactions)}")
             ```
         """
+        return run_query_steps(
+            TransactionUtils._get_transaction_steps(chain_id, hash, options),
+            custom_gql_fetch,
+        )
+
+    @staticmethod
+    def _get_transaction_steps(
+        chain_id: ChainId, hash: str, options: Optional[SubgraphOptions] = None
+    ) -> QuerySteps[Optional[TransactionData]]:
         network = NETWORKS.get(chain_id)
         if not network:
             raise TransactionUtilsError("Unsupported Chain ID")
 
         from human_protocol_sdk.gql.transaction import get_transaction_query
 
-        transaction_data = custom_gql_fetch(
+        transaction_data = yield SubgraphQuery(
             network,
             query=get_transaction_query(),
             params={"hash": hash.lower()},
@@ -268,15 +287,25 @@ class TransactionUtils:
                 print(f"{tx.tx_hash}: {tx.method} - {tx.value}")
             ```
         """
+        return run_query_steps(
+            TransactionUtils._get_transactions_steps(filter, options), custom_gql_fetch
+        )
+
+    @staticmethod
+    def _get_transactions_steps(
+        filter: TransactionFilter,
+        options: Optional[SubgraphOptions] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> QuerySteps[List[TransactionData]]:
         from human_protocol_sdk.gql.transaction import get_transactions_query
 
         network_data = NETWORKS.get(filter.chain_id)
         if not network_data:
             raise TransactionUtilsError("Unsupported Chain ID")
 
-        data = custom_gql_fetch(
+        data = yield SubgraphQuery(
             network_data,
-            query=get_transactions_query(filter),
+            query=get_transactions_query(filter, cursor is not None),
             params={
                 "fromAddress": (
                     filter.from_address.lower() if filter.from_address else None
@@ -296,6 +325,7 @@ class TransactionUtils:
                 "first": filter.first,
                 "skip": filter.skip,
                 "orderDirection": filter.order_direction.value,
+                **(cursor.to_params() if cursor else {}),
             },
             options=options,
         )
@@ -342,3 +372,72 @@ class TransactionUtils:
         )
 
         return transactions
+
+    @staticmethod
+    def iter_transactions(
+        filter: TransactionFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[TransactionData]:
+        """Iterate over all transactions matching the provided filter criteria.
+
+        Pages through the subgraph by timestamp instead of ``skip``, so deep pages are as
+        fast as the first one and there is no limit on the number of results. Records
+        are parsed and yielded lazily, holding one page in memory.
+        ``first`` and ``skip`` of the filter are ignored.
+
+        Args:
+            filter (TransactionFilter): Filter parameters including chain ID, addresses,
+                date/block ranges and method signature.
+            options (Optional[SubgraphOptions]): Optional configuration for subgraph requests.
+            page_size (int): Number of records requested per page (max 1000).
+            prefetch (bool): Fetch the next page in a background thread while the
+                current one is being consumed.
+
+        Returns:
+            Iterator over all matching records.
+
+        Raises:
+            TransactionUtilsError: Raised on first iteration for the same reasons as ``get_transactions``.
+
+        Example:
+            ```python
+            from human_protocol_sdk.constants import ChainId
+            from human_protocol_sdk.filter import TransactionFilter
+            from human_protocol_sdk.transaction import TransactionUtils
+
+            for transaction in TransactionUtils.iter_transactions(
+                TransactionFilter(
+                    chain_id=ChainId.POLYGON_AMOY,
+                    from_address="0x1234567890123456789012345678901234567890",
+                )
+            ):
+                print(transaction.tx_hash)
+            ```
+        """
+        return iter_query_pages(
+            TransactionUtils._get_transactions_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    def _get_transactions_pages(
+        filter: TransactionFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+    ) -> QueryPages[TransactionData]:
+        page_filter = copy.copy(filter)
+        page_filter.first = min(max(page_size, 1), SUBGRAPH_PAGE_SIZE)
+        page_filter.skip = 0
+
+        return QueryPages(
+            lambda cursor: TransactionUtils._get_transactions_steps(
+                page_filter, options, cursor
+            ),
+            lambda transaction: PageCursor(
+                transaction.tx_hash, str(transaction.timestamp // 1000)
+            ),
+            page_filter.first,
+        )
@@ -1,17 +1,45 @@
 import json
 import logging
 import os
+import random
 import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple, Type, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from human_protocol_sdk.constants import (
     ARTIFACTS_FOLDER,
+    CONTRACT_CACHE_MAX_SIZE,
     DEFAULT_CONFIRMATION_POLL_INTERVAL,
+    MULTICALL3_ADDRESS,
+    MULTICALL_BATCH_SIZE,
     ChainId,
 )
+from eth_utils.abi import (
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+)
 from validators import url as URL
 from web3 import Web3
 from web3.contract import Contract
@@ -36,7 +64,7 @@ class SubgraphOptions:
 
     Attributes:
         max_retries (Optional[int]): Maximum number of retry attempts for failed queries. Must be paired with base_delay.
-        base_delay (Optional[int]): Base delay in milliseconds between retry attempts. Must be paired with max_retries.
+        base_delay (Optional[int]): Base delay in milliseconds between retry attempts, doubled after every attempt. Must be paired with max_retries.
         indexer_id (Optional[str]): Specific indexer ID to route requests to (requires SUBGRAPH_API_KEY environment variable).
     """
 
@@ -45,6 +73,102 @@ class SubgraphOptions:
     indexer_id: Optional[str] = None
 
 
+@dataclass
+class SubgraphQueryMetrics:
+    """Metrics of a single subgraph query reported to the transport metrics hook.
+
+    Attributes:
+        query_name (str): Operation name of the GraphQL query, e.g. "GetEscrows".
+        latency (float): Total time spent on the query in seconds, including retries.
+        retries (int): Number of retry attempts made after the first request.
+        success (bool): Whether the query eventually succeeded.
+    """
+
+    query_name: str
+    latency: float
+    retries: int
+    success: bool
+
+
+@dataclass
+class SubgraphTransportOptions:
+    """Process-wide HTTP transport configuration for subgraph queries.
+
+    Attributes:
+        timeout (float): Per-request timeout in seconds.
+        pool_maxsize (int): Maximum number of keep-alive connections per subgraph host.
+        metrics_hook (Optional[Callable[[SubgraphQueryMetrics], None]]): Called after
+            every subgraph query with its latency and retry count.
+    """
+
+    timeout: float = 30
+    pool_maxsize: int = 10
+    metrics_hook: Optional[Callable[[SubgraphQueryMetrics], None]] = None
+
+
+_subgraph_transport = SubgraphTransportOptions()
+_subgraph_sessions: Dict[str, requests.Session] = {}
+_subgraph_sessions_lock = threading.Lock()
+
+
+def configure_subgraph_transport(options: SubgraphTransportOptions) -> None:
+    """Configure the HTTP transport shared by all subgraph queries.
+
+    Open pooled sessions are closed and recreated with the new settings on next use.
+
+    Args:
+        options (SubgraphTransportOptions): Transport configuration.
+
+    Example:
+        ```python
+        from human_protocol_sdk.utils import (
+            SubgraphTransportOptions,
+            configure_subgraph_transport,
+        )
+
+        def report(metrics):
+            print(metrics.query_name, metrics.latency, metrics.retries)
+
+        configure_subgraph_transport(
+            SubgraphTransportOptions(timeout=10, pool_maxsize=20, metrics_hook=report)
+        )
+        ```
+    """
+    global _subgraph_transport
+
+    with _subgraph_sessions_lock:
+        _subgraph_transport = options
+        for session in _subgraph_sessions.values():
+            session.close()
+        _subgraph_sessions.clear()
+
+
+def _get_subgraph_session(url: str) -> requests.Session:
+    """Get the pooled keep-alive session for the host of a subgraph URL."""
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+
+    with _subgraph_sessions_lock:
+        session = _subgraph_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            # Retries are handled by custom_gql_fetch
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=_subgraph_transport.pool_maxsize,
+                max_retries=0,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _subgraph_sessions[key] = session
+        return session
+
+
+def _get_query_name(query: str) -> str:
+    match = re.search(r"\b(?:query|mutation)\s+(\w+)", query)
+    return match.group(1) if match else "anonymous"
+
+
 @dataclass
 class WaitOptions:
     """Configuration for transaction receipt waiting logic."""
@@ -234,6 +358,10 @@ def custom_gql_fetch(
 ) -> Dict[str, Any]:
     """Fetch data from the subgraph with optional retry logic and indexer routing.
 
+    Requests go through a pooled keep-alive session per subgraph host, configured with
+    `configure_subgraph_transport`. Indexer, connection and timeout errors are retried
+    with jittered exponential backoff.
+
     Args:
         network (Dict[str, Any]): Network configuration dictionary containing subgraph URLs.
         query (str): GraphQL query string to execute.
@@ -267,16 +395,178 @@ def custom_gql_fetch(
         )
         ```
     """
-    subgraph_api_key = os.getenv("SUBGRAPH_API_KEY", "")
+    start_time = time.monotonic()
 
     if not options:
-        return _fetch_subgraph_data(
-            network,
-            query,
-            params,
-            use_hmt_subgraph=use_hmt_subgraph,
-        )
+        try:
+            data = _fetch_subgraph_data(
+                network,
+                query,
+                params,
+                use_hmt_subgraph=use_hmt_subgraph,
+            )
+        except Exception:
+            _report_subgraph_metrics(query, start_time, 0, False)
+            raise
+        _report_subgraph_metrics(query, start_time, 0, True)
+        return data
+
+    max_retries, base_delay_seconds = _get_retry_settings(options)
+
+    last_error = None
+
+    for attempt in range(max_retries + 1):
+        try:
+            data = _fetch_subgraph_data(
+                network,
+                query,
+                params,
+                options.indexer_id,
+                use_hmt_subgraph,
+            )
+            _report_subgraph_metrics(query, start_time, attempt, True)
+            return data
+        except Exception as error:
+            last_error = error
+
+            if not _is_retryable_subgraph_error(error) or attempt == max_retries:
+                break
+
+            time.sleep(_get_backoff_delay(base_delay_seconds, attempt))
 
+    _report_subgraph_metrics(query, start_time, attempt, False)
+    raise last_error
+
+
+class SubgraphQuery:
+    """A subgraph request yielded by query steps, holding `custom_gql_fetch` arguments.
+
+    Attributes:
+        args (Tuple[Any, ...]): Positional arguments of the fetch call.
+        kwargs (Dict[str, Any]): Keyword arguments of the fetch call.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.args = args
+        self.kwargs = kwargs
+
+
+T = TypeVar("T")
+
+QuerySteps = Generator[SubgraphQuery, Dict[str, Any], T]
+"""Generator that yields subgraph requests, receives their responses and returns
+the parsed result. It contains no I/O, so the same steps back both the sync utils
+and their `human_protocol_sdk.aio` counterparts."""
+
+
+def run_query_steps(
+    steps: QuerySteps[T],
+    fetch: Optional[Callable[..., Dict[str, Any]]] = None,
+) -> T:
+    """Drive query steps by executing every yielded request with a blocking fetch.
+
+    Args:
+        steps (QuerySteps[T]): Query steps to drive.
+        fetch (Callable[..., Dict[str, Any]]): Fetch function, `custom_gql_fetch` by default.
+
+    Returns:
+        The value returned by the query steps.
+    """
+    fetch = fetch or custom_gql_fetch
+    try:
+        query = next(steps)
+        while True:
+            query = steps.send(fetch(*query.args, **query.kwargs))
+    except StopIteration as stop:
+        return stop.value
+
+
+@dataclass
+class PageCursor:
+    """Position after the last record of a page in keyset pagination.
+
+    Attributes:
+        id (str): Subgraph ID of the last record.
+        value (Optional[str]): Value of the order field of the last record, e.g. its
+            creation timestamp. ``None`` when records are paginated by ID only.
+    """
+
+    id: str
+    value: Optional[str] = None
+
+    def to_params(self) -> Dict[str, Any]:
+        if self.value is None:
+            return {"cursorId": self.id}
+
+        return {"cursorValue": self.value, "cursorId": self.id}
+
+
+@dataclass
+class QueryPages(Generic[T]):
+    """Keyset pagination of a subgraph list query.
+
+    Attributes:
+        get_steps (Callable[[Optional[PageCursor]], QuerySteps[List[T]]]): Builds query
+            steps for the page after the given cursor, or for the first page.
+        get_cursor (Callable[[T], PageCursor]): Returns the cursor of a record.
+        page_size (int): Number of records requested per page.
+    """
+
+    get_steps: Callable[[Optional[PageCursor]], QuerySteps[List[T]]]
+    get_cursor: Callable[[T], PageCursor]
+    page_size: int
+
+
+def iter_query_pages(
+    pages: QueryPages[T],
+    fetch: Optional[Callable[..., Dict[str, Any]]] = None,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """Lazily iterate over all records of a keyset-paginated subgraph query.
+
+    Each page continues after the cursor of the previous page's last record instead
+    of using ``skip``, so every page costs the same and there is no 5000 record limit.
+    Only one page is held in memory at a time.
+
+    Args:
+        pages (QueryPages[T]): Pagination of the query.
+        fetch (Callable[..., Dict[str, Any]]): Fetch function, `custom_gql_fetch` by default.
+        prefetch (bool): Fetch the next page in a background thread while the current
+            one is being consumed.
+
+    Yields:
+        Parsed records, page by page.
+    """
+    fetch = fetch or custom_gql_fetch
+
+    def load(cursor: Optional[PageCursor]) -> List[T]:
+        return run_query_steps(pages.get_steps(cursor), fetch)
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = load(None)
+        while True:
+            has_more = len(page) >= pages.page_size
+            next_page = None
+            if has_more and executor is not None:
+                next_page = executor.submit(load, pages.get_cursor(page[-1]))
+
+            yield from page
+
+            if not has_more:
+                return
+            page = (
+                next_page.result()
+                if next_page is not None
+                else load(pages.get_cursor(page[-1]))
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_retry_settings(options: SubgraphOptions) -> Tuple[int, float]:
+    """Validate subgraph options and return max retries and base delay in seconds."""
     has_max_retries = options.max_retries is not None
     has_base_delay = options.base_delay is not None
 
@@ -285,7 +575,7 @@ def custom_gql_fetch(
             "Retry configuration must include both max_retries and base_delay"
         )
 
-    if options.indexer_id and not subgraph_api_key:
+    if options.indexer_id and not os.getenv("SUBGRAPH_API_KEY", ""):
         raise ValueError(
             "Routing requests to a specific indexer requires SUBGRAPH_API_KEY to be set"
         )
@@ -293,27 +583,38 @@ def custom_gql_fetch(
     max_retries = int(options.max_retries) if has_max_retries else 0
     base_delay_seconds = (options.base_delay or 0) / 1000
 
-    last_error = None
+    return max_retries, base_delay_seconds
 
-    for attempt in range(max_retries + 1):
-        try:
-            return _fetch_subgraph_data(
-                network,
-                query,
-                params,
-                options.indexer_id,
-                use_hmt_subgraph,
-            )
-        except Exception as error:
-            last_error = error
 
-            if not is_indexer_error(error):
-                break
+def _get_backoff_delay(base_delay_seconds: float, attempt: int) -> float:
+    # Exponential backoff with jitter, so that clients don't retry in lock-step
+    delay = base_delay_seconds * 2**attempt
+    return random.uniform(delay / 2, delay)
 
-            delay = base_delay_seconds * attempt
-            time.sleep(delay)
 
-    raise last_error
+def _report_subgraph_metrics(
+    query: str, start_time: float, retries: int, success: bool
+) -> None:
+    metrics_hook = _subgraph_transport.metrics_hook
+    if metrics_hook is None:
+        return
+    try:
+        metrics_hook(
+            SubgraphQueryMetrics(
+                query_name=_get_query_name(query),
+                latency=time.monotonic() - start_time,
+                retries=retries,
+                success=success,
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Subgraph metrics hook failed: {e}")
+
+
+def _is_retryable_subgraph_error(error: Exception) -> bool:
+    return is_indexer_error(error) or isinstance(
+        error, (requests.ConnectionError, requests.Timeout)
+    )
 
 
 def _fetch_subgraph_data(
@@ -338,6 +639,30 @@ def _fetch_subgraph_data(
     Raises:
         Exception: If the HTTP request fails or returns a non-200 status code.
     """
+    subgraph_url, headers = _get_subgraph_request(network, indexer_id, use_hmt_subgraph)
+
+    request = _get_subgraph_session(subgraph_url).post(
+        subgraph_url,
+        json={"query": query, "variables": params},
+        headers=headers,
+        timeout=_subgraph_transport.timeout,
+    )
+    if request.status_code == 200:
+        return request.json()
+    else:
+        raise Exception(
+            "Subgraph query failed. return code is {}. \n{}".format(
+                request.status_code, query
+            )
+        )
+
+
+def _get_subgraph_request(
+    network: Dict[str, Any],
+    indexer_id: Optional[str] = None,
+    use_hmt_subgraph: bool = False,
+) -> Tuple[str, Optional[Dict[str, str]]]:
+    """Resolve the subgraph URL and authorization headers for a request."""
     default_subgraph_url, default_subgraph_url_api_key = _resolve_subgraph_urls(
         network, use_hmt_subgraph
     )
@@ -356,17 +681,7 @@ def _fetch_subgraph_data(
         {"Authorization": f"Bearer {subgraph_api_key}"} if subgraph_api_key else None
     )
 
-    request = requests.post(
-        subgraph_url, json={"query": query, "variables": params}, headers=headers
-    )
-    if request.status_code == 200:
-        return request.json()
-    else:
-        raise Exception(
-            "Subgraph query failed. return code is {}. \n{}".format(
-                request.status_code, query
-            )
-        )
+    return subgraph_url, headers
 
 
 def _attach_indexer_id(url: str, indexer_id: Optional[str]) -> str:
@@ -461,9 +776,170 @@ def parse_transfer_transaction(
     return hmt_transferred and tx_balance is not None, tx_balance
 
 
+@dataclass
+class ContractCacheInfo:
+    """Counters of the process-wide ABI registry and contract instance cache.
+
+    Attributes:
+        abi_hits (int): Number of interface lookups served from the ABI registry.
+        abi_misses (int): Number of artifact files loaded from disk.
+        contract_hits (int): Number of contract lookups served from the cache.
+        contract_misses (int): Number of contract instances created.
+        contract_size (int): Number of contract instances currently cached.
+        contract_maxsize (int): Maximum number of contract instances kept.
+    """
+
+    abi_hits: int
+    abi_misses: int
+    contract_hits: int
+    contract_misses: int
+    contract_size: int
+    contract_maxsize: int
+
+
+class _ContractCache:
+    """Thread-safe registry of loaded artifacts and LRU of contract instances.
+
+    Artifacts are parsed once per file. Contract instances are keyed by
+    (chain id, address, interface) and bound to the Web3 instance that created
+    them, so a lookup from another Web3 instance replaces the cached entry.
+    """
+
+    def __init__(self, maxsize: int = CONTRACT_CACHE_MAX_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._interfaces: Dict[str, Dict[str, Any]] = {}
+        self._contracts: "OrderedDict[Tuple[int, str, Callable], Contract]" = (
+            OrderedDict()
+        )
+        self._abi_hits = 0
+        self._abi_misses = 0
+        self._contract_hits = 0
+        self._contract_misses = 0
+
+    def get_interface(self, contract_entrypoint: str) -> Dict[str, Any]:
+        key = os.path.realpath(contract_entrypoint)
+        with self._lock:
+            contract_interface = self._interfaces.get(key)
+            if contract_interface is not None:
+                self._abi_hits += 1
+                return contract_interface
+
+            with open(contract_entrypoint) as f:
+                contract_interface = json.load(f)
+
+            self._interfaces[key] = contract_interface
+            self._abi_misses += 1
+            return contract_interface
+
+    def get_contract(
+        self,
+        w3: Web3,
+        chain_id: int,
+        address: str,
+        get_interface: Callable[[], Dict[str, Any]],
+    ) -> Contract:
+        key = (chain_id, address.lower(), get_interface)
+        with self._lock:
+            contract = self._contracts.get(key)
+            if contract is not None and contract.w3 is w3:
+                self._contracts.move_to_end(key)
+                self._contract_hits += 1
+                return contract
+
+        contract = w3.eth.contract(address=address, abi=get_interface()["abi"])
+
+        with self._lock:
+            self._contracts[key] = contract
+            self._contracts.move_to_end(key)
+            self._contract_misses += 1
+            while len(self._contracts) > self.maxsize:
+                self._contracts.popitem(last=False)
+
+        return contract
+
+    def info(self) -> ContractCacheInfo:
+        with self._lock:
+            return ContractCacheInfo(
+                abi_hits=self._abi_hits,
+                abi_misses=self._abi_misses,
+                contract_hits=self._contract_hits,
+                contract_misses=self._contract_misses,
+                contract_size=len(self._contracts),
+                contract_maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._interfaces.clear()
+            self._contracts.clear()
+            self._abi_hits = 0
+            self._abi_misses = 0
+            self._contract_hits = 0
+            self._contract_misses = 0
+
+
+_contract_cache = _ContractCache()
+
+
+def get_contract(
+    w3: Web3,
+    chain_id: int,
+    address: str,
+    get_interface: Callable[[], Dict[str, Any]],
+) -> Contract:
+    """Get a cached contract instance for the given address.
+
+    Instances are kept in a process-wide LRU keyed by chain id, address and
+    interface, so repeated lookups do not rebuild the contract object.
+
+    Args:
+        w3 (Web3): Web3 instance the contract is bound to.
+        chain_id (int): Chain id of the network the contract is deployed on.
+        address (str): Address of the deployed contract.
+        get_interface (Callable[[], Dict[str, Any]]): Interface getter, e.g. `get_escrow_interface`.
+
+    Returns:
+        Contract instance bound to the given Web3 instance.
+
+    Example:
+        ```python
+        from human_protocol_sdk.utils import get_contract, get_escrow_interface
+
+        escrow_contract = get_contract(w3, w3.eth.chain_id, escrow_address, get_escrow_interface)
+        ```
+    """
+    return _contract_cache.get_contract(w3, chain_id, address, get_interface)
+
+
+def get_contract_cache_info() -> ContractCacheInfo:
+    """Get hit/miss counters of the ABI registry and contract instance cache.
+
+    Returns:
+        Snapshot of the cache counters.
+
+    Example:
+        ```python
+        from human_protocol_sdk.utils import get_contract_cache_info
+
+        info = get_contract_cache_info()
+        print(info.abi_hits, info.contract_hits)
+        ```
+    """
+    return _contract_cache.info()
+
+
+def clear_contract_cache() -> None:
+    """Drop all loaded artifacts and cached contract instances and reset the counters."""
+    _contract_cache.clear()
+
+
 def get_contract_interface(contract_entrypoint: str) -> Dict[str, Any]:
     """Retrieve the contract ABI and interface from a compiled artifact file.
 
+    Artifacts are loaded once per process; subsequent calls return the same
+    dictionary, which must not be modified.
+
     Args:
         contract_entrypoint (str): File path to the contract JSON artifact.
 
@@ -476,9 +952,7 @@ def get_contract_interface(contract_entrypoint: str) -> Dict[str, Any]:
         abi = interface["abi"]
         ```
     """
-    with open(contract_entrypoint) as f:
-        contract_interface = json.load(f)
-    return contract_interface
+    return _contract_cache.get_interface(contract_entrypoint)
 
 
 def get_erc20_interface() -> Dict[str, Any]:
@@ -573,6 +1047,179 @@ def get_kvstore_interface() -> Dict[str, Any]:
     )
 
 
+_MULTICALL3_INTERFACE = {
+    "abi": [
+        {
+            "inputs": [
+                {
+                    "components": [
+                        {"name": "target", "type": "address"},
+                        {"name": "allowFailure", "type": "bool"},
+                        {"name": "callData", "type": "bytes"},
+                    ],
+                    "name": "calls",
+                    "type": "tuple[]",
+                }
+            ],
+            "name": "aggregate3",
+            "outputs": [
+                {
+                    "components": [
+                        {"name": "success", "type": "bool"},
+                        {"name": "returnData", "type": "bytes"},
+                    ],
+                    "name": "returnData",
+                    "type": "tuple[]",
+                }
+            ],
+            "stateMutability": "payable",
+            "type": "function",
+        }
+    ]
+}
+
+
+def get_multicall3_interface() -> Dict[str, Any]:
+    """Retrieve the Multicall3 contract interface.
+
+    Only the `aggregate3` method is included.
+
+    Returns:
+        The Multicall3 contract interface containing the ABI.
+    """
+
+    return _MULTICALL3_INTERFACE
+
+
+def is_multicall_available(w3: Web3) -> bool:
+    """Check whether the Multicall3 contract is deployed on the connected network.
+
+    Args:
+        w3 (Web3): Web3 instance connected to the network.
+
+    Returns:
+        True if Multicall3 bytecode is present at `MULTICALL3_ADDRESS`, False otherwise.
+    """
+    try:
+        return len(w3.eth.get_code(MULTICALL3_ADDRESS)) > 0
+    except Exception:
+        return False
+
+
+def aggregate_calls(
+    w3: Web3,
+    chain_id: int,
+    calls: Sequence[ContractFunction],
+    use_multicall: bool = True,
+    batch_size: int = MULTICALL_BATCH_SIZE,
+) -> List[Tuple[bool, Any]]:
+    """Execute many read-only contract calls in as few RPC requests as possible.
+
+    Calls are sent in chunks of `batch_size` through Multicall3 `aggregate3`. When
+    Multicall3 is not available, each chunk is sent as a JSON-RPC batch of `eth_call`
+    requests instead. A failing call does not fail the others.
+
+    Args:
+        w3 (Web3): Web3 instance connected to the network.
+        chain_id (int): Chain id of the network.
+        calls (Sequence[ContractFunction]): Contract functions with bound arguments,
+            e.g. `contract.functions.status()`.
+        use_multicall (bool): Whether to aggregate the calls through Multicall3.
+        batch_size (int): Maximum number of calls per RPC request.
+
+    Returns:
+        A `(success, value)` tuple per call, in the order of `calls`. Single return
+        values are unwrapped; `value` is None for failed calls.
+
+    Example:
+        ```python
+        from human_protocol_sdk.utils import aggregate_calls
+
+        results = aggregate_calls(
+            w3,
+            w3.eth.chain_id,
+            [contract.functions.status(), contract.functions.manifest()],
+        )
+        ```
+    """
+    results: List[Tuple[bool, Any]] = []
+    for start in range(0, len(calls), batch_size):
+        chunk = calls[start : start + batch_size]
+        call_data = [_encode_call(w3, call) for call in chunk]
+        if use_multicall:
+            raw_results = _multicall(w3, chain_id, chunk, call_data)
+        else:
+            raw_results = _batch_call(w3, chunk, call_data)
+
+        for call, (success, data) in zip(chunk, raw_results):
+            if not success:
+                results.append((False, None))
+                continue
+            try:
+                results.append((True, _decode_call_result(w3, call, data)))
+            except Exception:
+                results.append((False, None))
+
+    return results
+
+
+def _encode_call(w3: Web3, call: ContractFunction) -> bytes:
+    return function_abi_to_4byte_selector(call.abi) + w3.codec.encode(
+        get_abi_input_types(call.abi), call.args or ()
+    )
+
+
+def _decode_call_result(w3: Web3, call: ContractFunction, data: bytes) -> Any:
+    output_types = get_abi_output_types(call.abi)
+    values = [
+        Web3.to_checksum_address(value) if output_type == "address" else value
+        for output_type, value in zip(output_types, w3.codec.decode(output_types, data))
+    ]
+    return values[0] if len(values) == 1 else tuple(values)
+
+
+def _multicall(
+    w3: Web3,
+    chain_id: int,
+    calls: Sequence[ContractFunction],
+    call_data: Sequence[bytes],
+) -> List[Tuple[bool, bytes]]:
+    multicall_contract = get_contract(
+        w3, chain_id, MULTICALL3_ADDRESS, get_multicall3_interface
+    )
+    return [
+        (success, data)
+        for success, data in multicall_contract.functions.aggregate3(
+            [(call.address, True, data) for call, data in zip(calls, call_data)]
+        ).call()
+    ]
+
+
+def _batch_call(
+    w3: Web3,
+    calls: Sequence[ContractFunction],
+    call_data: Sequence[bytes],
+) -> List[Tuple[bool, bytes]]:
+    try:
+        with w3.batch_requests() as batch:
+            for call, data in zip(calls, call_data):
+                batch.add(w3.eth.call({"to": call.address, "data": data}))
+            return [(True, bytes(data)) for data in batch.execute()]
+    except Exception as e:
+        # A single reverted call fails the whole batch, so retry the calls one by one
+        logger.debug(f"Batch request failed, falling back to single calls: {e}")
+
+    results: List[Tuple[bool, bytes]] = []
+    for call, data in zip(calls, call_data):
+        try:
+            results.append(
+                (True, bytes(w3.eth.call({"to": call.address, "data": data})))
+            )
+        except Exception:
+            results.append((False, b""))
+    return results
+
+
 def handle_error(e: Exception, exception_class: Type[Exception]) -> None:
     """Handle and translate errors raised during contract transactions.
 
@@ -14,12 +14,22 @@ Example:
 """
 
 import logging
-from typing import List, Optional
+import copy
+from typing import Iterator, List, Optional
 
 from web3 import Web3
 
-from human_protocol_sdk.constants import NETWORKS, ChainId
-from human_protocol_sdk.utils import SubgraphOptions, custom_gql_fetch
+from human_protocol_sdk.constants import NETWORKS, SUBGRAPH_PAGE_SIZE, ChainId
+from human_protocol_sdk.utils import (
+    PageCursor,
+    QueryPages,
+    QuerySteps,
+    SubgraphOptions,
+    SubgraphQuery,
+    custom_gql_fetch,
+    iter_query_pages,
+    run_query_steps,
+)
 from human_protocol_sdk.filter import WorkerFilter
 
 LOG = logging.getLogger("human_protocol_sdk.worker")
@@ -102,7 +112,16 @@ class WorkerUtils:
             )
             ```
         """
+        return run_query_steps(
+            WorkerUtils._get_workers_steps(filter, options), custom_gql_fetch
+        )
 
+    @staticmethod
+    def _get_workers_steps(
+        filter: WorkerFilter,
+        options: Optional[SubgraphOptions] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> QuerySteps[List[WorkerData]]:
         from human_protocol_sdk.gql.worker import get_workers_query
 
         workers = []
@@ -110,15 +129,16 @@ class WorkerUtils:
         if not network:
             raise WorkerUtilsError("Unsupported Chain ID")
 
-        workers_data = custom_gql_fetch(
+        workers_data = yield SubgraphQuery(
             network,
-            query=get_workers_query(filter),
+            query=get_workers_query(filter, cursor is not None),
             params={
                 "address": filter.worker_address,
                 "orderBy": filter.order_by,
                 "orderDirection": filter.order_direction.value,
                 "first": filter.first,
                 "skip": filter.skip,
+                **(cursor.to_params() if cursor else {}),
             },
             options=options,
         )
@@ -144,6 +164,67 @@ class WorkerUtils:
 
         return workers
 
+    @staticmethod
+    def iter_workers(
+        filter: WorkerFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Iterator[WorkerData]:
+        """Iterate over all workers matching the provided filter criteria.
+
+        Pages through the subgraph by ID instead of ``skip``, so deep pages are as
+        fast as the first one and there is no limit on the number of results. Records
+        are parsed and yielded lazily, holding one page in memory.
+        ``first``, ``skip`` and ``order_by`` of the filter are ignored.
+
+        Args:
+            filter (WorkerFilter): Filter parameters including chain ID and worker address.
+            options (Optional[SubgraphOptions]): Optional configuration for subgraph requests.
+            page_size (int): Number of records requested per page (max 1000).
+            prefetch (bool): Fetch the next page in a background thread while the
+                current one is being consumed.
+
+        Returns:
+            Iterator over all matching records.
+
+        Raises:
+            WorkerUtilsError: Raised on first iteration for the same reasons as ``get_workers``.
+
+        Example:
+            ```python
+            from human_protocol_sdk.constants import ChainId
+            from human_protocol_sdk.worker import WorkerUtils, WorkerFilter
+
+            for worker in WorkerUtils.iter_workers(
+                WorkerFilter(chain_id=ChainId.POLYGON_AMOY)
+            ):
+                print(worker.address, worker.payout_count)
+            ```
+        """
+        return iter_query_pages(
+            WorkerUtils._get_workers_pages(filter, options, page_size),
+            custom_gql_fetch,
+            prefetch,
+        )
+
+    @staticmethod
+    def _get_workers_pages(
+        filter: WorkerFilter,
+        options: Optional[SubgraphOptions] = None,
+        page_size: int = SUBGRAPH_PAGE_SIZE,
+    ) -> QueryPages[WorkerData]:
+        page_filter = copy.copy(filter)
+        page_filter.first = min(max(page_size, 1), SUBGRAPH_PAGE_SIZE)
+        page_filter.skip = 0
+        page_filter.order_by = "id"
+
+        return QueryPages(
+            lambda cursor: WorkerUtils._get_workers_steps(page_filter, options, cursor),
+            lambda worker: PageCursor(worker.id),
+            page_filter.first,
+        )
+
     @staticmethod
     def get_worker(
         chain_id: ChainId,
@@ -179,7 +260,17 @@ class WorkerUtils:
                 print(f"Payout count: {worker.payout_count}")
             ```
         """
+        return run_query_steps(
+            WorkerUtils._get_worker_steps(chain_id, worker_address, options),
+            custom_gql_fetch,
+        )
 
+    @staticmethod
+    def _get_worker_steps(
+        chain_id: ChainId,
+        worker_address: str,
+        options: Optional[SubgraphOptions] = None,
+    ) -> QuerySteps[Optional[WorkerData]]:
         from human_protocol_sdk.gql.worker import get_worker_query
 
         network = NETWORKS.get(chain_id)
@@ -190,7 +281,7 @@ class WorkerUtils:
             raise WorkerUtilsError(f"Invalid worker address: {worker_address}")
 
         network = NETWORKS[chain_id]
-        worker_data = custom_gql_fetch(
+        worker_data = yield SubgraphQuery(
             network,
             query=get_worker_query(),
             params={"address": worker_address.lower()},
@@ -0,0 +1,158 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from human_protocol_sdk.aio import EscrowUtils
+from human_protocol_sdk.constants import NETWORKS, ChainId, Status
+from human_protocol_sdk.escrow import EscrowClientError
+from human_protocol_sdk.escrow import EscrowUtils as SyncEscrowUtils
+from human_protocol_sdk.filter import EscrowFilter, StatusEventFilter
+from human_protocol_sdk.gql.escrow import get_escrow_query, get_escrows_query
+
+mock_escrow = {
+    "id": "0x1234567890123456789012345678901234567891",
+    "address": "0x1234567890123456789012345678901234567891",
+    "amountPaid": "1000000000000000000",
+    "balance": "1000000000000000000",
+    "count": "1",
+    "factoryAddress": "0x1234567890123456789012345678901234567890",
+    "launcher": "0x1234567890123456789012345678901234567891",
+    "status": "Pending",
+    "token": "0x1234567890123456789012345678901234567891",
+    "totalFundedAmount": "1000000000000000000",
+    "createdAt": "1683813973",
+}
+
+
+class TestAsyncEscrowUtils(unittest.IsolatedAsyncioTestCase):
+    async def test_get_escrows(self):
+        escrow_filter = EscrowFilter(chain_id=ChainId.POLYGON_AMOY)
+        response = {"data": {"escrows": [mock_escrow]}}
+
+        with patch(
+            "human_protocol_sdk.aio.escrow.custom_gql_fetch",
+            new_callable=AsyncMock,
+            return_value=response,
+        ) as mock_function:
+            escrows = await EscrowUtils.get_escrows(escrow_filter)
+
+        mock_function.assert_awaited_once()
+        args, kwargs = mock_function.await_args
+        self.assertEqual(args, (NETWORKS[ChainId.POLYGON_AMOY],))
+        self.assertEqual(kwargs["query"], get_escrows_query(escrow_filter))
+        self.assertIsNone(kwargs["options"])
+
+        self.assertEqual(len(escrows), 1)
+        self.assertEqual(escrows[0].address, mock_escrow["address"])
+        self.assertEqual(escrows[0].balance, int(mock_escrow["balance"]))
+
+    async def test_get_escrow_matches_sync_result(self):
+        response = {"data": {"escrow": mock_escrow}}
+
+        with patch(
+            "human_protocol_sdk.aio.escrow.custom_gql_fetch",
+            new_callable=AsyncMock,
+            return_value=response,
+        ) as mock_async, patch(
+            "human_protocol_sdk.escrow.escrow_utils.custom_gql_fetch",
+            return_value=response,
+        ) as mock_sync:
+            escrow = await EscrowUtils.get_escrow(
+                ChainId.POLYGON_AMOY, "0x1234567890123456789012345678901234567890"
+            )
+            sync_escrow = SyncEscrowUtils.get_escrow(
+                ChainId.POLYGON_AMOY, "0x1234567890123456789012345678901234567890"
+            )
+
+        mock_async.assert_awaited_once_with(
+            NETWORKS[ChainId.POLYGON_AMOY],
+            query=get_escrow_query(),
+            params={"escrowAddress": "0x1234567890123456789012345678901234567890"},
+            options=None,
+        )
+        self.assertEqual(mock_async.await_args, mock_sync.call_args)
+        self.assertEqual(escrow.__dict__, sync_escrow.__dict__)
+
+    async def test_get_escrow_empty_data(self):
+        with patch(
+            "human_protocol_sdk.aio.escrow.custom_gql_fetch",
+            new_callable=AsyncMock,
+            return_value={"data": {"escrow": None}},
+        ):
+            escrow = await EscrowUtils.get_escrow(
+                ChainId.POLYGON_AMOY, "0x1234567890123456789012345678901234567890"
+            )
+
+        self.assertIsNone(escrow)
+
+    async def test_get_escrow_invalid_address(self):
+        with patch(
+            "human_protocol_sdk.aio.escrow.custom_gql_fetch", new_callable=AsyncMock
+        ) as mock_function:
+            with self.assertRaises(EscrowClientError) as cm:
+                await EscrowUtils.get_escrow(ChainId.POLYGON_AMOY, "invalid_address")
+
+        self.assertEqual("Invalid escrow address: invalid_address", str(cm.exception))
+        mock_function.assert_not_awaited()
+
+    async def test_get_status_events(self):
+        response = {
+            "data": {
+                "escrowStatusEvents": [
+                    {
+                        "timestamp": "1620000000",
+                        "escrowAddress": "0x123",
+                        "status": "Pending",
+                        "block": "100",
+                        "txHash": "0xabc",
+                    }
+                ]
+            }
+        }
+
+        with patch(
+            "human_protocol_sdk.aio.escrow.custom_gql_fetch",
+            new_callable=AsyncMock,
+            return_value=response,
+        ):
+            events = await EscrowUtils.get_status_events(
+                StatusEventFilter(
+                    chain_id=ChainId.POLYGON_AMOY, statuses=[Status.Pending]
+                )
+            )
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].timestamp, 1620000000000)
+        self.assertEqual(events[0].chain_id, ChainId.POLYGON_AMOY)
+
+    async def test_iter_escrows(self):
+        second_escrow = {**mock_escrow, "id": "0x2", "address": "0x2"}
+
+        with patch(
+            "human_protocol_sdk.aio.escrow.custom_gql_fetch",
+            new_callable=AsyncMock,
+            side_effect=[
+                {"data": {"escrows": [mock_escrow]}},
+                {"data": {"escrows": [second_escrow]}},
+                {"data": {"escrows": []}},
+            ],
+        ) as mock_function:
+            escrows = [
+                escrow
+                async for escrow in EscrowUtils.iter_escrows(
+                    EscrowFilter(chain_id=ChainId.POLYGON_AMOY),
+                    page_size=1,
+                    prefetch=True,
+                )
+            ]
+
+        self.assertEqual(
+            [escrow.address for escrow in escrows], [mock_escrow["address"], "0x2"]
+        )
+        self.assertEqual(mock_function.await_count, 3)
+        params = mock_function.await_args.kwargs["params"]
+        self.assertEqual(params["cursorId"], "0x2")
+        self.assertEqual(params["cursorValue"], mock_escrow["createdAt"])
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
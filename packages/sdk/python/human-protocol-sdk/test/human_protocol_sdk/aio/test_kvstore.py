@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from web3 import Web3
+
+from human_protocol_sdk.aio import KVStoreUtils
+from human_protocol_sdk.constants import ChainId
+from human_protocol_sdk.kvstore import KVStoreClientError
+
+
+class TestAsyncKVStoreUtils(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.address = "0x1234567890123456789012345678901234567890"
+        self.content = "public key"
+        self.content_hash = Web3.keccak(text=self.content).hex()
+
+    def mock_kvstore(self, values):
+        return AsyncMock(
+            side_effect=[{"data": {"kvstores": [{"value": value}]}} for value in values]
+        )
+
+    async def test_get(self):
+        with patch(
+            "human_protocol_sdk.aio.kvstore.custom_gql_fetch",
+            self.mock_kvstore(["https://example.com"]),
+        ):
+            value = await KVStoreUtils.get(ChainId.LOCALHOST, self.address, "url")
+
+        self.assertEqual(value, "https://example.com")
+
+    async def test_get_public_key(self):
+        with patch(
+            "human_protocol_sdk.aio.kvstore.custom_gql_fetch",
+            self.mock_kvstore(["https://example.com/pk", self.content_hash]),
+        ), patch(
+            "human_protocol_sdk.aio.kvstore.fetch_text",
+            new_callable=AsyncMock,
+            return_value=self.content,
+        ) as mock_fetch_text:
+            public_key = await KVStoreUtils.get_public_key(
+                ChainId.LOCALHOST, self.address
+            )
+
+        self.assertEqual(public_key, self.content)
+        mock_fetch_text.assert_awaited_with("https://example.com/pk")
+
+    async def test_get_file_url_and_verify_hash_invalid_hash(self):
+        with patch(
+            "human_protocol_sdk.aio.kvstore.custom_gql_fetch",
+            self.mock_kvstore(["https://example.com", "0xinvalid"]),
+        ), patch(
+            "human_protocol_sdk.aio.kvstore.fetch_text",
+            new_callable=AsyncMock,
+            return_value=self.content,
+        ):
+            with self.assertRaises(KVStoreClientError) as cm:
+                await KVStoreUtils.get_file_url_and_verify_hash(
+                    ChainId.LOCALHOST, self.address
+                )
+
+        self.assertEqual("Invalid hash", str(cm.exception))
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
@@ -0,0 +1,139 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+
+from human_protocol_sdk.aio.utils import (
+    close_http_sessions,
+    custom_gql_fetch,
+    get_http_session,
+    run_query_steps,
+)
+from human_protocol_sdk.constants import NETWORKS, ChainId
+from human_protocol_sdk.utils import (
+    SubgraphOptions,
+    SubgraphQuery,
+    SubgraphTransportOptions,
+    configure_subgraph_transport,
+)
+
+
+class TestAsyncCustomGqlFetch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.network = NETWORKS[ChainId.LOCALHOST]
+        self.query = "query Test { test }"
+        self.variables = {"foo": "bar"}
+
+    async def test_returns_response_without_options(self):
+        expected = {"data": {"ok": True}}
+        with patch(
+            "human_protocol_sdk.aio.utils._fetch_subgraph_data",
+            new_callable=AsyncMock,
+            return_value=expected,
+        ) as mock_fetch:
+            result = await custom_gql_fetch(self.network, self.query, self.variables)
+
+        self.assertEqual(result, expected)
+        mock_fetch.assert_awaited_once_with(
+            self.network, self.query, self.variables, use_hmt_subgraph=False
+        )
+
+    async def test_retries_on_connection_error(self):
+        expected = {"data": {"ok": True}}
+        with patch(
+            "human_protocol_sdk.aio.utils._fetch_subgraph_data",
+            new_callable=AsyncMock,
+            side_effect=[aiohttp.ClientConnectionError("reset"), expected],
+        ) as mock_fetch, patch(
+            "human_protocol_sdk.aio.utils.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            result = await custom_gql_fetch(
+                self.network,
+                self.query,
+                self.variables,
+                options=SubgraphOptions(max_retries=2, base_delay=100),
+            )
+
+        self.assertEqual(result, expected)
+        self.assertEqual(mock_fetch.await_count, 2)
+        mock_sleep.assert_awaited_once()
+
+    async def test_raises_non_retryable_error(self):
+        error = Exception("Syntax error")
+        with patch(
+            "human_protocol_sdk.aio.utils._fetch_subgraph_data",
+            new_callable=AsyncMock,
+            side_effect=error,
+        ) as mock_fetch, patch(
+            "human_protocol_sdk.aio.utils.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            with self.assertRaises(Exception) as ctx:
+                await custom_gql_fetch(
+                    self.network,
+                    self.query,
+                    self.variables,
+                    options=SubgraphOptions(max_retries=3, base_delay=100),
+                )
+
+        self.assertIs(ctx.exception, error)
+        self.assertEqual(mock_fetch.await_count, 1)
+        mock_sleep.assert_not_awaited()
+
+    async def test_raises_when_retry_config_incomplete(self):
+        with self.assertRaises(ValueError):
+            await custom_gql_fetch(
+                self.network,
+                self.query,
+                self.variables,
+                options=SubgraphOptions(max_retries=3),
+            )
+
+
+class TestAsyncHttpSession(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_http_sessions()
+        configure_subgraph_transport(SubgraphTransportOptions())
+
+    async def test_reuses_session(self):
+        session = await get_http_session()
+        self.assertIs(await get_http_session(), session)
+
+    async def test_recreates_session_after_reconfiguration(self):
+        session = await get_http_session()
+        configure_subgraph_transport(SubgraphTransportOptions(pool_maxsize=3))
+
+        new_session = await get_http_session()
+
+        self.assertIsNot(new_session, session)
+        self.assertTrue(session.closed)
+        self.assertEqual(new_session.connector.limit_per_host, 3)
+
+
+class TestAsyncRunQuerySteps(unittest.IsolatedAsyncioTestCase):
+    async def test_sends_responses_to_steps(self):
+        def steps():
+            first = yield SubgraphQuery("network", query="first")
+            second = yield SubgraphQuery("network", query="second")
+            return first["value"] + second["value"]
+
+        fetch = AsyncMock(side_effect=[{"value": 1}, {"value": 2}])
+
+        result = await run_query_steps(steps(), fetch)
+
+        self.assertEqual(result, 3)
+        fetch.assert_any_await("network", query="first")
+        fetch.assert_any_await("network", query="second")
+
+    async def test_returns_without_fetching(self):
+        def steps():
+            return []
+            yield
+
+        fetch = AsyncMock()
+
+        self.assertEqual(await run_query_steps(steps(), fetch), [])
+        fetch.assert_not_awaited()
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
@@ -0,0 +1,182 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from test.human_protocol_sdk.utils.encryption import (
+    private_key,
+    private_key2,
+    private_key3,
+    public_key,
+    public_key2,
+    public_key3,
+    encrypted_message,
+    passphrase,
+    encrypted_unsigned_message,
+    message,
+)
+
+from human_protocol_sdk.encryption import Encryption, Keyring
+from pgpy.errors import PGPDecryptionError
+
+
+class TestKeyring(unittest.TestCase):
+    def setUp(self):
+        self.keyring = Keyring()
+
+    def tearDown(self):
+        self.keyring.close()
+
+    def test_add_public_key(self):
+        fingerprint = self.keyring.add_public_key(public_key)
+
+        self.assertEqual(fingerprint, "19640D5E12A9A76871BB17AD0C97AC86EF7CFC65")
+        self.assertIn(fingerprint, self.keyring)
+        self.assertIn(
+            "1964 0D5E 12A9 A768 71BB  17AD 0C97 AC86 EF7C FC65", self.keyring
+        )
+        self.assertEqual(self.keyring.add_public_key(public_key), fingerprint)
+
+    def test_add_public_key_invalid(self):
+        with self.assertRaises(ValueError):
+            self.keyring.add_public_key("invalid_public_key")
+
+        with self.assertRaises(ValueError) as cm:
+            self.keyring.add_public_key(private_key)
+        self.assertEqual("Invalid key: expected a public key", str(cm.exception))
+
+    def test_add_private_key(self):
+        fingerprint = self.keyring.add_private_key(private_key3, passphrase)
+
+        self.assertEqual(fingerprint, self.keyring.add_public_key(public_key3))
+        self.assertEqual(
+            self.keyring.add_private_key(private_key3, passphrase), fingerprint
+        )
+
+    def test_add_locked_private_key(self):
+        with self.assertRaises(ValueError) as cm:
+            self.keyring.add_private_key(private_key3)
+        self.assertEqual("Private key locked. Passphrase needed", str(cm.exception))
+
+    def test_add_locked_private_key_with_wrong_passphrase(self):
+        with self.assertRaises(PGPDecryptionError) as cm:
+            self.keyring.add_private_key(private_key3, "Test")
+        self.assertEqual("Passphrase was incorrect!", str(cm.exception))
+
+        self.keyring.add_private_key(private_key3, passphrase)
+        with self.assertRaises(PGPDecryptionError):
+            self.keyring.add_private_key(private_key3, "Test")
+
+    def test_add_private_key_invalid(self):
+        with self.assertRaises(ValueError) as cm:
+            self.keyring.add_private_key(public_key)
+        self.assertEqual("Invalid key: expected a private key", str(cm.exception))
+
+    def test_encrypt(self):
+        encrypted = self.keyring.encrypt(message, [public_key2, public_key3])
+
+        self.assertEqual(Encryption(private_key2).decrypt(encrypted), message.encode())
+        self.assertEqual(
+            Encryption(private_key3, passphrase).decrypt(encrypted), message.encode()
+        )
+
+    def test_encrypt_by_fingerprint(self):
+        fingerprint = self.keyring.add_public_key(public_key2)
+
+        encrypted = self.keyring.encrypt(message, [fingerprint])
+
+        self.assertEqual(Encryption(private_key2).decrypt(encrypted), message.encode())
+
+    def test_encrypt_unknown_key(self):
+        with self.assertRaises(ValueError) as cm:
+            self.keyring.encrypt(message, ["0C97AC86EF7CFC65"])
+        self.assertEqual("Unknown key: 0C97AC86EF7CFC65", str(cm.exception))
+
+    def test_sign_and_encrypt(self):
+        signer = self.keyring.add_private_key(private_key)
+
+        encrypted = self.keyring.encrypt(message, [public_key2], private_key=signer)
+
+        self.assertEqual(
+            Encryption(private_key2).decrypt(encrypted, public_key), message.encode()
+        )
+
+    def test_encrypt_many(self):
+        messages = [f"{message} {i}" for i in range(5)]
+
+        encrypted = self.keyring.encrypt_many(messages, [public_key2])
+
+        self.assertEqual(len(set(encrypted)), len(messages))
+        encryption = Encryption(private_key2)
+        self.assertEqual(
+            [encryption.decrypt(m) for m in encrypted], [m.encode() for m in messages]
+        )
+
+    def test_decrypt(self):
+        self.keyring.add_private_key(private_key2)
+
+        self.assertEqual(self.keyring.decrypt(encrypted_message), message.encode())
+        self.assertEqual(
+            self.keyring.decrypt(encrypted_message, public_key), message.encode()
+        )
+
+    def test_decrypt_with_protected_key(self):
+        self.keyring.add_private_key(private_key3, passphrase)
+
+        self.assertEqual(
+            self.keyring.decrypt(encrypted_unsigned_message), message.encode()
+        )
+
+    def test_decrypt_without_private_key(self):
+        self.keyring.add_private_key(private_key)
+
+        with self.assertRaises(ValueError) as cm:
+            self.keyring.decrypt(encrypted_message)
+        self.assertEqual(
+            "Failed to decrypt message: no private key for the message recipients",
+            str(cm.exception),
+        )
+
+    def test_decrypt_with_wrong_public_key(self):
+        self.keyring.add_private_key(private_key2)
+
+        with self.assertRaises(ValueError) as cm:
+            self.keyring.decrypt(encrypted_message, public_key3)
+        self.assertEqual(
+            "Failed to decrypt message: Could not find signature with this public key",
+            str(cm.exception),
+        )
+
+    def test_decrypt_many(self):
+        signer = self.keyring.add_private_key(private_key)
+        self.keyring.add_private_key(private_key3, passphrase)
+        messages = [f"{message} {i}" for i in range(5)]
+        encrypted = self.keyring.encrypt_many(
+            messages, [public_key3], private_key=signer
+        )
+
+        decrypted = self.keyring.decrypt_many(encrypted, public_key=signer)
+
+        self.assertEqual(decrypted, [m.encode() for m in messages])
+
+    def test_concurrent_use(self):
+        self.keyring.add_private_key(private_key3, passphrase)
+        messages = [f"{message} {i}" for i in range(8)]
+
+        def roundtrip(m: str) -> bytes:
+            return self.keyring.decrypt(self.keyring.encrypt(m, [public_key3]))
+
+        with ThreadPoolExecutor(4) as pool:
+            decrypted = list(pool.map(roundtrip, messages))
+
+        self.assertEqual(decrypted, [m.encode() for m in messages])
+
+    def test_close(self):
+        with Keyring() as keyring:
+            fingerprint = keyring.add_private_key(private_key3, passphrase)
+            key = keyring._get_private_key(fingerprint)
+            self.assertTrue(key.is_unlocked)
+
+        self.assertFalse(key.is_unlocked)
+        self.assertNotIn(fingerprint, keyring)
+
+
+if __name__ == "__main__":
+    unittest.main(exit=True)
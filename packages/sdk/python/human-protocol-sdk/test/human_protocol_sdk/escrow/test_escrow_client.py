@@ -1,13 +1,26 @@
 import unittest
 from datetime import datetime
 from test.human_protocol_sdk.utils import DEFAULT_GAS_PAYER_PRIV
+from test.human_protocol_sdk.utils.local_node import (
+    LOCAL_NODE_URL,
+    deploy_multicall3,
+    get_local_node_w3,
+)
 from types import SimpleNamespace
 from unittest.mock import MagicMock, PropertyMock, patch
 
-from human_protocol_sdk.constants import NETWORKS, ChainId, Status
+from human_protocol_sdk.constants import NETWORKS, ChainId, KVStoreKeys, Status
 from human_protocol_sdk.decorators import RequiresSignerError
-from human_protocol_sdk.escrow import EscrowClient, EscrowClientError, EscrowConfig
+from human_protocol_sdk.escrow import (
+    EscrowClient,
+    EscrowClientError,
+    EscrowConfig,
+    EscrowState,
+)
+from human_protocol_sdk.escrow.escrow_client import ESCROW_STATE_FIELDS
 from human_protocol_sdk.filter import EscrowFilter, FilterError
+from human_protocol_sdk.kvstore import KVStoreClient
+from human_protocol_sdk.staking import StakingClient
 from human_protocol_sdk.utils import WaitOptions
 from web3 import Web3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
@@ -3020,6 +3033,167 @@ class TestEscrowClient(unittest.TestCase):
             "Escrow address is not provided by the factory", str(cm.exception)
         )
 
+    def test_get_escrows_state(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+        oracle_address = "0x0000000000000000000000000000000000000001"
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_client.is_multicall_available",
+            return_value=True,
+        ) as mock_is_multicall_available, patch(
+            "human_protocol_sdk.escrow.escrow_client.aggregate_calls",
+            return_value=[(True, True), (True, 1), (True, 42), (True, oracle_address)],
+        ) as mock_aggregate_calls:
+            result = self.escrow.get_escrows_state(
+                [escrow_address],
+                fields=["status", "balance", "recording_oracle_address"],
+            )
+
+        mock_is_multicall_available.assert_called_once_with(self.escrow.w3)
+        mock_aggregate_calls.assert_called_once()
+        args, kwargs = mock_aggregate_calls.call_args
+        self.assertEqual(
+            [call.fn_name for call in args[2]],
+            ["hasEscrow", "status", "remainingFunds", "recordingOracle"],
+        )
+        self.assertTrue(kwargs["use_multicall"])
+        self.assertEqual(
+            result,
+            [
+                EscrowState(
+                    address=escrow_address,
+                    is_escrow=True,
+                    status=Status.Pending,
+                    balance=42,
+                    recording_oracle_address=oracle_address,
+                )
+            ],
+        )
+
+    def test_get_escrows_state_retries_legacy_getters(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_client.is_multicall_available",
+            return_value=False,
+        ), patch(
+            "human_protocol_sdk.escrow.escrow_client.aggregate_calls",
+            side_effect=[[(True, True), (False, None)], [(True, 42)]],
+        ) as mock_aggregate_calls:
+            result = self.escrow.get_escrows_state([escrow_address], fields=["balance"])
+
+        self.assertEqual(mock_aggregate_calls.call_count, 2)
+        args, kwargs = mock_aggregate_calls.call_args
+        self.assertEqual([call.fn_name for call in args[2]], ["getBalance"])
+        self.assertFalse(kwargs["use_multicall"])
+        self.assertEqual(result[0].balance, 42)
+
+    def test_get_escrows_state_not_factory_escrow(self):
+        escrow_address = "0x1234567890123456789012345678901234567890"
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_client.is_multicall_available",
+            return_value=True,
+        ), patch(
+            "human_protocol_sdk.escrow.escrow_client.aggregate_calls",
+            return_value=[(True, False), (True, 1)],
+        ):
+            result = self.escrow.get_escrows_state([escrow_address], fields=["status"])
+
+        self.assertEqual(result, [EscrowState(address=escrow_address, is_escrow=False)])
+
+    def test_get_escrows_state_invalid_address(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrows_state(["invalid_address"])
+        self.assertEqual(f"Invalid escrow address: invalid_address", str(cm.exception))
+
+    def test_get_escrows_state_invalid_field(self):
+        with self.assertRaises(EscrowClientError) as cm:
+            self.escrow.get_escrows_state(
+                ["0x1234567890123456789012345678901234567890"], fields=["invalid"]
+            )
+        self.assertEqual("Invalid escrow state field: invalid", str(cm.exception))
+
+
+class TestEscrowClientLocalNode(unittest.TestCase):
+    """`get_escrows_state` against escrows deployed on a local node."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.w3 = get_local_node_w3()
+        if cls.w3 is None:
+            raise unittest.SkipTest(f"No local node at {LOCAL_NODE_URL}")
+
+        network = NETWORKS[ChainId.LOCALHOST]
+        staking_client = StakingClient(cls.w3)
+        staking_client.approve_stake(Web3.to_wei(1, "ether"))
+        staking_client.stake(Web3.to_wei(1, "ether"))
+        # the oracles' fees are read from the KVStore on setup
+        KVStoreClient(cls.w3).set(KVStoreKeys.fee.value, "1")
+
+        escrow_client = EscrowClient(cls.w3)
+        oracle_address = cls.w3.eth.default_account
+        escrow_config = EscrowConfig(
+            recording_oracle_address=oracle_address,
+            reputation_oracle_address=oracle_address,
+            exchange_oracle_address=oracle_address,
+            manifest="https://example.com/manifest.json",
+            hash="manifest-hash",
+        )
+
+        launched_escrow = escrow_client.create_escrow(
+            network["hmt_address"], "job-requester"
+        )
+        pending_escrow = escrow_client.create_escrow(
+            network["hmt_address"], "job-requester"
+        )
+        escrow_client.fund(pending_escrow, Web3.to_wei(2, "ether"))
+        escrow_client.setup(pending_escrow, escrow_config)
+        escrow_client.store_results(
+            pending_escrow,
+            "https://example.com/intermediate-results.json",
+            "intermediate-results-hash",
+            Web3.to_wei(1, "ether"),
+        )
+
+        cls.escrow_addresses = [launched_escrow, pending_escrow]
+        cls.not_escrow_address = network["hmt_address"]
+
+    def assert_matches_field_getters(self, escrow_client: EscrowClient):
+        states = escrow_client.get_escrows_state(
+            [*self.escrow_addresses, self.not_escrow_address]
+        )
+
+        self.assertEqual(len(states), len(self.escrow_addresses) + 1)
+        for escrow_address, state in zip(self.escrow_addresses, states):
+            self.assertEqual(state.address, escrow_address)
+            self.assertTrue(state.is_escrow)
+            for field in ESCROW_STATE_FIELDS:
+                with self.subTest(escrow_address=escrow_address, field=field):
+                    self.assertEqual(
+                        getattr(state, field),
+                        getattr(escrow_client, f"get_{field}")(escrow_address),
+                    )
+        self.assertFalse(states[-1].is_escrow)
+
+        self.assertEqual(
+            [state.status for state in states[:-1]],
+            [Status.Launched, Status.Pending],
+        )
+
+    def test_get_escrows_state_with_batch_requests(self):
+        escrow_client = EscrowClient(self.w3)
+        escrow_client._multicall_available = False
+
+        self.assert_matches_field_getters(escrow_client)
+
+    def test_get_escrows_state_with_multicall(self):
+        deploy_multicall3(self.w3)
+        escrow_client = EscrowClient(self.w3)
+
+        self.assert_matches_field_getters(escrow_client)
+        self.assertTrue(escrow_client._multicall_available)
+
 
 if __name__ == "__main__":
     unittest.main(exit=True)
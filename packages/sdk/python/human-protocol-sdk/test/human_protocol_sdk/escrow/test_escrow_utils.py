@@ -5,6 +5,7 @@ from unittest.mock import patch
 from human_protocol_sdk.constants import NETWORKS, ChainId, Status, OrderDirection
 from human_protocol_sdk.gql.escrow import (
     get_escrow_query,
+    get_escrows_by_addresses_query,
     get_escrows_query,
 )
 from human_protocol_sdk.escrow import (
@@ -766,6 +767,210 @@ class TestEscrowUtils(unittest.TestCase):
             EscrowUtils.get_cancellation_refund(ChainId.POLYGON_AMOY, "invalid_address")
         self.assertEqual("Invalid escrow address", str(cm.exception))
 
+    def test_iter_escrows(self):
+        def make_escrow(index, created_at):
+            return {
+                "id": f"0x{index:040x}",
+                "address": f"0x{index:040x}",
+                "amountPaid": "0",
+                "balance": "0",
+                "count": "0",
+                "factoryAddress": "0x1234567890123456789012345678901234567890",
+                "launcher": "0x1234567890123456789012345678901234567890",
+                "status": "Pending",
+                "token": "0x1234567890123456789012345678901234567890",
+                "totalFundedAmount": "0",
+                "createdAt": str(created_at),
+            }
+
+        pages = [
+            {"data": {"escrows": [make_escrow(3, 300), make_escrow(2, 200)]}},
+            {"data": {"escrows": [make_escrow(1, 200)]}},
+        ]
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_utils.custom_gql_fetch",
+            side_effect=pages,
+        ) as mock_function:
+            escrow_filter = EscrowFilter(
+                chain_id=ChainId.POLYGON_AMOY, first=5, skip=20
+            )
+            escrows = list(EscrowUtils.iter_escrows(escrow_filter, page_size=2))
+
+        self.assertEqual(
+            [escrow.address for escrow in escrows],
+            [f"0x{index:040x}" for index in (3, 2, 1)],
+        )
+        self.assertEqual(mock_function.call_count, 2)
+        self.assertEqual((escrow_filter.first, escrow_filter.skip), (5, 20))
+
+        first_call, second_call = mock_function.call_args_list
+        self.assertEqual(first_call.kwargs["params"]["first"], 2)
+        self.assertEqual(first_call.kwargs["params"]["skip"], 0)
+        self.assertNotIn("cursorId", first_call.kwargs["params"])
+        self.assertNotIn("$cursorId", first_call.kwargs["query"])
+
+        self.assertEqual(second_call.kwargs["params"]["skip"], 0)
+        self.assertEqual(second_call.kwargs["params"]["cursorValue"], "200")
+        self.assertEqual(second_call.kwargs["params"]["cursorId"], f"0x{2:040x}")
+        self.assertIn(
+            "createdAt: $cursorValue, id_lt: $cursorId", second_call.kwargs["query"]
+        )
+
+    def test_iter_escrows_prefetch(self):
+        pages = [
+            {
+                "data": {
+                    "escrows": [
+                        {
+                            "id": "0x1",
+                            "address": "0x1",
+                            "amountPaid": "0",
+                            "balance": "0",
+                            "count": "0",
+                            "factoryAddress": "0x2",
+                            "launcher": "0x3",
+                            "status": "Pending",
+                            "token": "0x4",
+                            "totalFundedAmount": "0",
+                            "createdAt": "2",
+                        }
+                    ]
+                }
+            },
+            {"data": {"escrows": []}},
+        ]
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_utils.custom_gql_fetch",
+            side_effect=pages,
+        ) as mock_function:
+            escrows = list(
+                EscrowUtils.iter_escrows(
+                    EscrowFilter(chain_id=ChainId.POLYGON_AMOY),
+                    page_size=1,
+                    prefetch=True,
+                )
+            )
+
+        self.assertEqual([escrow.id for escrow in escrows], ["0x1"])
+        self.assertEqual(mock_function.call_count, 2)
+
+    def test_iter_status_events(self):
+        event = {
+            "id": "0xevent",
+            "timestamp": "1620000000",
+            "escrowAddress": "0x123",
+            "status": "Pending",
+            "block": "100",
+            "txHash": "0xabc",
+        }
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_utils.custom_gql_fetch",
+            side_effect=[
+                {"data": {"escrowStatusEvents": [event]}},
+                {"data": {"escrowStatusEvents": []}},
+            ],
+        ) as mock_function:
+            events = list(
+                EscrowUtils.iter_status_events(
+                    StatusEventFilter(
+                        chain_id=ChainId.POLYGON_AMOY,
+                        statuses=[Status.Pending],
+                        order_direction=OrderDirection.ASC,
+                    ),
+                    page_size=1,
+                )
+            )
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].id, "0xevent")
+        _, params = mock_function.call_args.args[1:]
+        self.assertEqual(params["cursorValue"], "1620000000")
+        self.assertEqual(params["cursorId"], "0xevent")
+        self.assertIn(
+            "timestamp: $cursorValue, id_gt: $cursorId",
+            mock_function.call_args.args[1],
+        )
+
+    def test_get_escrows_by_addresses(self):
+        addresses = [f"0x{index:040X}" for index in range(1, 1003)]
+        pages = [
+            {
+                "data": {
+                    "escrows": [
+                        {
+                            "id": addresses[0].lower(),
+                            "address": addresses[0].lower(),
+                            "amountPaid": "0",
+                            "balance": "10",
+                            "count": "0",
+                            "factoryAddress": "0x1234567890123456789012345678901234567890",
+                            "launcher": "0x1234567890123456789012345678901234567890",
+                            "status": "Pending",
+                            "token": "0x1234567890123456789012345678901234567890",
+                            "totalFundedAmount": "10",
+                            "createdAt": "1683811973",
+                        }
+                    ]
+                }
+            },
+            {"data": {"escrows": []}},
+        ]
+
+        with patch(
+            "human_protocol_sdk.escrow.escrow_utils.custom_gql_fetch",
+            side_effect=pages,
+        ) as mock_function:
+            escrows = EscrowUtils.get_escrows_by_addresses(
+                ChainId.POLYGON_AMOY, addresses + [addresses[0]]
+            )
+
+        self.assertEqual(list(escrows), [addresses[0].lower()])
+        self.assertEqual(escrows[addresses[0].lower()].balance, 10)
+
+        self.assertEqual(mock_function.call_count, 2)
+        first_call, second_call = mock_function.call_args_list
+        self.assertEqual(first_call.args, (NETWORKS[ChainId.POLYGON_AMOY],))
+        self.assertEqual(first_call.kwargs["query"], get_escrows_by_addresses_query())
+        self.assertEqual(
+            first_call.kwargs["params"],
+            {
+                "escrowAddresses": [address.lower() for address in addresses[:1000]],
+                "first": 1000,
+            },
+        )
+        self.assertEqual(
+            second_call.kwargs["params"],
+            {
+                "escrowAddresses": [address.lower() for address in addresses[1000:]],
+                "first": 2,
+            },
+        )
+
+    def test_get_escrows_by_addresses_invalid_address(self):
+        with patch(
+            "human_protocol_sdk.escrow.escrow_utils.custom_gql_fetch"
+        ) as mock_function:
+            with self.assertRaises(EscrowClientError) as cm:
+                EscrowUtils.get_escrows_by_addresses(
+                    ChainId.POLYGON_AMOY,
+                    ["0x1234567890123456789012345678901234567890", "invalid_address"],
+                )
+
+        self.assertEqual("Invalid escrow address: invalid_address", str(cm.exception))
+        mock_function.assert_not_called()
+
+    def test_get_escrows_by_addresses_empty(self):
+        with patch(
+            "human_protocol_sdk.escrow.escrow_utils.custom_gql_fetch"
+        ) as mock_function:
+            escrows = EscrowUtils.get_escrows_by_addresses(ChainId.POLYGON_AMOY, [])
+
+        self.assertEqual(escrows, {})
+        mock_function.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main(exit=True)
@@ -1,3 +1,4 @@
+import re
 import unittest
 from unittest.mock import patch
 
@@ -132,6 +133,57 @@ class TestStakingUtils(unittest.TestCase):
             mock_function.assert_called_once()
             self.assertEqual(len(stakers), 0)
 
+    def test_iter_stakers(self):
+        with patch(
+            "human_protocol_sdk.staking.staking_utils.custom_gql_fetch",
+            side_effect=[
+                {
+                    "data": {
+                        "stakers": [
+                            {
+                                "id": "0x1",
+                                "address": "0x1",
+                                "stakedAmount": "1000",
+                                "lockedAmount": "0",
+                                "withdrawnAmount": "0",
+                                "slashedAmount": "0",
+                                "lockedUntilTimestamp": "0",
+                                "lastDepositTimestamp": "0",
+                            }
+                        ]
+                    }
+                },
+                {"data": {"stakers": []}},
+            ],
+        ) as mock_function:
+            stakers = list(
+                StakingUtils.iter_stakers(
+                    StakersFilter(chain_id=ChainId.POLYGON_AMOY), page_size=1
+                )
+            )
+
+        self.assertEqual([staker.id for staker in stakers], ["0x1"])
+        params = mock_function.call_args.kwargs["params"]
+        self.assertEqual(params["orderBy"], "id")
+        self.assertEqual(params["cursorId"], "0x1")
+        self.assertNotIn("cursorValue", params)
+        self.assertIn("id_lt: $cursorId", mock_function.call_args.kwargs["query"])
+
+    def test_get_stakers_query_with_cursor(self):
+        query = get_stakers_query(
+            StakersFilter(chain_id=ChainId.POLYGON_AMOY, min_staked_amount="1"),
+            cursor=True,
+        )
+
+        self.assertIn("$cursorId: Bytes", query)
+        self.assertIn("id_lt: $cursorId", query)
+        self.assertNotIn("$cursorValue", query)
+        # graph-node rejects queries declaring unused variables, except the
+        # amount filters, which are always declared
+        for variable in re.findall(r"(\$\w+):", query):
+            if "Amount" not in variable:
+                self.assertGreater(query.count(variable), 1, variable)
+
     def test_get_stakers_invalid_network(self):
         with self.assertRaises(ValueError) as cm:
             filter = StakersFilter(chain_id=ChainId(123))
@@ -1,14 +1,35 @@
+import json
 import os
+import tempfile
+import requests
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from validators import ValidationError
+from web3 import Web3
+from web3.providers.rpc import HTTPProvider
 
+from eth_abi import encode
+from human_protocol_sdk.constants import MULTICALL3_ADDRESS
 from human_protocol_sdk.utils import (
     _attach_indexer_id,
+    _ContractCache,
     _fetch_subgraph_data,
+    _get_subgraph_session,
+    PageCursor,
+    QueryPages,
     SubgraphOptions,
+    SubgraphQuery,
+    SubgraphQueryMetrics,
+    SubgraphTransportOptions,
+    aggregate_calls,
+    clear_contract_cache,
+    configure_subgraph_transport,
     custom_gql_fetch,
+    get_contract,
+    get_contract_cache_info,
+    get_contract_interface,
     is_indexer_error,
+    iter_query_pages,
     validate_url,
 )
 
@@ -95,6 +116,108 @@ class TestGetDataFromSubgraph(unittest.TestCase):
         self.assertEqual(mock_fetch.call_count, 2)
         mock_sleep.assert_called_once()
 
+    def test_retries_with_exponential_backoff(self):
+        options = SubgraphOptions(max_retries=3, base_delay=100)
+        errors = [
+            make_graphql_error({"errors": [{"message": "bad indexers: stalled"}]})
+            for _ in range(3)
+        ]
+
+        with patch(
+            "human_protocol_sdk.utils._fetch_subgraph_data",
+            side_effect=[*errors, {"data": {"ok": True}}],
+        ), patch("human_protocol_sdk.utils.time.sleep") as mock_sleep:
+            custom_gql_fetch(self.network, self.query, self.variables, options=options)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 3)
+        for attempt, delay in enumerate(delays):
+            max_delay = 0.1 * 2**attempt
+            self.assertGreaterEqual(delay, max_delay / 2)
+            self.assertLessEqual(delay, max_delay)
+
+    def test_retries_on_connection_error(self):
+        options = SubgraphOptions(max_retries=1, base_delay=10)
+
+        with patch(
+            "human_protocol_sdk.utils._fetch_subgraph_data",
+            side_effect=[requests.ConnectionError("reset"), {"data": {"ok": True}}],
+        ) as mock_fetch, patch("human_protocol_sdk.utils.time.sleep"):
+            result = custom_gql_fetch(
+                self.network, self.query, self.variables, options=options
+            )
+
+        self.assertEqual(result, {"data": {"ok": True}})
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    def test_reports_query_metrics(self):
+        metrics_hook = Mock()
+        configure_subgraph_transport(
+            SubgraphTransportOptions(metrics_hook=metrics_hook)
+        )
+        self.addCleanup(configure_subgraph_transport, SubgraphTransportOptions())
+        options = SubgraphOptions(max_retries=2, base_delay=10)
+        error = make_graphql_error({"errors": [{"message": "bad indexers: syncing"}]})
+
+        with patch(
+            "human_protocol_sdk.utils._fetch_subgraph_data",
+            side_effect=[error, {"data": {"ok": True}}],
+        ), patch("human_protocol_sdk.utils.time.sleep"):
+            custom_gql_fetch(
+                self.network,
+                "query GetEscrows($first: Int) { escrows { id } }",
+                options=options,
+            )
+
+        metrics_hook.assert_called_once()
+        metrics = metrics_hook.call_args.args[0]
+        self.assertIsInstance(metrics, SubgraphQueryMetrics)
+        self.assertEqual(metrics.query_name, "GetEscrows")
+        self.assertEqual(metrics.retries, 1)
+        self.assertTrue(metrics.success)
+        self.assertGreaterEqual(metrics.latency, 0)
+
+    def test_reports_failed_query_metrics(self):
+        metrics_hook = Mock()
+        configure_subgraph_transport(
+            SubgraphTransportOptions(metrics_hook=metrics_hook)
+        )
+        self.addCleanup(configure_subgraph_transport, SubgraphTransportOptions())
+
+        with patch(
+            "human_protocol_sdk.utils._fetch_subgraph_data",
+            side_effect=Exception("network failure"),
+        ):
+            with self.assertRaises(Exception):
+                custom_gql_fetch(self.network, self.query)
+
+        metrics = metrics_hook.call_args.args[0]
+        self.assertEqual(metrics.query_name, "Test")
+        self.assertEqual(metrics.retries, 0)
+        self.assertFalse(metrics.success)
+
+    def test_fetch_subgraph_uses_pooled_session_with_timeout(self):
+        configure_subgraph_transport(SubgraphTransportOptions(timeout=5))
+        self.addCleanup(configure_subgraph_transport, SubgraphTransportOptions())
+
+        with patch("human_protocol_sdk.utils._get_subgraph_session") as mock_session:
+            mock_post = mock_session.return_value.post
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = {"data": {}}
+
+            _fetch_subgraph_data(self.network, self.query, self.variables)
+
+        mock_session.assert_called_once_with("http://subgraph")
+        self.assertEqual(mock_post.call_args.kwargs.get("timeout"), 5)
+
+    def test_reuses_session_per_host(self):
+        configure_subgraph_transport(SubgraphTransportOptions())
+        self.addCleanup(configure_subgraph_transport, SubgraphTransportOptions())
+
+        session = _get_subgraph_session("https://gateway.thegraph.com/api/a")
+        self.assertIs(session, _get_subgraph_session("https://gateway.thegraph.com/b"))
+        self.assertIsNot(session, _get_subgraph_session("http://localhost:8000/c"))
+
     def test_raises_when_retry_options_incomplete(self):
         options = SubgraphOptions(max_retries=2)
 
@@ -177,7 +300,10 @@ class TestGetDataFromSubgraph(unittest.TestCase):
         }
 
         with patch.dict(os.environ, {"SUBGRAPH_API_KEY": "token"}, clear=True):
-            with patch("human_protocol_sdk.utils.requests.post") as mock_post:
+            with patch(
+                "human_protocol_sdk.utils._get_subgraph_session"
+            ) as mock_session:
+                mock_post = mock_session.return_value.post
                 mock_post.return_value.status_code = 200
                 mock_post.return_value.json.return_value = {"data": {}}
 
@@ -197,7 +323,8 @@ class TestGetDataFromSubgraph(unittest.TestCase):
             "hmt_subgraph_url_api_key": "http://hmt-subgraph-with-key",
         }
 
-        with patch("human_protocol_sdk.utils.requests.post") as mock_post:
+        with patch("human_protocol_sdk.utils._get_subgraph_session") as mock_session:
+            mock_post = mock_session.return_value.post
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {"data": {}}
 
@@ -219,7 +346,10 @@ class TestGetDataFromSubgraph(unittest.TestCase):
         }
 
         with patch.dict(os.environ, {"SUBGRAPH_API_KEY": "token"}, clear=True):
-            with patch("human_protocol_sdk.utils.requests.post") as mock_post:
+            with patch(
+                "human_protocol_sdk.utils._get_subgraph_session"
+            ) as mock_session:
+                mock_post = mock_session.return_value.post
                 mock_post.return_value.status_code = 200
                 mock_post.return_value.json.return_value = {"data": {}}
 
@@ -240,7 +370,10 @@ class TestGetDataFromSubgraph(unittest.TestCase):
         }
 
         with patch.dict(os.environ, {"SUBGRAPH_API_KEY": "token"}, clear=True):
-            with patch("human_protocol_sdk.utils.requests.post") as mock_post:
+            with patch(
+                "human_protocol_sdk.utils._get_subgraph_session"
+            ) as mock_session:
+                mock_post = mock_session.return_value.post
                 mock_post.return_value.status_code = 200
                 mock_post.return_value.json.return_value = {"data": {}}
 
@@ -266,3 +399,198 @@ class TestAttachIndexerId(unittest.TestCase):
     def test_returns_original_url_when_indexer_missing(self):
         url = "https://gateway.thegraph.com/api/deployments/id/Qm123"
         self.assertEqual(_attach_indexer_id(url, None), url)
+
+
+class TestContractCache(unittest.TestCase):
+    def setUp(self):
+        clear_contract_cache()
+        self.addCleanup(clear_contract_cache)
+
+        artifact = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        json.dump({"abi": []}, artifact)
+        artifact.close()
+        self.addCleanup(os.remove, artifact.name)
+        self.artifact_path = artifact.name
+
+        self.get_interface = lambda: get_contract_interface(self.artifact_path)
+        self.w3 = Web3(MagicMock(spec=HTTPProvider))
+        self.address = "0x1234567890123456789012345678901234567890"
+
+    def test_loads_artifact_once(self):
+        first = get_contract_interface(self.artifact_path)
+        second = get_contract_interface(self.artifact_path)
+
+        self.assertIs(first, second)
+        info = get_contract_cache_info()
+        self.assertEqual(info.abi_misses, 1)
+        self.assertEqual(info.abi_hits, 1)
+
+    def test_returns_cached_contract(self):
+        first = get_contract(self.w3, 1338, self.address, self.get_interface)
+        second = get_contract(self.w3, 1338, self.address.lower(), self.get_interface)
+
+        self.assertIs(first, second)
+        info = get_contract_cache_info()
+        self.assertEqual(info.contract_misses, 1)
+        self.assertEqual(info.contract_hits, 1)
+        self.assertEqual(info.contract_size, 1)
+
+    def test_separates_chains_and_web3_instances(self):
+        contract = get_contract(self.w3, 1338, self.address, self.get_interface)
+        other_chain = get_contract(self.w3, 1, self.address, self.get_interface)
+        other_w3 = Web3(MagicMock(spec=HTTPProvider))
+        rebound = get_contract(other_w3, 1338, self.address, self.get_interface)
+
+        self.assertIsNot(contract, other_chain)
+        self.assertIsNot(contract, rebound)
+        self.assertIs(rebound.w3, other_w3)
+        self.assertEqual(get_contract_cache_info().contract_hits, 0)
+
+    def test_evicts_least_recently_used(self):
+        cache = _ContractCache(maxsize=1)
+        other_address = "0x0000000000000000000000000000000000000001"
+
+        first = cache.get_contract(self.w3, 1338, self.address, self.get_interface)
+        cache.get_contract(self.w3, 1338, other_address, self.get_interface)
+        refetched = cache.get_contract(self.w3, 1338, self.address, self.get_interface)
+
+        self.assertIsNot(first, refetched)
+        info = cache.info()
+        self.assertEqual(info.contract_size, 1)
+        self.assertEqual(info.contract_misses, 3)
+
+
+class TestAggregateCalls(unittest.TestCase):
+    def setUp(self):
+        self.w3 = Web3(MagicMock(spec=HTTPProvider))
+        self.contract = self.w3.eth.contract(
+            address="0x1234567890123456789012345678901234567890",
+            abi=[
+                {
+                    "inputs": [],
+                    "name": "launcher",
+                    "outputs": [{"name": "", "type": "address"}],
+                    "stateMutability": "view",
+                    "type": "function",
+                },
+                {
+                    "inputs": [],
+                    "name": "fundAmount",
+                    "outputs": [{"name": "", "type": "uint256"}],
+                    "stateMutability": "view",
+                    "type": "function",
+                },
+            ],
+        )
+        self.launcher = "0x0000000000000000000000000000000000000aBc"
+        self.calls = [
+            self.contract.functions.launcher(),
+            self.contract.functions.fundAmount(),
+        ]
+
+    def test_aggregates_calls_through_multicall(self):
+        multicall_contract = MagicMock()
+        multicall_contract.functions.aggregate3.return_value.call.return_value = [
+            (True, encode(["address"], [self.launcher])),
+            (False, b""),
+        ]
+
+        with patch(
+            "human_protocol_sdk.utils.get_contract", return_value=multicall_contract
+        ) as mock_get_contract:
+            result = aggregate_calls(self.w3, 1338, self.calls)
+
+        self.assertEqual(mock_get_contract.call_args.args[2], MULTICALL3_ADDRESS)
+        aggregated = multicall_contract.functions.aggregate3.call_args.args[0]
+        self.assertEqual(len(aggregated), 2)
+        self.assertTrue(all(allow_failure for _, allow_failure, _ in aggregated))
+        self.assertEqual(result, [(True, self.launcher), (False, None)])
+
+    def test_splits_calls_into_batches(self):
+        multicall_contract = MagicMock()
+        multicall_contract.functions.aggregate3.return_value.call.side_effect = [
+            [(True, encode(["address"], [self.launcher]))],
+            [(True, encode(["uint256"], [42]))],
+        ]
+
+        with patch(
+            "human_protocol_sdk.utils.get_contract", return_value=multicall_contract
+        ):
+            result = aggregate_calls(self.w3, 1338, self.calls, batch_size=1)
+
+        self.assertEqual(multicall_contract.functions.aggregate3.call_count, 2)
+        self.assertEqual(result, [(True, self.launcher), (True, 42)])
+
+    def test_falls_back_to_batch_requests(self):
+        batch = MagicMock()
+        batch.execute.return_value = [
+            encode(["address"], [self.launcher]),
+            encode(["uint256"], [42]),
+        ]
+        self.w3.batch_requests = MagicMock()
+        self.w3.batch_requests.return_value.__enter__.return_value = batch
+        self.w3.eth.call = MagicMock()
+
+        result = aggregate_calls(self.w3, 1338, self.calls, use_multicall=False)
+
+        self.assertEqual(batch.add.call_count, 2)
+        self.assertEqual(result, [(True, self.launcher), (True, 42)])
+
+    def test_retries_single_calls_when_batch_fails(self):
+        batch = MagicMock()
+        batch.execute.side_effect = Exception("execution reverted")
+        self.w3.batch_requests = MagicMock()
+        self.w3.batch_requests.return_value.__enter__.return_value = batch
+        self.w3.eth.call = MagicMock(
+            side_effect=[
+                # requests queued in the failed batch
+                None,
+                None,
+                encode(["address"], [self.launcher]),
+                Exception("execution reverted"),
+            ]
+        )
+
+        result = aggregate_calls(self.w3, 1338, self.calls, use_multicall=False)
+
+        self.assertEqual(result, [(True, self.launcher), (False, None)])
+
+
+class TestIterQueryPages(unittest.TestCase):
+    def setUp(self):
+        self.cursors = []
+
+        def get_steps(cursor):
+            self.cursors.append(cursor)
+            response = yield SubgraphQuery("network", query="query")
+            return response["items"]
+
+        self.pages = QueryPages(
+            get_steps=get_steps,
+            get_cursor=lambda item: PageCursor(id=str(item)),
+            page_size=2,
+        )
+
+    def test_stops_on_short_page(self):
+        fetch = Mock(side_effect=[{"items": [1, 2]}, {"items": [3]}])
+
+        items = list(iter_query_pages(self.pages, fetch))
+
+        self.assertEqual(items, [1, 2, 3])
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(self.cursors, [None, PageCursor(id="2")])
+
+    def test_prefetches_next_page(self):
+        fetch = Mock(side_effect=[{"items": [1, 2]}, {"items": []}])
+
+        iterator = iter_query_pages(self.pages, fetch, prefetch=True)
+        self.assertEqual(next(iterator), 1)
+        self.assertEqual(list(iterator), [2])
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_page_cursor_params(self):
+        self.assertEqual(
+            PageCursor(id="0x1", value="10").to_params(),
+            {"cursorValue": "10", "cursorId": "0x1"},
+        )
+        self.assertEqual(PageCursor(id="0x1").to_params(), {"cursorId": "0x1"})
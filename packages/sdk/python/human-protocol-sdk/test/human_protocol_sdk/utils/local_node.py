@@ -0,0 +1,149 @@
+import os
+from typing import Optional
+
+from web3 import Web3
+from web3.middleware import SignAndSendRawMiddlewareBuilder
+
+from human_protocol_sdk.constants import MULTICALL3_ADDRESS, NETWORKS, ChainId
+
+from .job import DEFAULT_GAS_PAYER_PRIV
+
+# Hardhat node started with `yarn local` in packages/core, or anvil with the same deployment
+LOCAL_NODE_URL = os.environ.get("LOCAL_NODE_URL", "http://localhost:8545")
+
+# Runtime bytecode of the canonical Multicall3 deployment, which local nodes don't have
+MULTICALL3_RUNTIME_CODE = (
+    "0x6080604052600436106100f35760003560e01c80634d2301cc1161008a578063a8b0574e116100"
+    "59578063a8b0574e1461025a578063bce38bd714610275578063c3077fa914610288578063ee82ac"
+    "5e1461029b57600080fd5b80634d2301cc146101ec57806372425d9d1461022157806382ad56cb14"
+    "61023457806386d516e81461024757600080fd5b80633408e470116100c65780633408e470146101"
+    "91578063399542e9146101a45780633e64a696146101c657806342cbb15c146101d957600080fd5b"
+    "80630f28c97d146100f8578063174dea711461011a578063252dba421461013a57806327e86d6e14"
+    "61015b575b600080fd5b34801561010457600080fd5b50425b6040519081526020015b6040518091"
+    "0390f35b61012d610128366004610a85565b6102ba565b6040516101119190610bbe565b61014d61"
+    "0148366004610a85565b6104ef565b604051610111929190610bd8565b34801561016757600080fd"
+    "5b50437fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff01406101"
+    "07565b34801561019d57600080fd5b5046610107565b6101b76101b2366004610c60565b61069056"
+    "5b60405161011193929190610cba565b3480156101d257600080fd5b5048610107565b3480156101"
+    "e557600080fd5b5043610107565b3480156101f857600080fd5b50610107610207366004610ce256"
+    "5b73ffffffffffffffffffffffffffffffffffffffff163190565b34801561022d57600080fd5b50"
+    "44610107565b61012d610242366004610a85565b6106ab565b34801561025357600080fd5b504561"
+    "0107565b34801561026657600080fd5b50604051418152602001610111565b61012d610283366004"
+    "610c60565b61085a565b6101b7610296366004610a85565b610a1a565b3480156102a757600080fd"
+    "5b506101076102b6366004610d18565b4090565b60606000828067ffffffffffffffff8111156102"
+    "d8576102d8610d31565b60405190808252806020026020018201604052801561031e57816020015b"
+    "6040805180820190915260008152606060208201528152602001906001900390816102f65790505b"
+    "5092503660005b8281101561047757600085828151811061034157610341610d60565b6020026020"
+    "010151905087878381811061035d5761035d610d60565b905060200281019061036f9190610d8f56"
+    "5b6040810135958601959093506103886020850185610ce2565b73ffffffffffffffffffffffffff"
+    "ffffffffffffff16816103ac6060870187610dcd565b6040516103ba929190610e32565b60006040"
+    "518083038185875af1925050503d80600081146103f7576040519150601f19603f3d011682016040"
+    "523d82523d6000602084013e6103fc565b606091505b506020808501919091529015158084529085"
+    "01351761046d577f08c379a000000000000000000000000000000000000000000000000000000000"
+    "600052602060045260176024527f4d756c746963616c6c333a2063616c6c206661696c6564000000"
+    "00000000000060445260846000fd5b5050600101610325565b508234146104e6576040517f08c379"
+    "a000000000000000000000000000000000000000000000000000000000815260206004820152601a"
+    "60248201527f4d756c746963616c6c333a2076616c7565206d69736d617463680000000000006044"
+    "8201526064015b60405180910390fd5b50505092915050565b436060828067ffffffffffffffff81"
+    "111561050c5761050c610d31565b60405190808252806020026020018201604052801561053f5781"
+    "6020015b606081526020019060019003908161052a5790505b5091503660005b8281101561068657"
+    "600087878381811061056257610562610d60565b90506020028101906105749190610e42565b9250"
+    "6105836020840184610ce2565b73ffffffffffffffffffffffffffffffffffffffff166105a66020"
+    "850185610dcd565b6040516105b4929190610e32565b6000604051808303816000865af19150503d"
+    "80600081146105f1576040519150601f19603f3d011682016040523d82523d6000602084013e6105"
+    "f6565b606091505b5086848151811061060957610609610d60565b60209081029190910101529050"
+    "8061067d576040517f08c379a0000000000000000000000000000000000000000000000000000000"
+    "00815260206004820152601760248201527f4d756c746963616c6c333a2063616c6c206661696c65"
+    "6400000000000000000060448201526064016104dd565b50600101610546565b5050509250929050"
+    "565b43804060606106a086868661085a565b905093509350939050565b6060818067ffffffffffff"
+    "ffff8111156106c7576106c7610d31565b6040519080825280602002602001820160405280156107"
+    "0d57816020015b604080518082019091526000815260606020820152815260200190600190039081"
+    "6106e55790505b5091503660005b828110156104e657600084828151811061073057610730610d60"
+    "565b6020026020010151905086868381811061074c5761074c610d60565b90506020028101906107"
+    "5e9190610e76565b925061076d6020840184610ce2565b73ffffffffffffffffffffffffffffffff"
+    "ffffffff166107906040850185610dcd565b60405161079e929190610e32565b6000604051808303"
+    "816000865af19150503d80600081146107db576040519150601f19603f3d011682016040523d8252"
+    "3d6000602084013e6107e0565b606091505b50602080840191909152901515808352908401351761"
+    "0851577f08c379a00000000000000000000000000000000000000000000000000000000060005260"
+    "2060045260176024527f4d756c746963616c6c333a2063616c6c206661696c656400000000000000"
+    "000060445260646000fd5b50600101610714565b6060818067ffffffffffffffff81111561087657"
+    "610876610d31565b6040519080825280602002602001820160405280156108bc57816020015b6040"
+    "805180820190915260008152606060208201528152602001906001900390816108945790505b5091"
+    "503660005b82811015610a105760008482815181106108df576108df610d60565b60200260200101"
+    "5190508686838181106108fb576108fb610d60565b905060200281019061090d9190610e42565b92"
+    "5061091c6020840184610ce2565b73ffffffffffffffffffffffffffffffffffffffff1661093f60"
+    "20850185610dcd565b60405161094d929190610e32565b6000604051808303816000865af1915050"
+    "3d806000811461098a576040519150601f19603f3d011682016040523d82523d6000602084013e61"
+    "098f565b606091505b506020830152151581528715610a07578051610a07576040517f08c379a000"
+    "00000000000000000000000000000000000000000000000000000081526020600482015260176024"
+    "8201527f4d756c746963616c6c333a2063616c6c206661696c656400000000000000000060448201"
+    "526064016104dd565b506001016108c3565b5050509392505050565b6000806060610a2b60018686"
+    "610690565b919790965090945092505050565b60008083601f840112610a4b57600080fd5b508135"
+    "67ffffffffffffffff811115610a6357600080fd5b6020830191508360208260051b850101111561"
+    "0a7e57600080fd5b9250929050565b60008060208385031215610a9857600080fd5b823567ffffff"
+    "ffffffffff811115610aaf57600080fd5b610abb85828601610a39565b9096909550935050505056"
+    "5b6000815180845260005b81811015610aed57602081850181015186830182015201610ad1565b81"
+    "811115610aff576000602083870101525b50601f017fffffffffffffffffffffffffffffffffffff"
+    "ffffffffffffffffffffffffffe0169290920160200192915050565b600082825180855260208086"
+    "019550808260051b84010181860160005b84811015610bb1578583037fffffffffffffffffffffff"
+    "ffffffffffffffffffffffffffffffffffffffffe001895281518051151584528401516040858501"
+    "819052610b9d81860183610ac7565b9a86019a9450505090830190600101610b4f565b5090979650"
+    "505050505050565b602081526000610bd16020830184610b32565b9392505050565b600060408201"
+    "848352602060408185015281855180845260608601915060608160051b870101935082870160005b"
+    "82811015610c52577fffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff"
+    "a0888703018452610c40868351610ac7565b95509284019290840190600101610c06565b50939897"
+    "5050505050505050565b600080600060408486031215610c7557600080fd5b83358015158114610c"
+    "8557600080fd5b9250602084013567ffffffffffffffff811115610ca157600080fd5b610cad8682"
+    "8701610a39565b9497909650939450505050565b838152826020820152606060408201526000610c"
+    "d96060830184610b32565b95945050505050565b600060208284031215610cf457600080fd5b8135"
+    "73ffffffffffffffffffffffffffffffffffffffff81168114610bd157600080fd5b600060208284"
+    "031215610d2a57600080fd5b5035919050565b7f4e487b7100000000000000000000000000000000"
+    "000000000000000000000000600052604160045260246000fd5b7f4e487b71000000000000000000"
+    "00000000000000000000000000000000000000600052603260045260246000fd5b600082357fffff"
+    "ffffffffffffffffffffffffffffffffffffffffffffffffffffffffff81833603018112610dc357"
+    "600080fd5b9190910192915050565b60008083357fffffffffffffffffffffffffffffffffffffff"
+    "ffffffffffffffffffffffffe1843603018112610e0257600080fd5b83018035915067ffffffffff"
+    "ffffff821115610e1d57600080fd5b602001915036819003821315610a7e57600080fd5b81838237"
+    "60009101908152919050565b600082357fffffffffffffffffffffffffffffffffffffffffffffff"
+    "ffffffffffffffffc1833603018112610dc357600080fd5b600082357fffffffffffffffffffffff"
+    "ffffffffffffffffffffffffffffffffffffffffa1833603018112610dc357600080fdfea2646970"
+    "667358221220bb2b5c71a328032f97c676ae39a1ec2148d3e5d6f73d95e9b17910152d61f1626473"
+    "6f6c634300080c0033"
+)
+
+
+def get_local_node_w3() -> Optional[Web3]:
+    """Web3 signing with the default gas payer on the local node.
+
+    Returns None when no node with the localhost deployment is reachable.
+    """
+    w3 = Web3(Web3.HTTPProvider(LOCAL_NODE_URL, request_kwargs={"timeout": 5}))
+    try:
+        if w3.eth.chain_id != ChainId.LOCALHOST.value:
+            return None
+        if not w3.eth.get_code(NETWORKS[ChainId.LOCALHOST]["factory_address"]):
+            return None
+    except Exception:
+        return None
+
+    w3.middleware_onion.inject(
+        SignAndSendRawMiddlewareBuilder.build(DEFAULT_GAS_PAYER_PRIV),
+        "SignAndSendRawMiddlewareBuilder",
+        layer=0,
+    )
+    w3.eth.default_account = w3.eth.account.from_key(DEFAULT_GAS_PAYER_PRIV).address
+    return w3
+
+
+def deploy_multicall3(w3: Web3) -> None:
+    """Set the Multicall3 code at its canonical address, if it is not there yet."""
+    if w3.eth.get_code(MULTICALL3_ADDRESS):
+        return
+
+    for method in ("hardhat_setCode", "anvil_setCode"):
+        response = w3.provider.make_request(
+            method, [MULTICALL3_ADDRESS, MULTICALL3_RUNTIME_CODE]
+        )
+        if "error" not in response:
+            return
+    raise RuntimeError("The local node can't set the Multicall3 code")
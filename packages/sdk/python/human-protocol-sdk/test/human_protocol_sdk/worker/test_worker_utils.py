@@ -1,3 +1,4 @@
+import re
 import unittest
 from unittest.mock import patch
 
@@ -147,6 +148,44 @@ class TestWorkerUtils(unittest.TestCase):
             WorkerUtils.get_worker(ChainId.POLYGON_AMOY, "invalid_address")
         self.assertEqual(f"Invalid worker address: invalid_address", str(cm.exception))
 
+    def test_iter_workers(self):
+        with patch(
+            "human_protocol_sdk.worker.worker_utils.custom_gql_fetch",
+            side_effect=[
+                {
+                    "data": {
+                        "workers": [{"id": "0x1", "address": "0x1", "payoutCount": 1}]
+                    }
+                },
+                {"data": {"workers": []}},
+            ],
+        ) as mock_function:
+            workers = list(
+                WorkerUtils.iter_workers(
+                    WorkerFilter(chain_id=ChainId.POLYGON_AMOY), page_size=1
+                )
+            )
+
+        self.assertEqual([worker.id for worker in workers], ["0x1"])
+        params = mock_function.call_args.kwargs["params"]
+        self.assertEqual(params["orderBy"], "id")
+        self.assertEqual(params["cursorId"], "0x1")
+        self.assertNotIn("cursorValue", params)
+        self.assertIn("id_lt: $cursorId", mock_function.call_args.kwargs["query"])
+
+    def test_get_workers_query_with_cursor(self):
+        query = get_workers_query(
+            WorkerFilter(chain_id=ChainId.POLYGON_AMOY, worker_address="0x1"),
+            cursor=True,
+        )
+
+        self.assertIn("$cursorId: Bytes", query)
+        self.assertIn("id_lt: $cursorId", query)
+        self.assertNotIn("$cursorValue", query)
+        # graph-node rejects queries declaring unused variables
+        for variable in re.findall(r"(\$\w+):", query):
+            self.assertGreater(query.count(variable), 1, variable)
+
 
 if __name__ == "__main__":
     unittest.main(exit=True)